@@ -1,70 +1,203 @@
 import os
+import re
 import sys
+from contextlib import suppress
+from hashlib import sha256
+from tempfile import mkstemp
+from typing import Final
 
 import numpy as np
-import pandas as pd
 from moptipy.api.objective import Objective
+from moptipy.examples.tsp.distances import (
+    coordinate_distances,
+    coordinates_from_text,
+    dense_distances,
+    distances_tour_length,
+    farthest_distances,
+    nearest_distances,
+)
+from moptipy.examples.tsp.instance import (
+    OPTIMAL_TOUR_LENGTHS_FILE,
+    known_optimal_tour_lengths,
+)
+from moptipy.examples.tsp.instance import Instance as TspInstance
+from moptipy.examples.tsp.tour_length import tour_length
 from moptipy.utils.path import Path
 
+#: the directory with the TSPLIB instances
+_TSPLIB_DIR: Final[str] = os.path.join(os.path.dirname(__file__), "tsplib")
+#: the directory where the cost matrices of the instances are cached
+_CACHE_DIR: Final[str] = os.path.join(_TSPLIB_DIR, ".cache")
+#: instances with more cities are kept as node coordinates, not as matrix
+DENSE_LIMIT: Final[int] = 5000
+#: the number of nearest neighbors whose distances are cached per city
+NN_CACHE: Final[int] = 8
+#: the version of the cached cost matrices, to be increased whenever the
+#: parser or the layout of the cached matrices changes
+_CACHE_VERSION: Final[int] = 2
+
+
+def _load_cost_matrix(name: str, data: bytes) -> np.ndarray:
+    """
+    Load the rolled cost matrix of a TSPLIB instance, using the cache.
+
+    The scripts look up city `c` as `c - 1`, so the matrix is rolled by one
+    city in both dimensions before it is cached. The memory-mapped cache
+    file is then used directly and no second matrix is ever created.
+
+    The matrix is cached as `.npy` file named after the hash of the
+    instance file and the cache format version and is loaded memory-mapped,
+    so repeated loads of the same instance, e.g., for every setup of an
+    experiment, are almost free. The cache file is readable for all users of
+    a shared cache directory. If it cannot be loaded, e.g., because it is
+    truncated, it is rebuilt. When a new cache file is written, the cache
+    files of the instance from other format versions or other contents of
+    the instance file are deleted. If the cache cannot be written, the
+    freshly computed matrix is returned.
+
+    :param name: the name of the instance
+    :param data: the contents of the TSPLIB file
+    :returns: the (read-only if cached) rolled cost matrix
+    """
+    cache: Final[str] = os.path.join(
+        _CACHE_DIR, f"{name}_v{_CACHE_VERSION}_"
+                    f"{sha256(data).hexdigest()[:16]}.npy")
+    if os.path.isfile(cache):
+        try:
+            return np.load(cache, mmap_mode="r")
+        except (OSError, ValueError, EOFError):
+            pass  # an unreadable or broken cache file is rebuilt
+    matrix: Final[np.ndarray] = np.roll(TspInstance.from_text(
+        data.decode("utf-8").splitlines(), name), 1, axis=(0, 1))
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        handle, temp = mkstemp(suffix=".npy", dir=_CACHE_DIR)
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                np.save(stream, matrix)
+            os.chmod(temp, 0o644)  # mkstemp creates files only we can read
+            os.replace(temp, cache)  # atomic, so parallel runs never see halves
+        except OSError:
+            os.remove(temp)
+            raise
+        _remove_stale_caches(name, cache)
+        return np.load(cache, mmap_mode="r")
+    except (OSError, ValueError, EOFError):
+        return matrix
+
+
+def _remove_stale_caches(name: str, cache: str) -> None:
+    """
+    Delete the cache files of an instance except for the current one.
+
+    These are the files of older cache format versions, including the
+    unversioned ones, and of older contents of the instance file. Files
+    that cannot be deleted are left alone.
+
+    :param name: the name of the instance
+    :param cache: the path to the current cache file
+    """
+    pattern: Final = re.compile(
+        f"{re.escape(name)}_(v\\d+_)?[0-9a-f]{{16}}\\.npy")
+    for file in os.listdir(_CACHE_DIR):
+        path = os.path.join(_CACHE_DIR, file)
+        if (path != cache) and pattern.fullmatch(file):
+            with suppress(OSError):
+                os.remove(path)
+
 
 class Instance(Objective):
-    def __init__(self, file_name: str) -> None:
+    def __init__(self, file_name: str, dense: bool | None = None) -> None:
         """
-        Loading a Euclidean 2d symmetrical tsp instance and initializing some of its parameters
-        Please add the length of the optimal solution of this instance to the lbdict before using it
+        Loading a tsp instance and initializing some of its parameters
+        The length of the optimal tour is taken from the TSPLIB page with the optimal tour lengths
+
+        The distances are either kept as dense cost matrix or computed on the
+        fly from the node coordinates, which needs O(n*NN_CACHE) instead of
+        O(n*n) memory. By default, only instances with node coordinates and
+        more than DENSE_LIMIT cities use the latter. Either way, the
+        algorithms access the distances via self.distances.
+
+        :param file_name: the name of the file in the tsplib directory
+        :param dense: True to always use a dense matrix, False to use the
+            node coordinates, None to decide based on the size
         """
-        lbdict = {'st70': 675, 'eil101': 629, 'berlin52': 7542, 'a280': 2579, 'bier127': 118282, 'eil51': 426, 'eil76': 538,
-                  'kroA100': 21282, 'kroB100': 22141, 'kroC100': 20749, 'kroD100': 21294, 'kroE100': 22068, 'lin105': 14379,
-                  'pr76': 108159, 'pr107': 44303, 'pr124': 59030, 'rat99': 1211, 'ts225': 126643}  # store the the optimal value of these Euc2d instances as the lower bound
         try:
-            file_name = file_name  # load the tsp instance
-            df = pd.read_csv(
-                Path.directory(os.path.dirname(__file__))
-                .resolve_inside("tsplib")
-                .resolve_inside(file_name), sep=" ", skiprows=6, header=None)
-            city = np.array(df[0][0:len(df)-1])
-            city_name = city.tolist()
-            city_x = np.array(df[1][0:len(df)-1])
-            city_y = np.array(df[2][0:len(df)-1])
-            city_location = list(zip(city_x, city_y))
-            city_number = len(city_name)
+            file = Path.directory(_TSPLIB_DIR).resolve_inside(file_name)
+            with open(file, "rb") as stream:  # the file is read only once
+                data = stream.read()
         except FileNotFoundError:
             sys.exit("I can not find it...")
-
-        def get_dab(a, b, city_location):  # get the distance between a and b
-
-            def ct_distance(l1):
-                """calculate the Euclidean distance between 2 cities in l1, round down"""
-                d = np.sqrt((l1[0][0]-l1[1][0]) ** 2 + (l1[0][1] - l1[1][1]) ** 2)
-                dis = int(0.5 + d)
-                return dis
-
-            a = city_location[a]
-            b = city_location[b]
-            dab = [a, b]
-            return ct_distance(dab)
-
-        cost_tsp = np.zeros((city_number, city_number))
-        for i in range(0, city_number):
-            for j in range(0, city_number):
-                cost_tsp[i][j] = get_dab(i, j, city_location)  # Create a cost matrix for this instance
+        coords = None
+        if dense is not True:
+            try:
+                _, weight_type, coords = coordinates_from_text(
+                    data.decode("utf-8").splitlines())
+            except ValueError:
+                if dense is False:
+                    raise
+            if (coords is not None) and (dense is None) and (
+                    len(coords) <= DENSE_LIMIT):
+                coords = None
+        rolled = None if coords is not None else _load_cost_matrix(
+            os.path.basename(file)[:-4], data)  # load the tsp instance
+
+        # the cities in x are looked up as x-1, i.e., with the data rolled by one
+        self._rolled = rolled
+        self._mean_nearest = None  # computed when it is first needed
+        if rolled is None:
+            city_number = len(coords)
+            self.distances = coordinate_distances(
+                weight_type, np.roll(coords, 1, axis=0), NN_CACHE)
+        else:
+            city_number = rolled.shape[0]
+            self.distances = dense_distances(rolled)
 
         """
         In fact, you can compute or generate an upper bound in other ways,
         as long as it is guaranteed to be larger than all feasible solutions in this instance
 
         """
-        index_max = np.argmax(cost_tsp, axis=1)
-        max = cost_tsp[range(cost_tsp.shape[0]), index_max]
-        upperbound = sum(max)  # The sum of the distance between each city and the city farthest from it
-        UB = int(upperbound)+1  # use this distance + 1 as the upperbound of this instance
+        # The sum of the distance between each city and the city farthest from it
+        upperbound = int(farthest_distances(self.distances).sum(dtype=np.int64))
+        UB = upperbound+1  # use this distance + 1 as the upperbound of this instance
 
         self.name = file_name[:-4]
         self.city_number = city_number
-        self.cost_tsp = cost_tsp
-        self.LB = (lbdict.get(self.name))  # get the lower bound from the lb dict
+        self.LB = known_optimal_tour_lengths(os.path.join(  # the optimal tour length is the lower bound
+            _TSPLIB_DIR, OPTIMAL_TOUR_LENGTHS_FILE)).get(self.name)
         self.UB = UB
 
+    @property
+    def cost_tsp(self) -> np.ndarray | None:
+        """
+        Get the cost matrix with the distances of city `i` in row `i`.
+
+        Only the matrix rolled by one city is kept, so every access creates
+        a new copy, which costs O(n*n) time and memory. Get it once and keep
+        it instead of accessing it in a loop. The scripts do not use it.
+
+        :returns: the cost matrix, or None if the distances are computed
+            from the node coordinates
+        """
+        if self._rolled is None:
+            return None
+        return np.roll(self._rolled, -1, axis=(0, 1))
+
+    @property
+    def mean_nearest_distance(self) -> float:
+        """
+        Get the mean distance between each city and its nearest neighbor.
+
+        It is computed only once per instance, when it is first needed.
+
+        :returns: the mean of the shortest non-zero distances of the cities
+        """
+        if self._mean_nearest is None:
+            self._mean_nearest = float(np.mean(
+                nearest_distances(self.distances)))
+        return self._mean_nearest
+
     def evaluate(self, x) -> int:
         """
         Get the tour distance as the objective value from the solution x.
@@ -74,16 +207,17 @@ class Instance(Objective):
 
         :returns: tour_total_distance
         """
-        tour_total_distance = 0
-        for i in range(0, self.city_number):
-            if i == self.city_number-1:
-                a = x[i]
-                b = x[0]
-            else:
-                a = x[i]
-                b = x[i+1]
-            tour_total_distance = tour_total_distance + self.cost_tsp[a-1][b-1]
-        return tour_total_distance
+        if self._rolled is None:
+            return distances_tour_length(self.distances, x)
+        return tour_length(self._rolled, x)
+
+    def is_always_integer(self) -> bool:
+        """
+        Tour lengths are always integers.
+
+        :returns: True
+        """
+        return True
 
     def lower_bound(self) -> int:
         """
@@ -15,7 +15,10 @@ The temperature schedule receives an iteration index `tau` as input and
 returns the current temperature via :meth:`~moptipy.algorithms.modules.\
 temperature_schedule.TemperatureSchedule.temperature`. Notice that `tau` is
 zero-based for simplicity reason, meanings that the first objective function
-evaluation is at index `0`.
+evaluation is at index `0`. Algorithms that step through the iterations one
+by one can instead keep the temperature as state and update it via
+:meth:`~moptipy.algorithms.modules.temperature_schedule.TemperatureSchedule.\
+step`, which the exponential schedule implements as a single multiplication.
 """
 
 from math import e, isfinite, log
@@ -58,6 +61,19 @@ class TemperatureSchedule(Component):
         """
 # end schedule
 
+    def step(self, t: float, tau: int) -> float:
+        """
+        Compute the temperature at iteration `tau + 1` from the one at `tau`.
+
+        By default, this just invokes :meth:`temperature`. Schedules that can
+        update the temperature incrementally may override it.
+
+        :param t: the temperature at iteration `tau`
+        :param tau: the current iteration index
+        :returns: the temperature at iteration `tau + 1`
+        """
+        return self.temperature(tau + 1)
+
     def log_parameters_to(self, logger: KeyValueLogSection) -> None:
         """
         Log all parameters of this temperature schedule as key-value pairs.
@@ -146,6 +162,23 @@ class ExponentialSchedule(TemperatureSchedule):
         return self.t0 * (self.__one_minus_epsilon ** tau)
 # end exponential
 
+    def step(self, t: float, tau: int) -> float:
+        """
+        Compute the temperature at iteration `tau + 1` from the one at `tau`.
+
+        :param t: the temperature at iteration `tau`
+        :param tau: the current iteration index
+        :returns: the temperature at iteration `tau + 1`, i.e., `t` multiplied
+            with `1 - epsilon`
+
+        >>> s = ExponentialSchedule(100.0, 0.5)
+        >>> s.step(s.temperature(0), 0)
+        50.0
+        >>> s.step(s.step(50.0, 1), 2)
+        12.5
+        """
+        return t * self.__one_minus_epsilon
+
     def log_parameters_to(self, logger: KeyValueLogSection) -> None:
         """
         Log all parameters of the exponential temperature schedule.
@@ -45,9 +45,9 @@ FFA is also implemented as a fitness assignment process
 """
 from typing import Callable, Final, cast
 
-import numpy as np
 from numpy.random import Generator
 
+from moptipy.algorithms.so.ffa_h import FrequencyTable
 from moptipy.api.algorithm import Algorithm1
 from moptipy.api.operators import Op0, Op1
 from moptipy.api.process import Process
@@ -73,9 +73,12 @@ class FEA1plus1(Algorithm1):
     Otherwise, it is discarded.
 
     This algorithm implementation requires that objective values are
-    integers and have lower and upper bounds that are not too far
-    away from each other. A more general version is available as a fitness
-    assignment process (:mod:`~moptipy.algorithms.so.fitness`) that can
+    integers and have finite lower and upper bounds. The frequencies are
+    stored in a :class:`~moptipy.algorithms.so.ffa_h.FrequencyTable`, which
+    only needs memory proportional to the number of objective values
+    actually encountered if the bounds are far apart. A more general
+    version is available as a fitness assignment process
+    (:mod:`~moptipy.algorithms.so.fitness`) that can
     be plugged into a general EA (:mod:`~moptipy.algorithms.so.general_ea`)
     in module :mod:`~moptipy.algorithms.so.fitnesses.ffa`.
     """
@@ -98,11 +101,12 @@ class FEA1plus1(Algorithm1):
         # Create records for old and new point in the search space.
         best_x = process.create()  # record for best-so-far solution
         new_x = process.create()  # record for new solution
-        lb: Final[int] = cast(int, process.lower_bound())
 
         # h holds the encounter frequency of each objective value.
-        h: Final[np.ndarray] = np.zeros(
-            cast(int, process.upper_bound()) - lb + 1, np.uint64)
+        h: Final[FrequencyTable] = FrequencyTable(
+            cast(int, process.lower_bound()), cast(int, process.upper_bound()))
+        h_add: Final[Callable[[int], int]] = h.add  # increment frequency
+        h_get: Final[Callable[[int], int]] = h.get  # get frequency
         # Obtain the random number generator.
         random: Final[Generator] = process.get_random()
 
@@ -113,14 +117,14 @@ class FEA1plus1(Algorithm1):
 
         # Start at a random point in the search space and evaluate it.
         self.op0.op0(random, best_x)  # Create 1 solution randomly and
-        best_f: int = cast(int, evaluate(best_x)) - lb  # evaluate it.
+        best_f: int = cast(int, evaluate(best_x))  # evaluate it.
 
         while not should_terminate():  # Until we need to quit...
             op1(random, new_x, best_x)  # new_x = neighbor of best_x
-            new_f: int = cast(int, evaluate(new_x)) - lb
+            new_f: int = cast(int, evaluate(new_x))
 
-            h[new_f] = h[new_f] + 1  # Increase frequency of new_f and
-            h[best_f] = best_h = h[best_f] + 1  # of best_f.
-            if h[new_f] <= best_h:  # new_x is no worse than best_x?
+            h_add(new_f)  # Increase frequency of new_f and
+            best_h: int = h_add(best_f)  # of best_f.
+            if h_get(new_f) <= best_h:  # new_x is no worse than best_x?
                 best_f = new_f  # Store its objective value.
                 best_x, new_x = new_x, best_x  # Swap best and new.
@@ -0,0 +1,301 @@
+"""
+A compact frequency table `H` for Frequency Fitness Assignment (FFA).
+
+FFA-based algorithms count how often each objective value has been
+encountered. The straightforward implementation is an array indexed directly
+by the objective value. For problems whose objective values are large
+integers, e.g., tour lengths of the Traveling Salesperson Problem, such an
+array is mostly empty but can still take up hundreds of megabytes.
+
+The :class:`FrequencyTable` stores the frequencies as `uint32` counters. If
+the range `ub - lb + 1` of possible objective values is small (at most
+:const:`DENSE_RANGE_LIMIT`), it is a plain array offset by the lower bound
+`lb`. Otherwise, it is an open-addressing hash table with linear probing,
+whose memory consumption is proportional to the number of objective values
+actually encountered. If a counter would exceed :const:`H_MAX`, all counters
+are halved, which keeps their relative order (up to rounding) intact.
+
+The table consists of numpy arrays only, so it can also be used from
+`numba`-compiled code via :func:`h_add` and :func:`h_get`, which receive the
+arrays :attr:`FrequencyTable.h`, :attr:`FrequencyTable.keys` and the lower
+bound :attr:`FrequencyTable.lb`. Compiled code must not insert more new
+objective values into a hash table than it has reserved beforehand via
+:meth:`FrequencyTable.reserve`, which may replace the arrays.
+
+>>> t = FrequencyTable(10, 20)
+>>> t.is_dense()
+True
+>>> t.add(12)
+1
+>>> t.add(12)
+2
+>>> t.get(12), t.get(13)
+(2, 0)
+>>> t = FrequencyTable(-10, 1_000_000_000_000)
+>>> t.is_dense()
+False
+>>> t.add(123_456_789)
+1
+>>> t.add(123_456_789)
+2
+>>> t.get(123_456_789), t.get(-5)
+(2, 0)
+>>> len(t)
+1
+"""
+from typing import Final
+
+import numba  # type: ignore
+import numpy as np
+
+from moptipy.utils.types import check_int_range, type_error
+
+#: the largest value a counter can take before all counters are halved
+H_MAX: Final[int] = 4_294_967_295
+#: the largest range of objective values for which a plain array is used
+DENSE_RANGE_LIMIT: Final[int] = 1_048_576
+#: the initial number of slots of a hash table
+_INITIAL_CAPACITY: Final[int] = 1024
+#: the key marking an empty slot of a hash table
+_EMPTY: Final[int] = -9_223_372_036_854_775_808
+#: the multiplier for spreading keys over the hash table, 2**64 divided by
+#: the golden ratio
+_SPREAD: Final[int] = 11_400_714_819_323_198_485
+
+
+@numba.njit(nogil=True, cache=True)
+def _halve(h: np.ndarray) -> None:
+    """
+    Halve all counters of a frequency table.
+
+    :param h: the counters
+    """
+    for i in range(h.size):  # pylint: disable=C0200
+        h[i] >>= 1
+
+
+@numba.njit(nogil=True, cache=True, inline="always")
+def _home(k: int, mask: int) -> int:
+    """
+    Get the home slot of a key in a hash table.
+
+    The lowest bits of a product only depend on the lowest bits of its
+    factors. Keys that only differ in their higher bits, e.g., tour lengths
+    that are all multiples of a power of two, would thus all end up in the
+    same slots if the product were just masked. Therefore, the upper half of
+    the key is folded onto its lower half before the multiplication, and the
+    well-mixed upper half of the product is folded back before masking.
+
+    :param k: the key minus the lower bound, i.e., a non-negative integer
+    :param mask: the number of slots minus one
+    :returns: the home slot of the key
+
+    >>> [_home(k << 40, 1023) for k in range(1, 6)]
+    [895, 766, 125, 509, 380]
+    """
+    x = np.uint64(k)
+    x = (x ^ (x >> np.uint64(32))) * np.uint64(_SPREAD)
+    return np.int64((x ^ (x >> np.uint64(32))) & np.uint64(mask))
+
+
+@numba.njit(nogil=True, cache=True, inline="always")
+def _slot(keys: np.ndarray, lb: int, f: int) -> int:
+    """
+    Get the slot of an objective value, inserting it if necessary.
+
+    The last element of `keys` holds the number of occupied slots.
+
+    :param keys: the keys of the table, empty for a plain array
+    :param lb: the lower bound of the objective values
+    :param f: the objective value
+    :returns: the index of the counter of `f`
+    """
+    if keys.size <= 0:
+        return f - lb
+    mask: int = keys.size - 2
+    i: int = _home(f - lb, mask)
+    while True:
+        k = keys[i]
+        if k == f:
+            return i
+        if k == _EMPTY:
+            keys[i] = f
+            keys[-1] += 1
+            return i
+        i = (i + 1) & mask
+
+
+@numba.njit(nogil=True, cache=True)
+def h_add(h: np.ndarray, keys: np.ndarray, lb: int, f: int) -> int:
+    """
+    Increment the frequency of an objective value.
+
+    :param h: the counters of the table
+    :param keys: the keys of the table, empty for a plain array
+    :param lb: the lower bound of the objective values
+    :param f: the objective value
+    :returns: the new frequency of `f`
+    """
+    i: Final[int] = _slot(keys, lb, f)
+    if h[i] >= H_MAX:
+        _halve(h)
+    c: Final[int] = int(h[i]) + 1
+    h[i] = c
+    return c
+
+
+@numba.njit(nogil=True, cache=True)
+def h_get(h: np.ndarray, keys: np.ndarray, lb: int, f: int) -> int:
+    """
+    Get the frequency of an objective value.
+
+    :param h: the counters of the table
+    :param keys: the keys of the table, empty for a plain array
+    :param lb: the lower bound of the objective values
+    :param f: the objective value
+    :returns: the frequency of `f`
+    """
+    if keys.size <= 0:
+        return int(h[f - lb])
+    mask: Final[int] = keys.size - 2
+    i: int = _home(f - lb, mask)
+    while True:
+        k = keys[i]
+        if k == f:
+            return int(h[i])
+        if k == _EMPTY:
+            return 0
+        i = (i + 1) & mask
+
+
+@numba.njit(nogil=True, cache=True)
+def _rehash(h: np.ndarray, keys: np.ndarray, new_h: np.ndarray,
+            new_keys: np.ndarray, lb: int) -> None:
+    """
+    Move all entries of a hash table into a bigger one.
+
+    :param h: the old counters
+    :param keys: the old keys
+    :param new_h: the new counters
+    :param new_keys: the new keys
+    :param lb: the lower bound of the objective values
+    """
+    for i in range(keys.size - 1):
+        k = keys[i]
+        if k != _EMPTY:
+            new_h[_slot(new_keys, lb, k)] = h[i]
+
+
+class FrequencyTable:
+    """A compact frequency table for FFA."""
+
+    def __init__(self, lb: int, ub: int) -> None:
+        """
+        Create the frequency table.
+
+        :param lb: the lower bound of the objective values
+        :param ub: the upper bound of the objective values
+        """
+        if not isinstance(lb, int):
+            raise type_error(lb, "lb", int)
+        #: the lower bound of the objective values
+        self.lb: Final[int] = lb
+        #: the upper bound of the objective values
+        self.ub: Final[int] = check_int_range(
+            ub, "ub", lb, 9_223_372_036_854_775_807)
+        #: the counters
+        self.h: np.ndarray
+        #: the keys of the hash table, followed by the number of used slots,
+        #: or an empty array if the table is a plain array
+        self.keys: np.ndarray
+        if (ub - lb) < DENSE_RANGE_LIMIT:
+            self.h = np.zeros(ub - lb + 1, np.uint32)
+            self.keys = np.empty(0, np.int64)
+        else:
+            self.__allocate(_INITIAL_CAPACITY)
+
+    def __allocate(self, capacity: int) -> None:
+        """
+        Allocate an empty hash table.
+
+        :param capacity: the number of slots, a power of two
+        """
+        self.h = np.zeros(capacity, np.uint32)
+        self.keys = np.full(capacity + 1, _EMPTY, np.int64)
+        self.keys[-1] = 0
+
+    def is_dense(self) -> bool:
+        """
+        Check whether this table is a plain array.
+
+        :returns: `True` if the table is a plain array, `False` if it is a
+            hash table
+        """
+        return self.keys.size <= 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of objective values with a slot in the table.
+
+        :returns: the number of objective values in the table
+        """
+        if self.keys.size <= 0:
+            return int(np.count_nonzero(self.h))
+        return int(self.keys[-1])
+
+    def reserve(self, n: int) -> None:
+        """
+        Make sure that `n` new objective values can be inserted.
+
+        If this table is a hash table that would become more than half full,
+        it is grown, which replaces :attr:`h` and :attr:`keys`.
+
+        :param n: the number of new objective values
+        """
+        keys: Final[np.ndarray] = self.keys
+        if keys.size <= 0:
+            return
+        needed: Final[int] = 2 * (int(keys[-1]) + n)
+        capacity: int = keys.size - 1
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        h: Final[np.ndarray] = self.h
+        self.__allocate(capacity)
+        _rehash(h, keys, self.h, self.keys, self.lb)
+
+    def add(self, f: int) -> int:
+        """
+        Increment the frequency of an objective value.
+
+        :param f: the objective value
+        :returns: the new frequency of `f`
+        :raises ValueError: if `f` is outside of the bounds of the table
+        """
+        if not (self.lb <= f <= self.ub):
+            raise ValueError(
+                f"f={f} is not in the range {self.lb}..{self.ub}.")
+        if self.keys.size > 0:
+            self.reserve(1)
+        return int(h_add(self.h, self.keys, self.lb, f))
+
+    def get(self, f: int) -> int:
+        """
+        Get the frequency of an objective value.
+
+        :param f: the objective value
+        :returns: the frequency of `f`
+        :raises ValueError: if `f` is outside of the bounds of the table
+        """
+        if not (self.lb <= f <= self.ub):
+            raise ValueError(
+                f"f={f} is not in the range {self.lb}..{self.ub}.")
+        return int(h_get(self.h, self.keys, self.lb, f))
+
+    def clear(self) -> None:
+        """Reset all frequencies to zero."""
+        if self.keys.size <= 0:
+            self.h.fill(0)
+        else:
+            self.__allocate(_INITIAL_CAPACITY)
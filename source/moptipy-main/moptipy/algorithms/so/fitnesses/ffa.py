@@ -16,6 +16,12 @@ This can make the EA with FFA compatible with the
 (:class:`moptipy.algorithms.modules.selections.best.Best`) is used
 at mu=lambda=1.
 
+For integer objective functions with finite bounds, the encounter
+frequencies are stored in a compact
+:class:`~moptipy.algorithms.so.ffa_h.FrequencyTable`, which switches to a
+hash table if the bounds are far apart. Otherwise, a
+:class:`~collections.Counter` is used.
+
 1. Thomas Weise, Zhize Wu, Xinlu Li, and Yan Chen. Frequency Fitness
    Assignment: Making Optimization Algorithms Invariant under Bijective
    Transformations of the Objective Function Value. *IEEE Transactions on
@@ -52,13 +58,12 @@ at mu=lambda=1.
 from collections import Counter
 from typing import Final, cast
 
-import numpy as np
 from numpy.random import Generator
 
+from moptipy.algorithms.so.ffa_h import FrequencyTable
 from moptipy.algorithms.so.fitness import Fitness, FRecord
 from moptipy.api.objective import Objective, check_objective
 from moptipy.utils.logger import KeyValueLogSection
-from moptipy.utils.nputils import DEFAULT_UNSIGNED_INT
 
 
 class FFA(Fitness):
@@ -74,12 +79,11 @@ class FFA(Fitness):
         if f.is_always_integer():
             lb: Final[int | float] = f.lower_bound()
             ub: Final[int | float] = f.upper_bound()
-            if isinstance(ub, int) and isinstance(lb, int) \
-                    and ((ub - lb) <= 100_000_000):
-                if 0 <= lb <= 10_000_000:
-                    return _IntFFA1.__new__(_IntFFA1, cast(int, ub))
-                return _IntFFA2.__new__(_IntFFA2, cast(int, lb),
-                                        cast(int, ub))
+            if isinstance(ub, int) and isinstance(lb, int) and (
+                    -9_223_372_036_854_775_808 <= lb <= ub
+                    <= 9_223_372_036_854_775_807):
+                return _IntFFA.__new__(_IntFFA, cast(int, lb),
+                                       cast(int, ub))
         return _DictFFA.__new__(_DictFFA)
 
     def __str__(self):
@@ -92,73 +96,16 @@ class FFA(Fitness):
         return "ffa"
 
 
-class _IntFFA1(FFA):
-    """The internal FFA-based class."""
-
-    #: the internal frequency table
-    __h: np.ndarray
-
-    def __new__(cls, ub: int) -> "_IntFFA1":
-        """Initialize the pure integer FFA."""
-        instance = object.__new__(_IntFFA1)
-        instance.__h = np.zeros(ub + 1, dtype=DEFAULT_UNSIGNED_INT)
-        return instance
-
-    def assign_fitness(self, p: list[FRecord], random: Generator) -> None:
-        """
-        Assign the frequency fitness.
-
-        :param p: the list of records
-        :param random: ignored
-        """
-        h: Final[np.ndarray] = self.__h
-        min_it: int = 9_223_372_036_854_775_808  # the minimum iteration index
-        max_it: int = -1  # the maximum iteration index
-        for r in p:
-            it: int = r.it  # get iteration index from record
-            if it < min_it:  # update minimum iteration index
-                min_it = it
-            if it > max_it:  # update maximum iteration index
-                max_it = it
-        if max_it <= 0:  # in the first iteration, all elements get the
-            for r in p:  # same fitness: 0
-                r.fitness = 0
-            return
-        for r in p:
-            h[r.f] += 1  # type: ignore
-        it_range: Final[int] = max_it - min_it + 1  # range of it index
-        for r in p:
-            r.fitness = ((int(h[r.f]) * it_range)  # type: ignore
-                         + max_it - r.it)
-
-    def log_parameters_to(self, logger: KeyValueLogSection) -> None:
-        """
-        Log all parameters of this component as key-value pairs.
-
-        :param logger: the logger for the parameters
-        """
-        super().log_parameters_to(logger)
-        logger.key_value("ub", len(self.__h) - 1)
-
-    def initialize(self) -> None:
-        """Initialize the algorithm."""
-        super().initialize()
-        self.__h.fill(0)
-
-
-class _IntFFA2(FFA):
+class _IntFFA(FFA):
     """The internal FFA-based class."""
 
     #: the internal frequency table
-    __h: np.ndarray
-    #: the lower bound
-    __lb: int
+    __h: FrequencyTable
 
-    def __new__(cls, lb: int, ub: int) -> "_IntFFA2":
+    def __new__(cls, lb: int, ub: int) -> "_IntFFA":
         """Initialize the pure integer FFA."""
-        instance = object.__new__(_IntFFA2)
-        instance.__h = np.zeros(ub - lb + 1, dtype=DEFAULT_UNSIGNED_INT)
-        instance.__lb = lb
+        instance = object.__new__(_IntFFA)
+        instance.__h = FrequencyTable(lb, ub)
         return instance
 
     def assign_fitness(self, p: list[FRecord], random: Generator) -> None:
@@ -168,8 +115,7 @@ class _IntFFA2(FFA):
         :param p: the list of records
         :param random: ignored
         """
-        h: Final[np.ndarray] = self.__h
-        lb: Final[int] = self.__lb
+        h: Final[FrequencyTable] = self.__h
 
         min_it: int = 9_223_372_036_854_775_808  # the minimum iteration index
         max_it: int = -1  # the maximum iteration index
@@ -184,10 +130,10 @@ class _IntFFA2(FFA):
                 r.fitness = 0
             return
         for r in p:
-            h[r.f - lb] += 1  # type: ignore
+            h.add(r.f)  # type: ignore
         it_range: Final[int] = max_it - min_it + 1  # range of it index
         for r in p:
-            r.fitness = ((int(h[r.f - lb]) * it_range)  # type: ignore
+            r.fitness = ((h.get(r.f) * it_range)  # type: ignore
                          + max_it - r.it)
 
     def log_parameters_to(self, logger: KeyValueLogSection) -> None:
@@ -197,13 +143,13 @@ class _IntFFA2(FFA):
         :param logger: the logger for the parameters
         """
         super().log_parameters_to(logger)
-        logger.key_value("lb", self.__lb)
-        logger.key_value("ub", len(self.__h) + self.__lb - 1)
+        logger.key_value("lb", self.__h.lb)
+        logger.key_value("ub", self.__h.ub)
 
     def initialize(self) -> None:
         """Initialize the algorithm."""
         super().initialize()
-        self.__h.fill(0)
+        self.__h.clear()
 
 
 class _DictFFA(FFA):
@@ -79,7 +79,7 @@ class SimulatedAnnealing(Algorithm1):
         random: Final[Generator] = process.get_random()
 
         # Put function references in variables to for faster calls.
-        temperature: Final[Callable[[int], float]] = self.schedule.temperature
+        step: Final[Callable[[float, int], float]] = self.schedule.step
         r01: Final[Callable[[], float]] = random.random  # random from [0, 1)
         evaluate: Final[Callable] = process.evaluate  # the objective
         op1: Final[Callable] = self.op1.op1  # the unary operator
@@ -89,14 +89,16 @@ class SimulatedAnnealing(Algorithm1):
         self.op0.op0(random, best_x)  # Create 1 solution randomly and
         best_f: int | float = evaluate(best_x)  # evaluate it.
         tau: int = 0  # The iteration index, needs to be 0 at first cmp.
+        temp: float = self.schedule.temperature(0)  # The temperature at tau.
 
         while not should_terminate():  # Until we need to quit...
             op1(random, new_x, best_x)  # new_x = neighbor of best_x
             new_f: int | float = evaluate(new_x)
             if (new_f <= best_f) or (  # Accept if <= or if SA criterion
-                    r01() < exp((best_f - new_f) / temperature(tau))):
+                    r01() < exp((best_f - new_f) / temp)):
                 best_f = new_f  # Store its objective value.
                 best_x, new_x = new_x, best_x  # Swap best and new.
+            temp = step(temp, tau)  # Update the temperature.
             tau = tau + 1  # Step the iteration index.
 # end book
 
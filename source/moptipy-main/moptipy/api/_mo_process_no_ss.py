@@ -201,6 +201,11 @@ class _MOProcessNoSS(MOProcess, _ProcessBase):
         raise ValueError(
             "register is not supported in multi-objective optimization")
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        raise ValueError("register_block is not supported in "
+                         "multi-objective optimization")
+
     def get_archive(self) -> list[MORecord]:
         return self._archive[0:self._archive_size]
 
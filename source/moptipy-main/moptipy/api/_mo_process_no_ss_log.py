@@ -109,6 +109,9 @@ class _MOProcessNoSSLog(_MOProcessNoSS):
 
         return result
 
+    def logs_all_fes(self) -> bool:
+        return self.__log_all
+
     def _check_timing(self) -> None:
         super()._check_timing()
         _check_log_time(self._start_time_nanos, self._current_time_nanos,
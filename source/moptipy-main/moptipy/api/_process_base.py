@@ -1,17 +1,20 @@
 """An internal module with the base class for implementing Processes."""
 import os
+import pickle  # nosec
 from io import StringIO
 from math import inf, isfinite
 from threading import Lock, Timer
 from time import time_ns
 from traceback import print_tb
-from typing import Any, Callable, Final, cast
+from typing import Any, Callable, Final, Iterable, Sequence, cast
 
+import numpy as np
 from numpy.random import Generator
 
 from moptipy.api.algorithm import Algorithm, check_algorithm
 from moptipy.api.logging import (
     _ALL_SECTIONS,
+    BINARY_SUFFIX,
     KEY_BEST_F,
     KEY_EXCEPTION_STACK_TRACE,
     KEY_EXCEPTION_TYPE,
@@ -49,6 +52,7 @@ from moptipy.api.process import (
     check_max_time_millis,
 )
 from moptipy.api.space import Space, check_space
+from moptipy.utils.binary_logger import BinaryLogger
 from moptipy.utils.logger import (
     SECTION_END,
     SECTION_START,
@@ -63,7 +67,7 @@ from moptipy.utils.nputils import (
 )
 from moptipy.utils.path import Path
 from moptipy.utils.sys_info import log_sys_info
-from moptipy.utils.types import type_error, type_name_of
+from moptipy.utils.types import check_int_range, type_error, type_name_of
 
 
 def _error_1(logger: Logger, title: str, exception_type,
@@ -181,7 +185,11 @@ class _ProcessBase(Process):
                  rand_seed: int | None = None,
                  max_fes: int | None = None,
                  max_time_millis: int | None = None,
-                 goal_f: int | float | None = None) -> None:
+                 goal_f: int | float | None = None,
+                 checkpoint_file: Path | None = None,
+                 checkpoint_interval_millis: int = 600_000,
+                 binary_log: bool = False,
+                 text_log: bool = True) -> None:
         """
         Perform the internal initialization. Do not call directly.
 
@@ -194,6 +202,13 @@ class _ProcessBase(Process):
         :param max_time_millis: the maximum runtime in milliseconds
         :param goal_f: the goal objective value. if it is reached, the process
             is terminated
+        :param checkpoint_file: the optional checkpoint file; if it exists,
+            the run is resumed from it
+        :param checkpoint_interval_millis: the milliseconds between two
+            checkpoints
+        :param binary_log: should a binary log be written next to the log
+            file?
+        :param text_log: should the text log file be written?
         """
         super().__init__()
         #: This will be `True` after :meth:`terminate` has been called.
@@ -237,6 +252,27 @@ class _ProcessBase(Process):
             else rand_seed_check(rand_seed)
         #: The random number generator.
         self.__random: Final[Generator] = rand_generator(self.__rand_seed)
+        if (checkpoint_file is not None) and \
+                (not isinstance(checkpoint_file, Path)):
+            raise type_error(checkpoint_file, "checkpoint_file", Path)
+        #: The checkpoint file, or `None` if no checkpoints are written.
+        self.__checkpoint_file: Final[Path | None] = checkpoint_file
+        #: The file next to the checkpoint file holding the spilled log.
+        self._checkpoint_log: Final[str | None] = None \
+            if checkpoint_file is None else checkpoint_file + ".log"
+        #: The nanoseconds between two checkpoints.
+        self.__checkpoint_interval: Final[int] = 1_000_000 * check_int_range(
+            checkpoint_interval_millis, "checkpoint_interval_millis",
+            1, 100_000_000_000)
+        #: The state of the run to be resumed, or `None`.
+        self.__resumed: Final[dict[str, Any] | None] = None \
+            if (checkpoint_file is None) or (not os.path.isfile(
+                checkpoint_file)) else _load_checkpoint(checkpoint_file)
+        if (self.__resumed is not None) and \
+                (self.__resumed["seed"] != self.__rand_seed):
+            raise ValueError(
+                f"Checkpoint {checkpoint_file!r} belongs to seed "
+                f"{self.__resumed['seed']}, not to {self.__rand_seed}.")
         #: The current best solution.
         self._current_best_y = solution_space.create()
         #: The current best objective value
@@ -245,6 +281,18 @@ class _ProcessBase(Process):
         if (log_file is not None) and (not isinstance(log_file, Path)):
             raise type_error(log_file, "log_file", Path)
         self.__log_file: Final[Path | None] = log_file
+        if not isinstance(binary_log, bool):
+            raise type_error(binary_log, "binary_log", bool)
+        if not isinstance(text_log, bool):
+            raise type_error(text_log, "text_log", bool)
+        if not (binary_log or text_log):
+            raise ValueError("Either a binary or a text log must be written.")
+        #: The binary log file, or `None` if no binary log is written.
+        self.__binary_log_file: Final[Path | None] = None \
+            if (log_file is None) or (not binary_log) \
+            else Path.path(log_file + BINARY_SUFFIX)
+        #: Should the text log file be written?
+        self.__text_log: Final[bool] = text_log
         #: the method for copying y
         self._copy_y: Final[Callable] = solution_space.copy
         #: set up the method forwards
@@ -265,8 +313,13 @@ class _ProcessBase(Process):
         self.__sections: dict[str, str] | None = \
             None if log_file is None else {}
 
-        #: The time when the process was started, in nanoseconds.
-        self._start_time_nanos: Final[int] = _TIME_IN_NS()
+        #: The time when the process was started, in nanoseconds. If the run
+        #: is resumed, the time consumed before the checkpoint is included.
+        self._start_time_nanos: Final[int] = _TIME_IN_NS() - (
+            0 if self.__resumed is None else self.__resumed["elapsed"])
+        #: The time when the next checkpoint is due, in nanoseconds.
+        self.__next_checkpoint: int = \
+            _TIME_IN_NS() + self.__checkpoint_interval
         #: The maximum runtime in milliseconds.
         self._max_time_millis: Final[int | None] = \
             check_max_time_millis(max_time_millis, True)
@@ -281,7 +334,9 @@ class _ProcessBase(Process):
         #: The timer until the end-of-run, or `None` if there is no end time.
         self.__timer: Final[Timer | None] = None \
             if (self._max_time_millis is None) else \
-            Timer(interval=self._max_time_millis / 1_000.0,
+            Timer(interval=max(0.0, self._max_time_millis / 1_000.0 - (
+                0 if self.__resumed is None else
+                self.__resumed["elapsed"] / 1_000_000_000.0)),
                   function=self.terminate)
 
         #: an internal base exception caught by the algorithm execution
@@ -292,7 +347,10 @@ class _ProcessBase(Process):
         Finish initialization, start timer for termination if needed.
 
         Internal method that must be called after __init__ is completed.
+        If the run is resumed from a checkpoint, its state is restored here.
         """
+        if self.__resumed is not None:
+            self._restore(self.__resumed)
         if self.__timer is not None:
             self.__timer.start()
 
@@ -358,6 +416,59 @@ class _ProcessBase(Process):
             del self.__timer
             self._current_time_nanos = _TIME_IN_NS()
 
+    def checkpoint(self, state: Callable[[], Any]) -> None:
+        if (self.__checkpoint_file is None) or self._terminated:
+            return
+        now: Final[int] = _TIME_IN_NS()
+        if now < self.__next_checkpoint:
+            return
+        data: Final[dict[str, Any]] = self._save(now)
+        data["algorithm"] = state()
+        temp: Final[str] = self.__checkpoint_file + ".tmp"
+        with open(temp, "wb") as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, self.__checkpoint_file)  # atomically replace old
+        self.__next_checkpoint = _TIME_IN_NS() + self.__checkpoint_interval
+
+    def get_resumed_state(self) -> Any:
+        return None if self.__resumed is None else self.__resumed["algorithm"]
+
+    def _save(self, now: int) -> dict[str, Any]:
+        """
+        Collect the state of this process for a checkpoint.
+
+        All time stamps are stored relative to the start time.
+
+        :param now: the current time in nanoseconds
+        :returns: the state of this process
+        """
+        return {"seed": self.__rand_seed,
+                "elapsed": now - self._start_time_nanos,
+                "fes": self._current_fes,
+                "best_f": self._current_best_f,
+                "best_y": self._current_best_y,
+                "last_improvement_fe": self._last_improvement_fe,
+                "last_improvement_time": -1
+                if self._last_improvement_time_nanos < 0 else
+                self._last_improvement_time_nanos - self._start_time_nanos,
+                "random": self.__random.bit_generator.state}
+
+    def _restore(self, state: dict[str, Any]) -> None:
+        """
+        Restore the state of this process from a checkpoint.
+
+        :param state: the state, as created by :meth:`_save`
+        """
+        self._current_fes = state["fes"]
+        self._current_best_f = state["best_f"]
+        self._copy_y(self._current_best_y, state["best_y"])
+        self._last_improvement_fe = state["last_improvement_fe"]
+        if state["last_improvement_time"] >= 0:
+            self._last_improvement_time_nanos = \
+                state["last_improvement_time"] + self._start_time_nanos
+        self._current_time_nanos = state["elapsed"] + self._start_time_nanos
+        self.__random.bit_generator.state = state["random"]
+
     def get_copy_of_best_y(self, y) -> None:
         """
         Get a copy of the current best point in the solution space.
@@ -556,7 +667,11 @@ class _ProcessBase(Process):
             t_error = be
 
         if self.__log_file is not None:
-            with FileLogger(self.__log_file) as logger:
+            with (FileLogger(self.__log_file)
+                  if self.__binary_log_file is None else
+                  BinaryLogger(self.__binary_log_file,
+                               self.__log_file if self.__text_log
+                               else None)) as logger:
                 try:
                     self._write_log(logger)
                 except Exception as be:
@@ -585,6 +700,13 @@ class _ProcessBase(Process):
                         sec.write(self.__sections[t])
                 del self.__sections
 
+        if (self.__checkpoint_file is not None) and (not exception_type) \
+                and (self._caught is None) \
+                and os.path.isfile(self.__checkpoint_file):
+            os.remove(self.__checkpoint_file)  # the run is complete
+            if os.path.isfile(self._checkpoint_log):
+                os.remove(self._checkpoint_log)
+
         if not exception_type:
             # if no error happened when closing the process, raise any error
             # caught during validation.
@@ -610,8 +732,113 @@ class _ProcessBase(Process):
         return "baseProcess"
 
 
+def _load_checkpoint(checkpoint_file: Path) -> dict[str, Any]:
+    """
+    Load the state of a run from a checkpoint file.
+
+    :param checkpoint_file: the checkpoint file
+    :returns: the state of the run
+    """
+    with open(checkpoint_file, "rb") as f:
+        state: Final = pickle.load(f)  # nosec
+    if not isinstance(state, dict):
+        raise type_error(state, f"checkpoint {checkpoint_file!r}", dict)
+    return state
+
+
+def _scan_block(
+        start_fe: int, n_fes: int, end_fes: int, best_f: int | float,
+        end_f: int | float, f: int | float, trace: np.ndarray | None,
+        ctn: int,
+        log_append: Callable[[int, int, int | float], None] | None = None,
+        log_all: bool = False) -> tuple[int, int]:
+    """
+    Scan a block of FEs handed in via `register_block`.
+
+    This function finds the FE at which the block is cut off by the FE limit
+    or by reaching the goal objective value and the FE of the last credited
+    improvement. If a log is kept, the improvements (or, if `log_all`, all
+    entries of `trace`) up to the cut-off are appended to it.
+
+    :param start_fe: the FEs consumed before the block
+    :param n_fes: the number of FEs in the block
+    :param end_fes: the maximum FEs
+    :param best_f: the best-so-far objective value before the block
+    :param end_f: the goal objective value
+    :param f: the best objective value of the block
+    :param trace: the `(fe, f)` trace of the block, or `None`
+    :param ctn: the current time in nanoseconds
+    :param log_append: the log appender, or `None` if no log is kept
+    :param log_all: should all FEs of the trace be logged?
+    :returns: a tuple of the consumed FEs after the block and the FE of the
+        last improvement in the block (or `-1` if there was none)
+    :raises ValueError: if `n_fes` is not positive or the best improvement
+        credited from the block does not have objective value `f`
+
+    >>> _scan_block(10, 5, 100, 7, 0, 6, None, 0)
+    (15, 15)
+    >>> _scan_block(10, 5, 12, 7, 0, 6, None, 0)
+    (12, -1)
+    >>> _scan_block(10, 5, 100, 7, 0, 6, np.array([[2, 8], [3, 6]]), 0)
+    (15, 13)
+    >>> _scan_block(10, 5, 100, 7, 6, 6, np.array([[2, 6]]), 0)
+    (12, 12)
+    >>> l = []
+    >>> _scan_block(0, 5, 100, 7, 0, 5, np.array([[2, 8], [3, 6], [4, 5]]),
+    ...             9, lambda *r: l.append(r), True)
+    (5, 4)
+    >>> print(l)
+    [(2, 9, 8), (3, 9, 6), (4, 9, 5)]
+    >>> l.clear()
+    >>> try:
+    ...     _scan_block(0, 3, 100, 7, 0, 4, np.array([[1, 6], [2, 5]]), 9,
+    ...                 lambda *r: l.append(r), True)
+    ... except ValueError as ve:
+    ...     print(l)
+    []
+    """
+    if n_fes <= 0:
+        raise ValueError(f"n_fes must be positive, but is {n_fes}.")
+    last_fe: int = start_fe + n_fes
+    if last_fe > end_fes:
+        last_fe = end_fes
+    improved_fe: int = -1
+    # the `(fe, f, improved)` entries that may go into the log
+    entries: Final[list[tuple[int, int | float, bool]]] = []
+    if trace is None:
+        if last_fe >= start_fe + n_fes:
+            if f < best_f:
+                best_f = f
+                improved_fe = last_fe
+            entries.append((last_fe, f, improved_fe >= 0))
+    else:
+        for row in trace.tolist():
+            fe: int = start_fe + int(row[0])
+            if fe > last_fe:
+                break
+            ff: int | float = row[1]
+            if ff < best_f:
+                best_f = ff
+                improved_fe = fe
+                entries.append((fe, ff, True))
+                if ff <= end_f:
+                    last_fe = fe
+                    break
+            else:
+                entries.append((fe, ff, False))
+    if (improved_fe >= 0) and (best_f != f):
+        raise ValueError(
+            f"The best objective value credited from the block is {best_f},"
+            f" but the best solution was registered with f={f}.")
+    if log_append is not None:  # only log after the block was validated
+        for fe, ff, improved in entries:
+            if improved or log_all:
+                log_append(fe, ctn, ff)
+    return last_fe, improved_fe
+
+
 def _check_log_time(start_time: int, current_time: int,
-                    log: list[list]) -> None:
+                    log: Iterable[Sequence]) -> None:
     """
     Check the time inside the log.
 
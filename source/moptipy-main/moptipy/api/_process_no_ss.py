@@ -1,7 +1,15 @@
 """Providing a process without explicit logging with a single space."""
-from typing import Final, cast
+from typing import Final
 
-from moptipy.api._process_base import _TIME_IN_NS, _ns_to_ms, _ProcessBase
+import numpy as np
+
+from moptipy.api._process_base import (
+    _TIME_IN_NS,
+    _ns_to_ms,
+    _ProcessBase,
+    _scan_block,
+)
+from moptipy.api._progress_log import _ProgressLog
 from moptipy.api.logging import (
     PROGRESS_CURRENT_F,
     PROGRESS_FES,
@@ -64,25 +72,51 @@ class _ProcessNoSS(_ProcessBase):
         if do_term:
             self.terminate()
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        if self._terminated:
+            if self._knows_that_terminated:
+                raise ValueError("The process has been terminated and "
+                                 "the algorithm knows it.")
+            return 0
+
+        self._current_time_nanos = ctn = _TIME_IN_NS()
+        current_fes, improved_fe = _scan_block(
+            self._current_fes, n_fes, self._end_fes, self._current_best_f,
+            self._end_f, f, trace, ctn)
+        self._current_fes = current_fes
+        do_term: bool = current_fes >= self._end_fes
+
+        if improved_fe > 0:
+            self._last_improvement_fe = improved_fe
+            self._current_best_f = f
+            self._last_improvement_time_nanos = ctn
+            do_term = do_term or (f <= self._end_f)
+            self._copy_y(self._current_best_y, x)
+
+        if do_term:
+            self.terminate()
+            return 0
+        return self._end_fes - current_fes
+
     def __str__(self) -> str:
         return "ProcessWithoutSearchSpace"
 
 
-def _write_log(log: list[list[int | float]],
+def _write_log(log: _ProgressLog,
                start_time: int,
                logger: Logger) -> None:
     """
     Write the log to a logger.
 
-    :param log: the log
+    :param log: the log, streamed chunk by chunk into the CSV
     :param start_time: the start time
     :param logger: the logger
     """
     if len(log) > 0:
-        with logger.csv(SECTION_PROGRESS,
-                        [PROGRESS_FES,
-                         PROGRESS_TIME_MILLIS,
-                         PROGRESS_CURRENT_F]) as csv:
-            for row in log:
-                csv.row([row[0], _ns_to_ms(cast(int, row[1]) - start_time),
-                         row[2]])
+        logger.csv_columns(SECTION_PROGRESS,
+                           [PROGRESS_FES,
+                            PROGRESS_TIME_MILLIS,
+                            PROGRESS_CURRENT_F],
+                           ((fes, _ns_to_ms(times - start_time), fs)
+                            for fes, times, fs in log.chunks()))
@@ -1,8 +1,11 @@
 """A process with logging, where search and solution space are the same."""
-from typing import Final
+from typing import Any, Final
 
-from moptipy.api._process_base import _TIME_IN_NS, _check_log_time
+import numpy as np
+
+from moptipy.api._process_base import _TIME_IN_NS, _check_log_time, _scan_block
 from moptipy.api._process_no_ss import _ProcessNoSS, _write_log
+from moptipy.api._progress_log import _ProgressLog
 from moptipy.api.algorithm import Algorithm
 from moptipy.api.objective import Objective
 from moptipy.api.space import Space
@@ -23,7 +26,11 @@ class _ProcessNoSSLog(_ProcessNoSS):
                  max_fes: int | None = None,
                  max_time_millis: int | None = None,
                  goal_f: int | float | None = None,
-                 log_all_fes: bool = False) -> None:
+                 log_all_fes: bool = False,
+                 checkpoint_file: Path | None = None,
+                 checkpoint_interval_millis: int = 600_000,
+                 binary_log: bool = False,
+                 text_log: bool = True) -> None:
         """
         Perform the internal initialization. Do not call directly.
 
@@ -37,6 +44,12 @@ class _ProcessNoSSLog(_ProcessNoSS):
         :param goal_f: the goal objective value. if it is reached, the process
             is terminated
         :param log_all_fes: should we log all FEs?
+        :param checkpoint_file: the optional checkpoint file
+        :param checkpoint_interval_millis: the milliseconds between two
+            checkpoints
+        :param binary_log: should a binary log be written next to the log
+            file?
+        :param text_log: should the text log file be written?
         """
         super().__init__(solution_space=solution_space,
                          objective=objective,
@@ -45,7 +58,11 @@ class _ProcessNoSSLog(_ProcessNoSS):
                          rand_seed=rand_seed,
                          max_fes=max_fes,
                          max_time_millis=max_time_millis,
-                         goal_f=goal_f)
+                         goal_f=goal_f,
+                         checkpoint_file=checkpoint_file,
+                         checkpoint_interval_millis=checkpoint_interval_millis,
+                         binary_log=binary_log,
+                         text_log=text_log)
         if not isinstance(log_file, str):
             raise type_error(log_file, "log_file", str)
         if not isinstance(log_all_fes, bool):
@@ -53,8 +70,9 @@ class _ProcessNoSSLog(_ProcessNoSS):
 
         #: `True` if all FEs are logged, `False` to only log improvements.
         self.__log_all: Final[bool] = log_all_fes
-        #: The in-memory log
-        self.__log: list[list[int | float]] = []
+        #: The memory-bounded log
+        self.__log: Final[_ProgressLog] = _ProgressLog(
+            objective.is_always_integer())
         #: the quick access to the log appending method
         self.__log_append = self.__log.append
 
@@ -83,7 +101,7 @@ class _ProcessNoSSLog(_ProcessNoSS):
         if do_log:
             if ctn <= 0:
                 self._current_time_nanos = ctn = _TIME_IN_NS()
-            self.__log_append([current_fes, ctn, result])
+            self.__log_append(current_fes, ctn, result)
 
         if do_term:
             self.terminate()
@@ -114,11 +132,52 @@ class _ProcessNoSSLog(_ProcessNoSS):
         if do_log:
             if ctn <= 0:
                 self._current_time_nanos = ctn = _TIME_IN_NS()
-            self.__log_append([current_fes, ctn, f])
+            self.__log_append(current_fes, ctn, f)
 
         if do_term:
             self.terminate()
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        if self._terminated:
+            if self._knows_that_terminated:
+                raise ValueError("The process has been terminated and "
+                                 "the algorithm knows it.")
+            return 0
+
+        self._current_time_nanos = ctn = _TIME_IN_NS()
+        current_fes, improved_fe = _scan_block(
+            self._current_fes, n_fes, self._end_fes, self._current_best_f,
+            self._end_f, f, trace, ctn, self.__log_append, self.__log_all)
+        self._current_fes = current_fes
+        do_term: bool = current_fes >= self._end_fes
+
+        if improved_fe > 0:
+            self._last_improvement_fe = improved_fe
+            self._current_best_f = f
+            self._last_improvement_time_nanos = ctn
+            do_term = do_term or (f <= self._end_f)
+            self._copy_y(self._current_best_y, x)
+
+        if do_term:
+            self.terminate()
+            return 0
+        return self._end_fes - current_fes
+
+    def logs_all_fes(self) -> bool:
+        return self.__log_all
+
+    def _save(self, now: int) -> dict[str, Any]:
+        state: Final[dict[str, Any]] = super()._save(now)
+        state["log"] = self.__log.save(self._checkpoint_log,
+                                       self._start_time_nanos)
+        return state
+
+    def _restore(self, state: dict[str, Any]) -> None:
+        super()._restore(state)
+        self.__log.restore(self._checkpoint_log, state["log"],
+                           self._start_time_nanos)
+
     def _check_timing(self) -> None:
         super()._check_timing()
         _check_log_time(self._start_time_nanos, self._current_time_nanos,
@@ -126,7 +185,7 @@ class _ProcessNoSSLog(_ProcessNoSS):
 
     def _write_log(self, logger: Logger) -> None:
         _write_log(self.__log, self._start_time_nanos, logger)
-        del self.__log
+        self.__log.close()
         super()._write_log(logger)
 
     def __str__(self) -> str:
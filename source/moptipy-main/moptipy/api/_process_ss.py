@@ -1,7 +1,9 @@
 """An implementation of processes with different search and solution spaces."""
-from typing import Callable, Final
+from typing import Any, Callable, Final
 
-from moptipy.api._process_base import _TIME_IN_NS
+import numpy as np
+
+from moptipy.api._process_base import _TIME_IN_NS, _scan_block
 from moptipy.api._process_no_ss import _ProcessNoSS
 from moptipy.api.algorithm import Algorithm
 from moptipy.api.encoding import Encoding, check_encoding
@@ -29,7 +31,11 @@ class _ProcessSS(_ProcessNoSS):
                  rand_seed: int | None = None,
                  max_fes: int | None = None,
                  max_time_millis: int | None = None,
-                 goal_f: int | float | None = None) -> None:
+                 goal_f: int | float | None = None,
+                 checkpoint_file: Path | None = None,
+                 checkpoint_interval_millis: int = 600_000,
+                 binary_log: bool = False,
+                 text_log: bool = True) -> None:
         """
         Perform the internal initialization. Do not call directly.
 
@@ -44,6 +50,12 @@ class _ProcessSS(_ProcessNoSS):
         :param max_time_millis: the maximum runtime in milliseconds
         :param goal_f: the goal objective value. if it is reached, the
             process is terminated
+        :param checkpoint_file: the optional checkpoint file
+        :param checkpoint_interval_millis: the milliseconds between two
+            checkpoints
+        :param binary_log: should a binary log be written next to the log
+            file?
+        :param text_log: should the text log file be written?
         """
         super().__init__(solution_space=solution_space,
                          objective=objective,
@@ -52,7 +64,11 @@ class _ProcessSS(_ProcessNoSS):
                          rand_seed=rand_seed,
                          max_fes=max_fes,
                          max_time_millis=max_time_millis,
-                         goal_f=goal_f)
+                         goal_f=goal_f,
+                         checkpoint_file=checkpoint_file,
+                         checkpoint_interval_millis=checkpoint_interval_millis,
+                         binary_log=binary_log,
+                         text_log=text_log)
 
         #: The search space.
         self._search_space: Final[Space] = check_space(search_space)
@@ -126,11 +142,51 @@ class _ProcessSS(_ProcessNoSS):
         if do_term:
             self.terminate()
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        if self._terminated:
+            if self._knows_that_terminated:
+                raise ValueError("The process has been terminated and the "
+                                 "algorithm knows it.")
+            return 0
+
+        self._current_time_nanos = ctn = _TIME_IN_NS()
+        current_fes, improved_fe = _scan_block(
+            self._current_fes, n_fes, self._end_fes, self._current_best_f,
+            self._end_f, f, trace, ctn)
+        self._current_fes = current_fes
+        do_term: bool = current_fes >= self._end_fes
+
+        if improved_fe > 0:
+            self._last_improvement_fe = improved_fe
+            self._current_best_f = f
+            self.copy(self._current_best_x, x)
+            current_y: Final = self._current_y
+            self._g(x, current_y)
+            self._current_y = self._current_best_y
+            self._current_best_y = current_y
+            self._last_improvement_time_nanos = ctn
+            do_term = do_term or (f <= self._end_f)
+
+        if do_term:
+            self.terminate()
+            return 0
+        return self._end_fes - current_fes
+
     def get_copy_of_best_x(self, x) -> None:
         if self._current_fes > 0:
             return self.copy(x, self._current_best_x)
         raise ValueError("No current best x available.")
 
+    def _save(self, now: int) -> dict[str, Any]:
+        state: Final[dict[str, Any]] = super()._save(now)
+        state["best_x"] = self._current_best_x
+        return state
+
+    def _restore(self, state: dict[str, Any]) -> None:
+        super()._restore(state)
+        self.copy(self._current_best_x, state["best_x"])
+
     def get_copy_of_best_y(self, y) -> None:
         if self._current_fes > 0:
             return self._copy_y(y, self._current_best_y)
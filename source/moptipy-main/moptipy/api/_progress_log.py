@@ -0,0 +1,276 @@
+"""
+An internal module with a memory-bounded log of the progress of a run.
+
+If all FEs or many improvements of a long run are logged, keeping one Python
+list per log entry in memory until the end of the run can exhaust the
+memory. A :class:`_ProgressLog` instead stores the entries in preallocated
+:mod:`numpy` arrays of fixed size. Whenever a chunk of arrays is full, it is
+handed to a background thread that appends it to a temporary file, and a
+fresh chunk is allocated. At the end of the run, the entries are streamed
+back from the file into the `PROGRESS` section of the log. The memory used
+by the log is therefore bounded by a few chunks, regardless of the length of
+the run. For checkpoints, only the chunks spilled since the last checkpoint
+are copied to a file next to the checkpoint.
+
+>>> log = _ProgressLog(True, 2)
+>>> for i in range(5):
+...     log.append(i, 10 * i, 100 - i)
+>>> len(log)
+5
+>>> list(log)
+[(0, 0, 100), (1, 10, 99), (2, 20, 98), (3, 30, 97), (4, 40, 96)]
+>>> log.close()
+"""
+from queue import Queue
+from tempfile import TemporaryFile
+from threading import Thread
+from typing import IO, Final, Iterator
+
+import numpy as np
+
+from moptipy.utils.types import check_int_range
+
+#: the default number of entries per chunk
+CHUNK_ENTRIES: Final[int] = 65_536
+
+
+class _ProgressLog:
+    """A log of `(fe, time_ns, f)` entries stored in fixed-size chunks."""
+
+    def __init__(self, is_int: bool, chunk_entries: int = CHUNK_ENTRIES) \
+            -> None:
+        """
+        Create the progress log.
+
+        :param is_int: are all objective values integers?
+        :param chunk_entries: the number of entries per chunk
+        """
+        #: the number of entries per chunk
+        self.__chunk: Final[int] = check_int_range(
+            chunk_entries, "chunk_entries", 1, 1_000_000_000)
+        #: the data type of the objective values
+        self.__f_type: Final[type] = np.int64 if is_int else np.float64
+        #: the FEs of the current chunk
+        self.__fes: np.ndarray = np.empty(self.__chunk, np.int64)
+        #: the times of the current chunk
+        self.__times: np.ndarray = np.empty(self.__chunk, np.int64)
+        #: the objective values of the current chunk
+        self.__fs: np.ndarray = np.empty(self.__chunk, self.__f_type)
+        #: the number of entries in the current chunk
+        self.__n: int = 0
+        #: the number of entries spilled to the temporary file
+        self.__spilled: int = 0
+        #: the number of spilled entries already saved for a checkpoint
+        self.__saved: int = 0
+        #: the bytes per spilled entry
+        self.__entry_bytes: Final[int] = 16 + np.dtype(self.__f_type).itemsize
+        #: the temporary file, created when the first chunk is spilled
+        self.__file: IO[bytes] | None = None
+        #: the queue of chunks to be written by the background thread
+        self.__queue: Queue | None = None
+        #: the background thread writing the chunks
+        self.__writer: Thread | None = None
+        #: an error caught by the background thread
+        self.__error: Exception | None = None
+
+    def append(self, fe: int, time: int, f: int | float) -> None:
+        """
+        Append an entry to the log.
+
+        :param fe: the FE
+        :param time: the time in nanoseconds
+        :param f: the objective value
+        """
+        n: int = self.__n
+        self.__fes[n] = fe
+        self.__times[n] = time
+        self.__fs[n] = f
+        n += 1
+        if n >= self.__chunk:
+            self.__spill()
+            n = 0
+        self.__n = n
+
+    def __spill(self) -> None:
+        """Hand the full chunk to the background writer."""
+        if self.__writer is None:
+            self.__file = TemporaryFile()  # noqa: SIM115
+            self.__queue = Queue(maxsize=2)  # at most two chunks are waiting
+            self.__writer = Thread(target=self.__write, daemon=True)
+            self.__writer.start()
+        self.__queue.put((self.__fes, self.__times, self.__fs))
+        self.__spilled += self.__chunk
+        self.__fes = np.empty(self.__chunk, np.int64)
+        self.__times = np.empty(self.__chunk, np.int64)
+        self.__fs = np.empty(self.__chunk, self.__f_type)
+
+    def __write(self) -> None:
+        """Write the chunks from the queue to the file until `None`."""
+        while True:
+            chunk = self.__queue.get()
+            try:
+                if chunk is None:
+                    return
+                if self.__error is None:
+                    for array in chunk:
+                        array.tofile(self.__file)
+            except Exception as be:
+                self.__error = be
+            finally:
+                self.__queue.task_done()
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the log.
+
+        :returns: the number of entries
+        """
+        return self.__spilled + self.__n
+
+    def chunks(self) -> Iterator[tuple[np.ndarray, np.ndarray,
+                                        np.ndarray]]:
+        """
+        Iterate over the chunks, streaming the spilled ones from the file.
+
+        :returns: an iterator over the arrays of FEs, times, and objective
+            values of the chunks
+        """
+        if self.__queue is not None:
+            self.__queue.join()  # wait until all chunks have been written
+            if self.__error is not None:
+                raise self.__error
+            file: Final[IO[bytes]] = self.__file
+            file.flush()
+            file.seek(0)
+            for _ in range(self.__spilled // self.__chunk):
+                yield (np.fromfile(file, np.int64, self.__chunk),
+                       np.fromfile(file, np.int64, self.__chunk),
+                       np.fromfile(file, self.__f_type, self.__chunk))
+            file.seek(0, 2)  # new chunks are appended at the end
+        n: Final[int] = self.__n
+        yield self.__fes[:n], self.__times[:n], self.__fs[:n]
+
+    def __iter__(self) -> Iterator[tuple[int, int, int | float]]:
+        """
+        Iterate over the entries.
+
+        :returns: an iterator over the `(fe, time_ns, f)` entries
+        """
+        for fes, times, fs in self.chunks():
+            yield from zip(fes.tolist(), times.tolist(), fs.tolist())
+
+    def save(self, path: str, start_time: int) \
+            -> tuple[int, int, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Save the log for a checkpoint.
+
+        The chunks spilled since the last call are appended to the file
+        `path`, so each chunk is copied only once. Only the entries of the
+        current chunk are returned, to be stored in the checkpoint itself.
+        All times are stored relative to the start time.
+
+        :param path: the file next to the checkpoint receiving the chunks
+        :param start_time: the start time in nanoseconds
+        :returns: the number of spilled entries, the chunk size, and the
+            arrays of the FEs, times, and objective values of the current
+            chunk
+
+        >>> from moptipy.utils.temp import TempFile
+        >>> log = _ProgressLog(False, 2)
+        >>> for i in range(3):
+        ...     log.append(i, i + 10, i / 2)
+        >>> with TempFile.create() as tf:
+        ...     state = log.save(tf, 10)
+        ...     log.close()
+        ...     log = _ProgressLog(False, 2)
+        ...     log.restore(tf, state, 100)
+        >>> state[0:2]
+        (2, 2)
+        >>> list(log)
+        [(0, 100, 0.0), (1, 101, 0.5), (2, 102, 1.0)]
+        >>> log.close()
+        """
+        saved: Final[int] = self.__saved
+        spilled: Final[int] = self.__spilled
+        with open(path, "ab" if saved > 0 else "wb") as out:
+            if spilled > saved:
+                self.__queue.join()  # wait until all chunks are written
+                if self.__error is not None:
+                    raise self.__error
+                file: Final[IO[bytes]] = self.__file
+                file.flush()
+                file.seek(saved * self.__entry_bytes)
+                for _ in range((spilled - saved) // self.__chunk):
+                    np.fromfile(file, np.int64, self.__chunk).tofile(out)
+                    (np.fromfile(file, np.int64, self.__chunk)
+                     - start_time).tofile(out)
+                    np.fromfile(file, self.__f_type, self.__chunk).tofile(
+                        out)
+                file.seek(0, 2)  # new chunks are appended at the end
+        self.__saved = spilled
+        n: Final[int] = self.__n
+        return (spilled, self.__chunk, self.__fes[:n].copy(),
+                self.__times[:n] - start_time, self.__fs[:n].copy())
+
+    def restore(self, path: str,
+                state: tuple[int, int, np.ndarray, np.ndarray, np.ndarray],
+                start_time: int) -> None:
+        """
+        Restore the log from a checkpoint into this empty log.
+
+        The chunks are streamed from the file `path` one by one. Chunks
+        appended to the file after the checkpoint was written are cut off.
+
+        :param path: the file next to the checkpoint holding the chunks
+        :param state: the state, as returned by :meth:`save`
+        :param start_time: the start time in nanoseconds
+        :raises ValueError: if the log is not empty or the chunk sizes differ
+        """
+        spilled, chunk, fes, times, fs = state
+        if len(self) != 0:
+            raise ValueError("Can only restore into an empty log.")
+        if chunk != self.__chunk:
+            raise ValueError(f"Cannot restore chunks of {chunk} entries "
+                             f"into chunks of {self.__chunk} entries.")
+        if spilled > 0:
+            with open(path, "r+b") as inp:
+                for _ in range(spilled // chunk):
+                    self.__extend(np.fromfile(inp, np.int64, chunk),
+                                  np.fromfile(inp, np.int64, chunk)
+                                  + start_time,
+                                  np.fromfile(inp, self.__f_type, chunk))
+                inp.truncate()  # drop chunks saved after the checkpoint
+        self.__extend(fes, times + start_time, fs)
+        self.__saved = spilled
+
+    def __extend(self, fes: np.ndarray, times: np.ndarray,
+                 fs: np.ndarray) -> None:
+        """
+        Append arrays of entries to the log.
+
+        :param fes: the FEs
+        :param times: the times in nanoseconds
+        :param fs: the objective values
+        """
+        start: int = 0
+        total: Final[int] = len(fes)
+        while start < total:
+            n: int = self.__n
+            end: int = start + min(self.__chunk - n, total - start)
+            self.__fes[n:n + end - start] = fes[start:end]
+            self.__times[n:n + end - start] = times[start:end]
+            self.__fs[n:n + end - start] = fs[start:end]
+            n += end - start
+            start = end
+            if n >= self.__chunk:
+                self.__spill()
+                n = 0
+            self.__n = n
+
+    def close(self) -> None:
+        """Stop the background writer and delete the temporary file."""
+        if self.__writer is not None:
+            self.__queue.put(None)
+            self.__writer.join()
+            self.__writer = None
+            self.__file.close()
@@ -0,0 +1,171 @@
+"""
+The cost model and progress tracking of scheduled experiments.
+
+If :func:`~moptipy.api.experiment.run_experiment` is asked to schedule its
+runs by cost, it creates one job per run, estimates how long each job will
+take, and lets the workers take the jobs longest-first from a central queue.
+This way, the long runs start early and do not end up being the last ones,
+which otherwise leaves all but one worker idle at the end of an experiment.
+
+The cost of a job is estimated as the time per FE of the algorithm on the
+instance times the FE budget of the run, capped by its time limit. The time
+per FE is taken from the log files of runs that have already been completed.
+If there are none for an algorithm-instance combination, it is extrapolated
+from the other instances based on the instance sizes, i.e., the dimensions
+of the search spaces.
+"""
+import os
+from math import inf, isfinite
+from time import monotonic_ns
+from typing import Final
+
+from moptipy.api.logging import FILE_SUFFIX
+from moptipy.evaluation.end_results import EndResult
+
+#: the FEs assumed for runs without FE limit and without time limit
+DEFAULT_FES: Final[int] = 1_000_000
+#: the milliseconds per FE and size unit assumed if nothing was measured
+DEFAULT_MILLIS_PER_FE: Final[float] = 1e-6
+
+
+def measured_speeds(base_dir: str) -> dict[tuple[str, str], float]:
+    """
+    Get the measured milliseconds per FE from the completed runs.
+
+    Log files that are empty, i.e., that belong to runs claimed but not yet
+    completed, or that cannot be parsed are ignored.
+
+    :param base_dir: the base directory of the experiment
+    :returns: a dictionary mapping algorithm-instance combinations to the
+        mean milliseconds per FE of their completed runs
+    """
+    sums: Final[dict[tuple[str, str], list[float]]] = {}
+
+    def __add(er: EndResult) -> None:
+        if er.total_fes > 0:
+            sums.setdefault((er.algorithm, er.instance), []).append(
+                er.total_time_millis / er.total_fes)
+
+    for root, _, files in os.walk(base_dir):
+        for file in files:
+            path = os.path.join(root, file)
+            if file.endswith(FILE_SUFFIX) and (os.path.getsize(path) > 0):
+                try:
+                    EndResult.from_logs(path, __add)
+                except (ValueError, TypeError):
+                    continue
+    return {k: sum(v) / len(v) for k, v in sums.items()}
+
+
+def estimate_costs(jobs: list[tuple[str, str, int, int | None, int | None]],
+                   speeds: dict[tuple[str, str], float]) -> list[float]:
+    """
+    Estimate the runtimes of jobs in milliseconds.
+
+    :param jobs: the jobs, each given as tuple of the algorithm name, the
+        instance name, the instance size, the maximum FEs, and the maximum
+        runtime in milliseconds
+    :param speeds: the measured milliseconds per FE, see
+        :func:`measured_speeds`
+    :returns: the estimated runtimes
+
+    >>> jobs = [("ea", "a", 10, 1000, None), ("ea", "b", 20, 1000, None),
+    ...         ("sa", "a", 10, 1000, 50), ("sa", "c", 30, None, None)]
+    >>> estimate_costs(jobs, {("ea", "a"): 0.5, ("sa", "a"): 0.1})
+    [500.0, 1000.0, 50, 300000.0]
+    >>> round(estimate_costs(jobs[:1], {})[0], 9)
+    0.01
+    """
+    sizes: Final[dict[str, int]] = {job[1]: job[2] for job in jobs}
+    per_size: Final[dict[str, list[float]]] = {}
+    for (algo, inst), speed in speeds.items():
+        if inst in sizes:
+            per_size.setdefault(algo, []).append(speed / max(1, sizes[inst]))
+    every: Final[list[float]] = [s for v in per_size.values() for s in v]
+    default: Final[float] = (sum(every) / len(every)) if len(every) > 0 \
+        else DEFAULT_MILLIS_PER_FE
+
+    result: Final[list[float]] = []
+    for algo, inst, size, max_fes, max_time_millis in jobs:
+        speed = speeds.get((algo, inst))
+        if speed is None:
+            mine = per_size.get(algo)
+            speed = max(1, size) * ((sum(mine) / len(mine)) if mine
+                                    else default)
+        cost: float = inf if max_fes is None else speed * max_fes
+        if max_time_millis is not None:
+            cost = min(cost, max_time_millis)
+        result.append(cost if isfinite(cost) else speed * DEFAULT_FES)
+    return result
+
+
+class Progress:
+    """
+    Track the progress of a scheduled experiment.
+
+    The remaining time is estimated by the remaining estimated cost,
+    corrected by the ratio of measured to estimated runtime of the jobs
+    completed so far, and divided by the number of workers.
+
+    >>> p = Progress(7_200_000.0, 4, 2)
+    >>> p.done(1_800_000.0, 3_600_000.0)
+    '1/4 jobs done, 0 skipped, est. time left: 1:30:00'
+    >>> p.done(1_800_000.0, None)
+    >>> p.done(1_800_000.0, 3_600_000.0)
+    >>> p.done(1_800_000.0, 3_600_000.0)
+    '4/4 jobs done, 1 skipped, est. time left: 0:00:00'
+    """
+
+    def __init__(self, total_cost: float, n_jobs: int, n_workers: int) -> None:
+        """
+        Create the progress tracker.
+
+        :param total_cost: the total estimated cost of all jobs
+        :param n_jobs: the number of jobs
+        :param n_workers: the number of workers
+        """
+        #: the estimated cost of the jobs not yet done
+        self.__remaining: float = total_cost
+        #: the number of jobs
+        self.__n_jobs: Final[int] = n_jobs
+        #: the number of workers
+        self.__n_workers: Final[int] = max(1, n_workers)
+        #: the number of completed jobs
+        self.__n_done: int = 0
+        #: the number of skipped jobs
+        self.__n_skipped: int = 0
+        #: the estimated cost of the executed jobs
+        self.__est: float = 0.0
+        #: the measured runtime of the executed jobs
+        self.__real: float = 0.0
+        #: the time when the last report was made
+        self.__last: int = -1
+
+    def done(self, cost: float, millis: float | None) -> str | None:
+        """
+        Register a completed job.
+
+        :param cost: the estimated cost of the job
+        :param millis: the measured runtime of the job in milliseconds, or
+            `None` if the job was skipped because it had been done before
+        :returns: a progress report, or `None` if the last report was made
+            less than a minute ago and this is not the last job
+        """
+        self.__remaining = max(0.0, self.__remaining - cost)
+        self.__n_done += 1
+        if millis is None:
+            self.__n_skipped += 1
+        else:
+            self.__est += cost
+            self.__real += millis
+        now: Final[int] = monotonic_ns()
+        if (self.__n_done < self.__n_jobs) and (self.__last >= 0) and (
+                (now - self.__last) < 60_000_000_000):
+            return None
+        self.__last = now
+        ratio: Final[float] = (self.__real / self.__est) \
+            if self.__est > 0.0 else 1.0
+        secs: int = int(self.__remaining * ratio / self.__n_workers / 1000.0)
+        return (f"{self.__n_done}/{self.__n_jobs} jobs done, "
+                f"{self.__n_skipped} skipped, est. time left: "
+                f"{secs // 3600}:{(secs // 60) % 60:02}:{secs % 60:02}")
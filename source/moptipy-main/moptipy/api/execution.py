@@ -19,7 +19,7 @@ from moptipy.api.process import (
 from moptipy.api.space import Space, check_space
 from moptipy.utils.nputils import rand_seed_check
 from moptipy.utils.path import Path
-from moptipy.utils.types import type_error
+from moptipy.utils.types import check_int_range, type_error
 
 
 def _check_log_file(log_file: Any, none_is_ok: bool = True) -> Path | None:
@@ -87,6 +87,10 @@ class Execution:
         self._log_file: Path | None = None
         self._log_improvements: bool = False
         self._log_all_fes: bool = False
+        self._checkpoint_file: Path | None = None
+        self._checkpoint_interval_millis: int = 600_000
+        self._binary_log: bool = False
+        self._text_log: bool = True
 
     def set_algorithm(self, algorithm: Algorithm) -> "Execution":
         """
@@ -275,6 +279,64 @@ class Execution:
         self._log_all_fes = log_all_fes
         return self
 
+    def set_binary_log(self, binary_log: bool = True,
+                       text_log: bool = True) -> "Execution":
+        """
+        Set whether the log should also be written in a binary format.
+
+        If a binary log is written, it is stored in a file next to the log
+        file, whose name is the log file name with the suffix
+        :const:`~moptipy.api.logging.BINARY_SUFFIX` appended. It holds the
+        same sections as the text log, but stores the `PROGRESS` section as
+        typed columns. The parsers in :mod:`~moptipy.evaluation` prefer the
+        binary log over the text log if both exist, as it can be loaded much
+        faster.
+
+        :param binary_log: should a binary log be written?
+        :param text_log: should the text log be written as well? If this is
+            `False`, only the binary log is written.
+        :returns: this execution
+        """
+        if not isinstance(binary_log, bool):
+            raise type_error(binary_log, "binary_log", bool)
+        if not isinstance(text_log, bool):
+            raise type_error(text_log, "text_log", bool)
+        if not (binary_log or text_log):
+            raise ValueError("Either a binary or a text log must be written.")
+        self._binary_log = binary_log
+        self._text_log = text_log
+        return self
+
+    def set_checkpoint(self, checkpoint_file: str | None,
+                       checkpoint_interval_millis: int = 600_000) \
+            -> "Execution":
+        """
+        Set the file for periodic checkpoints of the run.
+
+        If a checkpoint file is set, the process saves the state of the run
+        into this file every `checkpoint_interval_millis` milliseconds,
+        whenever the algorithm offers it via
+        :meth:`~moptipy.api.process.Process.checkpoint`. If the file exists
+        when the run starts, the run is resumed from it. If the progress is
+        logged, its entries that were moved out of memory are kept in the
+        file `checkpoint_file + ".log"`. Both files are deleted when the run
+        completes without error. Only algorithms that implement
+        the checkpoint protocol described at
+        :meth:`~moptipy.api.process.Process.get_resumed_state` can be
+        resumed.
+
+        :param checkpoint_file: the checkpoint file, or `None` to not write
+            checkpoints
+        :param checkpoint_interval_millis: the milliseconds between two
+            checkpoints
+        :returns: this execution
+        """
+        self._checkpoint_file = _check_log_file(checkpoint_file, True)
+        self._checkpoint_interval_millis = check_int_range(
+            checkpoint_interval_millis, "checkpoint_interval_millis",
+            1, 100_000_000_000)
+        return self
+
     def execute(self) -> Process:
         """
         Execute the experiment and return the process *after* the run.
@@ -332,9 +394,13 @@ class Execution:
             if log_improvements:
                 raise ValueError("Log file cannot be None "
                                  "if improvements should be logged.")
-        else:
+        elif self._text_log:
             log_file.create_file_or_truncate()
 
+        checkpoint_file: Final[Path | None] = self._checkpoint_file
+        ckpt_millis: Final[int] = self._checkpoint_interval_millis
+        binary_log: Final[bool] = self._binary_log
+        text_log: Final[bool] = self._text_log
         process: Final[_ProcessBase] = \
             (_ProcessNoSSLog(solution_space=solution_space,
                              objective=objective,
@@ -344,6 +410,10 @@ class Execution:
                              max_fes=max_fes,
                              max_time_millis=max_time_millis,
                              goal_f=goal_f,
+                             checkpoint_file=checkpoint_file,
+                             checkpoint_interval_millis=ckpt_millis,
+                             binary_log=binary_log,
+                             text_log=text_log,
                              log_all_fes=log_all_fes)
              if log_improvements or log_all_fes else
              _ProcessNoSS(solution_space=solution_space,
@@ -353,7 +423,12 @@ class Execution:
                           rand_seed=rand_seed,
                           max_fes=max_fes,
                           max_time_millis=max_time_millis,
-                          goal_f=goal_f)) if search_space is None else \
+                          goal_f=goal_f,
+                          checkpoint_file=checkpoint_file,
+                          checkpoint_interval_millis=ckpt_millis,
+                          binary_log=binary_log,
+                          text_log=text_log)) \
+            if search_space is None else \
             (_ProcessSSLog(solution_space=solution_space,
                            objective=objective,
                            algorithm=algorithm,
@@ -364,6 +439,10 @@ class Execution:
                            max_fes=max_fes,
                            max_time_millis=max_time_millis,
                            goal_f=goal_f,
+                           checkpoint_file=checkpoint_file,
+                           checkpoint_interval_millis=ckpt_millis,
+                           binary_log=binary_log,
+                           text_log=text_log,
                            log_all_fes=log_all_fes)
              if log_improvements or log_all_fes else
              _ProcessSS(solution_space=solution_space,
@@ -375,7 +454,11 @@ class Execution:
                         rand_seed=rand_seed,
                         max_fes=max_fes,
                         max_time_millis=max_time_millis,
-                        goal_f=goal_f))
+                        goal_f=goal_f,
+                        checkpoint_file=checkpoint_file,
+                        checkpoint_interval_millis=ckpt_millis,
+                        binary_log=binary_log,
+                        text_log=text_log))
         try:
             # noinspection PyProtectedMember
             process._after_init()  # finalize the created process
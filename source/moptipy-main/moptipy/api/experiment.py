@@ -5,7 +5,10 @@ Via the function :func:`run_experiment`, you can execute a complex experiment
 where multiple optimization algorithms are applied to multiple problem
 instances, where log files with the results and progress information about the
 runs are collected, and where multiprocessing is used to parallelize the
-experiment execution.
+experiment execution. The worker processes can share problem instances that
+are created once and stored in shared memory. Alternatively, the runs can be
+executed by several threads inside a single process, which then share the
+problem instances as well.
 Experiments are replicable, as random seeds are automatically generated based
 on problem instance names in a replicable fashion.
 
@@ -19,19 +22,25 @@ import gc
 import multiprocessing as mp
 import os.path
 import platform
+import queue
+import threading
 from contextlib import AbstractContextManager, nullcontext
 from math import ceil
+from time import monotonic_ns
 from typing import Any, Callable, Final, Iterable, Sequence, cast
 
 import psutil  # type: ignore
 from numpy.random import Generator, default_rng
 
+from moptipy.api._schedule import Progress, estimate_costs, measured_speeds
 from moptipy.api.execution import Execution
-from moptipy.api.logging import FILE_SUFFIX
-from moptipy.utils.cache import is_new
+from moptipy.api.logging import BINARY_SUFFIX, CHECKPOINT_SUFFIX, FILE_SUFFIX
+from moptipy.utils.cache import is_new, lru_loader
+from moptipy.utils.claims import Claim
 from moptipy.utils.console import logger
 from moptipy.utils.nputils import rand_seeds_from_str
 from moptipy.utils.path import Path
+from moptipy.utils.shared_arrays import SharedArrays
 from moptipy.utils.strings import sanitize_name, sanitize_names
 from moptipy.utils.sys_info import refresh_sys_info
 from moptipy.utils.types import check_int_range, type_error
@@ -48,10 +57,28 @@ def __run_experiment(base_dir: Path,
                      stdio_lock: AbstractContextManager,
                      cache: Callable[[str], bool],
                      thread_id: str,
-                     pre_warmup_barrier) -> None:
+                     pre_warmup_barrier,
+                     instance_cache: int | Callable[[Callable[[], Any]], Any],
+                     jobs=None,
+                     report: Callable[[float, float | None], Any] | None
+                     = None,
+                     checkpoint_interval_millis: int | None = None,
+                     binary_log: bool = False) -> None:
     """
     Execute a single thread of experiments.
 
+    The experiments are shuffled, but all experiments on the same instance
+    are then performed consecutively. The instances are memoized by their
+    factories, so that each instance is created only once as long as it is
+    not evicted from the cache.
+
+    If a queue of `jobs` is given, then the runs are not derived from the
+    experiments and `n_runs`. Instead, the jobs `(index, seed, cost)` are
+    taken from the queue until `None` is received. Here, `index` is the index
+    of the setup in `experiments`, `seed` is the random seed of the run, and
+    `cost` its estimated cost, which is passed to `report` together with the
+    measured runtime in milliseconds (or `None` if the run was skipped).
+
     :param base_dir: the base directory
     :param experiments: the stream of experiment setups
     :param perform_warmup: should we perform a warm-up per instance?
@@ -64,8 +91,20 @@ def __run_experiment(base_dir: Path,
     :param cache: the cache
     :param thread_id: the thread id
     :param pre_warmup_barrier: a barrier to wait at after the pre-warmup
+    :param instance_cache: the maximum total size of the arrays of the
+        cached instances, or the function loading the instances via a cache
+        shared by all threads, see :func:`~moptipy.utils.cache.lru_loader`
+    :param jobs: the queue with the jobs, or `None` to derive the runs
+    :param report: the function receiving the costs of the completed jobs
+    :param checkpoint_interval_millis: the milliseconds between two
+        checkpoints of a run, or `None` if no checkpoints are written
+    :param binary_log: should binary logs be written next to the log files?
     """
     random: Final[Generator] = default_rng()
+    load: Final[Callable[[Callable[[], Any]], Any]] = instance_cache \
+        if callable(instance_cache) else lru_loader(instance_cache)
+    indexed: Final[list[list[Callable]]] = list(experiments)  # job indices
+    warmed: Final[Callable[[int], bool]] = is_new()  # warmups of jobs
 
     for warmup in ([True, False] if perform_pre_warmup else [False]):
         wss: str
@@ -82,11 +121,22 @@ def __run_experiment(base_dir: Path,
                         "reached pre-warmup barrier.", thread_id, stdio_lock)
                     pre_warmup_barrier.wait()  # wait for all threads
 
-        for runs in ([1] if warmup else n_runs):  # for each number of runs
-            random.shuffle(cast(Sequence, experiments))  # shuffle experiments
-
-            for setup in experiments:  # for each setup
-                instance = setup[0]()  # load instance
+        scheduled: bool = (not warmup) and (jobs is not None)
+        for runs in ([1] if warmup else [0] if scheduled else n_runs):
+            work: Iterable[tuple[list[Callable], list[int] | None, float]]
+            if scheduled:  # take the jobs from the central queue
+                work = ((indexed[i], [seed], cost)
+                        for i, seed, cost in iter(jobs.get, None))
+            else:  # for each number of runs
+                random.shuffle(cast(Sequence, experiments))  # shuffle them
+                groups: dict[Callable, int] = {}  # group them by instance
+                for setup in experiments:
+                    groups.setdefault(setup[0], len(groups))
+                experiments.sort(key=lambda ex: groups[ex[0]])
+                work = ((setup, None, 0.0) for setup in experiments)
+
+            for setup, job_seeds, cost in work:  # for each setup
+                instance = load(setup[0])  # load or reuse instance
                 if instance is None:
                     raise TypeError("None is not an instance.")
                 inst_name = sanitize_name(str(instance))
@@ -102,51 +152,135 @@ def __run_experiment(base_dir: Path,
                 cd.ensure_dir_exists()
 
                 # generate sequence of seeds
-                seeds: list[int] = [0] if warmup else \
+                seeds: list[int] = [0] if warmup else job_seeds \
+                    if job_seeds is not None else \
                     rand_seeds_from_str(string=inst_name, n_seeds=runs)
                 random.shuffle(seeds)
-                needs_warmup = warmup or perform_warmup
+                needs_warmup = warmup or (perform_warmup and (
+                    (not scheduled) or warmed(id(setup))))
                 for seed in seeds:  # for every run
 
                     filename = sanitize_names(
                         [algo_name, inst_name, hex(seed)])
-                    if warmup:
-                        log_file = filename
-                    else:
+                    claim: AbstractContextManager = nullcontext()
+                    if not warmup:
                         log_file = Path.path(
                             os.path.join(cd, filename + FILE_SUFFIX))
 
-                        skip = True
+                        claimed: Claim | None = None
                         with file_lock:
                             if cache(log_file):
-                                skip = log_file.ensure_file_exists()
-                        if skip:
-                            continue  # run already done
-
-                    exp.set_rand_seed(seed)
-
-                    if needs_warmup:  # perform warmup run
-                        needs_warmup = False
-                        cpy: Execution = copy.copy(exp)
-                        cpy.set_max_fes(
-                            pre_warmup_fes if warmup else warmup_fes, True)
-                        cpy.set_max_time_millis(3600000, True)
-                        cpy.set_log_file(None)
-                        cpy.set_log_improvements(False)
-                        cpy.set_log_all_fes(False)
-                        logger(
-                            f"{wss} for {filename!r}.", thread_id, stdio_lock)
-                        with cpy.execute():
+                                claimed = Claim.acquire(log_file)
+                        if claimed is None:
+                            if report is not None:
+                                report(cost, None)
+                            continue  # run already done or in progress
+                        claim = claimed
+
+                    with claim:  # keep the claim alive during the run
+                        exp.set_rand_seed(seed)
+
+                        if needs_warmup:  # perform warmup run
+                            needs_warmup = False
+                            cpy: Execution = copy.copy(exp)
+                            cpy.set_max_fes(
+                                pre_warmup_fes if warmup else warmup_fes,
+                                True)
+                            cpy.set_max_time_millis(3600000, True)
+                            cpy.set_log_file(None)
+                            cpy.set_checkpoint(None)
+                            cpy.set_log_improvements(False)
+                            cpy.set_log_all_fes(False)
+                            logger(f"{wss} for {filename!r}.", thread_id,
+                                   stdio_lock)
+                            with cpy.execute():
+                                pass
+                            del cpy
+
+                        if warmup:
+                            continue
+
+                        # write the log privately and move it into place
+                        exp.set_log_file(claimed.part_file)
+                        if checkpoint_interval_millis is not None:
+                            exp.set_checkpoint(log_file + CHECKPOINT_SUFFIX,
+                                               checkpoint_interval_millis)
+                        exp.set_binary_log(binary_log)
+                        logger(filename, thread_id, stdio_lock)
+                        start: int = monotonic_ns()
+                        with exp.execute():  # run the experiment
                             pass
-                        del cpy
+                        committed: bool = claimed.commit(BINARY_SUFFIX)
+                        if not committed:  # another node took over the run
+                            logger(f"lost the claim of {filename!r}.",
+                                   thread_id, stdio_lock)
+                        if report is not None:
+                            report(cost, (monotonic_ns() - start) / 1_000_000
+                                   if committed else None)
 
-                    if warmup:
-                        continue
 
-                    exp.set_log_file(log_file)
-                    logger(filename, thread_id, stdio_lock)
-                    with exp.execute():  # run the experiment
-                        pass
+def __preloaded(instance: Any) -> Callable[[], Any]:
+    """
+    Create a callable that returns an already loaded instance.
+
+    :param instance: the instance
+    :returns: the callable returning `instance`
+
+    >>> __preloaded("x")()
+    'x'
+    """
+    return lambda: instance
+
+
+def __schedule(base_dir: Path, experiments: list[list[Callable]],
+               n_runs: list[int],
+               instance_cache: int | Callable[[Callable[[], Any]], Any]) \
+        -> list[tuple[int, int, float]]:
+    """
+    Create the jobs of an experiment, ordered longest-first.
+
+    Each job is one run, given as tuple of the index of its setup in
+    `experiments`, its random seed, and its estimated cost as computed by
+    :func:`~moptipy.api._schedule.estimate_costs`. The jobs of each entry of
+    `n_runs` come after those of the previous entry, and within each entry,
+    the jobs are sorted by decreasing cost.
+
+    :param base_dir: the base directory, searched for completed runs
+    :param experiments: the experiments
+    :param n_runs: the numbers of runs
+    :param instance_cache: the size of the instance cache, or the function
+        loading the instances via a cache shared by all threads
+    :returns: the jobs
+    """
+    load: Final[Callable[[Callable[[], Any]], Any]] = instance_cache \
+        if callable(instance_cache) else lru_loader(instance_cache)
+    specs: Final[list[tuple[str, str, int, int | None, int | None]]] = []
+    for setup in experiments:
+        instance = load(setup[0])
+        exp: Execution = setup[1](instance)
+        space = exp._search_space or exp._solution_space
+        specs.append((sanitize_name(str(exp._algorithm)),
+                      sanitize_name(str(instance)),
+                      int(getattr(space, "dimension", 1)),
+                      exp._max_fes, exp._max_time_millis))
+    del load
+    costs: Final[list[float]] = estimate_costs(
+        specs, measured_speeds(base_dir))
+
+    jobs: Final[list[tuple[int, int, int, float]]] = []
+    scheduled: Final[set[tuple[int, int]]] = set()
+    for rnd, runs in enumerate(n_runs):
+        seeds: dict[str, list[int]] = {}
+        for index, spec in enumerate(specs):
+            if spec[1] not in seeds:
+                seeds[spec[1]] = rand_seeds_from_str(
+                    string=spec[1], n_seeds=runs)
+            for seed in seeds[spec[1]]:
+                if (index, seed) not in scheduled:
+                    scheduled.add((index, seed))
+                    jobs.append((rnd, index, seed, costs[index]))
+    jobs.sort(key=lambda job: (job[0], -job[3]))
+    return [(index, seed, cost) for _, index, seed, cost in jobs]
 
 
 #: the number of logical CPU cores
@@ -175,7 +309,12 @@ def __waiting_run_experiment(base_dir: Path,
                              stdio_lock: AbstractContextManager,
                              cache: Callable,
                              thread_id: str,
-                             event, pre_warmup_barrier) -> None:
+                             event, pre_warmup_barrier,
+                             instance_cache: int | Callable[
+                                 [Callable[[], Any]], Any],
+                             jobs, report,
+                             checkpoint_interval_millis: int | None,
+                             binary_log: bool) -> None:
     """Wait until event is set, then run experiment."""
     logger("waiting for start signal", thread_id, stdio_lock)
     if not event.wait():
@@ -186,7 +325,8 @@ def __waiting_run_experiment(base_dir: Path,
     __run_experiment(base_dir, experiments, n_runs,
                      perform_warmup, warmup_fes, perform_pre_warmup,
                      pre_warmup_fes, file_lock, stdio_lock, cache,
-                     thread_id, pre_warmup_barrier)
+                     thread_id, pre_warmup_barrier, instance_cache,
+                     jobs, report, checkpoint_interval_millis, binary_log)
 
 
 def run_experiment(base_dir: str,
@@ -197,7 +337,13 @@ def run_experiment(base_dir: str,
                    perform_warmup: bool = True,
                    warmup_fes: int = 20,
                    perform_pre_warmup: bool = True,
-                   pre_warmup_fes: int = 20) -> Path:
+                   pre_warmup_fes: int = 20,
+                   use_threads: bool = False,
+                   share_instances: bool = False,
+                   instance_cache_bytes: int = 1_073_741_824,
+                   schedule_by_cost: bool = False,
+                   checkpoint_interval_millis: int | None = None,
+                   binary_log: bool = False) -> Path:
     """
     Run an experiment and store the log files into the given folder.
 
@@ -214,7 +360,21 @@ def run_experiment(base_dir: str,
 
     This function will use `n_threads` separate processes to parallelize the
     whole experiment (if you do not specify `n_threads`, it will be chosen
-    automatically).
+    automatically). If `use_threads` is `True`, it will instead use
+    `n_threads` threads inside the current process. All threads then load
+    the problem instances via one shared cache, so that each instance is
+    created only once as long as it is not evicted, which saves the memory
+    and start-up time of the separate processes. This pays off if the
+    algorithms spend their time in compiled code that releases the global
+    interpreter lock, e.g., `numba` functions with `nogil=True`. The log
+    files are the same in both modes.
+
+    If separate processes are used and `share_instances` is `True`, then
+    each problem instance is created only once, in the current process. Its
+    large :mod:`numpy` arrays are moved to shared memory via
+    :class:`~moptipy.utils.shared_arrays.SharedArrays` before the worker
+    processes are forked, so that all of them use the same arrays instead of
+    building and storing their own copies.
 
     Note for Windows users: The parallelization will not work under Windows.
     However, you can achieve *almost* the same effect and performance as for
@@ -223,6 +383,22 @@ def run_experiment(base_dir: str,
     `N` processes must have the same `base_dir` parameter. They will then
     automatically share the workload.
 
+    The same works for processes on different computers that share `base_dir`
+    over the network. Each run is claimed via a
+    :class:`~moptipy.utils.claims.Claim`, i.e., a claim file that is kept
+    alive by a periodic heartbeat. If a process dies, its claims become stale
+    and are taken over by the other processes. The log of a run is written to
+    a temporary file that is atomically renamed to the log file once the run
+    is complete, so incomplete runs never leave log files behind.
+
+    If `schedule_by_cost` is `True`, the runs are not shuffled. Instead, the
+    cost of each run is estimated from the size of its instance, its FE and
+    time limits, and the runtimes of the runs already completed in
+    `base_dir`. All threads then take the runs from one central queue, the
+    most expensive ones first, so that no thread is left with a long run at
+    the end while the others are already idle. The estimated remaining time
+    of the experiment is logged about once a minute.
+
     :param base_dir: the base directory where to store the results
     :param instances: an iterable of callables, each of which should return an
         object representing a problem instance, whose `__str__` representation
@@ -270,6 +446,30 @@ def run_experiment(base_dir: str,
         completed it, the actual experiment will begin. I am not sure whether
         this makes sense or not, but it also would not hurt.
     :param pre_warmup_fes: the FEs for the pre-warmup runs
+    :param use_threads: should the `n_threads` parallel executions be threads
+        inside the current process instead of separate processes? In this
+        case, the threads share one instance cache and no CPU affinity is
+        set.
+    :param share_instances: should the worker processes share the instances
+        in shared memory? Has no effect if only a single thread or
+        `use_threads` is used.
+    :param instance_cache_bytes: each thread memoizes the instances it
+        works on, so that consecutive runs on the same instance reuse the
+        same instance object. If the total size of the arrays of the cached
+        instances exceeds this number of bytes, the least recently used ones
+        are evicted. If `use_threads` is used, the bound applies to the one
+        cache shared by all threads.
+    :param schedule_by_cost: should the runs be taken longest-first from a
+        central queue instead of being shuffled in each thread?
+    :param checkpoint_interval_millis: if not `None`, each run saves a
+        checkpoint next to its log file every `checkpoint_interval_millis`
+        milliseconds, see
+        :meth:`~moptipy.api.execution.Execution.set_checkpoint`. A run that
+        was interrupted, e.g., because its computer crashed, is then resumed
+        from its last checkpoint when it is claimed again.
+    :param binary_log: should a binary log be written next to each log file,
+        see :meth:`~moptipy.api.execution.Execution.set_binary_log`? The
+        text log is always written, as its existence marks a completed run.
 
     :returns: the canonicalized path to `base_dir`
     """
@@ -281,9 +481,22 @@ def run_experiment(base_dir: str,
         raise type_error(perform_warmup, "perform_warmup", bool)
     if not isinstance(perform_pre_warmup, bool):
         raise type_error(perform_pre_warmup, "perform_pre_warmup", bool)
+    if not isinstance(use_threads, bool):
+        raise type_error(use_threads, "use_threads", bool)
+    if not isinstance(share_instances, bool):
+        raise type_error(share_instances, "share_instances", bool)
+    if not isinstance(schedule_by_cost, bool):
+        raise type_error(schedule_by_cost, "schedule_by_cost", bool)
+    if not isinstance(binary_log, bool):
+        raise type_error(binary_log, "binary_log", bool)
     check_int_range(warmup_fes, "warmup_fes", 1, 1_000_000)
     check_int_range(pre_warmup_fes, "pre_warmup_fes", 1, 1_000_000)
     check_int_range(n_threads, "n_threads", 1, 16384)
+    check_int_range(instance_cache_bytes, "instance_cache_bytes",
+                    0, 1_000_000_000_000_000)
+    if checkpoint_interval_millis is not None:
+        check_int_range(checkpoint_interval_millis,
+                        "checkpoint_interval_millis", 1, 100_000_000_000)
     instances = list(instances)
     if len(instances) <= 0:
         raise ValueError("Instance enumeration is empty.")
@@ -298,105 +511,166 @@ def run_experiment(base_dir: str,
         if not callable(setup):
             raise type_error(setup, "all setups", call=True)
 
-    experiments: Final[list[list[Callable]]] = \
-        [[ii, ss] for ii in instances for ss in setups]
-
-    del instances
-    del setups
-
-    if len(experiments) <= 0:
-        raise ValueError("No experiments found?")
-
     n_runs = [n_runs] if isinstance(n_runs, int) else list(n_runs)
     last = 0
     for run in n_runs:
         last = check_int_range(run, "n_runs", last + 1)
 
-    cache: Final[Callable[[str], bool]] = is_new()
-    use_dir: Final[Path] = Path.path(base_dir)
-    use_dir.ensure_dir_exists()
-
-    stdio_lock: AbstractContextManager
-
-    if n_threads > 1:
-        file_lock: AbstractContextManager = mp.Lock()
-        stdio_lock = mp.Lock()
-        logger(f"starting experiment with {n_threads} threads "
-               f"on {__CPU_LOGICAL_CORES} logical cores, "
-               f"{__CPU_PHYSICAL_CORES} physical cores (i.e.,"
-               f" {__CPU_LOGICAL_PER_PHYSICAL} logical cores per physical "
-               "core).", "", stdio_lock)
-
-        event: Final = mp.Event()
-        pre_warmup_barrier: Final = mp.Barrier(n_threads) \
-            if perform_pre_warmup else None
-        processes: Final[list[mp.Process]] = \
-            [mp.Process(target=__waiting_run_experiment,
-                        args=(use_dir,
-                              experiments.copy(),
-                              n_runs,
-                              perform_warmup,
-                              warmup_fes,
-                              perform_pre_warmup,
-                              pre_warmup_fes,
-                              file_lock,
-                              stdio_lock,
-                              cache,
-                              ":" + hex(i)[2:],
-                              event,
-                              pre_warmup_barrier))
-             for i in range(n_threads)]
-
-        for i, p in enumerate(processes):
-            p.start()
-            logger(f"started processes {hex(i)[2:]} in waiting state.",
+    instance_cache: int | Callable[[Callable[[], Any]], Any] = \
+        instance_cache_bytes
+    if use_threads and (n_threads > 1):  # one cache shared by all threads
+        instance_cache = lru_loader(instance_cache_bytes,
+                                    lock=threading.Lock())
+    # the shared memory is released when the experiment ends or fails
+    shared: Final[AbstractContextManager] = SharedArrays() if (
+        share_instances and (n_threads > 1) and not use_threads) \
+        else nullcontext()
+    with shared:
+        if isinstance(shared, SharedArrays):
+            instances = [__preloaded(shared.share(ii()))
+                         for ii in instances]
+        experiments: Final[list[list[Callable]]] = \
+            [[ii, ss] for ii in instances for ss in setups]
+
+        del instances
+        del setups
+
+        if len(experiments) <= 0:
+            raise ValueError("No experiments found?")
+
+        cache: Final[Callable[[str], bool]] = is_new()
+        use_dir: Final[Path] = Path.path(base_dir)
+        use_dir.ensure_dir_exists()
+
+        jobs = None  # the queue of scheduled jobs
+        progress: Progress | None = None
+        if schedule_by_cost:
+            job_list: Final[list[tuple[int, int, float]]] = __schedule(
+                use_dir, experiments, n_runs, instance_cache)
+            jobs = mp.Queue() if (n_threads > 1) and not use_threads \
+                else queue.Queue()
+            for job in job_list:
+                jobs.put(job)
+            for _ in range(n_threads):
+                jobs.put(None)  # one end marker per thread
+            progress = Progress(sum(job[2] for job in job_list), len(job_list),
+                                n_threads)
+
+        stdio_lock: AbstractContextManager
+
+        if n_threads > 1:
+            par: Final = threading if use_threads else mp
+            file_lock: AbstractContextManager = par.Lock()
+            stdio_lock = par.Lock()
+            logger(f"starting experiment with {n_threads} "
+                   f"{'threads in one process' if use_threads else 'threads'} "
+                   f"on {__CPU_LOGICAL_CORES} logical cores, "
+                   f"{__CPU_PHYSICAL_CORES} physical cores (i.e.,"
+                   f" {__CPU_LOGICAL_PER_PHYSICAL} logical cores per physical "
+                   "core).", "", stdio_lock)
+
+            event: Final = par.Event()
+            pre_warmup_barrier: Final = par.Barrier(n_threads) \
+                if perform_pre_warmup else None
+            done: Final = None if jobs is None else \
+                queue.Queue() if use_threads else mp.Queue()
+            processes: Final[list] = \
+                [(threading.Thread if use_threads else mp.Process)(
+                    target=__waiting_run_experiment,
+                    args=(use_dir,
+                          experiments.copy(),
+                          n_runs,
+                          perform_warmup,
+                          warmup_fes,
+                          perform_pre_warmup,
+                          pre_warmup_fes,
+                          file_lock,
+                          stdio_lock,
+                          cache,
+                          ":" + hex(i)[2:],
+                          event,
+                          pre_warmup_barrier,
+                          instance_cache,
+                          jobs,
+                          None if done is None else
+                          lambda c, t: done.put((c, t)),
+                          checkpoint_interval_millis,
+                          binary_log))
+                 for i in range(n_threads)]
+
+            for i, p in enumerate(processes):
+                p.start()
+                logger(f"started processes {hex(i)[2:]} in waiting state.",
+                       "", stdio_lock)
+
+            if not use_threads:  # affinity can only be set per process
+                # try to distribute the load evenly over all cores
+                n_cpus: int = __CPU_PHYSICAL_CORES
+                core_ofs: int = 0
+                if n_threads < n_cpus:
+                    n_cpus -= 1
+                    core_ofs = __CPU_LOGICAL_PER_PHYSICAL
+                n_cores: Final[int] = n_cpus * __CPU_LOGICAL_PER_PHYSICAL
+                n_cores_per_thread: Final[int] = max(1, n_cores // n_threads)
+
+                last_core: int = 0
+                for i, p in enumerate(processes):
+                    pid: int = int(p.pid)
+                    aff: list[int] = []
+                    for _ in range(n_cores_per_thread):
+                        aff.append(int(
+                            (last_core + core_ofs) % __CPU_LOGICAL_CORES))
+                        last_core += 1
+                    psutil.Process(pid).cpu_affinity(aff)
+                    logger(f"set affinity of processes {hex(i)[2:]} with "
+                           f"pid {pid} ({hex(pid)}) to {aff}.", "", stdio_lock)
+            logger("now releasing lock and starting all processes.",
                    "", stdio_lock)
+            event.set()
+            while progress is not None:  # collect the completed jobs
+                try:
+                    report = progress.done(*done.get(timeout=1))
+                except queue.Empty:
+                    if any(p.is_alive() for p in processes):
+                        continue
+                    break
+                if report is not None:
+                    logger(report, "", stdio_lock)
+            for i, p in enumerate(processes):
+                p.join()
+                logger(f"processes {hex(i)[2:]} has finished.", "", stdio_lock)
 
-        # try to distribute the load evenly over all cores
-        n_cpus: int = __CPU_PHYSICAL_CORES
-        core_ofs: int = 0
-        if n_threads < n_cpus:
-            n_cpus -= 1
-            core_ofs = __CPU_LOGICAL_PER_PHYSICAL
-        n_cores: Final[int] = n_cpus * __CPU_LOGICAL_PER_PHYSICAL
-        n_cores_per_thread: Final[int] = max(1, n_cores // n_threads)
-
-        last_core: int = 0
-        for i, p in enumerate(processes):
-            pid: int = int(p.pid)
-            aff: list[int] = []
-            for _ in range(n_cores_per_thread):
-                aff.append(int((last_core + core_ofs) % __CPU_LOGICAL_CORES))
-                last_core += 1
-            psutil.Process(pid).cpu_affinity(aff)
-            logger(f"set affinity of processes {hex(i)[2:]} with "
-                   f"pid {pid} ({hex(pid)}) to {aff}.", "", stdio_lock)
-        logger("now releasing lock and starting all processes.",
-               "", stdio_lock)
-        event.set()
-        for i, p in enumerate(processes):
-            p.join()
-            logger(f"processes {hex(i)[2:]} has finished.", "", stdio_lock)
-
-    else:
-        logger(f"starting experiment with single thread "
-               f"on {__CPU_LOGICAL_CORES} logical cores, "
-               f"{__CPU_PHYSICAL_CORES} physical cores (i.e.,"
-               f" {__CPU_LOGICAL_PER_PHYSICAL} logical cores per physical "
-               "core).")
-        stdio_lock = nullcontext()
-        __run_experiment(base_dir=use_dir,
-                         experiments=experiments,
-                         n_runs=n_runs,
-                         perform_warmup=perform_warmup,
-                         warmup_fes=warmup_fes,
-                         perform_pre_warmup=perform_pre_warmup,
-                         pre_warmup_fes=pre_warmup_fes,
-                         file_lock=nullcontext(),
-                         stdio_lock=stdio_lock,
-                         cache=cache,
-                         thread_id="",
-                         pre_warmup_barrier=None)
-
-    logger("finished experiment.", "", stdio_lock)
+        else:
+            logger(f"starting experiment with single thread "
+                   f"on {__CPU_LOGICAL_CORES} logical cores, "
+                   f"{__CPU_PHYSICAL_CORES} physical cores (i.e.,"
+                   f" {__CPU_LOGICAL_PER_PHYSICAL} logical cores per physical "
+                   "core).")
+            stdio_lock = nullcontext()
+
+            def __report(cost: float, millis: float | None) -> None:
+                report = progress.done(cost, millis)
+                if report is not None:
+                    logger(report)
+
+            __run_experiment(base_dir=use_dir,
+                             experiments=experiments,
+                             n_runs=n_runs,
+                             perform_warmup=perform_warmup,
+                             warmup_fes=warmup_fes,
+                             perform_pre_warmup=perform_pre_warmup,
+                             pre_warmup_fes=pre_warmup_fes,
+                             file_lock=nullcontext(),
+                             stdio_lock=stdio_lock,
+                             cache=cache,
+                             thread_id="",
+                             pre_warmup_barrier=None,
+                             instance_cache=instance_cache,
+                             jobs=jobs,
+                             report=None if progress is None else __report,
+                             checkpoint_interval_millis=(
+                                 checkpoint_interval_millis),
+                             binary_log=binary_log)
+
+        logger("finished experiment.", "", stdio_lock)
     return use_dir
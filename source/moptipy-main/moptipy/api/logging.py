@@ -4,6 +4,10 @@ from typing import Final
 
 #: the file suffix to be used for log files
 FILE_SUFFIX: Final[str] = ".txt"
+#: the suffix appended to the log file name for the checkpoint of a run
+CHECKPOINT_SUFFIX: Final[str] = ".checkpoint"
+#: the suffix appended to the log file name for the binary version of the log
+BINARY_SUFFIX: Final[str] = ".bin"
 
 #: the key for the exception type
 KEY_EXCEPTION_TYPE: Final[str] = "exceptionType"
@@ -35,6 +35,12 @@ class MOProcess(MOProblem, Process):
         raise ValueError(
             "register is not available during multi-objective optimization.")
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        """Unavailable during multi-objective optimization."""
+        raise ValueError("register_block is not available during "
+                         "multi-objective optimization.")
+
     def get_archive(self) -> list[MORecord]:
         """
         Get the archive of non-dominated solutions.
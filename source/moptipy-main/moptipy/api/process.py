@@ -54,7 +54,9 @@ about the `moptipy` API.
 """
 from contextlib import AbstractContextManager
 from math import inf, isnan
+from typing import Any, Callable, Final
 
+import numpy as np
 from numpy.random import Generator
 
 from moptipy.api.objective import Objective
@@ -211,6 +213,205 @@ class Process(Space, Objective, AbstractContextManager):
         :param f: the objective value
         """
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        """
+        Register a whole block of `n_fes` externally-evaluated FEs at once.
+
+        This function is equivalent to calling :meth:`register` `n_fes`
+        times, but it only needs to be called once. It is intended for
+        compiled kernels that perform thousands of iterations without ever
+        leaving their native loop. Such kernels only need to remember the
+        objective values that they may need to report, i.e., the
+        improvements, and can then hand the whole block back at once.
+
+        `trace` is an array with two columns. Each row `(fe, f)` states that
+        the `fe`-th FE of the block (counting from `1` to `n_fes`) had
+        objective value `f`. The rows must be sorted by `fe` and must include
+        at least every FE of the block that improved upon the best-so-far
+        solution, because only these FEs can be written to the log. If all
+        FEs are logged (see :meth:`logs_all_fes` and
+        :meth:`~moptipy.api.execution.Execution.set_log_all_fes`), then only
+        the FEs listed in `trace` can appear in the log, so it should list
+        every FE of the block. If `trace` is `None`, the block is treated as
+        `n_fes - 1` non-improving FEs followed by one FE that registers `x`
+        with objective value `f`.
+
+        `x` must be the best solution of the block and `f` its objective
+        value. `x` is only copied if the block improves upon the best-so-far
+        solution. The termination criteria are applied at exactly the right
+        FE: The process will count at most as many FEs as still permitted
+        and will stop counting at the first FE of the block that reaches the
+        goal objective value. Therefore, a block must not extend beyond the
+        remaining budget (this is what the return value is for) and should
+        end at the latest when reaching the
+        :meth:`~moptipy.api.objective.Objective.lower_bound`. All FEs of a
+        block are considered to have happened at the time when this method is
+        called.
+
+        This default implementation replays the block via :meth:`register`,
+        FE by FE, and stops as soon as :meth:`should_terminate` is `True`.
+        `x` is credited only at its own FE, i.e., the first FE in `trace`
+        with objective value `f` (or the last FE of the block if `trace` is
+        `None`). FEs missing from `trace` are registered as not improving
+        upon the best-so-far solution. This default implementation therefore
+        requires a complete `trace` if all FEs are logged, as such FEs would
+        otherwise appear in the log with wrong objective values. FEs beyond
+        the remaining budget are not registered.
+
+        :param n_fes: the number of FEs performed in the block
+        :param x: the best solution of the block
+        :param f: the objective value of `x`
+        :param trace: the array with `(fe, f)` rows, or `None`
+        :returns: the number of FEs that may still be consumed, which will be
+            a very large number if there is no FE limit and `0` if the process
+            has terminated
+        :raises ValueError: if all FEs are logged but `trace` does not list
+            every FE of the block, or if the FE of `x` is beyond the
+            remaining budget but an earlier FE of the block would improve
+            upon the best-so-far solution
+
+        >>> from math import inf
+        >>> class P(Process):
+        ...     def __init__(self):
+        ...         self.fes = 0
+        ...         self.best = inf
+        ...     def register(self, x, f):
+        ...         self.fes += 1
+        ...         if f < self.best:
+        ...             self.best = f
+        ...             print(f"{self.fes}: {x}={f}")
+        ...     def get_consumed_fes(self):
+        ...         return self.fes
+        ...     def get_max_fes(self):
+        ...         return 20
+        ...     def has_best(self):
+        ...         return self.fes > 0
+        ...     def get_best_f(self):
+        ...         return self.best
+        >>> p = P()
+        >>> p.register_block(5, "a", 7)
+        5: a=7
+        15
+        >>> p.register_block(6, "b", 3, np.array([[2, 5], [4, 3]]))
+        7: b=5
+        9: b=3
+        9
+        >>> p.register_block(12, "c", 1, np.array([[3, 2], [10, 1]]))
+        Traceback (most recent call last):
+        ...
+        ValueError: The FE 10 of x is beyond the 9 remaining FEs, but FE 3 \
+would improve the best-so-far objective value.
+        >>> p.register_block(12, "c", 3, np.array([[3, 4], [10, 3]]))
+        0
+        >>> p.fes, p.best
+        (20, 3)
+        """
+        if self.logs_all_fes() and ((trace is None and n_fes > 1) or (
+                trace is not None and len(trace) < n_fes - 1)):
+            raise ValueError(
+                "If all FEs are logged, the trace must list every FE of the "
+                f"block, but it has {0 if trace is None else len(trace)} "
+                f"rows for {n_fes} FEs.")
+        rows: Final[list[list]] = [[n_fes, f]] if trace is None \
+            else trace.tolist()
+        x_fe: int = -1  # the FE of x, -1 if x does not improve
+        for fe, ff in rows:
+            if ff == f:
+                x_fe = int(fe)
+                break
+        limit: int = n_fes  # the number of FEs that may be registered
+        max_fes: Final[int | None] = self.get_max_fes()
+        if max_fes is not None:
+            limit = min(limit, max_fes - self.get_consumed_fes())
+        if (x_fe < 0) or (x_fe > limit):  # nothing may be credited to x
+            best: int | float = self.get_best_f() if self.has_best() else inf
+            for fe, ff in rows:
+                if fe > limit:
+                    break
+                if ff < best:
+                    raise ValueError(
+                        f"The FE {x_fe} of x is beyond the {limit} remaining"
+                        f" FEs, but FE {int(fe)} would improve the "
+                        "best-so-far objective value.")
+
+        register: Final[Callable[[Any, int | float], None]] = self.register
+        should_terminate: Final[Callable[[], bool]] = self.should_terminate
+        done: int = 0
+        for fe, ff in [*rows, [limit + 1, inf]]:
+            end: int = min(int(fe) - 1, limit)
+            if done < end:  # the FEs not in the trace do not improve
+                best = self.get_best_f() if self.has_best() else inf
+                while done < end:
+                    if should_terminate():
+                        return 0
+                    done += 1
+                    register(x, best)
+            if done >= limit:
+                break
+            if should_terminate():
+                return 0
+            done += 1
+            register(x, ff)  # only improving at the FE of x, or before it
+        if should_terminate():
+            return 0
+        if max_fes is None:
+            return 9_223_372_036_854_775_807
+        return max_fes - self.get_consumed_fes()
+
+    def logs_all_fes(self) -> bool:
+        """
+        Check whether every single FE is written to the log.
+
+        Code that hands in blocks of FEs via :meth:`register_block` can use
+        this to decide whether it must provide a `trace` listing every FE of
+        the block or whether the improvements are enough.
+
+        :returns: `True` if all FEs are logged, `False` otherwise
+        """
+        return False
+
+    def checkpoint(self, state: Callable[[], Any]) -> None:
+        """
+        Offer the process to save a checkpoint of the run.
+
+        If a checkpoint file was set via
+        :meth:`~moptipy.api.execution.Execution.set_checkpoint`, the process
+        periodically saves the complete state of the run, so that it can be
+        resumed after an interruption. The process itself knows its consumed
+        FEs and runtime, the best solution, the in-memory log, and the state
+        of the random number generator. Only the algorithm knows the rest,
+        e.g., its current solution, its temperature, or its frequency table.
+
+        Algorithms that support checkpoints therefore call this method at
+        points where their state is consistent, e.g., after every block
+        handed in via :meth:`register_block`. If a checkpoint is due, the
+        process invokes `state`, which must return a picklable object holding
+        the state of the algorithm, and writes the checkpoint. Otherwise, it
+        returns immediately, so this method may be called often. If no
+        checkpoints are written, this method does nothing.
+
+        :param state: a callable returning the state of the algorithm
+        """
+
+    def get_resumed_state(self) -> Any:
+        """
+        Get the algorithm state stored in the checkpoint of a resumed run.
+
+        If the run is resumed from a checkpoint, this method returns the
+        object which the `state` callable passed to :meth:`checkpoint`
+        returned when the checkpoint was written. All other state, including
+        the state of the random number generator returned by
+        :meth:`get_random`, is restored automatically. An algorithm must
+        call this method at the start of its
+        :meth:`~moptipy.api.algorithm.Algorithm.solve` method and, if the
+        result is not `None`, continue from this state instead of creating
+        and evaluating its initial solutions. This way, the resumed run
+        follows exactly the same trajectory as an uninterrupted run.
+
+        :returns: the algorithm state, or `None` if the run is not resumed
+        """
+
     def get_consumed_fes(self) -> int:
         """
         Obtain the number consumed objective function evaluations.
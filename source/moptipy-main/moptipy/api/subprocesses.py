@@ -63,6 +63,7 @@ class __ForFEs(Process):
         self.from_str = owner.from_str  # type: ignore
         self.validate = owner.validate  # type: ignore
         self.n_points = owner.n_points  # type: ignore
+        self.logs_all_fes = owner.logs_all_fes  # type: ignore
         self.has_best = owner.has_best  # type: ignore
         self.get_copy_of_best_x = owner.get_copy_of_best_x  # type: ignore
         self.get_best_f = owner.get_best_f  # type: ignore
@@ -99,12 +100,35 @@ class __ForFEs(Process):
         return f
 
     def register(self, x, f: int | float) -> None:
+        if self.__fes_left <= 0:  # the budget is used up
+            self.__terminated = True
+            return
         self.__register(x, f)
         fel: Final[int] = self.__fes_left - 1
         self.__fes_left = fel
         if fel <= 0:
             self.__terminated = True
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        if self.__terminated or (self.__fes_left <= 0):
+            self.__terminated = True
+            return 0
+        if n_fes > self.__fes_left:  # cut off the FEs beyond the budget
+            n_fes = self.__fes_left
+            trace = np.empty((0, 2), np.int64) if trace is None \
+                else trace[trace[:, 0] <= n_fes]
+        owner: Final[Process] = self.__owner
+        start: Final[int] = owner.get_consumed_fes()
+        left: Final[int] = owner.register_block(n_fes, x, f, trace)
+        fel: Final[int] = self.__fes_left - (
+            owner.get_consumed_fes() - start)
+        self.__fes_left = fel
+        if (fel <= 0) or (left <= 0):
+            self.__terminated = True
+            return 0
+        return min(fel, left)
+
     def get_consumed_fes(self) -> int:
         return self.max_fes - self.__fes_left
 
@@ -145,6 +169,7 @@ class __ForFEsMO(MOProcess):
         self.from_str = owner.from_str  # type: ignore
         self.validate = owner.validate  # type: ignore
         self.n_points = owner.n_points  # type: ignore
+        self.logs_all_fes = owner.logs_all_fes  # type: ignore
         self.has_best = owner.has_best  # type: ignore
         self.get_copy_of_best_x = owner.get_copy_of_best_x  # type: ignore
         self.get_best_f = owner.get_best_f  # type: ignore
@@ -268,6 +293,7 @@ class __FromStartingPoint(Process):
         self.from_str = owner.from_str  # type: ignore
         self.validate = owner.validate  # type: ignore
         self.n_points = owner.n_points  # type: ignore
+        self.logs_all_fes = owner.logs_all_fes  # type: ignore
         self.should_terminate = owner.should_terminate  # type: ignore
         self.terminate = owner.terminate  # type: ignore
         #: the best solution
@@ -328,6 +354,26 @@ class __FromStartingPoint(Process):
                 self.__best_f = f
                 self.__last_improvement_fe = fe
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        self.__only_seed_used = False
+        owner: Final[Process] = self.__owner
+        start: Final[int] = owner.get_consumed_fes()
+        left: Final[int] = owner.register_block(n_fes, x, f, trace)
+        done: Final[int] = owner.get_consumed_fes() - start
+        if f < self.__best_f:
+            fe: int = n_fes  # the FE of the block at which `x` was found
+            if trace is not None:
+                hits: Final[np.ndarray] = np.flatnonzero(trace[:, 1] <= f)
+                if len(hits) > 0:
+                    fe = int(trace[hits[0], 0])
+            if fe <= done:  # `x` was found before the block was cut off
+                self.copy(self.__best_x, x)
+                self.__best_f = f
+                self.__last_improvement_fe = self.__fes + fe
+        self.__fes += done
+        return left
+
     def get_consumed_fes(self) -> int:
         return max(1, self.__fes)
 
@@ -406,6 +452,7 @@ class __WithoutShouldTerminate(Process):
         self.from_str = owner.from_str  # type: ignore
         self.validate = owner.validate  # type: ignore
         self.n_points = owner.n_points  # type: ignore
+        self.logs_all_fes = owner.logs_all_fes  # type: ignore
         self.has_best = owner.has_best  # type: ignore
         self.get_copy_of_best_x = owner.get_copy_of_best_x  # type: ignore
         self.get_best_f = owner.get_best_f  # type: ignore
@@ -419,6 +466,9 @@ class __WithoutShouldTerminate(Process):
         #: the fast call to the owner's register method
         self.__register: Final[Callable[[Any, int | float], None]] \
             = owner.register
+        #: the fast call to the owner's register_block method
+        self.__register_block: Final[Callable[..., int]] = \
+            owner.register_block
 
     def evaluate(self, x) -> float | int:
         if self.should_terminate():
@@ -430,6 +480,12 @@ class __WithoutShouldTerminate(Process):
             raise _InternalTerminationError
         self.__register(x, f)
 
+    def register_block(self, n_fes: int, x, f: int | float,
+                       trace: np.ndarray | None = None) -> int:
+        if self.should_terminate():
+            raise _InternalTerminationError
+        return self.__register_block(n_fes, x, f, trace)
+
     def __str__(self) -> str:
         return f"protect_{self._owner}"
 
@@ -465,6 +521,7 @@ class __WithoutShouldTerminateMO(MOProcess):
         self.from_str = owner.from_str  # type: ignore
         self.validate = owner.validate  # type: ignore
         self.n_points = owner.n_points  # type: ignore
+        self.logs_all_fes = owner.logs_all_fes  # type: ignore
         self.has_best = owner.has_best  # type: ignore
         self.get_copy_of_best_x = owner.get_copy_of_best_x  # type: ignore
         self.get_best_f = owner.get_best_f  # type: ignore
@@ -1,6 +1,6 @@
 """Some internal helper functions."""
 
-from typing import Final
+from typing import Any, Final, Sequence
 
 import numba  # type: ignore
 import numpy as np
@@ -83,3 +83,67 @@ def _get_reach_index(f: np.ndarray, goal_f: int | float):  # noqa
     0
     """
     return np.searchsorted(f[::-1], goal_f, side="right")
+
+
+def _pack_progress(source: Sequence[Any]) \
+        -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack the progress of several runs into one ragged columnar buffer.
+
+    The time and objective value arrays of all runs are concatenated. Run
+    `j` occupies the indices from `offsets[j]` to `offsets[j + 1] - 1` of the
+    concatenated arrays.
+
+    :param source: the sequence of
+        :class:`~moptipy.evaluation.progress.Progress` records
+    :return: the tuple of the offsets of the runs, which has one more element
+        than there are runs, the concatenated time arrays, and the
+        concatenated objective value arrays
+
+    >>> from moptipy.evaluation.progress import Progress
+    >>> o, t, f = _pack_progress([
+    ...     Progress("a", "i", 1, np.array([1, 5]), "FEs",
+    ...              np.array([9, 4]), "plainF"),
+    ...     Progress("a", "i", 2, np.array([1, 2, 8]), "FEs",
+    ...              np.array([7, 6, 3]), "plainF")])
+    >>> o.tolist(), t.tolist(), f.tolist()
+    ([0, 2, 5], [1, 5, 1, 2, 8], [9, 4, 7, 6, 3])
+    """
+    offsets: Final[np.ndarray] = np.zeros(len(source) + 1, np.int64)
+    np.cumsum([p.f.size for p in source], out=offsets[1:])
+    return (offsets, np.concatenate([p.time for p in source]),
+            np.concatenate([p.f for p in source]))
+
+
+@numba.njit(nogil=True, cache=True)
+def _reach_indices(offsets: np.ndarray, f: np.ndarray,
+                   goals: np.ndarray) -> np.ndarray:
+    """
+    Compute the indices where the runs first reach a set of goals.
+
+    The runs are packed as returned by :func:`_pack_progress`, i.e., the
+    objective values of each run are sorted in descending order. For each
+    run, all goals are located with one binary search over its reversed
+    objective values.
+
+    :param offsets: the offsets of the runs in `f`
+    :param f: the concatenated objective values of the runs
+    :param goals: a matrix with one row per goal and one column per run,
+        holding the goal objective value of the run
+    :return: a matrix of the same shape as `goals`, holding the index into
+        `f` of the first value less than or equal to the goal, or `-1` if
+        the run never reached the goal
+
+    >>> _reach_indices(np.array([0, 2, 5]), np.array([9, 4, 7, 6, 3]),
+    ...                np.array([[5, 5], [3, 3], [9, 7]])).tolist()
+    [[1, 4], [-1, 4], [0, 2]]
+    """
+    n_runs: Final[int] = len(offsets) - 1
+    result: Final[np.ndarray] = np.empty(goals.shape, np.int64)
+    for j in range(n_runs):
+        end = offsets[j + 1]
+        reached = np.searchsorted(f[offsets[j]:end][::-1], goals[:, j],
+                                  side="right")
+        for i in range(len(reached)):  # pylint: disable=C0200
+            result[i, j] = -1 if reached[i] <= 0 else end - reached[i]
+    return result
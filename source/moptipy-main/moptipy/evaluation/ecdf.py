@@ -41,7 +41,7 @@ import numpy as np
 
 import moptipy.api.logging as lg
 import moptipy.utils.nputils as npu
-from moptipy.evaluation._utils import _get_reach_index
+from moptipy.evaluation._utils import _pack_progress, _reach_indices
 from moptipy.evaluation.base import (
     F_NAME_NORMALIZED,
     F_NAME_SCALED,
@@ -196,22 +196,21 @@ class Ecdf(MultiRun2DData):
         return path
 
     @staticmethod
-    def _compute_times(source: list[Progress],
-                       goal: int | float) -> list[float]:
+    def _compute_times(time: np.ndarray, offsets: np.ndarray,
+                       reach: np.ndarray) -> list[float]:
         """
         Compute the times for the given goals.
 
-        :param source: the source array
-        :param goal: the goal value
+        :param time: the concatenated time arrays of the runs, see
+            :func:`~moptipy.evaluation._utils._pack_progress`
+        :param offsets: the offsets of the runs
+        :param reach: the indices where the runs reached the goal, or `-1`
+            for runs that did not reach it, see
+            :func:`~moptipy.evaluation._utils._reach_indices`
         :return: a list of times
         """
-        ret = []
-        for pr in source:
-            idx = _get_reach_index(pr.f, goal)
-            if idx <= 0:
-                continue
-            ret.append(pr.time[pr.time.size - idx])
-        return ret
+        del offsets
+        return time[reach[reach >= 0]].tolist()
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -241,6 +240,25 @@ class Ecdf(MultiRun2DData):
         :return: the Ecdf record
         :rtype: Ecdf
         """
+        return cls._create_all(source, [goal_f], use_default_goal_f)[0]
+
+    @classmethod
+    def _create_all(cls: type["Ecdf"],
+                    source: Iterable[Progress],
+                    goals_f: list[int | float | Callable | None],
+                    use_default_goal_f: bool = True) -> list["Ecdf"]:
+        """
+        Create one Ecdf record per goal from an iterable of Progress records.
+
+        The runs are packed into one columnar buffer and the times when they
+        reach the goals are computed for all goals at once.
+
+        :param source: the set of progress instances
+        :param goals_f: the goal objective values
+        :param use_default_goal_f: should we use the default lower bounds as
+            goals?
+        :return: the Ecdf records, one per goal
+        """
         if not isinstance(source, Iterable):
             raise type_error(source, "source", Iterable)
 
@@ -280,71 +298,93 @@ class Ecdf(MultiRun2DData):
         if (n_insts <= 0) or (n_insts > n):
             raise ValueError("Huh?.")
 
-        times: list[float] = []
-        goal: int | float | None
-        same_goal_f: int | float | None = None
-        first: bool = True
-        for instance, pl in inst_runs.items():
-            goal = None
-            if isinstance(goal_f, int | float):
-                goal = goal_f
-            elif callable(goal_f):
-                goal = goal_f(instance)
-            if (goal is None) and use_default_goal_f:
-                if f_name == F_NAME_SCALED:
-                    goal = 1
-                elif f_name == F_NAME_NORMALIZED:
-                    goal = 0
-                else:
-                    goal = pl[0].f_standard
-                    for pp in pl:
-                        if goal != pp.f_standard:
-                            raise ValueError("Inconsistent goals: "
-                                             f"{goal} and {pp.f_standard}")
-            if not isinstance(goal, int | float):
-                raise type_error(goal, "goal", (int, float))
-            if first:
-                same_goal_f = goal
-            elif goal != same_goal_f:
-                same_goal_f = None
-            res = cls._compute_times(pl, goal)
-            for t in res:
-                if isfinite(t):
-                    if t < 0:
-                        raise ValueError(f"Invalid ert {t}.")
-                    times.append(t)
-                elif not (t >= inf):
-                    raise ValueError(f"Invalid ert {t}.")
-        del inst_runs
-
-        if len(times) <= 0:
-            return cls(algorithm, n, n_insts, time_unit,
-                       f_name, same_goal_f,
-                       np.array([[0, 0], [inf, 0]]))
-
-        times.sort()
-        time: list[float] = [0]
-        ecdf: list[float] = [0]
-        success: int = 0
+        # pack the runs of each instance next to each other
+        runs: Final[list[Progress]] = [
+            pp for pl in inst_runs.values() for pp in pl]
+        offsets, time, f = _pack_progress(runs)
+        goals: Final[list[list[int | float]]] = []
+        same_goals_f: Final[list[int | float | None]] = []
+        for goal_f in goals_f:
+            row: list[int | float] = []
+            same_goal_f: int | float | None = None
+            first: bool = True
+            for instance, pl in inst_runs.items():
+                goal: int | float | None = None
+                if isinstance(goal_f, int | float):
+                    goal = goal_f
+                elif callable(goal_f):
+                    goal = goal_f(instance)
+                if (goal is None) and use_default_goal_f:
+                    if f_name == F_NAME_SCALED:
+                        goal = 1
+                    elif f_name == F_NAME_NORMALIZED:
+                        goal = 0
+                    else:
+                        goal = pl[0].f_standard
+                        for pp in pl:
+                            if goal != pp.f_standard:
+                                raise ValueError(
+                                    "Inconsistent goals: "
+                                    f"{goal} and {pp.f_standard}")
+                if not isinstance(goal, int | float):
+                    raise type_error(goal, "goal", (int, float))
+                if first:
+                    same_goal_f = goal
+                elif goal != same_goal_f:
+                    same_goal_f = None
+                row.extend([goal] * len(pl))
+            goals.append(row)
+            same_goals_f.append(same_goal_f)
+        reach: Final[np.ndarray] = _reach_indices(offsets, f,
+                                                  np.array(goals))
+
         div: Final[int] = cls._get_div(n, n_insts)
-        ll: int = 0
-        for t in times:
-            success += 1
-            if t > time[ll]:
-                time.append(t)
-                ecdf.append(success / div)
-                ll += 1
-            else:
-                ecdf[ll] = success / div
+        result: Final[list[Ecdf]] = []
+        for goal_reach, same_goal_f in zip(reach, same_goals_f,
+                                           strict=True):
+            times: list[float] = []
+            start: int = 0
+            for pl in inst_runs.values():
+                end: int = start + len(pl)
+                for t in cls._compute_times(time, offsets[start:end + 1],
+                                            goal_reach[start:end]):
+                    if isfinite(t):
+                        if t < 0:
+                            raise ValueError(f"Invalid ert {t}.")
+                        times.append(t)
+                    elif not (t >= inf):
+                        raise ValueError(f"Invalid ert {t}.")
+                start = end
 
-        time.append(inf)
-        ecdf.append(ecdf[ll])
+            if len(times) <= 0:
+                result.append(cls(algorithm, n, n_insts, time_unit,
+                                  f_name, same_goal_f,
+                                  np.array([[0, 0], [inf, 0]])))
+                continue
+
+            times.sort()
+            time_x: list[float] = [0]
+            ecdf: list[float] = [0]
+            success: int = 0
+            ll: int = 0
+            for t in times:
+                success += 1
+                if t > time_x[ll]:
+                    time_x.append(t)
+                    ecdf.append(success / div)
+                    ll += 1
+                else:
+                    ecdf[ll] = success / div
 
-        return cls(algorithm, n, n_insts,
-                   time_unit, f_name,
-                   same_goal_f,
-                   np.column_stack((np.array(time),
-                                    np.array(ecdf))))
+            time_x.append(inf)
+            ecdf.append(ecdf[ll])
+
+            result.append(cls(algorithm, n, n_insts,
+                              time_unit, f_name,
+                              same_goal_f,
+                              np.column_stack((np.array(time_x),
+                                               np.array(ecdf)))))
+        return result
 
     @classmethod
     def from_progresses(cls: type["Ecdf"],
@@ -356,6 +396,9 @@ class Ecdf(MultiRun2DData):
         """
         Compute one or multiple ECDFs from a stream of end results.
 
+        The runs of each algorithm are packed only once and the ECDFs for
+        all goals are computed from the same matrix of first-hitting times.
+
         :param source: the set of progress instances
         :param f_goal: one or multiple goal values
         :param consumer: the destination to which the new records will be
@@ -391,10 +434,27 @@ class Ecdf(MultiRun2DData):
         keyz = list(sorter.keys())
         keyz.sort()
 
-        for goal in f_goal:
-            use_default_goal = goal is None
-            for key in keyz:
-                consumer(cls.create(sorter[key], goal, use_default_goal))
+        # goals that are None are replaced by the default goals
+        goals: Final[list] = list(f_goal)
+        with_default: Final[list[int]] = [
+            i for i, goal in enumerate(goals) if goal is None]
+        with_goal: Final[list[int]] = [
+            i for i, goal in enumerate(goals) if goal is not None]
+        per_key: Final[list[list[Ecdf | None]]] = []
+        for key in keyz:
+            results: list[Ecdf | None] = [None] * len(goals)
+            for idxs, use_default_goal in ((with_default, True),
+                                           (with_goal, False)):
+                if len(idxs) > 0:
+                    for i, ecdf in zip(idxs, cls._create_all(
+                            sorter[key], [goals[i] for i in idxs],
+                            use_default_goal), strict=True):
+                        results[i] = ecdf
+            per_key.append(results)
+
+        for i in range(len(goals)):
+            for results in per_key:
+                consumer(results[i])
 
 
 def get_goal(ecdf: Ecdf) -> int | float | None:
@@ -34,7 +34,7 @@ from moptipy.evaluation.base import (
     F_NAME_SCALED,
     PerRunData,
 )
-from moptipy.evaluation.log_parser import ExperimentParser
+from moptipy.evaluation.log_parser import ExperimentParser, parse_parallel
 from moptipy.utils.console import logger
 from moptipy.utils.help import argparser
 from moptipy.utils.logger import CSV_SEPARATOR, parse_key_values
@@ -306,7 +306,8 @@ class EndResult(PerRunData):
                          f"should be one of {sorted(_GETTERS.keys())}.")
 
     @staticmethod
-    def from_logs(path: str, consumer: Callable[["EndResult"], Any]) -> None:
+    def from_logs(path: str, consumer: Callable[["EndResult"], Any],
+                  n_workers: int = 1, cache_file: str | None = None) -> None:
         """
         Parse a given path and pass all end results found to the consumer.
 
@@ -318,10 +319,20 @@ class EndResult(PerRunData):
         accepts instances of :class:`EndResult`, e.g., the `append` method of
         a :class:`list`.
 
+        If `n_workers > 1`, the log files are parsed by that many processes
+        in parallel via :func:`~moptipy.evaluation.log_parser.parse_parallel`
+        and the records are passed to the `consumer` in the sorted order of
+        the log file paths. If a `cache_file` is given, the end results
+        are stored in it and, when parsing the same log files again, only
+        new or changed log files are parsed.
+
         :param path: the path to parse
         :param consumer: the consumer
+        :param n_workers: the number of processes parsing the log files
+        :param cache_file: the optional file caching the parsed end results
         """
-        _InnerLogParser(consumer).parse(path)
+        parse_parallel(path, _InnerLogParser, consumer, n_workers,
+                       cache_file, "EndResult")
 
     @staticmethod
     def to_csv(results: Iterable["EndResult"], file: str) -> Path:
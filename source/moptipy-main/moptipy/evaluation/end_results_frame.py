@@ -0,0 +1,267 @@
+"""
+A columnar table of :class:`~moptipy.evaluation.end_results.EndResult` data.
+
+An :class:`~moptipy.evaluation.end_results.EndResult` is one immutable
+Python object per run. Grouping thousands of them by algorithm and instance
+means walking these objects again and again, e.g., once for the table of
+results and once more for the per-algorithm summary. An :class:`EndResults`
+frame instead holds the end results of all runs column-wise in
+:mod:`numpy` arrays, with the algorithm and instance names stored as
+categorical codes into sorted name tuples. It is built in a single pass and
+can then be grouped any number of times via :meth:`EndResults.groups`, as
+done by
+:meth:`~moptipy.evaluation.end_statistics.EndStatistics.from_end_results`.
+
+Optional values are encoded in the arrays: A missing `goal_f` is `nan`,
+a missing `max_fes` or `max_time_millis` is `-1`.
+
+>>> from moptipy.evaluation.end_results import EndResult
+>>> frame = EndResults.from_end_results([
+...     EndResult("b", "i", 1, 10, 5, 6, 100, 110, None, 100, None),
+...     EndResult("a", "i", 2, 12, 7, 8, 100, 110, None, 100, None),
+...     EndResult("b", "i", 3, 11, 9, 9, 100, 110, None, 100, None)])
+>>> len(frame)
+3
+>>> frame.algorithms, frame.algorithm.tolist()
+(('a', 'b'), [1, 0, 1])
+>>> frame.best_f.tolist()
+[10, 12, 11]
+>>> order, starts = frame.groups()
+>>> order.tolist(), starts.tolist()
+([1, 0, 2], [0, 1, 3])
+>>> [e.rand_seed for e in frame]
+[1, 2, 3]
+"""
+from math import isnan
+from typing import Final, Iterable, Iterator
+
+import numpy as np
+
+from moptipy.evaluation.end_results import EndResult
+from moptipy.utils.math import try_int
+from moptipy.utils.types import type_error
+
+
+def _column(values: list, dtype: type) -> np.ndarray:
+    """
+    Create a read-only column.
+
+    :param values: the values
+    :param dtype: the data type
+    :return: the column
+    """
+    result: Final[np.ndarray] = np.array(values, dtype)
+    result.flags.writeable = False
+    return result
+
+
+class EndResults:
+    """A columnar table of the end results of many runs."""
+
+    def __init__(self, algorithms: tuple[str, ...],
+                 instances: tuple[str, ...],
+                 algorithm: np.ndarray, instance: np.ndarray,
+                 rand_seed: np.ndarray, best_f: np.ndarray,
+                 last_improvement_fe: np.ndarray,
+                 last_improvement_time_millis: np.ndarray,
+                 total_fes: np.ndarray, total_time_millis: np.ndarray,
+                 goal_f: np.ndarray, max_fes: np.ndarray,
+                 max_time_millis: np.ndarray) -> None:
+        """
+        Create the table. Use :meth:`from_end_results` instead.
+
+        :param algorithms: the sorted algorithm names
+        :param instances: the sorted instance names
+        :param algorithm: the index of the algorithm of each run
+        :param instance: the index of the instance of each run
+        :param rand_seed: the random seeds
+        :param best_f: the best objective values
+        :param last_improvement_fe: the FEs of the last improvements
+        :param last_improvement_time_millis: the times of the last
+            improvements
+        :param total_fes: the total FEs
+        :param total_time_millis: the total times
+        :param goal_f: the goal objective values, `nan` if undefined
+        :param max_fes: the FE budgets, `-1` if undefined
+        :param max_time_millis: the time budgets, `-1` if undefined
+        """
+        n: Final[int] = len(algorithm)
+        for name, col in (("instance", instance), ("rand_seed", rand_seed),
+                          ("best_f", best_f),
+                          ("last_improvement_fe", last_improvement_fe),
+                          ("last_improvement_time_millis",
+                           last_improvement_time_millis),
+                          ("total_fes", total_fes),
+                          ("total_time_millis", total_time_millis),
+                          ("goal_f", goal_f), ("max_fes", max_fes),
+                          ("max_time_millis", max_time_millis)):
+            if not isinstance(col, np.ndarray):
+                raise type_error(col, name, np.ndarray)
+            if len(col) != n:
+                raise ValueError(
+                    f"{name} has {len(col)} rows, but algorithm has {n}.")
+        #: the sorted algorithm names
+        self.algorithms: Final[tuple[str, ...]] = algorithms
+        #: the sorted instance names
+        self.instances: Final[tuple[str, ...]] = instances
+        #: the index of the algorithm of each run in `algorithms`
+        self.algorithm: Final[np.ndarray] = algorithm
+        #: the index of the instance of each run in `instances`
+        self.instance: Final[np.ndarray] = instance
+        #: the random seeds
+        self.rand_seed: Final[np.ndarray] = rand_seed
+        #: the best objective values
+        self.best_f: Final[np.ndarray] = best_f
+        #: the FEs when the best objective values were reached
+        self.last_improvement_fe: Final[np.ndarray] = last_improvement_fe
+        #: the times when the best objective values were reached
+        self.last_improvement_time_millis: Final[np.ndarray] = \
+            last_improvement_time_millis
+        #: the total FEs
+        self.total_fes: Final[np.ndarray] = total_fes
+        #: the total times
+        self.total_time_millis: Final[np.ndarray] = total_time_millis
+        #: the goal objective values, `nan` where undefined
+        self.goal_f: Final[np.ndarray] = goal_f
+        #: the FE budgets, `-1` where undefined
+        self.max_fes: Final[np.ndarray] = max_fes
+        #: the time budgets, `-1` where undefined
+        self.max_time_millis: Final[np.ndarray] = max_time_millis
+
+    @staticmethod
+    def from_end_results(source: Iterable[EndResult]) -> "EndResults":
+        """
+        Create the table from end results.
+
+        :param source: the end results
+        :return: the table
+        """
+        if isinstance(source, EndResults):
+            return source
+        if not isinstance(source, Iterable):
+            raise type_error(source, "source", Iterable)
+        algorithm: Final[list[str]] = []
+        instance: Final[list[str]] = []
+        rand_seed: Final[list[int]] = []
+        best_f: Final[list[int | float]] = []
+        li_fe: Final[list[int]] = []
+        li_ms: Final[list[int]] = []
+        total_fes: Final[list[int]] = []
+        total_ms: Final[list[int]] = []
+        goal_f: Final[list[int | float]] = []
+        max_fes: Final[list[int]] = []
+        max_ms: Final[list[int]] = []
+        for er in source:
+            if not isinstance(er, EndResult):
+                raise type_error(er, "end result", EndResult)
+            algorithm.append(er.algorithm)
+            instance.append(er.instance)
+            rand_seed.append(er.rand_seed)
+            best_f.append(er.best_f)
+            li_fe.append(er.last_improvement_fe)
+            li_ms.append(er.last_improvement_time_millis)
+            total_fes.append(er.total_fes)
+            total_ms.append(er.total_time_millis)
+            goal_f.append(np.nan if er.goal_f is None else er.goal_f)
+            max_fes.append(-1 if er.max_fes is None else er.max_fes)
+            max_ms.append(
+                -1 if er.max_time_millis is None else er.max_time_millis)
+
+        algorithms: Final[tuple[str, ...]] = tuple(sorted(set(algorithm)))
+        instances: Final[tuple[str, ...]] = tuple(sorted(set(instance)))
+        algo_codes: Final[dict[str, int]] = {
+            a: i for i, a in enumerate(algorithms)}
+        inst_codes: Final[dict[str, int]] = {
+            a: i for i, a in enumerate(instances)}
+        return EndResults(
+            algorithms, instances,
+            _column([algo_codes[a] for a in algorithm], np.int64),
+            _column([inst_codes[i] for i in instance], np.int64),
+            _column(rand_seed, np.uint64),
+            _column(best_f, np.int64 if all(
+                isinstance(f, int) for f in best_f) else np.float64),
+            _column(li_fe, np.int64), _column(li_ms, np.int64),
+            _column(total_fes, np.int64), _column(total_ms, np.int64),
+            _column(goal_f, np.int64 if all(
+                isinstance(f, int) for f in goal_f) else np.float64),
+            _column(max_fes, np.int64), _column(max_ms, np.int64))
+
+    def __len__(self) -> int:
+        """
+        Get the number of runs in the table.
+
+        :return: the number of runs
+        """
+        return len(self.algorithm)
+
+    def __iter__(self) -> Iterator[EndResult]:
+        """
+        Convert the table back to end results.
+
+        :return: an iterator over the end results
+        """
+        for (a, i, seed, bf, li_fe, li_ms, t_fes, t_ms, gf, mf, mt) in zip(
+                self.algorithm.tolist(), self.instance.tolist(),
+                self.rand_seed.tolist(), self.best_f.tolist(),
+                self.last_improvement_fe.tolist(),
+                self.last_improvement_time_millis.tolist(),
+                self.total_fes.tolist(), self.total_time_millis.tolist(),
+                self.goal_f.tolist(), self.max_fes.tolist(),
+                self.max_time_millis.tolist(), strict=True):
+            yield EndResult(
+                self.algorithms[a], self.instances[i], seed, bf, li_fe,
+                li_ms, t_fes, t_ms, None if isnan(gf) else try_int(gf),
+                None if mf < 0 else mf, None if mt < 0 else mt)
+
+    def groups(self, join_all_algorithms: bool = False,
+               join_all_instances: bool = False) \
+            -> tuple[np.ndarray, np.ndarray]:
+        """
+        Group the runs by algorithm and/or instance.
+
+        The groups are sorted in the same way as the groups of
+        :meth:`~moptipy.evaluation.end_statistics.EndStatistics.\
+from_end_results`, i.e., by the instance name if all algorithms are joined,
+        by the algorithm name if all instances are joined, and by
+        `algorithm/instance` otherwise. Inside each group, the runs keep
+        their order.
+
+        :param join_all_algorithms: should the runs of all algorithms be
+            joined?
+        :param join_all_instances: should the runs of all instances be
+            joined?
+        :return: the indices of the runs sorted by group, and the start
+            index of each group in that array followed by the number of runs
+        """
+        if not isinstance(join_all_algorithms, bool):
+            raise type_error(join_all_algorithms,
+                             "join_all_algorithms", bool)
+        if not isinstance(join_all_instances, bool):
+            raise type_error(join_all_instances, "join_all_instances", bool)
+        codes: np.ndarray
+        labels: list[str]
+        if join_all_algorithms and join_all_instances:
+            codes = np.zeros(len(self), np.int64)
+            labels = [""]
+        elif join_all_algorithms:
+            codes = self.instance
+            labels = list(self.instances)
+        elif join_all_instances:
+            codes = self.algorithm
+            labels = list(self.algorithms)
+        else:
+            n_insts: Final[int] = len(self.instances)
+            codes = self.algorithm * n_insts + self.instance
+            labels = [f"{a}/{i}" for a in self.algorithms
+                      for i in self.instances]
+
+        present: Final[np.ndarray] = np.unique(codes)
+        rank: Final[np.ndarray] = np.empty(len(present), np.int64)
+        rank[sorted(range(len(present)),
+                    key=lambda k: labels[present[k]])] = \
+            np.arange(len(present))
+        group: Final[np.ndarray] = rank[np.searchsorted(present, codes)]
+        starts: Final[np.ndarray] = np.zeros(len(present) + 1, np.int64)
+        np.cumsum(np.bincount(group, minlength=len(present)),
+                  out=starts[1:])
+        return np.argsort(group, kind="stable"), starts
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from math import ceil, inf
 from typing import Any, Callable, Final, Iterable, Union
 
+import numpy as np
+
 import moptipy.api.logging as log
 from moptipy.evaluation._utils import _check_max_time_millis
 from moptipy.evaluation.base import (
@@ -14,6 +16,7 @@ from moptipy.evaluation.base import (
     MultiRunData,
 )
 from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.end_results_frame import EndResults
 from moptipy.evaluation.statistics import (
     CSV_COLS,
     EMPTY_CSV_ROW,
@@ -73,6 +76,131 @@ _GETTERS_1[log.KEY_BEST_F] = _GETTERS_1[F_NAME_RAW]
 _GETTERS_1[KEY_BEST_F_SCALED] = _GETTERS_1[F_NAME_SCALED]
 
 
+def _statistics(values: np.ndarray, starts: np.ndarray,
+                needed: list[bool] | None = None) -> list[Statistics | None]:
+    """
+    Compute the statistics of each group of a column sorted by group.
+
+    The values are passed to :meth:`~moptipy.evaluation.statistics.\
+Statistics.create` as lists of Python numbers, which keeps its exact integer
+    arithmetic.
+
+    :param values: the column values, sorted by group
+    :param starts: the start index of each group, followed by the length of
+        `values`
+    :param needed: for each group, whether its statistics are needed, or
+        `None` if they are needed for all groups
+    :return: the statistics of each group, or `None` for empty groups and
+        groups whose statistics are not needed
+    """
+    data: Final[list] = values.tolist()
+    bounds: Final[list[int]] = starts.tolist()
+    return [Statistics.create(data[bounds[g]:bounds[g + 1]])
+            if (bounds[g + 1] > bounds[g])
+            and ((needed is None) or needed[g]) else None
+            for g in range(len(bounds) - 1)]
+
+
+def _same_or_statistics(values: np.ndarray, starts: np.ndarray,
+                        defined: list[bool]) \
+        -> list[Statistics | int | float | None]:
+    """
+    Get a value that may be the same for all runs of each group.
+
+    :param values: the column values, sorted by group
+    :param starts: the start index of each group
+    :param defined: for each group, whether all values are defined
+    :return: `None` for groups with undefined values, the value if it is the
+        same in the whole group, and the statistics over the values otherwise
+    """
+    heads: Final[np.ndarray] = starts[:-1]
+    same: Final[list[bool]] = (np.minimum.reduceat(values, heads)
+                               == np.maximum.reduceat(values, heads)).tolist()
+    firsts: Final[list] = values[heads].tolist()
+    stats: Final[list] = _statistics(values, starts, [
+        d and not sm for d, sm in zip(defined, same, strict=True)])
+    return [None if not d else try_int(f) if sm else st
+            for d, sm, f, st in zip(defined, same, firsts, stats,
+                                    strict=True)]
+
+
+def _from_groups(frame: EndResults, order: np.ndarray,
+                 starts: np.ndarray) -> list["EndStatistics"]:
+    """
+    Compute the end statistics of all groups of runs of a table.
+
+    :param frame: the table of end results
+    :param order: the indices of the runs, sorted by group
+    :param starts: the start index of each group in `order`, followed by the
+        number of runs
+    :return: the end statistics of the groups
+    """
+    heads: Final[np.ndarray] = starts[:-1]
+    counts: Final[list[int]] = np.diff(starts).tolist()
+
+    def names(codes: np.ndarray, labels: tuple[str, ...]) \
+            -> list[str | None]:
+        lo = np.minimum.reduceat(codes[order], heads).tolist()
+        hi = np.maximum.reduceat(codes[order], heads).tolist()
+        return [labels[a] if a == b else None
+                for a, b in zip(lo, hi, strict=True)]
+
+    def every(mask: np.ndarray) -> np.ndarray:
+        return np.logical_and.reduceat(mask[order], heads)
+
+    def total(values: np.ndarray) -> list[int]:
+        return np.add.reduceat(values[order], heads).tolist()
+
+    best_f: Final[np.ndarray] = frame.best_f
+    goal_f: Final[np.ndarray] = frame.goal_f
+    li_fe: Final[np.ndarray] = frame.last_improvement_fe
+    li_ms: Final[np.ndarray] = frame.last_improvement_time_millis
+    has_goal: Final[np.ndarray] = ~np.isnan(goal_f)
+    with_goal: Final[list[bool]] = every(has_goal).tolist()
+    positive: Final[list[bool]] = every(has_goal & (goal_f > 0)).tolist()
+    success: Final[np.ndarray] = has_goal & (best_f <= goal_f)
+    n_success: Final[list[int]] = total(success.astype(np.int64))
+    ert_fes: Final[list[int]] = total(np.where(
+        success, li_fe, frame.total_fes))
+    ert_ms: Final[list[int]] = total(np.where(
+        success, li_ms, frame.total_time_millis))
+    success_order: Final[np.ndarray] = order[success[order]]
+    success_starts: Final[np.ndarray] = np.zeros(len(starts), np.int64)
+    np.cumsum(n_success, out=success_starts[1:])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled: Final[np.ndarray] = best_f / goal_f
+    return [EndStatistics(
+        algo, inst, n, bf, lfe, lms, tfes, tms, gf,
+        bfs if pos else None,
+        ns if wg else None,
+        sfes if wg else None,
+        sms if wg else None,
+        (inf if ns <= 0 else try_int_div(efes, ns)) if wg else None,
+        (inf if ns <= 0 else try_int_div(ems, ns)) if wg else None,
+        mfes, mms) for (algo, inst, n, bf, lfe, lms, tfes, tms, gf, bfs,
+                        pos, wg, ns, sfes, sms, efes, ems, mfes, mms)
+        in zip(names(frame.algorithm, frame.algorithms),
+               names(frame.instance, frame.instances), counts,
+               _statistics(best_f[order], starts),
+               _statistics(li_fe[order], starts),
+               _statistics(li_ms[order], starts),
+               _statistics(frame.total_fes[order], starts),
+               _statistics(frame.total_time_millis[order], starts),
+               _same_or_statistics(goal_f[order], starts, with_goal),
+               _statistics(scaled[order], starts, positive), positive,
+               with_goal,
+               n_success, _statistics(li_fe[success_order], success_starts),
+               _statistics(li_ms[success_order], success_starts),
+               ert_fes, ert_ms,
+               _same_or_statistics(frame.max_fes[order], starts,
+                                   every(frame.max_fes >= 0).tolist()),
+               _same_or_statistics(frame.max_time_millis[order], starts,
+                                   every(frame.max_time_millis >= 0)
+                                   .tolist()),
+               strict=True)]
+
+
 @dataclass(frozen=True, init=False, order=True)
 class EndStatistics(MultiRunData):
     """
@@ -394,124 +522,15 @@ class EndStatistics(MultiRunData):
         """
         Create an `EndStatistics` Record from an Iterable of `EndResult`.
 
-        :param source: the source
+        :param source: the source, which can also be an
+            :class:`~moptipy.evaluation.end_results_frame.EndResults` table
         :return: the statistics
         :rtype: EndStatistics
         """
-        if not isinstance(source, Iterable):
-            raise type_error(source, "source", Iterable)
-
-        n: int = 0
-        best_f: list[int | float] = []
-        last_improvement_fe: list[int] = []
-        last_improvement_time_millis: list[int] = []
-        total_fes: list[int] = []
-        total_time_millis: list[int] = []
-        max_fes: list[int] | None = []
-        max_fes_same: bool = True
-        max_time_millis: list[int] | None = []
-        max_time_same: bool = True
-        goal_f: list[int | float] | None = []
-        goal_f_same: bool = True
-        best_f_scaled: list[float] | None = []
-        n_success: int | None = 0
-        success_fes: list[int] | None = []
-        success_times: list[int] | None = []
-
-        fes: int = 0
-        time: int = 0
-        algorithm: str | None = None
-        instance: str | None = None
-
-        for er in source:
-            if not isinstance(er, EndResult):
-                raise type_error(er, "end result", EndResult)
-            if n == 0:
-                algorithm = er.algorithm
-                instance = er.instance
-            else:
-                if algorithm != er.algorithm:
-                    algorithm = None
-                if instance != er.instance:
-                    instance = None
-            n += 1
-            best_f.append(er.best_f)
-            last_improvement_fe.append(er.last_improvement_fe)
-            last_improvement_time_millis.append(
-                er.last_improvement_time_millis)
-            total_fes.append(er.total_fes)
-            total_time_millis.append(er.total_time_millis)
-            if er.max_fes is None:
-                max_fes = None
-            elif max_fes is not None:
-                if n > 1:
-                    max_fes_same = max_fes_same \
-                        and (max_fes[-1] == er.max_fes)
-                max_fes.append(er.max_fes)
-            if er.max_time_millis is None:
-                max_time_millis = None
-            elif max_time_millis is not None:
-                if n > 1:
-                    max_time_same = \
-                        max_time_same \
-                        and (max_time_millis[-1] == er.max_time_millis)
-                max_time_millis.append(er.max_time_millis)
-
-            if er.goal_f is None:
-                goal_f = None
-                best_f_scaled = None
-                n_success = None
-                success_fes = None
-                success_times = None
-            elif goal_f is not None:
-                if n > 1:
-                    goal_f_same = goal_f_same and (goal_f[-1] == er.goal_f)
-                goal_f.append(er.goal_f)
-
-                if er.goal_f <= 0:
-                    best_f_scaled = None
-                elif best_f_scaled is not None:
-                    best_f_scaled.append(er.best_f / er.goal_f)
-
-                if er.best_f <= er.goal_f:
-                    n_success += 1
-                    success_fes.append(er.last_improvement_fe)
-                    success_times.append(er.last_improvement_time_millis)
-                    fes += er.last_improvement_fe
-                    time += er.last_improvement_time_millis
-                else:
-                    fes += er.total_fes
-                    time += er.total_time_millis
-        if n <= 0:
+        frame: Final[EndResults] = EndResults.from_end_results(source)
+        if len(frame) <= 0:
             raise ValueError("There must be at least one end result record.")
-
-        return EndStatistics(
-            algorithm,
-            instance,
-            n,
-            Statistics.create(best_f),
-            Statistics.create(last_improvement_fe),
-            Statistics.create(last_improvement_time_millis),
-            Statistics.create(total_fes),
-            Statistics.create(total_time_millis),
-            None if (goal_f is None)
-            else (goal_f[0] if goal_f_same else Statistics.create(goal_f)),
-            None if (best_f_scaled is None)
-            else Statistics.create(best_f_scaled),
-            n_success,
-            None if (n_success is None) or (n_success <= 0)
-            else Statistics.create(success_fes),
-            None if (n_success is None) or (n_success <= 0)
-            else Statistics.create(success_times),
-            None if (n_success is None)
-            else (inf if (n_success <= 0) else try_int_div(fes, n_success)),
-            None if (n_success is None) else
-            (inf if (n_success <= 0) else try_int_div(time, n_success)),
-            None if max_fes is None else
-            (max_fes[0] if max_fes_same else Statistics.create(max_fes)),
-            None if max_time_millis is None
-            else (max_time_millis[0] if max_time_same
-                  else Statistics.create(max_time_millis)))
+        return _from_groups(frame, *frame.groups(True, True))[0]
 
     @staticmethod
     def from_end_results(source: Iterable[EndResult],
@@ -521,7 +540,14 @@ class EndStatistics(MultiRunData):
         """
         Aggregate statistics over a stream of end results.
 
-        :param source: the stream of end results
+        The end results are converted to a columnar
+        :class:`~moptipy.evaluation.end_results_frame.EndResults` table,
+        which is grouped once and aggregated column-wise. If the same end
+        results are aggregated several times, passing such a table as
+        `source` avoids converting them again.
+
+        :param source: the stream of end results, or an
+            :class:`~moptipy.evaluation.end_results_frame.EndResults` table
         :param consumer: the destination to which the new records will be
             sent, can be the `append` method of a :class:`list`
         :param join_all_algorithms: should the statistics be aggregated
@@ -533,42 +559,12 @@ class EndStatistics(MultiRunData):
             raise type_error(source, "source", Iterable)
         if not callable(consumer):
             raise type_error(consumer, "consumer", call=True)
-        if not isinstance(join_all_algorithms, bool):
-            raise type_error(join_all_algorithms,
-                             "join_all_algorithms", bool)
-        if not isinstance(join_all_instances, bool):
-            raise type_error(join_all_instances, "join_all_instances", bool)
-
-        if join_all_algorithms and join_all_instances:
-            consumer(EndStatistics.create(source))
-            return
-
-        sorter: dict[str, list[EndResult]] = {}
-        for er in source:
-            if not isinstance(er, EndResult):
-                raise type_error(source, "end results from source",
-                                 EndResult)
-            key = er.instance if join_all_algorithms else \
-                er.algorithm if join_all_instances else \
-                f"{er.algorithm}/{er.instance}"
-            if key in sorter:
-                lst = sorter[key]
-            else:
-                lst = []
-                sorter[key] = lst
-            lst.append(er)
-
-        if len(sorter) <= 0:
+        frame: Final[EndResults] = EndResults.from_end_results(source)
+        order, starts = frame.groups(join_all_algorithms, join_all_instances)
+        if len(frame) <= 0:
             raise ValueError("source must not be empty")
-
-        if len(sorter) > 1:
-            keyz = list(sorter.keys())
-            keyz.sort()
-            for key in keyz:
-                consumer(EndStatistics.create(sorter[key]))
-        else:
-            consumer(EndStatistics.create(
-                next(iter(sorter.values()))))
+        for es in _from_groups(frame, order, starts):
+            consumer(es)
 
     @staticmethod
     def to_csv(  # noqa
@@ -38,7 +38,7 @@ import numpy as np
 
 import moptipy.api.logging as lg
 import moptipy.utils.nputils as npu
-from moptipy.evaluation._utils import _get_reach_index
+from moptipy.evaluation._utils import _pack_progress, _reach_indices
 from moptipy.evaluation.base import (
     F_NAME_NORMALIZED,
     F_NAME_RAW,
@@ -58,6 +58,49 @@ from moptipy.utils.strings import num_to_str
 from moptipy.utils.types import type_error
 
 
+def _erts(time: np.ndarray, offsets: np.ndarray,
+          reach: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute ERTs from the indices where the runs reached the goals.
+
+    :param time: the concatenated time arrays of the runs, see
+        :func:`~moptipy.evaluation._utils._pack_progress`
+    :param offsets: the offsets of the runs
+    :param reach: the matrix of the indices where the runs (columns) reached
+        the goals (rows), see
+        :func:`~moptipy.evaluation._utils._reach_indices`
+    :return: the sums of the times that the runs spent with a quality worse
+        than each goal and the ERT for each goal
+
+    >>> _erts(np.array([1, 5, 1, 2, 8]), np.array([0, 2, 5]),
+    ...       np.array([[1, 4], [-1, 4], [-1, -1]]))
+    (array([13, 13, 13]), array([ 6.5, 13. ,  inf]))
+    """
+    hit: Final[np.ndarray] = reach >= 0
+    n_success: Final[np.ndarray] = hit.sum(axis=1)
+    time_sums: Final[np.ndarray] = np.where(
+        hit, time[reach], time[offsets[1:] - 1]).sum(axis=1)
+    erts: Final[np.ndarray] = np.full(len(n_success), inf)
+    np.divide(time_sums, n_success, out=erts, where=n_success > 0)
+    return time_sums, erts
+
+
+def _single_ert(time: np.ndarray, offsets: np.ndarray,
+                reach: np.ndarray) -> float:
+    """
+    Compute a single ERT from the indices where the runs reached the goal.
+
+    :param time: the concatenated time arrays of the runs
+    :param offsets: the offsets of the runs
+    :param reach: the indices where the runs reached the goal
+    :return: the ERT
+    """
+    time_sums, erts = _erts(time, offsets, reach.reshape((1, -1)))
+    if time_sums[0] <= 0:
+        raise ValueError(f"Time sum cannot be {time_sums[0]}.")
+    return float(erts[0])
+
+
 def compute_single_ert(source: Iterable[Progress],
                        goal_f: int | float) -> float:
     """
@@ -74,21 +117,11 @@ def compute_single_ert(source: Iterable[Progress],
     :param goal_f: the goal objective value
     :return: the ERT
     """
-    n_success: int = 0
-    time_sum: int = 0
-    for progress in source:
-        size = progress.f.size
-        idx = size - _get_reach_index(progress.f, goal_f)
-        if idx < size:
-            n_success += 1
-        else:
-            idx = cast(np.integer, -1)
-        time_sum = time_sum + int(progress.time[idx])
-    if time_sum <= 0:
-        raise ValueError(f"Time sum cannot be {time_sum}.")
-    if n_success <= 0:
-        return inf
-    return time_sum / n_success
+    prgs: Final[list[Progress]] = cast(list[Progress], source) \
+        if isinstance(source, list) else list(source)
+    offsets, time, f = _pack_progress(prgs)
+    return _single_ert(time, offsets, _reach_indices(
+        offsets, f, np.full((1, len(prgs)), goal_f)))
 
 
 @dataclass(frozen=True, init=False, order=True)
@@ -271,32 +304,11 @@ class Ert(MultiRun2DData):
             x = x[x >= lower_bound]
         base_len: Final[int] = x.size
 
-        # prepare for backward iteration over arrays
-        indices = np.array([(ppr.f.size - 1) for ppr in prgs],
-                           dtype=npu.DEFAULT_INT)
-        y = np.empty(base_len, dtype=npu.DEFAULT_FLOAT)
-
-        for out_index in range(base_len):
-            f_lim = x[out_index]
-            found = 0
-            time_sum: int = 0
-            for r_idx, pr in enumerate(prgs):
-                idx = indices[r_idx]
-                f_vals = pr.f
-                # did we fulfill the limit?
-                if f_vals[idx] <= f_lim:
-                    found += 1
-                    # can we move time cursor back?
-                    if (idx > 0) and (f_vals[idx - 1] <= f_lim):
-                        idx -= 1
-                        indices[r_idx] = idx
-                else:
-                    # condition not fulfilled, need to use maximum time
-                    idx = -1
-                time_sum = time_sum + int(pr.time[idx])
-
-            # compute ert value: infinite if no run meets condition
-            y[out_index] = inf if (found <= 0) else time_sum / found
+        # compute the times when the runs reach all the goals at once
+        offsets, time, f = _pack_progress(prgs)
+        y: Final[np.ndarray] = _erts(time, offsets, _reach_indices(
+            offsets, f, np.broadcast_to(x.reshape((base_len, 1)),
+                                        (base_len, n))))[1]
 
         # convert the two arrays into one matrix
         ert = np.concatenate((x, y)).reshape((base_len, 2), order="F")
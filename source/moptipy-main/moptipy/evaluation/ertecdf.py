@@ -27,9 +27,10 @@ instances that were solved.
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from moptipy.evaluation.ecdf import Ecdf
-from moptipy.evaluation.ert import compute_single_ert
-from moptipy.evaluation.progress import Progress
+from moptipy.evaluation.ert import _single_ert
 
 
 @dataclass(frozen=True, init=False, order=True)
@@ -53,16 +54,17 @@ class ErtEcdf(Ecdf):
         return f"ert[{super()._time_key()}]"
 
     @staticmethod
-    def _compute_times(source: list[Progress],
-                       goal: int | float) -> list[float]:
+    def _compute_times(time: np.ndarray, offsets: np.ndarray,
+                       reach: np.ndarray) -> list[float]:
         """
         Compute the times for the given goals.
 
-        :param source: the source array
-        :param goal: the goal value
+        :param time: the concatenated time arrays of the runs
+        :param offsets: the offsets of the runs
+        :param reach: the indices where the runs reached the goal
         :return: a list of times
         """
-        return [compute_single_ert(source, goal)]
+        return [_single_ert(time, offsets, reach)]
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -19,18 +19,91 @@ and the method :meth:`~moptipy.evaluation.progress.Progress.from_logs` in
 module :mod:`~moptipy.evaluation.progress` reads the whole
 :class:`~moptipy.evaluation.progress.Progress` that the algorithms make
 over time.
+
+If a binary log written by :class:`~moptipy.utils.binary_logger.BinaryLogger`
+exists next to a log file (see
+:meth:`~moptipy.api.execution.Execution.set_binary_log`), it is parsed
+instead of the text log. Its key-values sections are passed to
+:meth:`~LogParser.lines` as usual, whereas its typed column sections, such as
+the `PROGRESS`, are mapped into memory and passed to
+:meth:`~LogParser.columns` without being converted to text. A binary log
+without text log is parsed as well.
 """
 
+import multiprocessing as mp
+import os
+import pickle  # nosec
+from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE, BOM_UTF32_BE
+from contextlib import closing
+from mmap import ACCESS_READ, mmap
 from os import listdir
 from os.path import basename, dirname, isdir, isfile, join
-from typing import Final
+from typing import Any, Callable, Final, Iterator
+
+import numpy as np
 
 from moptipy.api import logging
+from moptipy.utils.binary_logger import read_binary_log
 from moptipy.utils.console import logger
-from moptipy.utils.logger import COMMENT_CHAR, SECTION_END, SECTION_START
+from moptipy.utils.logger import (
+    COMMENT_CHAR,
+    CSV_SEPARATOR,
+    SECTION_END,
+    SECTION_START,
+)
 from moptipy.utils.nputils import rand_seed_check
 from moptipy.utils.path import Path
-from moptipy.utils.strings import PART_SEPARATOR, sanitize_name
+from moptipy.utils.strings import PART_SEPARATOR, float_to_str, sanitize_name
+from moptipy.utils.types import check_int_range, type_error
+
+
+#: the byte order marks of UTF-16 and UTF-32 text
+_WIDE_BOMS: Final[tuple[bytes, ...]] = (
+    BOM_UTF16_LE, BOM_UTF16_BE, BOM_UTF32_BE)
+
+
+def _clean_lines(text: str) -> list[str]:
+    """
+    Strip the lines of a section from white space and comments.
+
+    :param text: the text of the section
+    :return: the non-empty lines
+
+    >>> _clean_lines("a: 1\\n  # comment\\n\\nb: 2 # x\\n")
+    ['a: 1', 'b: 2']
+    """
+    lines: Final[list[str]] = []
+    for line in text.splitlines():
+        cur = _clean_line(line)
+        if len(cur) > 0:
+            lines.append(cur)
+    return lines
+
+
+def _clean_line(line: str) -> str:
+    """
+    Strip a single line from white space and comments.
+
+    :param line: the line
+    :return: the stripped line, which may be empty
+
+    >>> _clean_line("  END_A # x\\r")
+    'END_A'
+    """
+    cur: str = line.strip()
+    i: Final[int] = cur.find(COMMENT_CHAR)
+    return cur if i < 0 else cur[:i].strip()
+
+
+def _is_sidecar(path: str) -> bool:
+    """
+    Check whether a file is a binary log next to its text log.
+
+    :param path: the path to the file
+    :return: `True` if the file is a binary log whose text log exists
+    """
+    return path.endswith(logging.BINARY_SUFFIX) and isfile(
+        path[:-len(logging.BINARY_SUFFIX)])
 
 
 class LogParser:
@@ -187,6 +260,39 @@ class LogParser:
         del lines
         return True
 
+    def columns(self, columns: dict[str, np.ndarray]) -> bool:
+        """
+        Consume the typed columns of a section from a binary log.
+
+        This method is invoked instead of
+        :meth:`~moptipy.evaluation.log_parser.LogParser.lines` for the
+        sections that a binary log stores as typed columns, such as the
+        `PROGRESS` section. The arrays are memory-mapped views of the file
+        and must not be modified. By default, the columns are converted to
+        the lines of the corresponding CSV section and passed to
+        :meth:`~moptipy.evaluation.log_parser.LogParser.lines`. Parsers can
+        override this method to process the arrays directly, which is much
+        faster.
+
+        :param columns: a dictionary mapping the column names to the
+            column arrays
+        :return: `True` if further parsing is necessary, `False` if the
+            parsing process can be terminated, exactly as for
+            :meth:`~moptipy.evaluation.log_parser.LogParser.lines`
+
+        >>> class P(LogParser):
+        ...     def lines(self, lines: list[str]) -> bool:
+        ...         print(lines)
+        ...         return True
+        >>> P().columns({"a": np.array([1, 2]), "b": np.array([0.5, 3.0])})
+        ['a;b', '1;0.5', '2;3']
+        True
+        """
+        values = [[str(v) if isinstance(v, int) else float_to_str(v)
+                   for v in c.tolist()] for c in columns.values()]
+        return self.lines([CSV_SEPARATOR.join(columns.keys()), *(
+            CSV_SEPARATOR.join(row) for row in zip(*values))])
+
     # noinspection PyMethodMayBeStatic
     def end_file(self) -> bool:
         """
@@ -219,6 +325,9 @@ class LogParser:
         :meth:`~moptipy.evaluation.log_parser.LogParser.lines` for
         each section content (if requested). At the end,
         :meth:`~moptipy.evaluation.log_parser.LogParser.end_file` is invoked.
+        If a binary log exists next to the file, it is parsed instead and
+        its typed column sections are passed to
+        :meth:`~moptipy.evaluation.log_parser.LogParser.columns`.
 
         This method can either be called directly or is called by
         :meth:`~moptipy.evaluation.log_parser.LogParser.parse_dir`. In the
@@ -233,7 +342,13 @@ class LogParser:
         :return: the return value received from invoking
             :meth:`~moptipy.evaluation.log_parser.LogParser.end_file`
         """
-        file: Final[Path] = Path.file(path)
+        file: Path = Path.file(path)
+        binary: Path | None = None
+        if file.endswith(logging.BINARY_SUFFIX):  # a binary log only
+            binary = file
+            file = Path.path(file[:-len(logging.BINARY_SUFFIX)])
+        elif isfile(file + logging.BINARY_SUFFIX):
+            binary = Path.file(file + logging.BINARY_SUFFIX)
 
         retval: bool
         try:
@@ -249,83 +364,10 @@ class LogParser:
                 logger(f"skipping file {file!r}.")
             return True
 
-        lines: list[str] = []
-        buffer: list[str] = []
-        state: int = 0
-        wants_section: bool = False
-        sec_end: str = ""
-        section: str = ""
-        sect_start: Final[str] = SECTION_START
-        sect_end: Final[str] = SECTION_END
-        cmt_chr: Final[str] = COMMENT_CHAR
-
-        index: int = 0
-        with file.open_for_read() as handle:
-            while True:
-
-                # get the next line
-                if index >= len(buffer):
-                    try:
-                        buffer = handle.readlines(128)
-                    except Exception as be:
-                        raise ValueError(
-                            f"Error when reading lines from file {file!r} "
-                            f"while in section {section!r}."
-                            if state == 1 else
-                            f"Error when reading lines from file {file!r}.") \
-                            from be
-                    if (buffer is None) or (len(buffer) <= 0):
-                        break
-                    index = 0
-
-                orig_cur = buffer[index]
-                index += 1
-
-                # strip next line from comments and white space
-                cur = orig_cur.strip()
-                if len(cur) <= 0:
-                    continue
-
-                i = cur.find(cmt_chr)
-                if i >= 0:
-                    cur = cur[:i].strip()
-                    if len(cur) <= 0:
-                        continue
-
-                if state in (0, 2):
-                    if not cur.startswith(sect_start):
-                        raise ValueError("Line should start with "
-                                         f"{sect_start!r} but is "
-                                         f"{orig_cur!r} in file {file!r}.")
-                    section = cur[len(sect_start):]
-                    if len(section) <= 0:
-                        raise ValueError(
-                            "Section title cannot be empty in "
-                            f"{file!r}, but encountered {orig_cur!r}.")
-                    state = 1
-                    sec_end = sect_end + section
-                    wants_section = self.start_section(section)
-                elif state == 1:
-                    if cur == sec_end:
-                        state = 2
-                        if wants_section:
-                            try:
-                                do_next = self.lines(lines)
-                            except Exception as be:
-                                raise ValueError(
-                                    "Error when processing section "
-                                    f"{section!r} in file {file!r}.") from be
-                            lines.clear()
-                            if not do_next:
-                                break
-                    elif wants_section:
-                        lines.append(cur)
-
-        if state == 0:
-            raise ValueError(f"Log file {file!r} contains no section.")
-        if state == 1:
-            raise ValueError(f"Log file {file!r} ended before"
-                             f"encountering {sec_end!r}.")
+        if binary is not None:
+            self.__parse_binary(binary)
+        else:
+            self.__parse_text(file)
 
         try:
             retval = self.end_file()
@@ -336,6 +378,124 @@ class LogParser:
             logger(f"finished parsing file {file!r}.")
         return retval
 
+    def __parse_binary(self, file: Path) -> None:
+        """
+        Parse the sections of a binary log file.
+
+        :param file: the binary log file
+        """
+        n_sections: int = 0
+        with closing(read_binary_log(file)) as sections:
+            for section, data in sections:
+                n_sections += 1
+                if not self.start_section(section):
+                    continue
+                try:
+                    do_next = self.lines(_clean_lines(data)) \
+                        if isinstance(data, str) else self.columns(
+                            {n: data[n] for n in data.dtype.names})
+                except Exception as be:
+                    raise ValueError(
+                        "Error when processing section "
+                        f"{section!r} in file {file!r}.") from be
+                if not do_next:
+                    break
+        if n_sections <= 0:
+            raise ValueError(f"Log file {file!r} contains no section.")
+
+    def __parse_text(self, file: Path) -> None:
+        """
+        Parse the sections of a text log file.
+
+        UTF-8 encoded files are mapped into memory. The end of each section
+        is then located by a byte search for its end marker and only the
+        sections requested by
+        :meth:`~moptipy.evaluation.log_parser.LogParser.start_section` are
+        decoded and split into lines. Skipping a large section, such as the
+        `PROGRESS` when only the end results are needed, therefore costs
+        hardly more than the search. Files in other encodings are decoded
+        as a whole first.
+
+        :param file: the log file
+        """
+        with open(file, "rb") as handle:
+            bom: Final[bytes] = handle.read(4)
+            if bom.startswith(_WIDE_BOMS):  # UTF-16 or UTF-32 text
+                self.__parse_sections(
+                    file, file.read_all_str().encode("utf-8"), 0)
+            elif len(bom) <= 0:
+                raise ValueError(f"Log file {file!r} contains no section.")
+            else:
+                with mmap(handle.fileno(), 0, access=ACCESS_READ) as data:
+                    self.__parse_sections(file, data, len(
+                        BOM_UTF8) if bom.startswith(BOM_UTF8) else 0)
+
+    def __parse_sections(self, file: Path, data: bytes | mmap,
+                         pos: int) -> None:
+        """
+        Parse the sections of UTF-8 encoded log data.
+
+        :param file: the log file
+        :param data: the log data
+        :param pos: the index where the text starts
+        """
+        size: Final[int] = len(data)
+        sect_start: Final[str] = SECTION_START
+        has_section: bool = False
+        while pos < size:
+            # get the next line, which must start a section
+            end: int = data.find(b"\n", pos)
+            if end < 0:
+                end = size
+            orig_cur: str = data[pos:end].decode("utf-8")
+            pos = end + 1
+            cur: str = _clean_line(orig_cur)
+            if len(cur) <= 0:
+                continue
+            if not cur.startswith(sect_start):
+                raise ValueError(
+                    f"Line should start with {sect_start!r} but is "
+                    f"{orig_cur!r} in file {file!r}.")
+            section: str = cur[len(sect_start):]
+            if len(section) <= 0:
+                raise ValueError("Section title cannot be empty in "
+                                 f"{file!r}, but encountered {orig_cur!r}.")
+            has_section = True
+            wants_section: bool = self.start_section(section)
+
+            # find the first line consisting only of the end marker
+            sec_end: str = SECTION_END + section
+            marker: bytes = sec_end.encode("utf-8")
+            body: int = pos
+            while True:
+                found: int = data.find(marker, pos)
+                if found < 0:
+                    raise ValueError(f"Log file {file!r} ended before"
+                                     f"encountering {sec_end!r}.")
+                line_start: int = max(
+                    data.rfind(b"\n", body, found) + 1, body)
+                end = data.find(b"\n", found)
+                if end < 0:
+                    end = size
+                pos = end + 1
+                if _clean_line(data[line_start:end].decode(
+                        "utf-8")) == sec_end:
+                    break
+
+            if wants_section:
+                try:
+                    do_next = self.lines(_clean_lines(
+                        data[body:line_start].decode("utf-8")))
+                except Exception as be:
+                    raise ValueError(
+                        "Error when processing section "
+                        f"{section!r} in file {file!r}.") from be
+                if not do_next:
+                    return
+
+        if not has_section:
+            raise ValueError(f"Log file {file!r} contains no section.")
+
     def parse_dir(self, path: str) -> bool:
         """
         Recursively parse the given directory.
@@ -371,6 +531,8 @@ class LogParser:
         for subpath in listdir(folder):
             sub = Path.path(join(folder, subpath))
             if isfile(sub):
+                if _is_sidecar(sub):
+                    continue  # parsed together with its text log
                 if do_files and (not self.parse_file(sub)):
                     logger(f"will parse no more files in {folder!r}.")
                     if not do_dirs:
@@ -399,6 +561,40 @@ class LogParser:
 
         return retval
 
+    def files(self, path: str) -> list[Path]:
+        """
+        List the files that parsing a path would visit, in sorted order.
+
+        If `path` identifies a file, only this file is returned. Otherwise,
+        the directory is traversed recursively and in sorted order, where
+        only the directories for which
+        :meth:`~moptipy.evaluation.log_parser.LogParser.start_dir` returns
+        `True` are entered. Binary logs that are parsed together with their
+        text log are not listed.
+        :meth:`~moptipy.evaluation.log_parser.LogParser.start_file` is not
+        invoked, as it is called when the files are parsed.
+
+        :param path: a path identifying either a directory or a file.
+        :return: the list of files
+        """
+        npath: Final[Path] = Path.path(path)
+        if isfile(npath):
+            return [npath]
+        if not isdir(npath):
+            raise ValueError(
+                f"Path {npath} is neither a file nor a directory?")
+        result: Final[list[Path]] = []
+        folder: Final[Path] = Path.directory(npath)
+        if self.start_dir(folder):
+            for subpath in sorted(listdir(folder)):
+                sub = Path.path(join(folder, subpath))
+                if isfile(sub):
+                    if not _is_sidecar(sub):
+                        result.append(sub)
+                elif isdir(sub):
+                    result.extend(self.files(sub))
+        return result
+
     def parse(self, path: str) -> bool:
         """
         Parse either a directory or a file.
@@ -473,3 +669,198 @@ class ExperimentParser(LogParser):
         self.algorithm = None
         self.instance = None
         return super().end_file()
+
+
+#: the key of the format version in the evaluation cache
+_CACHE_VERSION_KEY: Final[str] = "__version__"
+#: the format version of the evaluation cache
+_CACHE_VERSION: Final[int] = 1
+
+#: the parser of a worker process of :func:`parse_parallel`
+_WORKER_PARSER: Final[list[LogParser]] = []
+#: the records collected by the parser of a worker process
+_WORKER_RECORDS: Final[list] = []
+
+
+def _init_worker(factory: Callable[[Callable[[Any], Any]], LogParser]) \
+        -> None:
+    """
+    Create the parser of a worker process.
+
+    :param factory: the factory creating the parser for a consumer
+    """
+    _WORKER_PARSER.clear()
+    _WORKER_PARSER.append(factory(_WORKER_RECORDS.append))
+
+
+def _parse_in_worker(file: str) -> list:
+    """
+    Parse a file in a worker process.
+
+    :param file: the file
+    :return: the records that the parser passed to its consumer
+    """
+    _WORKER_RECORDS.clear()
+    _WORKER_PARSER[0].parse_file(file)
+    records: Final[list] = list(_WORKER_RECORDS)
+    _WORKER_RECORDS.clear()
+    return records
+
+
+def _stamp(file: str) -> tuple[int, ...]:
+    """
+    Get the modification time and size of a log file and its binary log.
+
+    :param file: the log file
+    :return: the stamp identifying the current version of the file
+    """
+    st = os.stat(file)
+    binary: Final[str] = file + logging.BINARY_SUFFIX
+    if not os.path.isfile(binary):
+        return st.st_mtime_ns, st.st_size
+    bst = os.stat(binary)
+    return st.st_mtime_ns, st.st_size, bst.st_mtime_ns, bst.st_size
+
+
+def _load_cache(cache_file: str) -> dict[str, dict[str, tuple]]:
+    """
+    Load the evaluation cache.
+
+    :param cache_file: the cache file
+    :return: the cache, or an empty dictionary if the file does not exist or
+        is invalid
+    """
+    if os.path.isfile(cache_file):
+        try:
+            with open(cache_file, "rb") as f:
+                cache = pickle.load(f)  # nosec
+            if isinstance(cache, dict) and \
+                    (cache.get(_CACHE_VERSION_KEY) == _CACHE_VERSION):
+                return cache
+        except Exception as be:  # noqa: BLE001
+            logger(f"ignoring invalid cache file {cache_file!r}: {be}")
+    return {_CACHE_VERSION_KEY: _CACHE_VERSION}
+
+
+def _store_cache(cache_file: str, cache: dict[str, dict[str, tuple]]) \
+        -> None:
+    """
+    Store the evaluation cache atomically.
+
+    :param cache_file: the cache file
+    :param cache: the cache
+    """
+    temp: Final[str] = f"{cache_file}.{os.getpid()}.tmp"
+    with open(temp, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, cache_file)
+
+
+def _parse_files(files: list[Path],
+                 factory: Callable[[Callable[[Any], Any]], LogParser],
+                 n_workers: int) -> Iterator[list]:
+    """
+    Parse files and collect the records of each file.
+
+    :param files: the files
+    :param factory: the factory creating the parser for a consumer
+    :param n_workers: the number of worker processes
+    :return: an iterator over the lists of records, one per file, in the
+        order of the files
+    """
+    n_workers = min(n_workers, len(files))
+    if (n_workers <= 1) or ("fork" not in mp.get_all_start_methods()):
+        records: Final[list] = []
+        parser: Final[LogParser] = factory(records.append)
+        for file in files:
+            parser.parse_file(file)
+            yield list(records)
+            records.clear()
+        return
+    logger(f"parsing {len(files)} files with {n_workers} processes.")
+    with mp.get_context("fork").Pool(
+            n_workers, _init_worker, (factory, )) as pool:
+        yield from pool.imap(_parse_in_worker, files, max(
+            1, min(64, len(files) // (4 * n_workers))))
+
+
+def parse_parallel(path: str,
+                   factory: Callable[[Callable[[Any], Any]], LogParser],
+                   consumer: Callable[[Any], Any],
+                   n_workers: int = 1,
+                   cache_file: str | None = None,
+                   cache_key: str = "") -> None:
+    """
+    Parse a file or directory with a pool of worker processes and a cache.
+
+    The parser created by `factory` for a given consumer callable is used to
+    list the files to parse (see
+    :meth:`~moptipy.evaluation.log_parser.LogParser.files`). These files
+    are then distributed over `n_workers` forked processes, each of which
+    creates its own parser via `factory`. The records that the workers pass
+    to their consumers are sent back and handed to `consumer` in the sorted
+    order of the files, so the result does not depend on which process
+    parses which file. If processes cannot be forked on this system, the
+    files are parsed in the current process.
+
+    If a `cache_file` is given, the records parsed from each log file are
+    stored in it, together with the modification time and size of the log
+    file (and of its binary log, if any). When the same path is parsed
+    again, only the new or changed log files are parsed, while the records
+    of the others are loaded from the cache. The records are stored under
+    the `cache_key`, which must identify the type of the parser and all of
+    its options: Records parsed with different options are kept apart and
+    never mixed up. Records of log files that no longer exist are removed
+    from the cache.
+
+    If neither `n_workers > 1` nor a `cache_file` is given, the path is
+    parsed in the current process, in the order in which the directories
+    are listed.
+
+    :param path: the file or directory to parse
+    :param factory: a callable creating a parser that passes its records to
+        the consumer given as its parameter
+    :param consumer: the consumer of the records
+    :param n_workers: the number of worker processes
+    :param cache_file: the path to the cache file, or `None` if no cache
+        should be used
+    :param cache_key: the key identifying the parser and its options in the
+        cache
+    """
+    if not callable(factory):
+        raise type_error(factory, "factory", call=True)
+    if not callable(consumer):
+        raise type_error(consumer, "consumer", call=True)
+    check_int_range(n_workers, "n_workers", 1, 16384)
+    if not isinstance(cache_key, str):
+        raise type_error(cache_key, "cache_key", str)
+    if (cache_file is None) and (n_workers <= 1):
+        factory(consumer).parse(path)
+        return
+
+    files: Final[list[Path]] = factory(consumer).files(path)
+    cache: Final[dict[str, dict[str, tuple]]] = {} if cache_file is None \
+        else _load_cache(Path.path(cache_file))
+    entries: Final[dict[str, tuple]] = cache.get(cache_key, {})
+    stamps: Final[list[tuple[int, ...]]] = [_stamp(f) for f in files]
+    todo: Final[list[Path]] = [
+        f for f, s in zip(files, stamps, strict=True)
+        if (f not in entries) or (entries[f][0] != s)]
+    if cache_file is not None:
+        logger(f"found {len(files) - len(todo)} of {len(files)} log files "
+               f"under {path!r} in cache {cache_file!r}.")
+
+    parsed: Final[Iterator[list]] = _parse_files(todo, factory, n_workers)
+    for file, stamp in zip(files, stamps, strict=True):
+        if (file not in entries) or (entries[file][0] != stamp):
+            entries[file] = (stamp, next(parsed))
+        for record in entries[file][1]:
+            consumer(record)
+    for _ in parsed:  # close the pool
+        pass
+
+    if cache_file is not None:
+        for file in [f for f in entries if not os.path.isfile(f)]:
+            del entries[file]
+        cache[cache_key] = entries
+        _store_cache(Path.path(cache_file), cache)
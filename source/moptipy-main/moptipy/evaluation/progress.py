@@ -1,6 +1,6 @@
 """Progress data over a run."""
 from dataclasses import dataclass
-from math import inf, isfinite
+from math import isfinite
 from typing import Any, Callable, Final
 
 import numpy as np
@@ -16,7 +16,7 @@ from moptipy.evaluation.base import (
     check_f_name,
     check_time_unit,
 )
-from moptipy.evaluation.log_parser import ExperimentParser
+from moptipy.evaluation.log_parser import ExperimentParser, parse_parallel
 from moptipy.utils.console import logger
 from moptipy.utils.logger import (
     COMMENT_CHAR,
@@ -24,6 +24,7 @@ from moptipy.utils.logger import (
     KEY_VALUE_SEPARATOR,
     parse_key_values,
 )
+from moptipy.utils.math import DBL_INT_LIMIT_P
 from moptipy.utils.nputils import is_all_finite, is_np_float, is_np_int
 from moptipy.utils.path import Path
 from moptipy.utils.strings import num_to_str, str_to_intfloat
@@ -155,7 +156,9 @@ class Progress(PerRunData):
                   time_unit: str = TIME_UNIT_FES,
                   f_name: str = F_NAME_RAW,
                   f_standard: dict[str, int | float] | None = None,
-                  only_improvements: bool = True) -> None:
+                  only_improvements: bool = True,
+                  n_workers: int = 1,
+                  cache_file: str | None = None) -> None:
         """
         Parse a given path and pass all progress data found to the consumer.
 
@@ -164,7 +167,13 @@ class Progress(PerRunData):
         the `collector`. If `path` identifies a directory, then this directory
         is parsed recursively for each log file found, one record is passed to
         the `consumer`. The `consumer` is simply a callable function. You could
-        pass in the `append` method of a :class:`list`.
+        pass in the `append` method of a :class:`list`. If `n_workers > 1`,
+        the log files are parsed by that many processes in parallel via
+        :func:`~moptipy.evaluation.log_parser.parse_parallel` and the records
+        are passed to the `consumer` in the sorted order of the log files.
+        If a `cache_file` is given, the progress data is stored in it and,
+        when parsing the same log files with the same options again, only
+        new or changed log files are parsed.
 
         :param path: the path to parse
         :param consumer: the consumer, can be the `append` method of a
@@ -174,9 +183,14 @@ class Progress(PerRunData):
         :param f_standard: a dictionary mapping instances to standard values
         :param only_improvements: enforce that f-values should be improving and
             time values increasing
+        :param n_workers: the number of processes parsing the log files
+        :param cache_file: the optional file caching the parsed progress
         """
-        _InnerLogParser(time_unit, f_name, consumer, f_standard,
-                        only_improvements).parse(path)
+        parse_parallel(path, lambda c: _InnerLogParser(
+            time_unit, f_name, c, f_standard, only_improvements),
+            consumer, n_workers, cache_file,
+            f"Progress;{time_unit};{f_name};{only_improvements};"
+            f"{None if f_standard is None else sorted(f_standard.items())}")
 
     def to_csv(self, file: str,
                put_header: bool = True) -> str:
@@ -214,6 +228,57 @@ class Progress(PerRunData):
         return path
 
 
+def _load_columns(lines: list[str], cols: list[int]) -> list[np.ndarray]:
+    """
+    Load some columns of a CSV section into :mod:`numpy` arrays.
+
+    Only the requested columns are parsed, in one bulk call. In line with
+    :func:`~moptipy.utils.strings.str_to_intfloat`, a column whose values
+    are all integers becomes an `int64` array and a column without any
+    integer becomes a `float64` array. A column mixing integers with other
+    values, e.g., with `inf`, becomes an `object` array holding each value
+    as the `int` or `float` that `str_to_intfloat` would return. The bulk
+    parsing goes via `float64`, which is exact for integers below
+    :const:`~moptipy.utils.math.DBL_INT_LIMIT_P`. The rare bigger integers
+    are parsed again, value by value.
+
+    :param lines: the lines of the section, starting with the header
+    :param cols: the indices of the columns to load
+    :return: the arrays with the column data, in the order of `cols`
+
+    >>> [c.tolist() for c in _load_columns(
+    ...     ["a;b;c", "1;2;3.5", "2;4;3.0"], [0, 2])]
+    [[1, 2], [3.5, 3]]
+    >>> [c.tolist() for c in _load_columns(["a;b", "1;2.0", "2;4e1"], [1])]
+    [[2, 40]]
+    >>> _load_columns(["a", "9007199254740993"], [0])[0].tolist()
+    [9007199254740993]
+    >>> _load_columns(["a", "3", "inf", "2.5"], [0])[0].tolist()
+    [3, inf, 2.5]
+    """
+    unique: Final[list[int]] = list(dict.fromkeys(cols))
+    table: Final[np.ndarray] = np.loadtxt(
+        lines, np.float64, delimiter=CSV_SEPARATOR, skiprows=1,
+        usecols=unique, ndmin=2)
+    result: Final[dict[int, np.ndarray]] = {}
+    for j, i in enumerate(unique):
+        col: np.ndarray = np.ascontiguousarray(table[:, j])
+        ints: np.ndarray = np.flatnonzero(  # the indices of the integers
+            np.isfinite(col) & (col == np.floor(col)))
+        if len(ints) == len(col) and np.all(np.abs(col) < DBL_INT_LIMIT_P):
+            col = col.astype(np.int64)
+        elif len(ints) > 0:  # the integers must stay integers
+            values: np.ndarray = col.astype(object)
+            values[ints] = col[ints].astype(np.int64).tolist()
+            for k in ints[np.abs(col[ints]) >= DBL_INT_LIMIT_P]:
+                values[k] = str_to_intfloat(
+                    lines[k + 1].split(CSV_SEPARATOR)[i].strip())
+            col = np.array(values.tolist()) if len(ints) == len(col) \
+                else values
+        result[i] = col
+    return [result[i] for i in cols]
+
+
 class _InnerLogParser(ExperimentParser):
     """The internal log parser class."""
 
@@ -433,39 +498,43 @@ class _InnerLogParser(ExperimentParser):
                             "appears twice.")
                     f_col_idx = idx
 
-            def aa(splt):  # noqa
-                return splt[time_col_idx], splt[f_col_idx]
-
-            time, f = zip(*[[c.strip()
-                             for c in aa(line.split(CSV_SEPARATOR))]
-                            for line in lines[1:]], strict=True)
-            time = [int(t) for t in time]
-            f = [str_to_intfloat(v) for v in f]
-            if self.__only_improvements:
-                biggest_t: int = -1
-                best_f: int | float = inf
-                for idx, t in enumerate(time):
-                    v = f[idx]
-                    if t > biggest_t:
-                        if biggest_t >= 0:
-                            self.__t_collector.append(biggest_t)
-                            self.__f_collector.append(best_f)
-                        best_f = v
-                        biggest_t = t
-                    elif v < best_f:
-                        best_f = v
-                if biggest_t >= 0:
-                    self.__t_collector.append(biggest_t)
-                    self.__f_collector.append(best_f)
-            else:
-                self.__t_collector.extend(time)
-                self.__f_collector.extend(f)
-
-            self.__last_fe = int((lines[-1].split(CSV_SEPARATOR))[fe_col_idx])
-            if self.__last_fe <= 0:
-                raise ValueError(f"Last FE cannot be {self.__last_fe}.")
-
-            self.__state = (self.__state | 4) & (~32)
-            return self.__state != 7
+            if min(time_col_idx, f_col_idx, fe_col_idx) < 0:
+                raise ValueError(
+                    f"Columns {logging.PROGRESS_FES}, {time_col_name}, and "
+                    f"{logging.PROGRESS_CURRENT_F} must all appear in "
+                    f"{lines[0]!r}.")
+            return self.columns(dict(zip(
+                (logging.PROGRESS_FES, time_col_name,
+                 logging.PROGRESS_CURRENT_F), _load_columns(
+                    lines, [fe_col_idx, time_col_idx, f_col_idx]),
+                strict=True)))
 
         raise ValueError("Illegal state.")
+
+    def columns(self, columns: dict[str, np.ndarray]) -> bool:
+        if (self.__state & 32) == 0:
+            return super().columns(columns)
+
+        time: Final[np.ndarray] = columns[
+            logging.PROGRESS_TIME_MILLIS if self.__time_unit
+            == TIME_UNIT_MILLIS else logging.PROGRESS_FES]
+        f: Final[np.ndarray] = columns[logging.PROGRESS_CURRENT_F]
+        if len(time) <= 0:
+            raise ValueError("The progress must not be empty.")
+        if self.__only_improvements:
+            # keep the best f of each group of entries with the same time
+            biggest_t: Final[np.ndarray] = np.maximum.accumulate(time)
+            starts: Final[np.ndarray] = np.flatnonzero(np.concatenate(
+                ([True], time[1:] > biggest_t[:-1])))
+            self.__t_collector.extend(time[starts].tolist())
+            self.__f_collector.extend(np.minimum.reduceat(f, starts).tolist())
+        else:
+            self.__t_collector.extend(time.tolist())
+            self.__f_collector.extend(f.tolist())
+
+        self.__last_fe = int(columns[logging.PROGRESS_FES][-1])
+        if self.__last_fe <= 0:
+            raise ValueError(f"Last FE cannot be {self.__last_fe}.")
+
+        self.__state = (self.__state | 4) & (~32)
+        return self.__state != 7
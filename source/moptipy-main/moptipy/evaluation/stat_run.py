@@ -1,4 +1,5 @@
 """Statistic runs are time-depending statistics over several runs."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from math import erf, sqrt
 from typing import Any, Callable, Final, Iterable
@@ -10,7 +11,7 @@ import moptipy.evaluation.statistics as statn
 from moptipy.evaluation.base import MultiRun2DData, MultiRunData, PerRunData
 from moptipy.evaluation.progress import Progress
 from moptipy.utils.nputils import DEFAULT_FLOAT, DEFAULT_INT, is_np_float
-from moptipy.utils.types import type_error
+from moptipy.utils.types import check_int_range, type_error
 
 #: The value of the CDF of the standard normal distribution CDF at -1,
 #: which corresponds to "mean - 1 * sd".
@@ -40,53 +41,151 @@ def _unique_floats_1d(data: list[np.ndarray]) -> np.ndarray:
     return res
 
 
-def __apply_fun(x_unique: np.ndarray,
-                x_raw: list[np.ndarray],
-                y_raw: list[np.ndarray],
-                stat_func: Callable,
-                out_len: int,
-                dest_y: np.ndarray,
-                stat_dim: int,
-                values_buf: np.ndarray,
-                pos_buf: np.ndarray) -> np.ndarray:
+@numba.njit(nogil=True, cache=True)
+def __insert_sorted(ordered: np.ndarray, old: float, new: float) -> None:
     """
-    Perform the work of computing the time-depending statistic.
+    Replace one value in a sorted array by another one.
+
+    :param ordered: the sorted array, which must contain `old`
+    :param old: the value to remove
+    :param new: the value to insert
+
+    >>> arr = np.array([1.0, 3.0, 5.0, 7.0])
+    >>> __insert_sorted(arr, 3.0, 6.0)
+    >>> arr.tolist()
+    [1.0, 5.0, 6.0, 7.0]
+    >>> __insert_sorted(arr, 7.0, 0.0)
+    >>> arr.tolist()
+    [0.0, 1.0, 5.0, 6.0]
+    """
+    k: int = int(np.searchsorted(ordered, old))
+    m: int = int(np.searchsorted(ordered, new))
+    if m > k:
+        for i in range(k, m - 1):
+            ordered[i] = ordered[i + 1]
+        ordered[m - 1] = new
+    else:
+        for i in range(k, m, -1):
+            ordered[i] = ordered[i - 1]
+        ordered[m] = new
+
+
+@numba.njit(nogil=True, cache=True)
+def __quantile(ordered: np.ndarray, q: float) -> float:
+    """
+    Compute a quantile of sorted data.
+
+    :param ordered: the sorted data
+    :param q: the quantile
+    :return: the quantile
+    """
+    return np.quantile(ordered, q)
+
+
+@numba.njit(nogil=True, cache=True)
+def __compute_stats(x_unique: np.ndarray, x_all: np.ndarray,
+                    y_all: np.ndarray, starts: np.ndarray,
+                    codes: np.ndarray, dest: np.ndarray) -> None:
+    """
+    Compute several time-depending statistics in one merge pass.
+
+    The time and objective values of all runs are concatenated in `x_all`
+    and `y_all`, where run `j` occupies the indices from `starts[j]` to
+    `starts[j + 1] - 1`. The runs are merged by advancing one index per run
+    over the unique time points `x_unique`, i.e., each step only looks at
+    the next time value of each run. The current values of all runs are kept
+    in a sorted array as well, which is updated by moving only the changed
+    values, so the minimum, maximum, median, and quantiles never require
+    sorting. All statistics with the codes in `codes` are computed from the
+    same current values and stored in the corresponding rows of `dest`.
+
+    :param x_unique: the unique time coordinates, which must not be smaller
+        than the first time value of any run
+    :param x_all: the concatenated time values of the runs
+    :param y_all: the concatenated objective values of the runs
+    :param starts: the start indices of the runs, plus the total length
+    :param codes: the codes of the statistics to compute
+    :param dest: the destination matrix with one row per statistic and one
+        column per unique time point
+
+    >>> dst = np.empty((2, 3))
+    >>> __compute_stats(np.array([1.0, 2.0, 3.0]),
+    ...                 np.array([1.0, 3.0, 1.0, 2.0]),
+    ...                 np.array([9.0, 5.0, 7.0, 6.0]),
+    ...                 np.array([0, 2, 4]), np.array([0, 2]), dst)
+    >>> dst.tolist()
+    [[7.0, 6.0, 5.0], [8.0, 7.5, 5.5]]
+    """
+    n_runs: int = len(starts) - 1
+    pos: np.ndarray = starts[:-1].copy()
+    values: np.ndarray = np.empty(n_runs, y_all.dtype)
+    for j in range(n_runs):
+        values[j] = y_all[pos[j]]
+    ordered: np.ndarray = np.sort(values)
+    half: int = n_runs // 2
+    need_mean: bool = False
+    for code in codes:
+        need_mean = need_mean or code == 2 or (5 <= code <= 7)
+    for i in range(len(x_unique)):  # pylint: disable=C0200
+        x = x_unique[i]
+        for j in range(n_runs):  # advance all runs to the time x
+            idx = pos[j]
+            end = starts[j + 1] - 1
+            while (idx < end) and (x_all[idx + 1] <= x):
+                idx += 1
+            if idx != pos[j]:
+                pos[j] = idx
+                y = y_all[idx]
+                if y != values[j]:
+                    __insert_sorted(ordered, values[j], y)
+                    values[j] = y
+        mean: float = values.mean() if need_mean else 0.0
+        sd: float = values.std() if need_mean else 0.0
+        for s in range(len(codes)):  # pylint: disable=C0200
+            code = codes[s]
+            if code == 0:
+                dest[s, i] = ordered[0]
+            elif code == 1:
+                dest[s, i] = ordered[half] if (n_runs % 2) == 1 else \
+                    (ordered[half - 1] + ordered[half]) / 2.0
+            elif code == 3:
+                dest[s, i] = np.exp(np.mean(np.log(values)))
+            elif code == 4:
+                dest[s, i] = ordered[n_runs - 1]
+            elif code <= 7:  # the mean and standard deviation
+                dest[s, i] = mean if code == 2 else sd if code == 5 else \
+                    (mean - sd) if code == 6 else (mean + sd)
+            elif code == 8:
+                dest[s, i] = ordered[(n_runs - 1) // 10] \
+                    if (n_runs > 10) and ((n_runs % 10) == 1) \
+                    else __quantile(ordered, 0.1)
+            elif code == 9:
+                dest[s, i] = ordered[(9 * (n_runs - 1)) // 10] \
+                    if (n_runs > 10) and ((n_runs % 10) == 1) \
+                    else __quantile(ordered, 0.9)
+            elif code == 10:
+                dest[s, i] = __quantile(ordered, __Q159)
+            else:
+                dest[s, i] = __quantile(ordered, __Q841)
 
-    The unique x-values `x_unique` have separately been computed with
-    :func:`_unique_floats_1d` from `x_raw` so that they can be reused.
-    `x_raw` and `y_raw` are lists with the raw time and objective data,
-    respectively. `stat_fun` is the statistic function that will be applied to
-    the step-wise generated data filled into `values_buf`. `pos_buf` will be
-    used maintain the current indices into `x_raw` and `y_raw`. `dest_y` will
-    be filled with the computed statistic for each element of `x_unique`.
-    In a final step, we will remove all redundant elements of both arrays: If
-    `x_unique` increases but `dest_y` remains the same, then the corresponding
-    point is deleted if it is not the last point in the list. As a result,
-    a two-dimensional time/value array is returned.
+
+def _compress(x_unique: np.ndarray, dest_y: np.ndarray) -> np.ndarray:
+    """
+    Remove the redundant points of a time-depending statistic.
+
+    If `x_unique` increases but `dest_y` remains the same, then the
+    corresponding point is deleted if it is not the last point in the list.
+    As a result, a two-dimensional time/value array is returned.
 
     :param x_unique: the unique time coordinates
-    :param x_raw: a tuple of several x-data arrays
-    :param y_raw: a tuple of several y-data arrays
-    :param Callable stat_func: a statistic function which must have been
-        jitted with numba
-    :param out_len: the length of `dest_y` and `x_unique`
-    :param dest_y: the destination array for the computed statistics
-    :param stat_dim: the dimension of the tuples `x_raw` and `y_raw`
-    :param values_buf: the buffer for the values to be passed to `stat_func`
-    :param pos_buf: the position buffer
+    :param dest_y: the statistic value for each time coordinate
     :return: the two-dimensional `np.ndarray` where the first column is the
         time and the second column is the statistic value
-    """
-    for i in range(out_len - 1, -1, -1):  # reverse iteration
-        x = x_unique[i]  # x_unique holds all unique x values
-        for j in range(stat_dim):  # for all Progress datasets do
-            idx = pos_buf[j]  # get the current position
-            if x < x_raw[j][idx]:  # if x < then current time value
-                idx = idx - 1  # step back by one
-                pos_buf[j] = idx  # now x >= x_raw[j][idx]
-            values_buf[j] = y_raw[j][idx]
-        dest_y[i] = stat_func(values_buf)
 
+    >>> _compress(np.array([1.0, 2.0, 3.0, 4.0, 5.0]),
+    ...           np.array([5.0, 5.0, 3.0, 2.0, 2.0])).tolist()
+    [[1.0, 5.0], [3.0, 3.0], [4.0, 2.0], [5.0, 2.0]]
+    """
     changes = 1 + np.flatnonzero(dest_y[1:] != dest_y[:-1])
     dest_len = len(dest_y) - 1
     changes_len = len(changes)
@@ -102,177 +201,36 @@ def __apply_fun(x_unique: np.ndarray,
     return np.column_stack((x_unique[indexes], dest_y[indexes]))
 
 
-def _apply_fun(x_unique: np.ndarray, x_raw: list[np.ndarray],
-               y_raw: list[np.ndarray], stat_func: Callable) -> np.ndarray:
-    """
-    Compute a time-depending statistic.
-
-    The unique x-values `x_unique` have separate been computed with
-    `_unique_floats_1d` from `x_raw` so that they can be reused.
-    `x_raw` and `y_raw` are tuples with the raw time and objective data,
-    respectively. `stat_fun` is the statistic function that will be applied.
-    In a final step, we will remove all redundant elements of both arrays: If
-    `x_unique` increases but `dest_y` remains the same, then the corresponding
-    point is deleted if it is not the last point in the list. As a result,
-    a two-dimensional time/value array is returned. This function uses
-    :meth:`__apply_fun` as internal work horse.
-
-    :param x_unique: the unique time coordinates
-    :param x_raw: a tuple of several x-data arrays
-    :param y_raw: a tuple of several y-data arrays
-    :param stat_func: a statistic function which must have been jitted with
-        numba
-    :return: the two-dimensional `numpy.ndarray` where the first column is the
-        time and the second column is the statistic value
-    """
-    out_len: Final[int] = len(x_unique)
-    dest_y: Final[np.ndarray] = np.zeros(out_len, DEFAULT_FLOAT)
-    stat_dim: Final[int] = len(x_raw)
-    values: Final[np.ndarray] = np.zeros(stat_dim, DEFAULT_FLOAT)
-    pos: Final[np.ndarray] = np.array([len(x) - 1 for x in x_raw], DEFAULT_INT)
-
-    return __apply_fun(x_unique, x_raw, y_raw, stat_func, out_len,
-                       dest_y, stat_dim, values, pos)
-
-
-@numba.njit(parallel=True)
-def __stat_arith_mean(data: np.ndarray) -> np.number:
-    """
-    Compute the arithmetic mean.
-
-    :param data: the data
-    :return: the arithmetic mean
-    """
-    return data.mean()
-
-
-@numba.njit(parallel=True)
-def __stat_geo_mean(data: np.ndarray) -> np.number:
-    """
-    Compute the geometric mean.
-
-    :param data: the data
-    :return: the geometric mean
-    """
-    return np.exp(np.mean(np.log(data)))
-
-
-@numba.njit(parallel=True)
-def __stat_min(data: np.ndarray) -> np.number:
-    """
-    Compute the minimum.
-
-    :param data: the data
-    :return: the minimum
-    """
-    return data.min()
-
-
-@numba.njit(parallel=True)
-def __stat_max(data: np.ndarray) -> np.number:
-    """
-    Compute the maximum.
-
-    :param data: the data
-    :return: the maximum
-    """
-    return data.max()
-
-
-@numba.njit
-def __stat_median(data: np.ndarray) -> np.ndarray:
-    """
-    Compute the median.
-
-    :param data: the data
-    :return: the median
+def _apply_funs(x_unique: np.ndarray, x_raw: list[np.ndarray],
+                y_raw: list[np.ndarray], names: list[str]) \
+        -> list[np.ndarray]:
     """
-    return np.median(data)
-
+    Compute several time-depending statistics.
 
-@numba.njit(parallel=True)
-def __stat_sd(data: np.ndarray) -> np.number:
-    """
-    Compute the standard deviation.
-
-    :param data: the data
-    :return: the standard deviation
-    """
-    return data.std()
-
-
-@numba.njit(parallel=True)
-def __stat_mean_minus_sd(data: np.ndarray) -> np.number:
-    """
-    Compute the arithmetic mean minus the standard deviation.
-
-    :param data: the data
-    :return: the arithmetic mean minus the standard deviation
-    """
-    return data.mean() - data.std()
-
-
-@numba.njit(parallel=True)
-def __stat_mean_plus_sd(data: np.ndarray) -> np.number:
-    """
-    Compute the arithmetic mean plus the standard deviation.
-
-    :param data: the data
-    :return: the arithmetic mean plus the standard deviation
-    """
-    return data.mean() + data.std()
-
-
-@numba.njit
-def __stat_quantile_10(data: np.ndarray) -> np.ndarray:
-    """
-    Compute the 10% quantile.
-
-    :param data: the data
-    :return: the 10% quantile
-    """
-    length: Final[int] = len(data)
-    if (length > 10) and ((length % 10) == 1):
-        data.sort()
-        return data[(length - 1) // 10]
-    return np.quantile(data, 0.1)
-
-
-@numba.njit
-def __stat_quantile_90(data: np.ndarray) -> np.ndarray:
-    """
-    Compute the 90% quantile.
-
-    :param data: the data
-    :return: the 90% quantile
-    """
-    length: Final[int] = len(data)
-    if (length > 10) and ((length % 10) == 1):
-        data.sort()
-        return data[(9 * (length - 1)) // 10]
-    return np.quantile(data, 0.9)
-
-
-@numba.njit
-def __stat_quantile_159(data: np.ndarray) -> np.ndarray:
-    """
-    Compute the 15.9% quantile, which equals mean-sd in normal distributions.
-
-    :param data: the data
-    :return: the 15.9% quantile
-    """
-    return np.quantile(data, __Q159)
-
-
-@numba.njit
-def __stat_quantile_841(data: np.ndarray) -> np.ndarray:
-    """
-    Compute the 84.1% quantile, which equals mean+sd in normal distributions.
+    The unique x-values `x_unique` have separately been computed with
+    :func:`_unique_floats_1d` from `x_raw`. `x_raw` and `y_raw` are lists
+    with the raw time and objective data, respectively. All statistics in
+    `names` are computed together in one pass of :func:`__compute_stats`
+    and then compressed with :func:`_compress`.
 
-    :param data: the data
-    :return: the 84.1% quantile
-    """
-    return np.quantile(data, __Q841)
+    :param x_unique: the unique time coordinates
+    :param x_raw: a list of several x-data arrays
+    :param y_raw: a list of several y-data arrays
+    :param names: the names of the statistics
+    :return: the two-dimensional `np.ndarray` for each statistic, where the
+        first column is the time and the second column is the statistic
+        value
+    """
+    starts: Final[np.ndarray] = np.zeros(len(x_raw) + 1, DEFAULT_INT)
+    np.cumsum([len(x) for x in x_raw], out=starts[1:])
+    dest: Final[np.ndarray] = np.empty((len(names), len(x_unique)),
+                                       DEFAULT_FLOAT)
+    __compute_stats(x_unique,
+                    np.concatenate(x_raw).astype(DEFAULT_FLOAT),
+                    np.concatenate(y_raw).astype(DEFAULT_FLOAT),
+                    starts, np.array([_STAT_CODES[n] for n in names],
+                                     DEFAULT_INT), dest)
+    return [_compress(x_unique, d) for d in dest]
 
 
 #: The statistics key for the minimum
@@ -302,20 +260,21 @@ STAT_Q159: Final[str] = "q159"
 #: is where "mean + standard deviation" is located-
 STAT_Q841: Final[str] = "q841"
 
-#: The internal function map.
-_FUNC_MAP: Final[dict[str, Callable]] = {
-    STAT_MINIMUM: __stat_min,
-    STAT_MEDIAN: __stat_median,
-    STAT_MEAN_ARITH: __stat_arith_mean,
-    STAT_MEAN_GEOM: __stat_geo_mean,
-    STAT_MAXIMUM: __stat_max,
-    STAT_STDDEV: __stat_sd,
-    STAT_MEAN_MINUS_STDDEV: __stat_mean_minus_sd,
-    STAT_MEAN_PLUS_STDDEV: __stat_mean_plus_sd,
-    STAT_Q10: __stat_quantile_10,
-    STAT_Q90: __stat_quantile_90,
-    STAT_Q159: __stat_quantile_159,
-    STAT_Q841: __stat_quantile_841,
+#: The internal map of statistics names to the codes used in the compiled
+#: statistics engine.
+_STAT_CODES: Final[dict[str, int]] = {
+    STAT_MINIMUM: 0,
+    STAT_MEDIAN: 1,
+    STAT_MEAN_ARITH: 2,
+    STAT_MEAN_GEOM: 3,
+    STAT_MAXIMUM: 4,
+    STAT_STDDEV: 5,
+    STAT_MEAN_MINUS_STDDEV: 6,
+    STAT_MEAN_PLUS_STDDEV: 7,
+    STAT_Q10: 8,
+    STAT_Q90: 9,
+    STAT_Q159: 10,
+    STAT_Q841: 11,
 }
 
 
@@ -432,28 +391,37 @@ class StatRun(MultiRun2DData):
             raise ValueError(
                 f"Invalid shape of unique values {x_unique.shape}.")
 
-        count = 0
+        names: Final[list[str]] = []
         for name in statistics:
             if not isinstance(name, str):
                 raise type_error(name, "statistic name", str)
-            if name not in _FUNC_MAP:
+            if name not in _STAT_CODES:
                 raise ValueError(f"Unknown statistic name {name!r}.")
-            consumer(StatRun(algorithm, instance, n, time_unit, f_name, name,
-                             _apply_fun(x_unique, time, f, _FUNC_MAP[name])))
-            count += 1
-
-        if count <= 0:
+            names.append(name)
+        if len(names) <= 0:
             raise ValueError("No statistic names provided.")
 
+        for name, stat in zip(names, _apply_funs(x_unique, time, f, names),
+                              strict=True):
+            consumer(StatRun(algorithm, instance, n, time_unit, f_name, name,
+                             stat))
+
     @staticmethod
     def from_progress(source: Iterable[Progress],
                       statistics: str | Iterable[str],
                       consumer: Callable[["StatRun"], Any],
                       join_all_algorithms: bool = False,
-                      join_all_instances: bool = False) -> None:
+                      join_all_instances: bool = False,
+                      n_threads: int = 1) -> None:
         """
         Aggregate statist runs over a stream of progress data.
 
+        All statistics of one group of runs are computed together by a
+        compiled engine which releases the global interpreter lock. If
+        `n_threads > 1`, the groups are processed by that many threads in
+        parallel. The stat runs are passed to the `consumer` in the same
+        order in either case.
+
         :param source: the stream of progress data
         :param statistics: the statistics that should be computed per group
         :param consumer: the destination to which the new stat runs will be
@@ -462,6 +430,8 @@ class StatRun(MultiRun2DData):
             over all algorithms
         :param join_all_instances: should the statistics be aggregated
             over all algorithms
+        :param n_threads: the number of threads computing the statistics of
+            different groups in parallel
         """
         if not isinstance(source, Iterable):
             raise type_error(source, "source", Iterable)
@@ -469,8 +439,10 @@ class StatRun(MultiRun2DData):
             statistics = [statistics]
         if not isinstance(statistics, Iterable):
             raise type_error(statistics, "statistics", Iterable)
+        statistics = list(statistics)
         if not callable(consumer):
             raise type_error(consumer, "consumer", call=True)
+        check_int_range(n_threads, "n_threads", 1, 16384)
         if not isinstance(join_all_algorithms, bool):
             raise type_error(join_all_algorithms, "join_all_algorithms", bool)
         if not isinstance(join_all_instances, bool):
@@ -493,13 +465,22 @@ class StatRun(MultiRun2DData):
         if len(sorter) <= 0:
             raise ValueError("source must not be empty")
 
-        if len(sorter) > 1:
-            keys = list(sorter.keys())
-            keys.sort()
+        keys: Final[list[str]] = sorted(sorter.keys())
+        n_threads = min(n_threads, len(keys))
+        if n_threads <= 1:
             for key in keys:
                 StatRun.create(sorter[key], statistics, consumer)
-        else:
-            StatRun.create(next(iter(sorter.values())), statistics, consumer)
+            return
+
+        def __group(k: str) -> list[StatRun]:
+            runs: Final[list[StatRun]] = []
+            StatRun.create(sorter[k], statistics, runs.append)
+            return runs
+
+        with ThreadPoolExecutor(n_threads) as pool:
+            for group in pool.map(__group, keys):
+                for run in group:
+                    consumer(run)
 
 
 def get_statistic(obj: PerRunData | MultiRunData) -> str | None:
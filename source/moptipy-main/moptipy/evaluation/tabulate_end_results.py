@@ -15,6 +15,7 @@ from moptipy.api.logging import (
 )
 from moptipy.evaluation.base import F_NAME_RAW, F_NAME_SCALED
 from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.end_results_frame import EndResults
 from moptipy.evaluation.end_statistics import KEY_BEST_F_SCALED, EndStatistics
 from moptipy.evaluation.statistics import (
     KEY_MAXIMUM,
@@ -529,8 +530,10 @@ def tabulate_end_results(
                 "then specify algorithm_summary_statistics=None")
 
     # gather the statistics for each algorithm-instance combination
+    frame: EndResults = EndResults.from_end_results(end_results)
+    del end_results
     algo_inst_list: Final[list[EndStatistics]] = []
-    EndStatistics.from_end_results(end_results, algo_inst_list.append)
+    EndStatistics.from_end_results(frame, algo_inst_list.append)
     if len(algo_inst_list) <= 0:
         raise ValueError("no algorithm-instance combinations?")
     # get the sorted lists of algorithms and instances
@@ -587,10 +590,10 @@ def tabulate_end_results(
             if es.algorithm in algo_dict:
                 raise ValueError(f"already encountered {es.algorithm}?")
             algo_dict[es.algorithm] = es
-        EndStatistics.from_end_results(end_results, __put,
+        EndStatistics.from_end_results(frame, __put,
                                        join_all_instances=True)
         del __put
-    del end_results
+    del frame
     if len(algo_dict) != n_algos:
         raise ValueError(f"there are {n_algos} algorithms, but in the "
                          f"summary, only {len(algo_dict)} appear?")
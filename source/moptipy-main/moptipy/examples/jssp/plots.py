@@ -8,6 +8,7 @@ import moptipy.utils.plot_utils as pu
 from moptipy.evaluation.axis_ranger import AxisRanger
 from moptipy.evaluation.base import F_NAME_RAW, F_NAME_SCALED, TIME_UNIT_MILLIS
 from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.end_results_frame import EndResults
 from moptipy.evaluation.end_statistics import EndStatistics
 from moptipy.evaluation.plot_end_results import plot_end_results
 from moptipy.evaluation.plot_end_statistics_over_parameter import (
@@ -415,11 +416,12 @@ def plot_end_makespans_over_param(
 
     logger(f"now plotting end statistics over parameter {title!r}.")
 
+    frame: Final[EndResults] = EndResults.from_end_results(end_results)
     end_stats: Final[list[EndStatistics]] = []
     if plot_single_instances:
-        EndStatistics.from_end_results(end_results, end_stats.append)
+        EndStatistics.from_end_results(frame, end_stats.append)
     if plot_instance_summary:
-        EndStatistics.from_end_results(end_results, end_stats.append,
+        EndStatistics.from_end_results(frame, end_stats.append,
                                        join_all_instances=True)
     if len(end_stats) <= 0:
         raise ValueError("no end statistics records to plot!")
@@ -0,0 +1,25 @@
+"""
+The Traveling Salesperson Problem is a classical combinatorial task.
+
+In a Traveling Salesperson Problem (TSP), we are given `n` cities and the
+distances between them. The goal is to find the shortest round-trip tour that
+visits each city exactly once and then returns to its starting point. Here we
+provide a class for representing and loading TSP instances in the TSPLIB
+format (:mod:`~moptipy.examples.tsp.instance`), the tour length objective
+function (:mod:`~moptipy.examples.tsp.tour_length`), distance backends that
+compute distances from node coordinates instead of storing a matrix
+(:mod:`~moptipy.examples.tsp.distances`), and tour representations with fast
+segment reversals (:mod:`~moptipy.examples.tsp.tour`). Tours are
+permutations of the city indices `0..n-1`, i.e., they live in the space
+:class:`~moptipy.spaces.permutations.Permutations`.
+
+1. Gerhard Reinelt. TSPLIB - A Traveling Salesman Problem Library.
+   *ORSA Journal on Computing* 3(4):376-384. November 1991.
+   doi: https://doi.org/10.1287/ijoc.3.4.376.
+2. David Lee Applegate, Robert E. Bixby, Vašek Chvátal, and William John
+   Cook. *The Traveling Salesman Problem: A Computational Study.* 2007.
+   Princeton, NJ, USA: Princeton University Press. ISBN: 978-0-691-12993-8.
+3. Thomas Weise. *Optimization Algorithms.* 2021-2023. Hefei, Anhui, China:
+   Institute of Applied Optimization, School of Artificial Intelligence and
+   Big Data, Hefei University. https://thomasweise.github.io/oa
+"""
@@ -0,0 +1,311 @@
+"""
+Distance backends for TSP instances that do not need a dense matrix.
+
+A :class:`~moptipy.examples.tsp.instance.Instance` is the full `n*n` distance
+matrix, which needs `O(n²)` memory. For TSPLIB instances with tens of
+thousands of cities, this becomes gigabytes per process. The distances of
+instances given by node coordinates can instead be computed on the fly.
+
+A distance backend is a tuple `(kind, data)` that can be passed to
+`numba`-compiled code, where :func:`distance` returns the distance between
+two cities:
+
+- :func:`dense_distances` wraps a distance matrix (`kind` :const:`DENSE`).
+- :func:`coordinate_distances` wraps the node coordinates and computes the
+  TSPLIB-rounded `EUC_2D`, `CEIL_2D`, `ATT`, or `GEO` distances from them.
+  Optionally, the `k` nearest neighbors of each city and their distances are
+  cached. They are stored as additional columns of the `n*(2+2k)` array
+  `data`, so that the compiled code only ever handles a single array. A
+  backend of this type needs only `O(n*k)` memory.
+
+Since both backends work with the same functions, algorithms written against
+:func:`distance` run unchanged on both.
+
+>>> lines = ["NAME: x3", "TYPE: TSP", "DIMENSION: 3",
+...          "EDGE_WEIGHT_TYPE: EUC_2D", "NODE_COORD_SECTION",
+...          "1 0 0", "2 3 4", "3 1 1.2", "EOF"]
+>>> name, weight_type, coords = coordinates_from_text(lines)
+>>> d = coordinate_distances(weight_type, coords, 1)
+>>> distance(d, 0, 1), distance(d, 1, 2), distances_tour_length(
+...     d, np.array([0, 1, 2]))
+(5, 3, 10)
+"""
+from typing import Final
+
+import numba  # type: ignore
+import numpy as np
+
+import moptipy.utils.nputils as npu
+from moptipy.examples.tsp.instance import _GEO_PI, _GEO_RRR, _parse_tsplib
+from moptipy.utils.types import check_int_range, type_error
+
+#: the backend kind of a dense distance matrix
+DENSE: Final[int] = 0
+#: the backend kind of TSPLIB `EUC_2D` distances
+EUC_2D: Final[int] = 1
+#: the backend kind of TSPLIB `CEIL_2D` distances
+CEIL_2D: Final[int] = 2
+#: the backend kind of TSPLIB `ATT` distances
+ATT: Final[int] = 3
+#: the backend kind of TSPLIB `GEO` distances
+GEO: Final[int] = 4
+#: the backend kinds for the TSPLIB edge weight types
+COORDINATE_KINDS: Final[dict[str, int]] = {
+    "EUC_2D": EUC_2D, "CEIL_2D": CEIL_2D, "ATT": ATT, "GEO": GEO}
+
+
+@numba.njit(nogil=True, cache=True, inline="always")
+def _compute(kind: int, data: np.ndarray, i: int, j: int) -> int:
+    """
+    Compute a distance without using the cache.
+
+    :param kind: the backend kind
+    :param data: the distance matrix or the coordinates
+    :param i: the first city
+    :param j: the second city
+    :returns: the distance from `i` to `j`
+    """
+    if kind == DENSE:
+        return int(data[i, j])
+    dx = data[i, 0] - data[j, 0]
+    dy = data[i, 1] - data[j, 1]
+    if kind == EUC_2D:
+        return int(np.floor(np.sqrt(dx * dx + dy * dy) + 0.5))
+    if kind == CEIL_2D:
+        return int(np.ceil(np.sqrt(dx * dx + dy * dy)))
+    if kind == ATT:
+        r = np.sqrt((dx * dx + dy * dy) / 10.0)
+        t = np.floor(r + 0.5)
+        return int(t + 1.0) if t < r else int(t)
+    if i == j:
+        return 0
+    q1 = np.cos(data[i, 1] - data[j, 1])
+    q2 = np.cos(dx)
+    q3 = np.cos(data[i, 0] + data[j, 0])
+    return int(np.floor(_GEO_RRR * np.arccos(min(1.0, max(
+        -1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))) + 1.0))
+
+
+@numba.njit(nogil=True, cache=True, inline="always")
+def distance(distances: tuple, i: int, j: int) -> int:
+    """
+    Get the distance between two cities.
+
+    `EUC_2D` and `CEIL_2D` distances need just a square root, so they are
+    computed right away. Only for the trigonometric `GEO` and the `ATT`
+    distances, the cached nearest neighbors of `i` are checked first.
+
+    :param distances: the distance backend
+    :param i: the first city
+    :param j: the second city
+    :returns: the distance from `i` to `j`
+
+    >>> distance(dense_distances(np.array([[0, 2], [3, 0]])), 0, 1)
+    2
+    """
+    kind, data = distances
+    if (kind == GEO) or (kind == ATT):
+        k = (data.shape[1] - 2) >> 1
+        for t in range(2, k + 2):
+            if data[i, t] == j:
+                return int(data[i, t + k])
+    return _compute(kind, data, i, j)
+
+
+@numba.njit(nogil=True, cache=True)
+def distances_tour_length(distances: tuple, x: np.ndarray) -> int:
+    """
+    Compute the length of a tour.
+
+    :param distances: the distance backend
+    :param x: the tour, i.e., a permutation of the cities
+    :returns: the length of the tour
+    """
+    i: int = x[-1]
+    result: int = 0
+    for j in x:
+        result += distance(distances, i, j)
+        i = j
+    return result
+
+
+@numba.njit(nogil=True, cache=True)
+def nearest_distances(distances: tuple) -> np.ndarray:
+    """
+    Get the shortest non-zero distance leaving each city.
+
+    If the backend caches the nearest neighbors of the cities, the distance
+    is taken from the cache, which needs only `O(n*k)` time. Otherwise, or
+    if all cached neighbors have distance `0`, all cities are checked.
+
+    :param distances: the distance backend
+    :returns: the array with the shortest non-zero distance of each city,
+        `0` if there is none
+
+    >>> xy = np.array([[0, 0], [0, 0], [0, 0], [3, 4], [6, 8]])
+    >>> nearest_distances(coordinate_distances("EUC_2D", xy, 2))
+    array([5, 5, 5, 5, 5])
+    """
+    kind, data = distances
+    n: Final[int] = data.shape[0]
+    k: Final[int] = 0 if kind == DENSE else (data.shape[1] - 2) >> 1
+    result: Final[np.ndarray] = np.zeros(n, np.int64)
+    for i in range(n):
+        best = 0
+        for t in range(k + 2, k + k + 2):  # the cache is sorted by distance
+            if data[i, t] > 0:
+                best = int(data[i, t])
+                break
+        if best <= 0:  # not in the cache: check all cities
+            for j in range(n):
+                d = _compute(kind, data, i, j)
+                if (d > 0) and ((best <= 0) or (d < best)):
+                    best = d
+        result[i] = best
+    return result
+
+
+@numba.njit(nogil=True, cache=True)
+def farthest_distances(distances: tuple) -> np.ndarray:
+    """
+    Get the longest distance leaving each city.
+
+    :param distances: the distance backend
+    :returns: the array with the longest distance of each city
+    """
+    kind, data = distances
+    n: Final[int] = data.shape[0]
+    result: Final[np.ndarray] = np.zeros(n, np.int64)
+    for i in range(n):
+        best = 0
+        for j in range(n):
+            best = max(best, _compute(kind, data, i, j))
+        result[i] = best
+    return result
+
+
+@numba.njit(nogil=True, cache=True)
+def _nearest_neighbors(kind: int, data: np.ndarray) -> None:
+    """
+    Fill the nearest neighbor cache in the columns `2...2k+1` of `data`.
+
+    :param kind: the backend kind
+    :param data: the coordinates, followed by the `k` columns to receive the
+        nearest neighbors of each city and the `k` columns for their distances
+    """
+    n: Final[int] = data.shape[0]
+    k: Final[int] = (data.shape[1] - 2) >> 1
+    for i in range(n):
+        count = 0
+        for j in range(n):
+            if i == j:
+                continue
+            d = _compute(kind, data, i, j)
+            if count < k:
+                count += 1
+            elif d >= data[i, k + k + 1]:
+                continue
+            t = count + 1  # insertion sort into the sorted neighbor list
+            while (t > 2) and (data[i, t + k - 1] > d):
+                data[i, t] = data[i, t - 1]
+                data[i, t + k] = data[i, t + k - 1]
+                t -= 1
+            data[i, t] = j
+            data[i, t + k] = d
+
+
+def dense_distances(matrix: np.ndarray) -> tuple:
+    """
+    Create a distance backend from a distance matrix.
+
+    :param matrix: the square distance matrix
+    :returns: the distance backend
+    """
+    if not isinstance(matrix, np.ndarray):
+        raise type_error(matrix, "matrix", np.ndarray)
+    if (matrix.ndim != 2) or (matrix.shape[0] != matrix.shape[1]):
+        raise ValueError(f"Invalid shape {matrix.shape} of distance matrix.")
+    return DENSE, matrix
+
+
+def coordinate_distances(weight_type: str, coords: np.ndarray,
+                         k: int = 0) -> tuple:
+    """
+    Create a distance backend computing distances from node coordinates.
+
+    :param weight_type: the TSPLIB `EDGE_WEIGHT_TYPE`, i.e., one of the keys
+        of :const:`COORDINATE_KINDS`
+    :param coords: the `n*2` node coordinates as given in the TSPLIB file
+    :param k: the number of nearest neighbors whose distances are cached per
+        city, `0` for no cache
+    :returns: the distance backend
+
+    >>> d = coordinate_distances("GEO", np.array(
+    ...     [[16.47, 96.10], [16.47, 94.44], [20.09, 92.54]]))
+    >>> distance(d, 0, 1), distance(d, 0, 2), distance(d, 1, 1)
+    (153, 510, 0)
+    """
+    if not isinstance(weight_type, str):
+        raise type_error(weight_type, "weight_type", str)
+    if weight_type not in COORDINATE_KINDS:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE {weight_type!r}.")
+    if not isinstance(coords, np.ndarray):
+        raise type_error(coords, "coords", np.ndarray)
+    if (coords.ndim != 2) or (coords.shape[1] != 2) or (coords.shape[0] < 2):
+        raise ValueError(f"Invalid shape {coords.shape} of coordinates.")
+    kind: Final[int] = COORDINATE_KINDS[weight_type]
+    n: Final[int] = coords.shape[0]
+    k = min(check_int_range(k, "k", 0, 1_000_000), n - 1)
+    data: Final[np.ndarray] = np.empty((n, 2 + k + k), npu.DEFAULT_FLOAT)
+    data[:, 0:2] = coords
+    if kind == GEO:  # convert DDD.MM to radians once, as TSPLIB specifies
+        deg: Final[np.ndarray] = np.trunc(data[:, 0:2])
+        data[:, 0:2] = _GEO_PI * (deg + 5.0 * (data[:, 0:2] - deg) / 3.0) \
+            / 180.0
+    if k > 0:
+        _nearest_neighbors(kind, data)
+    return kind, data
+
+
+def neighbor_cache(distances: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the cached nearest neighbors of a distance backend.
+
+    :param distances: the distance backend
+    :returns: the `n*k` arrays with the `k` nearest neighbors of each city,
+        sorted by distance, and with their distances; `k` is `0` if the
+        backend has no cache
+
+    >>> nn, nn_dist = neighbor_cache(coordinate_distances("EUC_2D", np.array(
+    ...     [[0, 0], [3, 4], [1, 1]]), 1))
+    >>> nn[:, 0], nn_dist[:, 0]
+    (array([2, 2, 0]), array([1, 4, 1]))
+    """
+    kind, data = distances
+    k: Final[int] = 0 if kind == DENSE else (data.shape[1] - 2) >> 1
+    return (data[:, 2:k + 2].astype(np.int64),
+            data[:, k + 2:k + k + 2].astype(np.int64))
+
+
+def coordinates_from_text(lines: list[str]) -> tuple[str, str, np.ndarray]:
+    """
+    Read the node coordinates from the lines of a TSPLIB file.
+
+    :param lines: the lines of the TSPLIB file
+    :returns: the name of the instance, its `EDGE_WEIGHT_TYPE`, and the
+        `n*2` array of node coordinates
+    :raises ValueError: if the instance does not have supported node
+        coordinates
+    """
+    if not isinstance(lines, list):
+        raise type_error(lines, "lines", list)
+    name, n, spec, coords, _ = _parse_tsplib(lines)
+    weight_type: Final[str] = spec.get("EDGE_WEIGHT_TYPE", "")
+    if weight_type not in COORDINATE_KINDS:
+        raise ValueError(f"Instance {name!r} has no supported node "
+                         f"coordinates, EDGE_WEIGHT_TYPE is {weight_type!r}.")
+    if len(coords) != n:
+        raise ValueError(f"Instance {name!r} has DIMENSION {n}, but "
+                         f"{len(coords)} node coordinates.")
+    return name, weight_type, np.loadtxt(
+        coords, dtype=npu.DEFAULT_FLOAT, usecols=(1, 2), ndmin=2)
@@ -0,0 +1,477 @@
+"""
+A representation of Traveling Salesperson Problem instances.
+
+In a Traveling Salesperson Problem (TSP), `n` cities and the distances
+between them are given. The goal is to find the shortest round-trip tour that
+visits each city exactly once and returns to its starting point.
+
+Our problem instances are extensions of :class:`numpy.ndarray`: They are the
+`n*n` distance matrix of the TSP, stored in the most compact signed integer
+type that can hold all distances. Additionally, the instance name, the number
+of cities, and lower and upper bounds for the tour length are provided as
+attributes. Cities are identified by their zero-based index, i.e., a tour is
+a permutation of `0..n-1`.
+
+Instances can be loaded from files in the TSPLIB format [1, 2] via
+:meth:`~Instance.from_file` or from their text via
+:meth:`~Instance.from_text`. All TSPLIB node coordinate types for which the
+distance functions are exactly specified are supported, namely `EUC_2D`,
+`CEIL_2D`, `ATT`, and `GEO`, as well as `EXPLICIT` distance matrices in all
+of the `EDGE_WEIGHT_FORMAT`s (`FULL_MATRIX`, `UPPER_ROW`, `LOWER_ROW`,
+`UPPER_DIAG_ROW`, `LOWER_DIAG_ROW`, `UPPER_COL`, `LOWER_COL`,
+`UPPER_DIAG_COL`, and `LOWER_DIAG_COL`). The lengths of the optimal tours of
+the symmetric TSPLIB instances are published in an HTML page [3] which can
+be read with :func:`known_optimal_tour_lengths`. If this page is found next
+to an instance file, :meth:`~Instance.from_file` uses the optimal tour length
+as lower bound.
+
+1. Gerhard Reinelt. TSPLIB - A Traveling Salesman Problem Library.
+   *ORSA Journal on Computing* 3(4):376-384. November 1991.
+   doi: https://doi.org/10.1287/ijoc.3.4.376.
+   http://comopt.ifi.uni-heidelberg.de/software/TSPLIB95
+2. Gerhard Reinelt. *TSPLIB95.* Heidelberg, Germany: Universität
+   Heidelberg, Institut für Angewandte Mathematik. 1995.
+   http://comopt.ifi.uni-heidelberg.de/software/TSPLIB95/tsp95.pdf
+3. Gerhard Reinelt. *Optimal Solutions for Symmetric TSPs.* Heidelberg,
+   Germany: Universität Heidelberg, Institut für Informatik.
+   http://comopt.ifi.uni-heidelberg.de/software/TSPLIB95/STSP.html
+"""
+import os
+from functools import cache
+from re import findall
+from typing import Final
+
+import numpy as np
+
+import moptipy.utils.nputils as npu
+from moptipy.api.component import Component
+from moptipy.utils.logger import KeyValueLogSection
+from moptipy.utils.nputils import int_range_to_dtype
+from moptipy.utils.path import Path
+from moptipy.utils.strings import sanitize_name
+from moptipy.utils.types import check_int_range, type_error
+
+#: the recommended scope under which instance data should be stored
+SCOPE_INSTANCE: Final = "inst"
+#: the number of cities in the instance
+N_CITIES: Final = "nCities"
+#: the lower bound of the tour length of the instance
+TOUR_LENGTH_LOWER_BOUND: Final = "tourLengthLowerBound"
+#: the upper bound of the tour length of the instance
+TOUR_LENGTH_UPPER_BOUND: Final = "tourLengthUpperBound"
+#: is the instance symmetric?
+SYMMETRIC: Final = "symmetric"
+
+#: the name of the HTML page with the known optimal tour lengths
+OPTIMAL_TOUR_LENGTHS_FILE: Final[str] = \
+    "optimal_tour_lengths_of_symmetric_tsps.html"
+
+#: the value of pi used by TSPLIB for geographical distances
+_GEO_PI: Final[float] = 3.141592
+#: the earth radius used by TSPLIB for geographical distances
+_GEO_RRR: Final[float] = 6378.388
+
+
+def _euc_2d(coords: np.ndarray) -> np.ndarray:
+    """
+    Compute the TSPLIB `EUC_2D` distance matrix.
+
+    :param coords: the coordinates
+    :returns: the (floating point) distance matrix
+
+    >>> _euc_2d(np.array([[0.0, 0.0], [3.0, 4.0], [1.0, 1.2]]))
+    array([[0., 5., 2.],
+           [5., 0., 3.],
+           [2., 3., 0.]])
+    """
+    dx: Final[np.ndarray] = coords[:, 0][:, None] - coords[:, 0][None, :]
+    dy: Final[np.ndarray] = coords[:, 1][:, None] - coords[:, 1][None, :]
+    return np.floor(np.sqrt(dx ** 2 + dy ** 2) + 0.5)
+
+
+def _ceil_2d(coords: np.ndarray) -> np.ndarray:
+    """
+    Compute the TSPLIB `CEIL_2D` distance matrix.
+
+    :param coords: the coordinates
+    :returns: the (floating point) distance matrix
+
+    >>> _ceil_2d(np.array([[0.0, 0.0], [3.0, 4.0], [1.0, 1.2]]))
+    array([[0., 5., 2.],
+           [5., 0., 4.],
+           [2., 4., 0.]])
+    """
+    dx: Final[np.ndarray] = coords[:, 0][:, None] - coords[:, 0][None, :]
+    dy: Final[np.ndarray] = coords[:, 1][:, None] - coords[:, 1][None, :]
+    return np.ceil(np.sqrt(dx ** 2 + dy ** 2))
+
+
+def _att(coords: np.ndarray) -> np.ndarray:
+    """
+    Compute the TSPLIB `ATT` (pseudo-Euclidean) distance matrix.
+
+    :param coords: the coordinates
+    :returns: the (floating point) distance matrix
+
+    >>> _att(np.array([[0.0, 0.0], [30.0, 40.0], [10.0, 1.0]]))
+    array([[ 0., 16.,  4.],
+           [16.,  0., 14.],
+           [ 4., 14.,  0.]])
+    """
+    dx: Final[np.ndarray] = coords[:, 0][:, None] - coords[:, 0][None, :]
+    dy: Final[np.ndarray] = coords[:, 1][:, None] - coords[:, 1][None, :]
+    r: Final[np.ndarray] = np.sqrt((dx ** 2 + dy ** 2) / 10.0)
+    t: Final[np.ndarray] = np.floor(r + 0.5)
+    return np.where(t < r, t + 1.0, t)
+
+
+def _geo(coords: np.ndarray) -> np.ndarray:
+    """
+    Compute the TSPLIB `GEO` (geographical) distance matrix.
+
+    The coordinates are latitude and longitude in the `DDD.MM` format,
+    converted exactly as specified in the TSPLIB FAQ.
+
+    :param coords: the coordinates
+    :returns: the (floating point) distance matrix
+
+    >>> _geo(np.array([[16.47, 96.10], [16.47, 94.44], [20.09, 92.54]]))
+    array([[  0., 153., 510.],
+           [153.,   0., 422.],
+           [510., 422.,   0.]])
+    """
+    deg: Final[np.ndarray] = np.trunc(coords)
+    rad: Final[np.ndarray] = _GEO_PI * (
+        deg + 5.0 * (coords - deg) / 3.0) / 180.0
+    lat: Final[np.ndarray] = rad[:, 0]
+    lon: Final[np.ndarray] = rad[:, 1]
+    q1: Final[np.ndarray] = np.cos(lon[:, None] - lon[None, :])
+    q2: Final[np.ndarray] = np.cos(lat[:, None] - lat[None, :])
+    q3: Final[np.ndarray] = np.cos(lat[:, None] + lat[None, :])
+    d: Final[np.ndarray] = np.floor(_GEO_RRR * np.arccos(np.clip(
+        0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)) + 1.0)
+    np.fill_diagonal(d, 0.0)
+    return d
+
+
+def _explicit(weights: np.ndarray, n: int, edge_format: str) -> np.ndarray:
+    """
+    Unpack an `EXPLICIT` TSPLIB edge weight section into a full matrix.
+
+    :param weights: the flat array of edge weights
+    :param n: the number of cities
+    :param edge_format: the `EDGE_WEIGHT_FORMAT`
+    :returns: the distance matrix
+
+    >>> _explicit(np.array([1, 2, 3]), 3, "UPPER_ROW")
+    array([[0, 1, 2],
+           [1, 0, 3],
+           [2, 3, 0]])
+    >>> _explicit(np.array([1, 2, 3]), 3, "LOWER_ROW")
+    array([[0, 1, 2],
+           [1, 0, 3],
+           [2, 3, 0]])
+    >>> _explicit(np.array([0, 1, 0, 2, 3, 0]), 3, "LOWER_DIAG_ROW")
+    array([[0, 1, 2],
+           [1, 0, 3],
+           [2, 3, 0]])
+    >>> _explicit(np.array([0, 1, 2, 3, 0, 4, 5, 6, 0]), 3, "FULL_MATRIX")
+    array([[0, 1, 2],
+           [3, 0, 4],
+           [5, 6, 0]])
+    """
+    if edge_format == "FULL_MATRIX":
+        if weights.size != n * n:
+            raise ValueError(f"FULL_MATRIX needs {n * n} edge weights, "
+                             f"but got {weights.size}.")
+        return weights.reshape((n, n))
+
+    # A column-wise upper triangle is a row-wise lower triangle and vice
+    # versa, so we only need to distinguish row-wise upper and lower parts.
+    upper: Final[bool] = edge_format in (
+        "UPPER_ROW", "UPPER_DIAG_ROW", "LOWER_COL", "LOWER_DIAG_COL")
+    if (not upper) and (edge_format not in (
+            "LOWER_ROW", "LOWER_DIAG_ROW", "UPPER_COL", "UPPER_DIAG_COL")):
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT {edge_format!r}.")
+    k: Final[int] = 0 if "DIAG" in edge_format else 1
+    rows, cols = np.triu_indices(n, k) if upper else np.tril_indices(n, -k)
+    if weights.size != rows.size:
+        raise ValueError(f"{edge_format} needs {rows.size} edge weights, "
+                         f"but got {weights.size}.")
+    matrix: Final[np.ndarray] = np.zeros((n, n), weights.dtype)
+    matrix[rows, cols] = weights
+    matrix[cols, rows] = weights
+    return matrix
+
+
+#: the functions computing the distance matrices from node coordinates
+_COORD_DISTANCES: Final = {
+    "EUC_2D": _euc_2d, "CEIL_2D": _ceil_2d, "ATT": _att, "GEO": _geo}
+
+
+def _parse_tsplib(lines: list[str]) -> tuple[
+        str, int, dict[str, str], list[str], list[str]]:
+    """
+    Split the lines of a TSPLIB file into its specification and data parts.
+
+    :param lines: the lines of the file
+    :returns: the name of the instance, its dimension, the specification
+        entries, the lines of the `NODE_COORD_SECTION`, and the lines of the
+        `EDGE_WEIGHT_SECTION`
+
+    >>> nm, nn, sp, cs, ws = _parse_tsplib([
+    ...     "NAME: x3", "TYPE: TSP", "DIMENSION: 3",
+    ...     "EDGE_WEIGHT_TYPE: EUC_2D", "NODE_COORD_SECTION",
+    ...     "1 0 0", "2 3 4", "3 1 1.2", "EOF"])
+    >>> print(nm, nn, sp["EDGE_WEIGHT_TYPE"], cs, ws)
+    x3 3 EUC_2D ['1 0 0', '2 3 4', '3 1 1.2'] []
+    """
+    spec: Final[dict[str, str]] = {}
+    coords: Final[list[str]] = []
+    weights: Final[list[str]] = []
+    data: list[str] | None = None
+    for line in lines:
+        line = line.strip()
+        if (len(line) <= 0) or (line == "EOF"):
+            continue
+        if line.endswith("_SECTION"):
+            data = coords if line == "NODE_COORD_SECTION" else (
+                weights if line == "EDGE_WEIGHT_SECTION" else None)
+            continue
+        idx: int = line.find(":")
+        if idx > 0:
+            key: str = line[:idx].strip()
+            if key.isupper() and (" " not in key):
+                spec[key] = line[idx + 1:].strip()
+                data = None
+                continue
+        if data is not None:
+            data.append(line)
+
+    if "DIMENSION" not in spec:
+        raise ValueError("TSPLIB data has no DIMENSION.")
+    return spec.get("NAME", ""), check_int_range(
+        int(spec["DIMENSION"]), "DIMENSION", 2, 1_000_000_000), \
+        spec, coords, weights
+
+
+def _matrix_from_tsplib(lines: list[str]) -> tuple[str, np.ndarray]:
+    """
+    Parse the name and the distance matrix from the lines of a TSPLIB file.
+
+    :param lines: the lines of the file
+    :returns: the name of the instance and its distance matrix
+
+    >>> nm, mat = _matrix_from_tsplib([
+    ...     "NAME: x3", "TYPE: TSP", "DIMENSION: 3",
+    ...     "EDGE_WEIGHT_TYPE: EUC_2D", "NODE_COORD_SECTION",
+    ...     "1 0 0", "2 3 4", "3 1 1.2", "EOF"])
+    >>> print(nm)
+    x3
+    >>> mat
+    array([[0., 5., 2.],
+           [5., 0., 3.],
+           [2., 3., 0.]])
+    """
+    name, n, spec, coords, weights = _parse_tsplib(lines)
+    weight_type: Final[str] = spec.get("EDGE_WEIGHT_TYPE", "")
+    if weight_type == "EXPLICIT":
+        if len(weights) <= 0:
+            raise ValueError(f"Instance {name!r} has no EDGE_WEIGHT_SECTION.")
+        return name, _explicit(
+            np.array(" ".join(weights).split(), dtype=npu.DEFAULT_FLOAT),
+            n, spec.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX"))
+    if weight_type not in _COORD_DISTANCES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE {weight_type!r} "
+                         f"in instance {name!r}.")
+    if len(coords) != n:
+        raise ValueError(f"Instance {name!r} has DIMENSION {n}, but "
+                         f"{len(coords)} node coordinates.")
+    return name, _COORD_DISTANCES[weight_type](np.loadtxt(
+        coords, dtype=npu.DEFAULT_FLOAT, usecols=(1, 2), ndmin=2))
+
+
+@cache
+def known_optimal_tour_lengths(file: str) -> dict[str, int]:
+    """
+    Load the known optimal tour lengths of the symmetric TSPLIB instances.
+
+    :param file: the path to the `optimal_tour_lengths_of_symmetric_tsps.html`
+        page of TSPLIB
+    :returns: a dictionary mapping instance names to optimal tour lengths
+    """
+    path: Final[Path] = Path.file(file)
+    with open(path, encoding="cp1252") as stream:
+        text: Final[str] = stream.read()
+    return {name: int(length) for name, length in findall(
+        r"<big>\s*([A-Za-z0-9]+)\s*:\s*(\d+)\s*</big>", text)}
+
+
+class Instance(Component, np.ndarray):
+    """
+    An instance of the Traveling Salesperson Problem.
+
+    Besides the metadata, this object is the `n*n` distance matrix of the
+    instance, i.e., `I[i, j]` is the distance from city `i` to city `j`.
+    """
+
+    #: the name of the instance
+    name: str
+    #: the number of cities == self.shape[0]
+    n_cities: int
+    #: the lower bound of the tour length of this TSP instance
+    tour_length_lower_bound: int
+    #: the upper bound of the tour length of this TSP instance
+    tour_length_upper_bound: int
+    #: is this instance symmetric?
+    is_symmetric: bool
+
+    def __new__(cls, name: str, tour_length_lower_bound: int | None,
+                matrix: np.ndarray) -> "Instance":
+        """
+        Create an instance of the Traveling Salesperson Problem.
+
+        :param cls: the class
+        :param name: the name of the instance
+        :param tour_length_lower_bound: the lower bound of the tour length,
+            which may be the length of the known optimal tour. If `None` is
+            provided, the sum of the shortest distances leaving each city
+            is used.
+        :param matrix: the distance matrix (will be copied)
+
+        >>> inst = Instance("x3", None, np.array([[0, 5, 2], [5, 0, 3],
+        ...                                       [2, 3, 0]]))
+        >>> print(inst.n_cities, inst.tour_length_lower_bound,
+        ...       inst.tour_length_upper_bound, inst.is_symmetric, inst.dtype)
+        3 7 13 True int8
+        """
+        use_name: Final[str] = sanitize_name(name)
+        if name != use_name:
+            raise ValueError(f"Name {name!r} is not a valid name.")
+        if not isinstance(matrix, np.ndarray):
+            raise type_error(matrix, "matrix", np.ndarray)
+        if (len(matrix.shape) != 2) or (matrix.shape[0] != matrix.shape[1]):
+            raise ValueError(
+                f"Invalid shape {str(matrix.shape)!r} of distance matrix "
+                f"of instance {name!r}, must be square.")
+        n_cities: Final[int] = check_int_range(
+            matrix.shape[0], "n_cities", 2, 1_000_000_000)
+        if not (npu.is_np_int(matrix.dtype) or np.array_equal(
+                matrix, np.floor(matrix))):
+            raise ValueError("Distance matrix must contain integers in "
+                             f"instance {name!r}.")
+        off_diag: Final[np.ndarray] = ~np.eye(n_cities, dtype=np.bool_)
+        min_value: Final[int] = int(matrix[off_diag].min())
+        if min_value < 0:
+            raise ValueError("Distances must not be negative, but found "
+                             f"{min_value} in instance {name!r}.")
+        max_value: Final[int] = int(matrix.max())
+
+        # The most compact signed type, since algorithms compute differences.
+        obj: Final[Instance] = super().__new__(
+            Instance, matrix.shape, int_range_to_dtype(
+                min_value=-max_value, max_value=max_value))
+        np.copyto(obj, matrix, casting="unsafe")
+        np.fill_diagonal(obj, 0)
+        lb: Final[int] = int(np.where(
+            off_diag, obj, max_value).min(axis=1).sum(dtype=np.int64))
+        ub: Final[int] = int(obj.max(axis=1).sum(dtype=np.int64))
+        if tour_length_lower_bound is None:
+            tour_length_lower_bound = lb
+        else:
+            check_int_range(tour_length_lower_bound,
+                            "tour_length_lower_bound", lb, ub)
+
+        #: the name of the instance
+        obj.name = use_name
+        #: the number of cities == self.shape[0]
+        obj.n_cities = n_cities
+        #: the lower bound of the tour length of this TSP instance
+        obj.tour_length_lower_bound = tour_length_lower_bound
+        #: the upper bound of the tour length of this TSP instance
+        obj.tour_length_upper_bound = ub
+        #: is this instance symmetric?
+        obj.is_symmetric = bool(np.array_equal(obj, obj.T))
+        return obj
+
+    def __str__(self) -> str:
+        """
+        Get the name of this TSP instance.
+
+        :return: the name
+        """
+        return self.name
+
+    def log_parameters_to(self, logger: KeyValueLogSection) -> None:
+        """
+        Log the parameters describing this TSP instance to the logger.
+
+        :param logger: the logger for the parameters
+        """
+        super().log_parameters_to(logger)
+        logger.key_value(N_CITIES, self.n_cities)
+        logger.key_value(TOUR_LENGTH_LOWER_BOUND,
+                         self.tour_length_lower_bound)
+        logger.key_value(TOUR_LENGTH_UPPER_BOUND,
+                         self.tour_length_upper_bound)
+        logger.key_value(SYMMETRIC, self.is_symmetric)
+        logger.key_value(npu.KEY_NUMPY_TYPE, self.dtype.char)
+
+    @staticmethod
+    def from_text(lines: list[str], name: str | None = None,
+                  tour_length_lower_bound: int | None = None) -> "Instance":
+        """
+        Create a TSP instance from the lines of a TSPLIB file.
+
+        :param lines: the lines of the TSPLIB file
+        :param name: the name of the instance, or `None` to use the `NAME`
+            specified in the data
+        :param tour_length_lower_bound: the lower bound of the tour length,
+            or `None` to compute one
+        :return: the TSP instance
+
+        >>> inst = Instance.from_text([
+        ...     "NAME: x4", "TYPE: TSP", "DIMENSION: 4",
+        ...     "EDGE_WEIGHT_TYPE: EXPLICIT", "EDGE_WEIGHT_FORMAT: UPPER_ROW",
+        ...     "EDGE_WEIGHT_SECTION", "1 2 3", "4 5", "6", "EOF"])
+        >>> print(inst.name, inst.n_cities)
+        x4 4
+        >>> np.asarray(inst)
+        array([[0, 1, 2, 3],
+               [1, 0, 4, 5],
+               [2, 4, 0, 6],
+               [3, 5, 6, 0]], dtype=int8)
+        """
+        if not isinstance(lines, list):
+            raise type_error(lines, "lines", list)
+        found_name, matrix = _matrix_from_tsplib(lines)
+        return Instance(found_name if name is None else name,
+                        tour_length_lower_bound, matrix)
+
+    @staticmethod
+    def from_file(file: str,
+                  tour_length_lower_bound: int | None = None) -> "Instance":
+        """
+        Load a TSP instance from a TSPLIB file.
+
+        The name of the instance is the file name without extension. If no
+        lower bound is provided and the TSPLIB page with the optimal tour
+        lengths (:const:`OPTIMAL_TOUR_LENGTHS_FILE`) is located in the same
+        directory as the file, the optimal tour length listed there is used.
+
+        :param file: the path to the file
+        :param tour_length_lower_bound: the lower bound of the tour length,
+            or `None` to look it up or compute it
+        :return: the TSP instance
+        """
+        path: Final[Path] = Path.file(file)
+        name: Final[str] = os.path.splitext(os.path.basename(path))[0]
+        if tour_length_lower_bound is None:
+            optima: Final[str] = os.path.join(
+                os.path.dirname(path), OPTIMAL_TOUR_LENGTHS_FILE)
+            if os.path.isfile(optima):
+                tour_length_lower_bound = known_optimal_tour_lengths(
+                    optima).get(name)
+        with open(path, encoding="utf-8") as stream:
+            return Instance.from_text(stream.read().splitlines(), name,
+                                      tour_length_lower_bound)
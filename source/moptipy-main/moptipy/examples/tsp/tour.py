@@ -0,0 +1,583 @@
+"""
+Tour representations supporting fast 2-opt style segment reversals.
+
+A 2-opt move on a tour replaces two edges by reversing the path between them.
+In the plain array representation, reversing the path `x[i..j]` costs time
+proportional to its length, i.e., up to `n`. This module offers three ways to
+make this cheaper:
+
+- :func:`reverse_shorter` reverses either the path `x[i..j]` or its
+  complement, whichever is shorter. Both yield the same cyclic tour, so at
+  most `n/2` elements are moved.
+- :class:`ArrayTour` keeps the tour as an array together with the index of
+  each city and answers `next`, `prev`, and `between` queries in `O(1)`.
+  Its :meth:`~ArrayTour.reverse` applies :func:`reverse_shorter`.
+- :class:`TwoLevelTour` splits the tour into about `sqrt(n)` segments, each
+  of which has a reversal bit [1]. A reversal splits at most two segments
+  and then reverses the order of the segments between them and flips their
+  reversal bits, which takes `O(sqrt(n))` time. The segments are rebuilt
+  whenever splitting has produced too many of them. `next`, `prev`, and
+  `between` queries take `O(1)` time.
+
+Both classes offer the same methods. They work on tours in which each of the
+cities `0..n-1` occurs exactly once and can always be converted back to a
+plain array via `to_array`, e.g., whenever a
+:class:`~moptipy.api.process.Process` needs to copy or log a solution.
+
+>>> t = TwoLevelTour(np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+>>> t.reverse(2, 5)
+>>> print(t.to_array())
+[0 1 5 4 3 2 6 7 8 9]
+>>> t.next(1), t.prev(1), t.between(1, 4, 2)
+(5, 0, True)
+>>> t = ArrayTour(np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+>>> t.reverse(2, 5)
+>>> print(t.to_array())
+[0 1 5 4 3 2 6 7 8 9]
+
+1. Michael L. Fredman, David S. Johnson, Lyle A. McGeoch, and Gretchen
+   Ostheimer. Data Structures for Traveling Salesmen. *Journal of
+   Algorithms* 18(3):432-479, May 1995.
+   https://doi.org/10.1006/jagm.1995.1018
+"""
+from math import isqrt
+from typing import Final
+
+import numba  # type: ignore
+import numpy as np
+
+from moptipy.utils.types import type_error
+
+#: the column of a segment holding the index of its first element in `buf`
+_LO: Final[int] = 0
+#: the column of a segment holding the index of its last element in `buf`
+_HI: Final[int] = 1
+#: the column of a segment holding its reversal bit
+_REV: Final[int] = 2
+#: the column of a segment holding the tour position of its first city
+_OFF: Final[int] = 3
+
+
+@numba.njit(nogil=True, cache=True)
+def reverse_shorter(x: np.ndarray, i: int, j: int) -> None:
+    """
+    Reverse the cyclic path from index `i` to `j` or its complement.
+
+    Both alternatives result in the same cyclic tour, so the one moving
+    fewer elements is chosen.
+
+    :param x: the tour
+    :param i: the index of the first element of the path
+    :param j: the index of the last element of the path
+
+    >>> xx = np.array([0, 1, 2, 3, 4, 5, 6, 7])
+    >>> reverse_shorter(xx, 2, 4)
+    >>> print(xx)
+    [0 1 4 3 2 5 6 7]
+    >>> reverse_shorter(xx, 1, 6)
+    >>> print(xx)
+    [7 1 4 3 2 5 6 0]
+    >>> reverse_shorter(xx, 6, 1)
+    >>> print(xx)
+    [0 6 4 3 2 5 1 7]
+    """
+    n: Final[int] = len(x)
+    length: int = (j - i) % n + 1
+    if (length + length) > n:
+        i = (j + 1) % n
+        length = n - length
+    b: int = i + length - 1
+    if b < n:
+        a: int = i
+        while a < b:
+            x[a], x[b] = x[b], x[a]
+            a += 1
+            b -= 1
+        return
+    for t in range(length // 2):
+        a = (i + t) % n
+        c = (b - t) % n
+        x[a], x[c] = x[c], x[a]
+
+
+@numba.njit(nogil=True, cache=True)
+def _array_reverse(x: np.ndarray, pos: np.ndarray, i: int, j: int) -> None:
+    """
+    Reverse the shorter side of a tour and update the city indices.
+
+    :param x: the tour
+    :param pos: the index of each city in `x`
+    :param i: the index of the first element of the path
+    :param j: the index of the last element of the path
+    """
+    n: Final[int] = len(x)
+    length: int = (j - i) % n + 1
+    if (length + length) > n:
+        i = (j + 1) % n
+        length = n - length
+    b: Final[int] = i + length - 1
+    for t in range(length // 2):
+        p = (i + t) % n
+        q = (b - t) % n
+        cp = x[p]
+        cq = x[q]
+        x[p] = cq
+        pos[cq] = p
+        x[q] = cp
+        pos[cp] = q
+
+
+class ArrayTour:
+    """A tour stored as array with the index of each city."""
+
+    def __init__(self, x: np.ndarray) -> None:
+        """
+        Create the tour.
+
+        :param x: the permutation of the cities, which is copied
+        """
+        if not isinstance(x, np.ndarray):
+            raise type_error(x, "x", np.ndarray)
+        #: the tour
+        self.x: Final[np.ndarray] = np.array(x, dtype=np.int64)
+        #: the index of each city in :attr:`x`
+        self.pos: Final[np.ndarray] = np.empty(len(x), np.int64)
+        self.pos[self.x] = np.arange(len(x))
+
+    def __len__(self) -> int:
+        """
+        Get the number of cities.
+
+        :returns: the number of cities
+        """
+        return len(self.x)
+
+    def next(self, c: int) -> int:
+        """
+        Get the successor of a city.
+
+        :param c: the city
+        :returns: the city following `c`
+        """
+        return int(self.x[(self.pos[c] + 1) % len(self.x)])
+
+    def prev(self, c: int) -> int:
+        """
+        Get the predecessor of a city.
+
+        :param c: the city
+        :returns: the city preceding `c`
+        """
+        return int(self.x[self.pos[c] - 1])
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        """
+        Check whether `b` is on the path from `a` forward to `c`.
+
+        :param a: the start city
+        :param b: the city to check
+        :param c: the end city
+        :returns: `True` if going forward from `a` reaches `b` no later than
+            `c`, `False` otherwise
+        """
+        pos: Final[np.ndarray] = self.pos
+        n: Final[int] = len(pos)
+        return bool(((pos[b] - pos[a]) % n) <= ((pos[c] - pos[a]) % n))
+
+    def reverse(self, a: int, b: int) -> None:
+        """
+        Reverse the path from city `a` forward to city `b`.
+
+        :param a: the first city of the path
+        :param b: the last city of the path
+        """
+        _array_reverse(self.x, self.pos, self.pos[a], self.pos[b])
+
+    def to_array(self, dest: np.ndarray | None = None) -> np.ndarray:
+        """
+        Convert the tour to a plain array.
+
+        :param dest: the optional destination array
+        :returns: the array holding the tour
+        """
+        if dest is None:
+            return self.x.copy()
+        np.copyto(dest, self.x)
+        return dest
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_build(x: np.ndarray, buf: np.ndarray, where: np.ndarray,
+              owner: np.ndarray, seg: np.ndarray, order: np.ndarray,
+              rank: np.ndarray, meta: np.ndarray) -> None:
+    """
+    Build the segments of a two-level tour from an array.
+
+    :param x: the tour
+    :param buf: the city storage
+    :param where: the index of each city in `buf`
+    :param owner: the segment of each city
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param rank: the index of each segment in `order`
+    :param meta: the number of segments, their maximum, and the group size
+    """
+    n: Final[int] = len(x)
+    g: Final[int] = meta[2]
+    m: int = 0
+    for lo in range(0, n, g):
+        hi = min(lo + g, n) - 1
+        seg[m, _LO] = lo
+        seg[m, _HI] = hi
+        seg[m, _REV] = 0
+        seg[m, _OFF] = lo
+        order[m] = m
+        rank[m] = m
+        for p in range(lo, hi + 1):
+            c = x[p]
+            buf[p] = c
+            where[c] = p
+            owner[c] = m
+        m += 1
+    meta[0] = m
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_to_array(buf: np.ndarray, seg: np.ndarray, order: np.ndarray,
+                 m: int, dest: np.ndarray) -> None:
+    """
+    Write a two-level tour into an array.
+
+    :param buf: the city storage
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param m: the number of segments
+    :param dest: the destination array
+    """
+    k: int = 0
+    for r in range(m):
+        s = order[r]
+        lo = seg[s, _LO]
+        hi = seg[s, _HI]
+        if seg[s, _REV] == 0:
+            for p in range(lo, hi + 1):
+                dest[k] = buf[p]
+                k += 1
+        else:
+            for p in range(hi, lo - 1, -1):
+                dest[k] = buf[p]
+                k += 1
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_pos(where: np.ndarray, owner: np.ndarray, seg: np.ndarray,
+            c: int) -> int:
+    """
+    Get the position of a city in a two-level tour.
+
+    :param where: the index of each city in the city storage
+    :param owner: the segment of each city
+    :param seg: the segments
+    :param c: the city
+    :returns: the index of `c` in the tour
+    """
+    s: Final[int] = owner[c]
+    if seg[s, _REV] == 0:
+        return seg[s, _OFF] + where[c] - seg[s, _LO]
+    return seg[s, _OFF] + seg[s, _HI] - where[c]
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_next(buf: np.ndarray, where: np.ndarray, owner: np.ndarray,
+             seg: np.ndarray, order: np.ndarray, rank: np.ndarray, m: int,
+             c: int) -> int:
+    """
+    Get the successor of a city in a two-level tour.
+
+    :param buf: the city storage
+    :param where: the index of each city in `buf`
+    :param owner: the segment of each city
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param rank: the index of each segment in `order`
+    :param m: the number of segments
+    :param c: the city
+    :returns: the city following `c`
+    """
+    s: Final[int] = owner[c]
+    p: Final[int] = where[c]
+    if seg[s, _REV] == 0:
+        if p < seg[s, _HI]:
+            return buf[p + 1]
+    elif p > seg[s, _LO]:
+        return buf[p - 1]
+    t: Final[int] = order[(rank[s] + 1) % m]
+    return buf[seg[t, _HI]] if seg[t, _REV] != 0 else buf[seg[t, _LO]]
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_prev(buf: np.ndarray, where: np.ndarray, owner: np.ndarray,
+             seg: np.ndarray, order: np.ndarray, rank: np.ndarray, m: int,
+             c: int) -> int:
+    """
+    Get the predecessor of a city in a two-level tour.
+
+    :param buf: the city storage
+    :param where: the index of each city in `buf`
+    :param owner: the segment of each city
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param rank: the index of each segment in `order`
+    :param m: the number of segments
+    :param c: the city
+    :returns: the city preceding `c`
+    """
+    s: Final[int] = owner[c]
+    p: Final[int] = where[c]
+    if seg[s, _REV] == 0:
+        if p > seg[s, _LO]:
+            return buf[p - 1]
+    elif p < seg[s, _HI]:
+        return buf[p + 1]
+    t: Final[int] = order[(rank[s] - 1) % m]
+    return buf[seg[t, _LO]] if seg[t, _REV] != 0 else buf[seg[t, _HI]]
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_offsets(seg: np.ndarray, order: np.ndarray, m: int) -> None:
+    """
+    Recompute the tour positions of the first cities of all segments.
+
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param m: the number of segments
+    """
+    off: int = 0
+    for r in range(m):
+        s = order[r]
+        seg[s, _OFF] = off
+        off += seg[s, _HI] - seg[s, _LO] + 1
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_split(buf: np.ndarray, where: np.ndarray, owner: np.ndarray,
+              seg: np.ndarray, order: np.ndarray, rank: np.ndarray,
+              meta: np.ndarray, c: int) -> None:
+    """
+    Split the segment of city `c` such that `c` becomes its first city.
+
+    The smaller part of the segment is moved to a new segment.
+
+    :param buf: the city storage
+    :param where: the index of each city in `buf`
+    :param owner: the segment of each city
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param rank: the index of each segment in `order`
+    :param meta: the number of segments, their maximum, and the group size
+    :param c: the city
+    """
+    s: Final[int] = owner[c]
+    p: Final[int] = where[c]
+    lo: Final[int] = seg[s, _LO]
+    hi: Final[int] = seg[s, _HI]
+    rev: Final[int] = seg[s, _REV]
+    if p == (hi if rev != 0 else lo):
+        return  # c already is the first city of its segment
+    # the part before c in tour order is a_lo..a_hi, c's part b_lo..b_hi
+    a_lo: Final[int] = p + 1 if rev != 0 else lo
+    a_hi: Final[int] = hi if rev != 0 else p - 1
+    b_lo: Final[int] = lo if rev != 0 else p
+    b_hi: Final[int] = p if rev != 0 else hi
+    m: Final[int] = meta[0]
+    r: int = rank[s]
+    if (a_hi - a_lo) <= (b_hi - b_lo):  # the new segment precedes s
+        new_lo, new_hi = a_lo, a_hi
+        seg[s, _LO] = b_lo
+        seg[s, _HI] = b_hi
+    else:  # the new segment follows s
+        new_lo, new_hi = b_lo, b_hi
+        seg[s, _LO] = a_lo
+        seg[s, _HI] = a_hi
+        r += 1
+    seg[m, _LO] = new_lo
+    seg[m, _HI] = new_hi
+    seg[m, _REV] = rev
+    for q in range(new_lo, new_hi + 1):
+        owner[buf[q]] = m
+    for q in range(m, r, -1):
+        t = order[q - 1]
+        order[q] = t
+        rank[t] = q
+    order[r] = m
+    rank[m] = r
+    meta[0] = m + 1
+    _tl_offsets(seg, order, m + 1)
+
+
+@numba.njit(nogil=True, cache=True)
+def _tl_reverse(buf: np.ndarray, where: np.ndarray, owner: np.ndarray,
+                seg: np.ndarray, order: np.ndarray, rank: np.ndarray,
+                meta: np.ndarray, a: int, b: int) -> None:
+    """
+    Reverse the path from city `a` forward to city `b` in a two-level tour.
+
+    :param buf: the city storage
+    :param where: the index of each city in `buf`
+    :param owner: the segment of each city
+    :param seg: the segments
+    :param order: the segments in tour order
+    :param rank: the index of each segment in `order`
+    :param meta: the number of segments, their maximum, and the group size
+    :param a: the first city of the path
+    :param b: the last city of the path
+    """
+    n: Final[int] = len(buf)
+    length: int = (_tl_pos(where, owner, seg, b)
+                   - _tl_pos(where, owner, seg, a)) % n + 1
+    if (length + length) > n:  # reverse the shorter complement instead
+        a, b = (_tl_next(buf, where, owner, seg, order, rank, meta[0], b),
+                _tl_prev(buf, where, owner, seg, order, rank, meta[0], a))
+        length = n - length
+    if length <= 1:
+        return
+    s: Final[int] = owner[a]
+    if (owner[b] == s) and (_tl_pos(where, owner, seg, b)
+                            > _tl_pos(where, owner, seg, a)):
+        i: int = min(where[a], where[b])  # path inside one segment
+        j: int = max(where[a], where[b])
+        while i < j:
+            ci = buf[i]
+            cj = buf[j]
+            buf[i] = cj
+            where[cj] = i
+            buf[j] = ci
+            where[ci] = j
+            i += 1
+            j -= 1
+        return
+    _tl_split(buf, where, owner, seg, order, rank, meta, a)
+    _tl_split(buf, where, owner, seg, order, rank, meta, _tl_next(
+        buf, where, owner, seg, order, rank, meta[0], b))
+    m: Final[int] = meta[0]
+    r1: Final[int] = rank[owner[a]]
+    r2: Final[int] = rank[owner[b]]
+    k: Final[int] = (r2 - r1) % m + 1
+    for t in range(k // 2):
+        q1 = (r1 + t) % m
+        q2 = (r2 - t) % m
+        order[q1], order[q2] = order[q2], order[q1]
+    for t in range(k):
+        q = (r1 + t) % m
+        sq = order[q]
+        rank[sq] = q
+        seg[sq, _REV] ^= 1
+    if m > meta[1]:  # too many segments: rebuild them
+        x: Final[np.ndarray] = np.empty(n, buf.dtype)
+        _tl_to_array(buf, seg, order, m, x)
+        _tl_build(x, buf, where, owner, seg, order, rank, meta)
+    else:
+        _tl_offsets(seg, order, m)
+
+
+class TwoLevelTour:
+    """A tour stored as segments with reversal bits."""
+
+    def __init__(self, x: np.ndarray) -> None:
+        """
+        Create the tour.
+
+        :param x: the permutation of the cities
+        """
+        if not isinstance(x, np.ndarray):
+            raise type_error(x, "x", np.ndarray)
+        n: Final[int] = len(x)
+        if n <= 0:
+            raise ValueError("A tour must contain at least one city.")
+        g: Final[int] = max(1, isqrt(n - 1) + 1)
+        max_segments: Final[int] = 2 * ((n + g - 1) // g) + 2
+        #: the cities, stored segment by segment
+        self.buf: Final[np.ndarray] = np.empty(n, np.int64)
+        #: the index of each city in :attr:`buf`
+        self.where: Final[np.ndarray] = np.empty(n, np.int64)
+        #: the segment of each city
+        self.owner: Final[np.ndarray] = np.empty(n, np.int64)
+        #: the segments: first and last index in :attr:`buf`, the reversal
+        #: bit, and the tour position of the first city
+        self.seg: Final[np.ndarray] = np.empty((max_segments + 2, 4),
+                                               np.int64)
+        #: the segments in tour order
+        self.order: Final[np.ndarray] = np.empty(max_segments + 2, np.int64)
+        #: the index of each segment in :attr:`order`
+        self.rank: Final[np.ndarray] = np.empty(max_segments + 2, np.int64)
+        #: the number of segments, their maximum, and the group size
+        self.meta: Final[np.ndarray] = np.array([0, max_segments, g],
+                                                np.int64)
+        _tl_build(np.asarray(x, np.int64), self.buf, self.where, self.owner,
+                  self.seg, self.order, self.rank, self.meta)
+
+    def __len__(self) -> int:
+        """
+        Get the number of cities.
+
+        :returns: the number of cities
+        """
+        return len(self.buf)
+
+    def next(self, c: int) -> int:
+        """
+        Get the successor of a city.
+
+        :param c: the city
+        :returns: the city following `c`
+        """
+        return int(_tl_next(self.buf, self.where, self.owner, self.seg,
+                            self.order, self.rank, self.meta[0], c))
+
+    def prev(self, c: int) -> int:
+        """
+        Get the predecessor of a city.
+
+        :param c: the city
+        :returns: the city preceding `c`
+        """
+        return int(_tl_prev(self.buf, self.where, self.owner, self.seg,
+                            self.order, self.rank, self.meta[0], c))
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        """
+        Check whether `b` is on the path from `a` forward to `c`.
+
+        :param a: the start city
+        :param b: the city to check
+        :param c: the end city
+        :returns: `True` if going forward from `a` reaches `b` no later than
+            `c`, `False` otherwise
+        """
+        n: Final[int] = len(self.buf)
+        pa: Final[int] = _tl_pos(self.where, self.owner, self.seg, a)
+        return bool(
+            ((_tl_pos(self.where, self.owner, self.seg, b) - pa) % n)
+            <= ((_tl_pos(self.where, self.owner, self.seg, c) - pa) % n))
+
+    def reverse(self, a: int, b: int) -> None:
+        """
+        Reverse the path from city `a` forward to city `b`.
+
+        :param a: the first city of the path
+        :param b: the last city of the path
+        """
+        _tl_reverse(self.buf, self.where, self.owner, self.seg, self.order,
+                    self.rank, self.meta, a, b)
+
+    def to_array(self, dest: np.ndarray | None = None) -> np.ndarray:
+        """
+        Convert the tour to a plain array.
+
+        :param dest: the optional destination array
+        :returns: the array holding the tour
+        """
+        if dest is None:
+            dest = np.empty(len(self.buf), np.int64)
+        _tl_to_array(self.buf, self.seg, self.order, self.meta[0], dest)
+        return dest
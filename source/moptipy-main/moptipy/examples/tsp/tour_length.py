@@ -0,0 +1,109 @@
+"""An objective function for minimizing the length of a TSP tour."""
+from typing import Final
+
+import numba  # type: ignore
+import numpy as np
+
+from moptipy.api.objective import Objective
+from moptipy.examples.tsp.instance import SCOPE_INSTANCE, Instance
+from moptipy.utils.logger import KeyValueLogSection
+from moptipy.utils.types import type_error
+
+
+@numba.njit(nogil=True, cache=True)
+def tour_length(instance: np.ndarray, x: np.ndarray) -> int:
+    """
+    Compute the length of a tour.
+
+    The tour `x` is a permutation of the cities `0..n-1`. Its length is the
+    sum of the distances from each city to the next one, including the
+    distance from the last city back to the first one. This is jitted for
+    performance.
+
+    :param instance: the distance matrix
+    :param x: the tour
+    :return: the length of the tour
+
+    >>> tour_length(np.array([[0, 5, 2], [5, 0, 3], [2, 3, 0]]),
+    ...             np.array([0, 1, 2]))
+    10
+    """
+    i: int = x[-1]
+    result: int = 0
+    for j in x:
+        result += instance[i, j]
+        i = j
+    return int(result)
+
+
+class TourLength(Objective):
+    """Compute the length of a tour of a TSP (for minimization)."""
+
+    def __init__(self, instance: Instance) -> None:
+        """
+        Initialize the tour length objective function.
+
+        :param instance: the TSP instance
+        """
+        super().__init__()
+        if not isinstance(instance, Instance):
+            raise type_error(instance, "instance", Instance)
+        #: the TSP instance
+        self.instance: Final[Instance] = instance
+
+    def evaluate(self, x) -> int:
+        """
+        Compute the length of a tour.
+
+        :param x: the tour, i.e., a permutation of the cities
+        :return: the length of the tour
+
+        >>> inst = Instance("x3", None, np.array([[0, 5, 2], [5, 0, 3],
+        ...                                       [2, 3, 0]]))
+        >>> TourLength(inst).evaluate(np.array([2, 1, 0]))
+        10
+        """
+        return tour_length(self.instance, x)
+
+    def lower_bound(self) -> int:
+        """
+        Get the lower bound of the tour length.
+
+        :return: the lower bound of the tour length of the instance
+        """
+        return self.instance.tour_length_lower_bound
+
+    def upper_bound(self) -> int:
+        """
+        Get the upper bound of the tour length.
+
+        :return: the sum of the longest distances leaving each city
+        """
+        return self.instance.tour_length_upper_bound
+
+    def is_always_integer(self) -> bool:
+        """
+        Return `True` because :func:`tour_length` always returns `int` values.
+
+        :retval True: always
+        """
+        return True
+
+    def log_parameters_to(self, logger: KeyValueLogSection) -> None:
+        """
+        Log the parameters of this objective function to the logger.
+
+        :param logger: the logger for the parameters
+        """
+        super().log_parameters_to(logger)
+        with logger.scope(SCOPE_INSTANCE) as scope:
+            self.instance.log_parameters_to(scope)
+
+    def __str__(self) -> str:
+        """
+        Get the name of the tour length objective function.
+
+        :return: `tourLength`
+        :retval "tourLength": always
+        """
+        return "tourLength"
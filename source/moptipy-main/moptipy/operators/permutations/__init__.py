@@ -23,6 +23,10 @@ These operators can be used in conjunction with the space
   element occurs once, this means that all elements change their position. If
   applied to permutations with repetitions, things are more complex and some
   moves may be impossible, in which case a best effort is attempted.
+- Module :mod:`~moptipy.operators.permutations.op1_2opt_nn` offers unary
+  operators for tours of the Traveling Salesperson Problem: a random 2-opt
+  move connecting a city with one of its nearest neighbors and an iterated
+  local search step using 2-opt and Or-opt moves with don't-look bits.
 - Module :mod:`~moptipy.operators.permutations.op2_gap` offers an operator
   that tries to build a new permutation by appending not-yet-appended elements
   from both input permutations, alternating between them randomly.
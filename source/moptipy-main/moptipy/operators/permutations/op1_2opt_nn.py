@@ -0,0 +1,549 @@
+"""
+Neighbor-list based 2-opt moves and local search for tours.
+
+If a permutation represents a tour in the Traveling Salesperson Problem (TSP),
+then reversing a subsequence of it replaces two edges by two new ones. This is
+the well-known 2-opt move [1]. Sampling the two cut points uniformly at random
+is wasteful on larger instances: almost all such moves connect cities that are
+far apart and hence are useless. Good moves usually connect a city with one of
+its nearest neighbors [2]. This module therefore pre-computes, for each city,
+the list of its `k` nearest neighbors via :func:`nearest_neighbors` and
+offers two unary operators built on top of these candidate lists:
+
+- :class:`Op1TwoOptNN` picks a random city `a` and a random city `c` from the
+  neighbor list of `a` and performs the 2-opt move that makes `c` the
+  successor of `a`.
+- :class:`Op1TwoOptLS` is an iterated local search step: It first applies a
+  random double-bridge move [3] to a copy of the tour and then performs a
+  first-improvement local search with 2-opt and Or-opt [4] moves restricted to
+  the neighbor lists. Don't-look bits [2] make sure that only cities whose
+  surroundings have changed are examined again, so one application takes
+  roughly linear time instead of examining all `O(n²)` moves. It can be
+  used as unary operator of the :class:`~moptipy.algorithms.so.rls.RLS` or
+  :class:`~moptipy.algorithms.so.ea.EA` and, via such an algorithm, as local
+  search of the :class:`~moptipy.algorithms.so.ma.MA` or the
+  :class:`~moptipy.algorithms.so.general_ma.GeneralMA`.
+
+Both operators work on permutations of the cities `0..n-1` in which each city
+occurs exactly once and assume a symmetric distance matrix, such as a
+:class:`~moptipy.examples.tsp.instance.Instance`. Reversals are applied to the
+shorter side of the tour, which yields the same cyclic tour.
+
+1. Shen Lin. Computer Solutions of the Traveling Salesman Problem. *The Bell
+   System Technical Journal* 44(10):2245-2269, December 1965.
+   https://doi.org/10.1002/j.1538-7305.1965.tb04146.x
+2. Jon Louis Bentley. Fast Algorithms for Geometric Traveling Salesman
+   Problems. *ORSA Journal on Computing* 4(4):387-411, 1992.
+   https://doi.org/10.1287/ijoc.4.4.387
+3. Olivier C. Martin, Steve W. Otto, and Edward W. Felten. Large-Step Markov
+   Chains for the Traveling Salesman Problem. *Complex Systems* 5(3):299-326,
+   1991.
+4. Ilhan Or. *Traveling Salesman-Type Combinatorial Problems and Their
+   Relation to the Logistics of Regional Blood Banking.* PhD Thesis, 1976.
+   Evanston, IL, USA: Northwestern University.
+"""
+from typing import Callable, Final
+
+import numba  # type: ignore
+import numpy as np
+from numpy.random import Generator
+
+from moptipy.api.operators import Op1
+from moptipy.utils.logger import KeyValueLogSection
+from moptipy.utils.nputils import int_range_to_dtype
+from moptipy.utils.types import check_int_range, type_error
+
+
+def nearest_neighbors(distances: np.ndarray, k: int) -> np.ndarray:
+    """
+    Compute the `k` nearest neighbors of each city.
+
+    :param distances: the square distance matrix
+    :param k: the number of neighbors per city, reduced to `n - 1` if larger
+    :returns: a matrix whose row `i` holds the `k` cities closest to city
+        `i`, ordered by increasing distance
+
+    >>> nearest_neighbors(np.array([[0, 1, 5, 3], [1, 0, 2, 6],
+    ...                             [5, 2, 0, 4], [3, 6, 4, 0]]), 2)
+    array([[1, 3],
+           [0, 2],
+           [1, 3],
+           [0, 2]], dtype=int8)
+    """
+    if not isinstance(distances, np.ndarray):
+        raise type_error(distances, "distances", np.ndarray)
+    n: Final[int] = len(distances)
+    if (distances.ndim != 2) or (distances.shape[1] != n) or (n < 2):
+        raise ValueError("distances must be a square matrix with at least "
+                         f"two rows, but has shape {distances.shape}.")
+    k = min(check_int_range(k, "k", 1), n - 1)
+    dist: Final[np.ndarray] = np.array(distances, dtype=np.float64)
+    np.fill_diagonal(dist, np.inf)  # a city is not its own neighbor
+    nn: np.ndarray = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    nn = np.take_along_axis(nn, np.argsort(np.take_along_axis(
+        dist, nn, axis=1), axis=1, kind="stable"), axis=1)
+    return nn.astype(int_range_to_dtype(0, n - 1))
+
+
+@numba.njit(nogil=True, cache=True)
+def _reverse_block(x: np.ndarray, pos: np.ndarray, i: int,
+                   length: int) -> None:
+    """
+    Reverse `length` elements of a cyclic tour starting at index `i`.
+
+    :param x: the tour
+    :param pos: the index of each city in the tour, updated accordingly
+    :param i: the index of the first element of the block
+    :param length: the length of the block
+    """
+    n: Final[int] = len(x)
+    j: Final[int] = i + length - 1
+    for t in range(length // 2):
+        a = (i + t) % n
+        b = (j - t) % n
+        ca = x[a]
+        cb = x[b]
+        x[a] = cb
+        pos[cb] = a
+        x[b] = ca
+        pos[ca] = b
+
+
+@numba.njit(nogil=True, cache=True)
+def _reverse(x: np.ndarray, pos: np.ndarray, i: int, j: int) -> None:
+    """
+    Reverse the part of a cyclic tour from index `i` to index `j`.
+
+    If the part is longer than half of the tour, the rest of the tour is
+    reversed instead, which yields the same cyclic tour.
+
+    :param x: the tour
+    :param pos: the index of each city in the tour, updated accordingly
+    :param i: the index of the first element of the part
+    :param j: the index of the last element of the part
+
+    >>> xx = np.array([0, 1, 2, 3, 4, 5, 6, 7])
+    >>> pp = np.array([0, 1, 2, 3, 4, 5, 6, 7])
+    >>> _reverse(xx, pp, 2, 4)
+    >>> print(xx)
+    [0 1 4 3 2 5 6 7]
+    >>> _reverse(xx, pp, 1, 6)
+    >>> print(xx)
+    [7 1 4 3 2 5 6 0]
+    >>> print(pp)
+    [7 1 4 3 2 5 6 0]
+    """
+    n: Final[int] = len(x)
+    length: Final[int] = (j - i) % n + 1
+    if (length + length) > n:
+        _reverse_block(x, pos, (j + 1) % n, n - length)
+    else:
+        _reverse_block(x, pos, i, length)
+
+
+@numba.njit(nogil=True, cache=True)
+def _two_opt_nn(x: np.ndarray, pos: np.ndarray, i: int, c: int) -> None:
+    """
+    Make city `c` the successor of the city at index `i`.
+
+    :param x: the tour
+    :param pos: the index of each city in the tour, updated accordingly
+    :param i: the index of the first city
+    :param c: the city to become its successor, which must not be adjacent
+    """
+    _reverse(x, pos, (i + 1) % len(x), pos[c])
+
+
+@numba.njit(nogil=True, cache=True)
+def _try_2opt(x: np.ndarray, pos: np.ndarray, dist: np.ndarray,
+              nn: np.ndarray, a: int, touched: np.ndarray) -> int:
+    """
+    Try to find and apply an improving 2-opt move adding an edge at `a`.
+
+    :param x: the tour
+    :param pos: the index of each city in the tour
+    :param dist: the distance matrix
+    :param nn: the neighbor lists
+    :param a: the city
+    :param touched: the array receiving the cities whose edges have changed
+    :returns: the number of cities written to `touched`, `0` if no improving
+        move was found
+    """
+    n: Final[int] = len(x)
+    pa: Final[int] = pos[a]
+    an: Final[int] = x[(pa + 1) % n]
+    ap: Final[int] = x[pa - 1]
+    d_n: Final[int] = dist[a, an]
+    d_p: Final[int] = dist[a, ap]
+    for c in nn[a]:
+        d_ac = dist[a, c]
+        if (d_ac >= d_n) and (d_ac >= d_p):
+            return 0  # the neighbor lists are sorted: no gain possible
+        pc = pos[c]
+        if d_ac < d_n:  # replace (a, an) and (c, cn) by (a, c) and (an, cn)
+            cn = x[(pc + 1) % n]
+            if (c != an) and (cn != a) and (
+                    (d_ac + dist[an, cn]) < (d_n + dist[c, cn])):
+                _reverse(x, pos, (pa + 1) % n, pc)
+                touched[0] = a
+                touched[1] = an
+                touched[2] = c
+                touched[3] = cn
+                return 4
+        if d_ac < d_p:  # replace (ap, a) and (cp, c) by (c, a) and (cp, ap)
+            cp = x[pc - 1]
+            if (c != ap) and (cp != a) and (
+                    (d_ac + dist[ap, cp]) < (d_p + dist[c, cp])):
+                _reverse(x, pos, pc, (pa - 1) % n)
+                touched[0] = a
+                touched[1] = ap
+                touched[2] = c
+                touched[3] = cp
+                return 4
+    return 0
+
+
+@numba.njit(nogil=True, cache=True)
+def _try_or_opt(x: np.ndarray, pos: np.ndarray, dist: np.ndarray,
+                nn: np.ndarray, a: int, touched: np.ndarray) -> int:
+    """
+    Try to move a segment of up to three cities starting at `a` elsewhere.
+
+    The segment is inserted next to a neighbor `c` of `a`, either between
+    `c` and its successor or, reversed, between the predecessor of `c` and
+    `c`. Of the two ways to shift the segment through the tour, the shorter
+    one is applied.
+
+    :param x: the tour
+    :param pos: the index of each city in the tour
+    :param dist: the distance matrix
+    :param nn: the neighbor lists
+    :param a: the first city of the segment
+    :param touched: the array receiving the cities whose edges have changed
+    :returns: the number of cities written to `touched`, `0` if no improving
+        move was found
+    """
+    n: Final[int] = len(x)
+    pa: Final[int] = pos[a]
+    p: Final[int] = x[pa - 1]
+    for length in range(1, 4):
+        if (length + 3) > n:
+            return 0
+        s = x[(pa + length - 1) % n]  # the last city of the segment
+        nx = x[(pa + length) % n]
+        gain = dist[p, a] + dist[s, nx] - dist[p, nx]
+        if gain <= 0:
+            continue
+        moved = False
+        for c in nn[a]:
+            d_ac = dist[a, c]
+            if d_ac >= gain:
+                break  # the neighbor lists are sorted: no gain possible
+            pc = pos[c]
+            off = (pc - pa) % n
+            if off < length:
+                continue  # c is in the segment
+            len2 = n - off - 1
+            if c != p:  # insert as c, a..s, d
+                d = x[(pc + 1) % n]
+                if (d_ac + dist[s, d] - dist[c, d]) < gain:
+                    len1 = off - length + 1
+                    if len1 <= len2:
+                        _reverse_block(x, pos, pa, length + len1)
+                        _reverse_block(x, pos, pa, len1)
+                        _reverse_block(x, pos, pa + len1, length)
+                    else:
+                        _reverse_block(x, pos, pc + 1, len2 + length)
+                        _reverse_block(x, pos, pc + 1, length)
+                        _reverse_block(x, pos, pc + 1 + length, len2)
+                    touched[4] = d
+                    touched[5] = c
+                    moved = True
+                    break
+            if c != nx:  # insert as e, s..a, c
+                e = x[pc - 1]
+                if (d_ac + dist[s, e] - dist[e, c]) < gain:
+                    len1 = off - length
+                    len2 += 1
+                    if len1 <= len2:
+                        _reverse_block(x, pos, pa, length + len1)
+                        _reverse_block(x, pos, pa, len1)
+                    else:
+                        _reverse_block(x, pos, pc, len2 + length)
+                        _reverse_block(x, pos, pc + length, len2)
+                    touched[4] = e
+                    touched[5] = c
+                    moved = True
+                    break
+        if not moved:
+            continue
+        touched[0] = p
+        touched[1] = a
+        touched[2] = s
+        touched[3] = nx
+        return 6
+    return 0
+
+
+@numba.njit(nogil=True, cache=True)
+def _local_search(x: np.ndarray, pos: np.ndarray, dist: np.ndarray,
+                  nn: np.ndarray, queue: np.ndarray, active: np.ndarray,
+                  touched: np.ndarray, count: int) -> None:
+    """
+    Apply 2-opt and Or-opt moves until no improving move can be found.
+
+    If `count` is `0`, all cities start in the queue of cities to examine.
+    Otherwise, only the first `count` cities in `queue` do, which is enough
+    if `x` was a local optimum before the edges at these cities were
+    changed. A city whose examination does not yield an improving move
+    leaves the queue, i.e., its don't-look bit is set. The endpoints of all
+    edges changed by a move are put back into the queue.
+
+    :param x: the tour
+    :param pos: the array to receive the index of each city in the tour
+    :param dist: the distance matrix
+    :param nn: the neighbor lists
+    :param queue: the ring buffer for the queue of cities to examine
+    :param active: the array marking which cities are in the queue
+    :param touched: the array receiving the cities changed by a move
+    :param count: the number of cities to examine first, possibly with
+        repetitions, or `0` to examine all cities
+    """
+    n: Final[int] = len(x)
+    for i in range(n):
+        pos[x[i]] = i
+    if count <= 0:  # examine all cities
+        for i in range(n):
+            c = x[i]
+            queue[i] = c
+            active[c] = True
+        count = n
+    else:  # examine only the given cities, each of them once
+        active[:] = False
+        given: Final[int] = count
+        count = 0
+        for i in range(given):
+            c = queue[i]
+            if not active[c]:
+                queue[count] = c
+                count += 1
+                active[c] = True
+    head: int = 0
+    while count > 0:
+        a = queue[head]
+        head = (head + 1) % n
+        count -= 1
+        active[a] = False
+        changed = _try_2opt(x, pos, dist, nn, a, touched)
+        if changed <= 0:
+            changed = _try_or_opt(x, pos, dist, nn, a, touched)
+        for t in range(changed):
+            c = touched[t]
+            if not active[c]:
+                queue[(head + count) % n] = c
+                count += 1
+                active[c] = True
+
+
+@numba.njit(nogil=True, cache=True)
+def _double_bridge(dest: np.ndarray, x: np.ndarray, i: int, j: int,
+                   k: int) -> None:
+    """
+    Apply a double-bridge move.
+
+    The tour `x = A B C D` with `B = x[i:j]`, `C = x[j:k]` becomes
+    `dest = A C B D`.
+
+    :param dest: the destination tour
+    :param x: the source tour
+    :param i: the first cut point
+    :param j: the second cut point
+    :param k: the third cut point
+
+    >>> dd = np.empty(8, int)
+    >>> _double_bridge(dd, np.array([0, 1, 2, 3, 4, 5, 6, 7]), 2, 4, 7)
+    >>> print(dd)
+    [0 1 4 5 6 2 3 7]
+    """
+    dest[:i] = x[:i]
+    m: Final[int] = i + k - j
+    dest[i:m] = x[j:k]
+    dest[m:k] = x[i:j]
+    dest[k:] = x[k:]
+
+
+def _check_distances(distances: np.ndarray) -> int:
+    """
+    Check a distance matrix for the 2-opt operators.
+
+    :param distances: the distance matrix
+    :returns: the number of cities
+    """
+    if not isinstance(distances, np.ndarray):
+        raise type_error(distances, "distances", np.ndarray)
+    n: Final[int] = len(distances)
+    if (distances.ndim != 2) or (distances.shape[1] != n) or (n < 4):
+        raise ValueError("distances must be a square matrix with at least "
+                         f"four rows, but has shape {distances.shape}.")
+    return n
+
+
+class Op1TwoOptNN(Op1):
+    """
+    A random 2-opt move connecting a city with one of its nearest neighbors.
+
+    The operator copies `x` to `dest`, picks a random city `a` and a random
+    city `c` from the neighbor list of `a` and reverses the part of `dest`
+    from the successor of `a` to `c`. If `c` is already adjacent to `a`, a
+    random non-adjacent city is used instead.
+    """
+
+    def __init__(self, distances: np.ndarray, k: int = 10) -> None:
+        """
+        Initialize the operator.
+
+        :param distances: the symmetric distance matrix of the cities
+        :param k: the number of nearest neighbors per city
+        """
+        super().__init__()
+        #: the number of cities
+        self.n: Final[int] = _check_distances(distances)
+        #: the neighbor lists
+        self.nn: Final[np.ndarray] = nearest_neighbors(distances, k)
+        #: the number of nearest neighbors per city
+        self.k: Final[int] = self.nn.shape[1]
+        #: the index of each city in the tour
+        self.__pos: Final[np.ndarray] = np.empty(self.n, np.int64)
+
+    def op1(self, random: Generator, dest: np.ndarray, x: np.ndarray) -> None:
+        """
+        Copy `x` into `dest` and apply a random neighbor-list 2-opt move.
+
+        :param random: the random number generator
+        :param dest: the array to receive the modified copy of `x`
+        :param x: the existing point in the search space
+        """
+        np.copyto(dest, x)
+        pos: Final[np.ndarray] = self.__pos
+        pos[dest] = np.arange(self.n)
+        n: Final[int] = self.n
+        ri: Final[Callable[[int], int]] = random.integers  # fast call!
+        i: Final[int] = ri(n)
+        c: int = self.nn[dest[i], ri(self.k)]
+        if ((pos[c] - i) % n) in (1, n - 1):  # c is adjacent to dest[i]
+            c = dest[(i + 2 + ri(n - 3)) % n]
+        _two_opt_nn(dest, pos, i, c)
+
+    def log_parameters_to(self, logger: KeyValueLogSection) -> None:
+        """
+        Log the parameters of this operator to the given logger.
+
+        :param logger: the logger for the parameters
+        """
+        super().log_parameters_to(logger)
+        logger.key_value("k", self.k)
+
+    def __str__(self) -> str:
+        """
+        Get the name of this unary operator.
+
+        :returns: "2optnn" followed by the number of neighbors
+        """
+        return f"2optnn{self.k}"
+
+
+class Op1TwoOptLS(Op1):
+    """
+    A double-bridge kick followed by a neighbor-list 2-opt/Or-opt descent.
+
+    The operator copies `x` to `dest`, applies a random double-bridge move
+    (or, for fewer than eight cities, a random neighbor-list 2-opt move) and
+    then improves `dest` with first-improvement 2-opt and Or-opt moves using
+    don't-look bits until it is a local optimum.
+
+    The operator remembers the two local optima it returned most recently.
+    If `x` is one of them, e.g., because the operator is used in an iterated
+    local search, only the six cities at the edges changed by the
+    double-bridge move are examined at first instead of all cities.
+    """
+
+    def __init__(self, distances: np.ndarray, k: int = 10) -> None:
+        """
+        Initialize the operator.
+
+        :param distances: the symmetric distance matrix of the cities
+        :param k: the number of nearest neighbors per city
+        """
+        super().__init__()
+        #: the number of cities
+        self.n: Final[int] = _check_distances(distances)
+        #: the distance matrix
+        self.distances: Final[np.ndarray] = distances
+        #: the neighbor lists
+        self.nn: Final[np.ndarray] = nearest_neighbors(distances, k)
+        #: the number of nearest neighbors per city
+        self.k: Final[int] = self.nn.shape[1]
+        #: the index of each city in the tour
+        self.__pos: Final[np.ndarray] = np.empty(self.n, np.int64)
+        #: the queue of the cities to examine
+        self.__queue: Final[np.ndarray] = np.empty(self.n, np.int64)
+        #: the cities in the queue, i.e., those without don't-look bit
+        self.__active: Final[np.ndarray] = np.empty(self.n, np.bool_)
+        #: the cities whose edges were changed by a move
+        self.__touched: Final[np.ndarray] = np.empty(6, np.int64)
+        #: the two local optima returned most recently
+        self.__optima: Final[np.ndarray] = np.full((2, self.n), -1, np.int64)
+
+    def op1(self, random: Generator, dest: np.ndarray, x: np.ndarray) -> None:
+        """
+        Copy `x` into `dest`, perturb it, and apply the local search.
+
+        :param random: the random number generator
+        :param dest: the array to receive the modified copy of `x`
+        :param x: the existing point in the search space
+        """
+        n: Final[int] = self.n
+        pos: Final[np.ndarray] = self.__pos
+        queue: Final[np.ndarray] = self.__queue
+        optima: Final[np.ndarray] = self.__optima
+        ri: Final[Callable[[int], int]] = random.integers  # fast call!
+        slot: int = 0  # the slot of the optimum to be overwritten by dest
+        count: int = 0  # the number of cities to examine, 0 for all
+        if n >= 8:
+            if np.array_equal(x, optima[0]):
+                slot, count = 1, 6
+            elif np.array_equal(x, optima[1]):
+                count = 6
+            cuts = np.sort(random.choice(n - 1, 3, False)) + 1
+            _double_bridge(dest, x, cuts[0], cuts[1], cuts[2])
+            if count > 0:  # x is a local optimum: the kick changed 3 edges
+                queue[0:3] = x[cuts - 1]
+                queue[3:6] = x[cuts]
+        else:
+            np.copyto(dest, x)
+            pos[dest] = np.arange(n)
+            i: Final[int] = ri(n)
+            c: int = self.nn[dest[i], ri(self.k)]
+            if ((pos[c] - i) % n) in (1, n - 1):  # c is adjacent to dest[i]
+                c = dest[(i + 2 + ri(n - 3)) % n]
+            _two_opt_nn(dest, pos, i, c)
+        _local_search(dest, pos, self.distances, self.nn, queue,
+                      self.__active, self.__touched, count)
+        optima[slot] = dest
+
+    def log_parameters_to(self, logger: KeyValueLogSection) -> None:
+        """
+        Log the parameters of this operator to the given logger.
+
+        :param logger: the logger for the parameters
+        """
+        super().log_parameters_to(logger)
+        logger.key_value("k", self.k)
+
+    def __str__(self) -> str:
+        """
+        Get the name of this unary operator.
+
+        :returns: "2optls" followed by the number of neighbors
+        """
+        return f"2optls{self.k}"
@@ -0,0 +1,282 @@
+"""
+A compact binary log format and a memory-mapped reader for it.
+
+The text logs written by :class:`~moptipy.utils.logger.FileLogger` are easy
+to read for humans, but parsing long `PROGRESS` sections back line by line
+is slow when thousands of log files are evaluated. A :class:`BinaryLogger`
+writes the same sections into a compact binary file instead, optionally
+together with the text log. Sections that are written column-wise via
+:meth:`~moptipy.utils.logger.Logger.csv_columns` are stored as typed,
+packed records, all other sections keep their text. :func:`read_binary_log`
+loads the text sections and maps the typed records into memory without
+copying them.
+
+The file starts with the eight bytes :const:`MAGIC`, followed by the
+sections. Each section begins with a one-byte kind and the title. A text
+section then holds its UTF-8 encoded body, a column section its column
+names, the :mod:`numpy` data types of the columns, the number of rows, and
+the rows as little-endian packed records. All integers in the format are
+little-endian.
+
+>>> from moptipy.utils.temp import TempFile
+>>> with TempFile.create() as t:
+...     with BinaryLogger(t) as log:
+...         with log.key_values("A") as kv:
+...             kv.key_value("x", 1)
+...         log.csv_columns("B", ["y", "z"], [
+...             (np.array([1, 2]), np.array([0.5, 0.25]))])
+...     for title, data in read_binary_log(t):
+...         print(title, repr(data) if isinstance(data, str) else
+...               (data["y"].tolist(), data["z"].tolist()))
+A 'x: 1\\n'
+B ([1, 2], [0.5, 0.25])
+"""
+from io import StringIO, TextIOBase
+from os.path import realpath
+from struct import Struct
+from typing import BinaryIO, Final, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from moptipy.utils.logger import Logger
+from moptipy.utils.path import Path
+from moptipy.utils.types import type_error
+
+#: the first bytes of every binary log file
+MAGIC: Final[bytes] = b"MPYBLOG1"
+#: the kind byte of a text section
+_KIND_TEXT: Final[bytes] = b"T"
+#: the kind byte of a section of typed columns
+_KIND_COLUMNS: Final[bytes] = b"C"
+#: the length prefix of strings
+_SHORT: Final[Struct] = Struct("<H")
+#: the length prefix of text bodies and the row count of columns
+_LONG: Final[Struct] = Struct("<Q")
+
+
+class _SectionStream(TextIOBase):
+    """A text stream capturing the current section and forwarding text."""
+
+    def __init__(self, text: TextIOBase | None) -> None:
+        """
+        Create the stream.
+
+        :param text: the stream to forward all text to, or `None`
+        """
+        super().__init__()
+        #: the stream of the text log, or `None`
+        self.text: Final[TextIOBase | None] = text
+        #: the buffer of the current section
+        self.__buffer: Final[StringIO] = StringIO()
+        #: should the text be captured?
+        self.capture: bool = True
+
+    def write(self, s: str) -> int:
+        """
+        Write a string.
+
+        :param s: the string
+        :returns: the number of written characters
+        """
+        if self.text is not None:
+            self.text.write(s)
+        if self.capture:
+            self.__buffer.write(s)
+        return len(s)
+
+    def take(self) -> str:
+        """
+        Get the captured text and clear the buffer.
+
+        :returns: the text captured since the last call
+        """
+        buffer: Final[StringIO] = self.__buffer
+        result: Final[str] = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return result
+
+    def close(self) -> None:
+        """Close the stream of the text log."""
+        if self.text is not None:
+            self.text.close()
+        super().close()
+
+
+def _write_str(file: BinaryIO, s: str) -> None:
+    """
+    Write a short string prefixed with its length.
+
+    :param file: the file
+    :param s: the string
+    """
+    data: Final[bytes] = s.encode("utf-8")
+    file.write(_SHORT.pack(len(data)))
+    file.write(data)
+
+
+def _read_str(file: BinaryIO) -> str:
+    """
+    Read a short string prefixed with its length.
+
+    :param file: the file
+    :returns: the string
+    """
+    return file.read(_SHORT.unpack(file.read(_SHORT.size))[0]).decode(
+        "utf-8")
+
+
+class BinaryLogger(Logger):
+    """A logger writing a binary log file and, optionally, a text log."""
+
+    def __init__(self, path: str, text_path: str | None = None) -> None:
+        """
+        Initialize the logger.
+
+        :param path: the path to the binary file to create
+        :param text_path: the path to the text log to write as well, or
+            `None` if only the binary file should be written
+        """
+        if not isinstance(path, str):
+            raise type_error(path, "path", str)
+        #: the stream capturing the sections
+        self.__stream: Final[_SectionStream] = _SectionStream(
+            None if text_path is None
+            else Path.path(realpath(text_path)).open_for_write())
+        super().__init__(stream=self.__stream, name=path)
+        #: the binary file
+        self.__file: Final[BinaryIO] = open(  # noqa
+            realpath(path), mode="wb")  # pylint: disable=R1732
+        self.__file.write(MAGIC)
+        #: is a column section being written?
+        self.__columns: bool = False
+
+    def _open_section(self, title: str) -> None:
+        super()._open_section(title)
+        self.__stream.take()  # drop the section start
+
+    def _close_section(self, title: str) -> None:
+        body: Final[str] = self.__stream.take()
+        super()._close_section(title)
+        self.__stream.take()  # drop the section end
+        if not self.__columns:
+            file: Final[BinaryIO] = self.__file
+            file.write(_KIND_TEXT)
+            _write_str(file, title)
+            data: Final[bytes] = body.encode("utf-8")
+            file.write(_LONG.pack(len(data)))
+            file.write(data)
+
+    def csv_columns(self, title: str, header: list[str],
+                    chunks: Iterable[Sequence[np.ndarray]]) -> None:
+        """
+        Write a section of typed columns.
+
+        :param title: the title of the new section
+        :param header: the list of column titles
+        :param chunks: the chunks of column arrays
+        """
+        file: Final[BinaryIO] = self.__file
+        has_text: Final[bool] = self.__stream.text is not None
+        self.__columns = True
+        self.__stream.capture = False
+        try:
+            with self.csv(title, header) as csv:
+                dtype: np.dtype | None = None
+                count_at: int = -1
+                n_rows: int = 0
+                for chunk in chunks:
+                    if dtype is None:
+                        dtype = np.dtype([
+                            (h, c.dtype.newbyteorder("<"))
+                            for h, c in zip(header, chunk, strict=True)])
+                        count_at = self.__column_header(title, dtype)
+                    rows = np.empty(len(chunk[0]), dtype)
+                    for h, c in zip(header, chunk, strict=True):
+                        rows[h] = c
+                    file.write(rows.data)
+                    n_rows += len(rows)
+                    if has_text:
+                        for row in zip(*[c.tolist() for c in chunk]):
+                            csv.row(row)
+                if dtype is None:
+                    count_at = self.__column_header(title, np.dtype(
+                        [(h, "<i8") for h in header]))
+                end: Final[int] = file.tell()
+                file.seek(count_at)
+                file.write(_LONG.pack(n_rows))
+                file.seek(end)
+        finally:
+            self.__stream.capture = True
+            self.__columns = False
+
+    def __column_header(self, title: str, dtype: np.dtype) -> int:
+        """
+        Write the header of a column section.
+
+        :param title: the section title
+        :param dtype: the record type
+        :returns: the position of the row count, which is written as `0`
+        """
+        file: Final[BinaryIO] = self.__file
+        file.write(_KIND_COLUMNS)
+        _write_str(file, title)
+        names: Final = dtype.names
+        file.write(_SHORT.pack(len(names)))
+        for name in names:
+            _write_str(file, name)
+            _write_str(file, dtype.fields[name][0].str)
+        count_at: Final[int] = file.tell()
+        file.write(_LONG.pack(0))
+        return count_at
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        """
+        Close the logger and the binary file.
+
+        :param exception_type: ignored
+        :param exception_value: ignored
+        :param traceback: ignored
+        """
+        try:
+            super().__exit__(exception_type, exception_value, traceback)
+        finally:
+            self.__file.close()
+
+
+def read_binary_log(path: str) -> Iterator[tuple[str, str | np.ndarray]]:
+    """
+    Read the sections of a binary log file.
+
+    Text sections are returned as their text. Column sections are returned
+    as structured :class:`numpy.ndarray` records which are mapped into
+    memory, i.e., only the data which is actually accessed is loaded.
+    A column, say `f`, is then available as zero-copy view `data["f"]`.
+
+    :param path: the path to the binary log file
+    :returns: an iterator of the section titles and their data
+    :raises ValueError: if the file is not a binary log
+    """
+    with open(path, mode="rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path!r} is not a binary log file.")
+        while True:
+            kind = file.read(1)
+            if len(kind) <= 0:
+                return
+            title = _read_str(file)
+            if kind == _KIND_TEXT:
+                size = _LONG.unpack(file.read(_LONG.size))[0]
+                yield title, file.read(size).decode("utf-8")
+            elif kind == _KIND_COLUMNS:
+                n_cols = _SHORT.unpack(file.read(_SHORT.size))[0]
+                dtype = np.dtype([(_read_str(file), _read_str(file))
+                                  for _ in range(n_cols)])
+                n_rows = _LONG.unpack(file.read(_LONG.size))[0]
+                start = file.tell()
+                yield title, np.empty(0, dtype) if n_rows <= 0 else \
+                    np.memmap(file, dtype, "r", start, (n_rows, ))
+                file.seek(start + n_rows * dtype.itemsize)
+            else:
+                raise ValueError(
+                    f"Invalid section kind {kind!r} in {path!r}.")
@@ -1,5 +1,11 @@
-"""A factory for functions checking whether argument values are new."""
-from typing import Any, Callable
+"""Factories for functions checking for new values and caching objects."""
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Final
+
+import numpy as np
+
+from moptipy.utils.types import check_int_range, type_error
 
 
 def is_new() -> Callable[[str], bool]:
@@ -35,3 +41,120 @@ def is_new() -> Callable[[str], bool]:
         return setdefault(x, n) == n
 
     return add
+
+
+def object_nbytes(obj: Any) -> int:
+    """
+    Estimate the memory occupied by the :mod:`numpy` arrays of an object.
+
+    The object itself, its attributes, and the elements of tuples stored in
+    its attributes are checked. Arrays are counted only once, even if they
+    are referenced several times.
+
+    :param obj: the object
+    :returns: the total number of bytes of the arrays found
+
+    >>> class X:
+    ...     def __init__(self):
+    ...         self.a = np.zeros(10, np.int64)
+    ...         self.t = (1, self.a, np.zeros(3, np.int8))
+    >>> object_nbytes(X())
+    83
+    >>> object_nbytes(np.zeros((2, 2), np.int32))
+    16
+    >>> object_nbytes("x")
+    0
+    """
+    seen: Final[set[int]] = set()
+    total: int = 0
+    values: list[Any] = [obj]
+    attrs: Final[dict[str, Any] | None] = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        for value in attrs.values():
+            if isinstance(value, tuple):
+                values.extend(value)
+            else:
+                values.append(value)
+    for value in values:
+        if isinstance(value, np.ndarray) and (id(value) not in seen):
+            seen.add(id(value))
+            total += value.nbytes
+    return total
+
+
+def lru_loader(max_bytes: int = 1_073_741_824,
+               size_of: Callable[[Any], int] = object_nbytes,
+               lock: AbstractContextManager | None = None) \
+        -> Callable[[Callable[[], Any]], Any]:
+    """
+    Create a function that memoizes the objects created by factories.
+
+    The returned function `load(factory)` invokes `factory()` only if it has
+    not done so before or if the object created by it has been evicted. The
+    objects are evicted in least-recently-used order as soon as their total
+    size exceeds `max_bytes`. The most recently used object is never evicted,
+    even if it alone is larger than `max_bytes`.
+
+    If a `lock` is given, it is held during each call of the returned
+    function, so that several threads can share one cache. An object is
+    then created only once, even if several threads ask for it at the same
+    time.
+
+    :param max_bytes: the maximum total size of the cached objects
+    :param size_of: the function computing the size of an object
+    :param lock: the lock guarding the cache, or `None` if the function is
+        used by only one thread
+    :returns: the memoizing function
+
+    >>> created = []
+    >>> def f1():
+    ...     created.append(1)
+    ...     return np.zeros(10, np.int8)
+    >>> def f2():
+    ...     created.append(2)
+    ...     return np.zeros(10, np.int8)
+    >>> load = lru_loader(15)
+    >>> load(f1) is load(f1)
+    True
+    >>> _ = load(f2)
+    >>> _ = load(f2)
+    >>> _ = load(f1)
+    >>> created
+    [1, 2, 1]
+    >>> from threading import Lock
+    >>> load = lru_loader(15, lock=Lock())
+    >>> load(f2) is load(f2)
+    True
+    >>> created
+    [1, 2, 1, 2]
+    """
+    check_int_range(max_bytes, "max_bytes", 0, 1_000_000_000_000_000)
+    if not callable(size_of):
+        raise type_error(size_of, "size_of", call=True)
+    if (lock is not None) and not isinstance(lock, AbstractContextManager):
+        raise type_error(lock, "lock", AbstractContextManager)
+    cache: Final[OrderedDict[Any, tuple[Any, int]]] = OrderedDict()
+    total: int = 0
+
+    def load(factory: Callable[[], Any]) -> Any:
+        nonlocal total
+        entry: tuple[Any, int] | None = cache.get(factory)
+        if entry is not None:
+            cache.move_to_end(factory)
+            return entry[0]
+        obj: Final[Any] = factory()
+        size: Final[int] = size_of(obj)
+        cache[factory] = (obj, size)
+        total += size
+        while (total > max_bytes) and (len(cache) > 1):
+            total -= cache.popitem(last=False)[1][1]
+        return obj
+
+    if lock is None:
+        return load
+
+    def locked_load(factory: Callable[[], Any]) -> Any:
+        with lock:
+            return load(factory)
+
+    return locked_load
@@ -0,0 +1,269 @@
+"""
+Crash-safe claims of runs for experiments on shared file systems.
+
+:func:`~moptipy.api.experiment.run_experiment` can be started on several
+computers that share the experiment folder over the network. Each run must
+then be claimed by exactly one of them. A :class:`Claim` is a small file next
+to the log file of the run. It is created atomically and holds the host name,
+the process id, a random token, and a heartbeat time stamp, which is renewed
+periodically by a background thread while the run is in progress. The log
+file is first written to a private temporary file and moved into place by an
+atomic rename when the run is complete, so a log file is either complete or
+missing.
+
+If a node crashes or is preempted, its claims are no longer renewed. After
+they become stale, other nodes remove them and take over the runs. Claims of
+dead processes on the same host are recognized as stale right away.
+
+>>> from moptipy.utils.temp import TempDir
+>>> with TempDir.create() as td:
+...     log = td.resolve_inside("run.txt")
+...     claim = Claim.acquire(log)
+...     print(Claim.acquire(log))
+...     with claim:
+...         claim.part_file.write_all("done")
+...         print(claim.commit())
+...     print(log.read_all_str().strip(), os.path.exists(claim.claim_file))
+...     print(Claim.acquire(log))
+None
+True
+done False
+None
+"""
+import os
+import secrets
+import socket
+import threading
+from contextlib import AbstractContextManager, suppress
+from glob import escape, glob
+from time import time
+from typing import Final
+
+import psutil  # type: ignore
+
+from moptipy.utils.path import Path
+from moptipy.utils.types import check_int_range
+
+#: the suffix of claim files
+CLAIM_SUFFIX: Final[str] = ".claim"
+#: the suffix of the temporary files into which the logs are written
+PART_SUFFIX: Final[str] = ".part"
+#: the default number of seconds between two heartbeats
+HEARTBEAT_SECONDS: Final[int] = 30
+#: the default number of seconds without heartbeat after which a claim is
+#: stale
+STALE_SECONDS: Final[int] = 600
+
+
+def _read_claim(claim_file: str) -> tuple[str, int, str, float] | None:
+    """
+    Read a claim file.
+
+    :param claim_file: the claim file
+    :returns: the tuple of host, process id, token, and time of the last
+        heartbeat, or `None` if the file does not exist or is incomplete
+    """
+    try:
+        with open(claim_file, encoding="utf-8") as f:
+            parts = f.read().split("\n")
+        heartbeat = max(float(parts[3]), os.path.getmtime(claim_file))
+        return parts[0], int(parts[1]), parts[2], heartbeat
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _is_stale(claim_file: str, stale_seconds: int) -> bool:
+    """
+    Check whether a claim is stale.
+
+    A claim is stale if its heartbeat is older than `stale_seconds` or if it
+    was made on this host by a process that no longer exists. A claim file
+    that is still being written is considered as stale only if it was not
+    modified for `stale_seconds`.
+
+    :param claim_file: the claim file
+    :param stale_seconds: the seconds after which a claim is stale
+    :returns: `True` if the claim is stale, `False` otherwise
+    """
+    claim = _read_claim(claim_file)
+    if claim is None:
+        try:
+            return (time() - os.path.getmtime(claim_file)) > stale_seconds
+        except OSError:
+            return False  # the claim file has just been removed
+    host, pid, _, heartbeat = claim
+    if (host == socket.gethostname()) and not psutil.pid_exists(pid):
+        return True
+    return (time() - heartbeat) > stale_seconds
+
+
+def _remove_parts(part_file: str) -> None:
+    """
+    Remove a temporary log file and the temporary files next to it.
+
+    :param part_file: the temporary log file
+    """
+    for file in [part_file, *glob(escape(part_file) + ".*")]:
+        with suppress(OSError):
+            os.remove(file)
+
+
+class Claim(AbstractContextManager):
+    """
+    A claim of a run, kept alive by heartbeats.
+
+    A claim is obtained via :meth:`acquire`. The log of the run must be
+    written to :attr:`part_file` and moved into place via :meth:`commit`.
+    Leaving the `with` block of the claim stops its heartbeat and removes its
+    claim file as well as any leftover temporary log file.
+    """
+
+    def __init__(self, log_file: Path, token: str,
+                 heartbeat_seconds: int) -> None:
+        """
+        Create the claim object, after the claim file has been created.
+
+        :param log_file: the final log file
+        :param token: the random token identifying the claim
+        :param heartbeat_seconds: the seconds between two heartbeats
+        """
+        #: the final log file
+        self.log_file: Final[Path] = log_file
+        #: the claim file
+        self.claim_file: Final[Path] = Path.path(log_file + CLAIM_SUFFIX)
+        #: the temporary file to write the log to
+        self.part_file: Final[Path] = Path.path(
+            f"{log_file}.{token}{PART_SUFFIX}")
+        #: the random token of this claim
+        self.__token: Final[str] = token
+        #: the event stopping the heartbeat
+        self.__stop: Final[threading.Event] = threading.Event()
+        #: the lock separating the heartbeats from the commit
+        self.__lock: Final[threading.Lock] = threading.Lock()
+        #: did we lose the claim to another node?
+        self.lost: bool = False
+        self.__beat()
+        #: the heartbeat thread
+        self.__thread: Final[threading.Thread] = threading.Thread(
+            target=self.__heartbeat, args=(heartbeat_seconds, ), daemon=True)
+        self.__thread.start()
+
+    @staticmethod
+    def acquire(log_file: str,
+                heartbeat_seconds: int = HEARTBEAT_SECONDS,
+                stale_seconds: int = STALE_SECONDS) -> "Claim | None":
+        """
+        Try to claim the run belonging to a log file.
+
+        :param log_file: the final log file of the run
+        :param heartbeat_seconds: the seconds between two heartbeats
+        :param stale_seconds: the seconds after which a claim without
+            heartbeat is stale and can be taken over
+        :returns: the claim, or `None` if the log file already exists or the
+            run is claimed by another live process
+        """
+        log: Final[Path] = Path.path(log_file)
+        check_int_range(heartbeat_seconds, "heartbeat_seconds", 1, 86_400)
+        check_int_range(stale_seconds, "stale_seconds",
+                        heartbeat_seconds + 1, 1_000_000_000)
+        claim_file: Final[str] = log + CLAIM_SUFFIX
+        token: Final[str] = secrets.token_hex(8)
+        for _ in range(2):
+            if os.path.exists(log):
+                return None  # the run is already done
+            try:
+                os.close(os.open(claim_file, os.O_CREAT | os.O_EXCL))
+                return Claim(log, token, heartbeat_seconds)
+            except FileExistsError:
+                pass
+            if not _is_stale(claim_file, stale_seconds):
+                return None  # the run is in progress
+            # move the stale claim out of the way: only one node succeeds
+            stale_file: str = f"{claim_file}.{token}"
+            try:
+                os.rename(claim_file, stale_file)
+            except OSError:
+                continue
+            if not _is_stale(stale_file, stale_seconds):
+                with suppress(OSError):  # the claim was renewed, restore it
+                    os.link(stale_file, claim_file)
+                os.remove(stale_file)
+                return None
+            stale = _read_claim(stale_file)
+            if stale is not None:  # delete the incomplete log of the claim
+                _remove_parts(f"{log}.{stale[2]}{PART_SUFFIX}")
+            os.remove(stale_file)
+        return None
+
+    def __beat(self) -> None:
+        """Write the heartbeat to the claim file."""
+        with self.__lock:
+            if self.lost:
+                return
+            current = _read_claim(self.claim_file)
+            if (current is not None) and (current[2] != self.__token):
+                self.lost = True  # another node has taken over the run
+                return
+            with suppress(OSError):
+                with open(self.claim_file, "w", encoding="utf-8") as f:
+                    f.write(f"{socket.gethostname()}\n{os.getpid()}\n"
+                            f"{self.__token}\n{time()}")
+
+    def __heartbeat(self, heartbeat_seconds: int) -> None:
+        """
+        Renew the claim periodically until the claim is released or lost.
+
+        :param heartbeat_seconds: the seconds between two heartbeats
+        """
+        while not (self.__stop.wait(heartbeat_seconds) or self.lost):
+            self.__beat()
+
+    def commit(self, *sidecars: str) -> bool:
+        """
+        Atomically move the completed log file into place.
+
+        If the claim has been lost, i.e., another node has taken over the
+        run, nothing is moved: the other node owns the log file now and may
+        already have deleted :attr:`part_file`.
+
+        :param sidecars: the suffixes of additional files written next to
+            :attr:`part_file`, which are moved next to the log file before
+            the log file itself
+        :returns: `True` if the log file was moved into place, `False` if
+            the claim was lost
+        """
+        with self.__lock:
+            if not self.lost:
+                current = _read_claim(self.claim_file)
+                self.lost = (current is None) or (current[2] != self.__token)
+            if self.lost:
+                return False
+            for suffix in sidecars:
+                if os.path.isfile(self.part_file + suffix):
+                    os.replace(self.part_file + suffix,
+                               self.log_file + suffix)
+            os.replace(self.part_file, self.log_file)
+            return True
+
+    def release(self) -> None:
+        """Stop the heartbeat and remove the claim and temporary files."""
+        self.__stop.set()
+        self.__thread.join()
+        _remove_parts(self.part_file)
+        if not self.lost:
+            current = _read_claim(self.claim_file)
+            if (current is not None) and (current[2] == self.__token):
+                with suppress(OSError):
+                    os.remove(self.claim_file)
+
+    def __exit__(self, exception_type, exception_value, traceback) -> bool:
+        """
+        Release the claim.
+
+        :param exception_type: ignored
+        :param exception_value: ignored
+        :param traceback: ignored
+        :returns: `True` to suppress an exception, `False` to rethrow it
+        """
+        self.release()
+        return exception_type is None
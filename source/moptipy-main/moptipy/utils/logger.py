@@ -35,7 +35,9 @@ from io import StringIO, TextIOBase
 from math import isfinite
 from os.path import realpath
 from re import sub
-from typing import Callable, Final, Iterable, cast
+from typing import Callable, Final, Iterable, Sequence, cast
+
+import numpy as np
 
 from moptipy.utils.cache import is_new
 from moptipy.utils.path import Path
@@ -277,6 +279,34 @@ class Logger(AbstractContextManager):
         """
         return CsvLogSection(title=title, logger=self, header=header)
 
+    def csv_columns(self, title: str, header: list[str],
+                    chunks: Iterable[Sequence[np.ndarray]]) -> None:
+        """
+        Write a CSV section whose data is given column-wise.
+
+        The data is provided as a sequence of chunks, where each chunk holds
+        one :class:`numpy.ndarray` per column. This allows large tables to be
+        streamed into the log without holding them in memory as a whole.
+        Loggers that store typed data, such as the
+        :class:`~moptipy.utils.binary_logger.BinaryLogger`, can keep the
+        columns in their binary form.
+
+        :param title: the title of the new section
+        :param header: the list of column titles
+        :param chunks: the chunks of column arrays
+
+        >>> with InMemoryLogger() as l:
+        ...     l.csv_columns("A", ["x", "y"], [
+        ...         (np.array([1, 2]), np.array([0.5, 3.0])),
+        ...         (np.array([3]), np.array([7.0]))])
+        ...     print(l.get_log())
+        ['BEGIN_A', 'x;y', '1;0.5', '2;3', '3;7', 'END_A']
+        """
+        with self.csv(title, header) as csv:
+            for chunk in chunks:
+                for row in zip(*[c.tolist() for c in chunk]):
+                    csv.row(row)
+
     def text(self, title: str) -> "TextLogSection":
         r"""
         Create a log section for unstructured text.
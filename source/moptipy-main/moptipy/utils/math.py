@@ -371,9 +371,11 @@ def __bin_search_root(value: int, power: int) -> int:
     if power == 2:
         return int_sqrt
 
-    # compute the maximum base root
-    root_min: int = 1
-    root_max: int = (int_sqrt - 1) if value > 3 else 1
+    # compute the maximum base root, which has about bits/power bits
+    bits: Final[int] = value.bit_length()
+    root_min: int = max(1, 1 << ((bits - 1) // power))
+    root_max: int = min((int_sqrt - 1) if value > 3 else 1,
+                        1 << -(-bits // power))
     while root_max >= root_min:
         root_mid = isqrt(root_min * root_max)
         power_mid = root_mid ** power
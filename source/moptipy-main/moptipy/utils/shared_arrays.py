@@ -0,0 +1,158 @@
+"""
+Share large :mod:`numpy` arrays between processes without copying them.
+
+When :func:`~moptipy.api.experiment.run_experiment` forks several worker
+processes, each worker normally creates its own copy of every problem
+instance, e.g., of a large distance matrix. A :class:`SharedArrays` registry
+instead moves the large arrays of objects created once in the parent process
+into :mod:`multiprocessing.shared_memory` blocks. The objects then hold
+views of these blocks, which the forked workers inherit without copying.
+The shared arrays must be treated as read-only, as all processes see any
+change made to them.
+
+>>> with SharedArrays(min_bytes=8) as sa:
+...     a = sa.array(np.array([1, 2, 3]))
+...     print(a, type(a.base).__name__)
+[1 2 3] mmap
+"""
+from contextlib import AbstractContextManager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Final, TypeVar
+
+import numpy as np
+
+from moptipy.utils.types import check_int_range, type_error
+
+#: the type variable for the objects to be shared
+T = TypeVar("T")
+
+
+class SharedArrays(AbstractContextManager):
+    """
+    A registry of arrays placed in shared memory.
+
+    The shared memory blocks are released when the registry is closed, which
+    must only happen after all processes using them have finished.
+    """
+
+    def __init__(self, min_bytes: int = 65536) -> None:
+        """
+        Create the registry.
+
+        :param min_bytes: the minimum size of arrays to be moved into shared
+            memory by :meth:`share`, smaller arrays are kept as they are
+        """
+        #: the minimum size of arrays to be shared
+        self.min_bytes: Final[int] = check_int_range(
+            min_bytes, "min_bytes", 1, 1_000_000_000_000)
+        #: the shared memory blocks
+        self.__blocks: Final[list[SharedMemory]] = []
+        #: the shared arrays by the ids of their originals
+        self.__shared: Final[dict[int, tuple[np.ndarray, np.ndarray]]] = {}
+
+    def array(self, arr: np.ndarray) -> np.ndarray:
+        """
+        Copy an array into shared memory.
+
+        If the same array object is passed in several times, the same shared
+        array is returned each time. If `arr` is an instance of a subclass of
+        :class:`numpy.ndarray`, the shared array will be an instance of that
+        subclass with the same attributes.
+
+        :param arr: the array
+        :returns: an equivalent array backed by shared memory
+        """
+        if not isinstance(arr, np.ndarray):
+            raise type_error(arr, "arr", np.ndarray)
+        known = self.__shared.get(id(arr))
+        if known is not None:
+            return known[1]
+        block: Final[SharedMemory] = SharedMemory(
+            create=True, size=max(1, arr.nbytes))
+        self.__blocks.append(block)
+        result: Final[np.ndarray] = np.ndarray.__new__(
+            type(arr), arr.shape, arr.dtype, buffer=block.buf)
+        result[...] = arr
+        if hasattr(arr, "__dict__"):
+            result.__dict__.update(arr.__dict__)
+        # keep the original alive so that its id cannot be reused
+        self.__shared[id(arr)] = (arr, result)
+        return result
+
+    def share(self, obj: T) -> T:
+        """
+        Move the large arrays of an object into shared memory.
+
+        If `obj` itself is a large array, a shared copy of it is returned.
+        Otherwise, all large arrays that are attributes of `obj` or elements
+        of tuples stored in its attributes are replaced with shared copies.
+        Arrays referenced several times are shared only once.
+
+        :param obj: the object, e.g., a problem instance
+        :returns: the object to use instead of `obj`
+
+        >>> class X:
+        ...     def __init__(self):
+        ...         self.a = np.zeros(100)
+        ...         self.t = (1, self.a)
+        >>> with SharedArrays(min_bytes=16) as sa:
+        ...     x = sa.share(X())
+        ...     print(type(x.a.base).__name__, x.t[1] is x.a, x.t[0])
+        mmap True 1
+        """
+        if isinstance(obj, np.ndarray):
+            return self.array(obj) if self.__is_large(obj) else obj
+        attrs: Final[dict[str, Any] | None] = getattr(obj, "__dict__", None)
+        if attrs is None:
+            return obj
+        for key, value in list(attrs.items()):
+            if isinstance(value, np.ndarray):
+                if self.__is_large(value):
+                    attrs[key] = self.array(value)
+            elif isinstance(value, tuple) and any(
+                    isinstance(v, np.ndarray) and self.__is_large(v)
+                    for v in value):
+                attrs[key] = tuple(
+                    self.array(v) if isinstance(v, np.ndarray)
+                    and self.__is_large(v) else v for v in value)
+        return obj
+
+    def __is_large(self, arr: np.ndarray) -> bool:
+        """
+        Check whether an array should be shared.
+
+        :param arr: the array
+        :returns: `True` if the array is large enough to be shared
+        """
+        return arr.nbytes >= self.min_bytes
+
+    def close(self) -> None:
+        """Release all shared memory blocks."""
+        self.__shared.clear()
+        while len(self.__blocks) > 0:
+            block = self.__blocks.pop()
+            block.unlink()
+            try:
+                block.close()
+            except BufferError:  # views still exist, unmapped when freed
+                pass
+
+    def __enter__(self) -> "SharedArrays":
+        """
+        Enter a `with` block.
+
+        :returns: this registry
+        """
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> bool:
+        """
+        Release all shared memory blocks.
+
+        :param exception_type: ignored
+        :param exception_value: ignored
+        :param traceback: ignored
+        :returns: `True` to suppress an exception, `False` to rethrow it
+        """
+        self.close()
+        return exception_type is None
@@ -13,7 +13,7 @@ def test_ffa_on_bit_strings() -> None:
     """Test the frequency fitness assignment process on bit strings."""
     validate_fitness_on_bitstrings(
         fitness=lambda f: FFA(f),
-        class_needed="moptipy.algorithms.so.fitnesses.ffa._IntFFA1")
+        class_needed="moptipy.algorithms.so.fitnesses.ffa._IntFFA")
 
 
 def test_ffa_on_bit_strings_2() -> None:
@@ -23,11 +23,8 @@ def test_ffa_on_bit_strings_2() -> None:
         random: Final[Generator] = default_rng()
         olb = f.lower_bound()
         oub = f.upper_bound()
-        while True:
-            lb = int(random.integers(-100_000_000, 100_000_000))
-            ub = int(random.integers(lb + oub - olb + 1, lb + 100_000_000))
-            if ((ub - lb) <= 100_000_000) and (not (0 <= lb <= 10_000_000)):
-                break
+        lb = int(random.integers(-100_000_000, 100_000_000))
+        ub = int(random.integers(lb + oub - olb + 1, lb + 100_000_000))
         f.lower_bound = lambda _l=lb: _l  # type: ignore
         f.upper_bound = lambda _u=ub: _u  # type: ignore
         ofe = f.evaluate
@@ -36,7 +33,7 @@ def test_ffa_on_bit_strings_2() -> None:
 
     validate_fitness_on_bitstrings(
         fitness=lambda f: FFA(f),
-        class_needed="moptipy.algorithms.so.fitnesses.ffa._IntFFA2",
+        class_needed="moptipy.algorithms.so.fitnesses.ffa._IntFFA",
         prepare_objective=prepare)
 
 
@@ -47,29 +44,44 @@ def test_ffa_on_bit_strings_3() -> None:
         random: Final[Generator] = default_rng()
         lb = olb = f.lower_bound()
         oub = f.upper_bound()
-        choice: Final[int] = random.integers(1, 4)
-
-        if choice in (1, 3):
-            while True:
-                lb = int(random.integers(-1_000_000_000, 1_000_000_000))
-                ub = int(random.integers(lb + oub - olb + 1,
-                                         lb + 10_000_000_000))
-                if (ub - lb) > 100_000_000:
-                    break
+
+        if random.integers(2) <= 0:
+            lb = int(random.integers(-1_000_000_000, 1_000_000_000))
+            ub = int(random.integers(lb + oub - olb + 1,
+                                     lb + 10_000_000_000))
             f.lower_bound = lambda _l=lb: _l  # type: ignore
             f.upper_bound = lambda _u=ub: _u  # type: ignore
             ofe = f.evaluate
             f.evaluate = \
                 lambda x, _l=lb - olb, _o=ofe: _o(x) + _l  # type: ignore
 
-        if choice in (2, 3):
-            f.is_always_integer = lambda: False
-            ofe2 = f.evaluate
-            f.evaluate = lambda x, _of=ofe2: float(_of(x))  # type: ignore
-
+        f.is_always_integer = lambda: False
+        ofe2 = f.evaluate
+        f.evaluate = lambda x, _of=ofe2: float(_of(x))  # type: ignore
         return f
 
     validate_fitness_on_bitstrings(
         fitness=lambda f: FFA(f),
         class_needed="moptipy.algorithms.so.fitnesses.ffa._DictFFA",
         prepare_objective=prepare)
+
+
+def test_ffa_on_bit_strings_4() -> None:
+    """Test the table-based FFA with far apart bounds on bit strings."""
+
+    def prepare(f: Objective) -> Objective:
+        random: Final[Generator] = default_rng()
+        olb = f.lower_bound()
+        oub = f.upper_bound()
+        lb = int(random.integers(-1_000_000_000_000, -1))
+        ub = int(random.integers(lb + oub - olb + 1, 1_000_000_000_000))
+        f.lower_bound = lambda _l=lb: _l  # type: ignore
+        f.upper_bound = lambda _u=ub: _u  # type: ignore
+        ofe = f.evaluate
+        f.evaluate = lambda x, _l=lb - olb, _o=ofe: _o(x) + _l  # type: ignore
+        return f
+
+    validate_fitness_on_bitstrings(
+        fitness=lambda f: FFA(f),
+        class_needed="moptipy.algorithms.so.fitnesses.ffa._IntFFA",
+        prepare_objective=prepare)
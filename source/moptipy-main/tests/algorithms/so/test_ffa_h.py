@@ -0,0 +1,80 @@
+"""Test the compact FFA frequency table."""
+from collections import Counter
+from typing import Final
+
+import numpy as np
+from numpy.random import Generator, default_rng
+from pytest import raises
+
+from moptipy.algorithms.so.ffa_h import H_MAX, FrequencyTable, _home, h_add
+
+
+def __check(lb: int, ub: int, dense: bool) -> None:
+    """
+    Compare a frequency table with a `Counter`.
+
+    :param lb: the lower bound
+    :param ub: the upper bound
+    :param dense: should the table be a plain array?
+    """
+    random: Final[Generator] = default_rng()
+    table: Final[FrequencyTable] = FrequencyTable(lb, ub)
+    assert table.is_dense() == dense
+    counter: Final[Counter] = Counter()
+    values: Final[np.ndarray] = random.integers(lb, ub + 1, 300)
+    for _ in range(5000):
+        f = int(values[random.integers(values.size)])
+        counter[f] += 1
+        assert table.add(f) == counter[f]
+    for f in values:
+        assert table.get(int(f)) == counter[int(f)]
+    assert len(table) == len(counter)
+    table.clear()
+    assert len(table) == 0
+    assert table.get(int(values[0])) == 0
+    with raises(ValueError):
+        table.add(lb - 1)
+    with raises(ValueError):
+        table.get(ub + 1)
+
+
+def test_frequency_table_dense() -> None:
+    """Test the frequency table as a plain array."""
+    __check(-20, 1000, True)
+
+
+def test_frequency_table_hashed() -> None:
+    """Test the frequency table as a hash table."""
+    __check(3, 1_000_000_000_000, False)
+
+
+def test_frequency_table_halving() -> None:
+    """Test that the counters are halved before they overflow."""
+    table: Final[FrequencyTable] = FrequencyTable(0, 10)
+    table.h[2] = H_MAX
+    table.h[5] = 7
+    assert h_add(table.h, table.keys, table.lb, 2) == (H_MAX >> 1) + 1
+    assert table.get(5) == 3
+
+
+def __check_strided(stride: int) -> None:
+    """
+    Check that strided keys are spread over the hash table.
+
+    :param stride: the distance between two keys
+    """
+    table: Final[FrequencyTable] = FrequencyTable(0, 1023 * stride)
+    table.reserve(512)
+    mask: Final[int] = table.keys.size - 2
+    homes: Final[set[int]] = {_home(i * stride, mask) for i in range(512)}
+    assert len(homes) > 256
+    for i in range(512):
+        assert table.add(i * stride) == 1
+    assert len(table) == 512
+    assert table.get(511 * stride) == 1
+
+
+def test_frequency_table_hashed_strided() -> None:
+    """Test the hash table with keys that only differ in high bits."""
+    for stride in [2 ** 11, 2 ** 32, 2 ** 40]:
+        __check_strided(stride)
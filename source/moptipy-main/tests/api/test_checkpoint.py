@@ -0,0 +1,112 @@
+"""Test the checkpointing and resuming of runs."""
+from os.path import exists
+from time import sleep
+
+import pytest
+
+from moptipy.api.algorithm import Algorithm
+from moptipy.api.execution import Execution
+from moptipy.api.process import Process
+from moptipy.examples.bitstrings.onemax import OneMax
+from moptipy.spaces.bitstrings import BitStrings
+from moptipy.utils.temp import TempDir
+
+
+class _Walker(Algorithm):
+    """A random walk that can be checkpointed and crash."""
+
+    def __init__(self, crash_at: int | None = None) -> None:
+        """
+        Create the random walk.
+
+        :param crash_at: the FE at which the walk crashes, or `None`
+        """
+        super().__init__()
+        #: the FE at which the walk crashes
+        self.crash_at = crash_at
+        #: the number of FEs performed by this object
+        self.steps = 0
+
+    def solve(self, process: Process) -> None:
+        """
+        Apply the random walk.
+
+        :param process: the process
+        """
+        random = process.get_random()
+        resumed = process.get_resumed_state()
+        if resumed is None:
+            x = process.create()
+            x[:] = random.integers(0, 2, len(x)) > 0
+            f = process.evaluate(x)
+        else:
+            x, f = resumed
+        while not process.should_terminate():
+            i = random.integers(len(x))
+            x[i] = not x[i]
+            f2 = process.evaluate(x)
+            self.steps += 1
+            if f2 <= f:
+                f = f2
+            else:
+                x[i] = not x[i]
+            fes = process.get_consumed_fes()
+            if fes == 200:
+                sleep(0.01)  # make sure that a checkpoint is due
+            if fes == self.crash_at:
+                raise ValueError("crash")
+            process.checkpoint(lambda: (x, f))  # noqa: B023
+
+    def __str__(self) -> str:
+        """
+        Get the name of this algorithm.
+
+        :returns: "walker"
+        """
+        return "walker"
+
+
+def __progress(file: str) -> list[str]:
+    """
+    Get the FEs and objective values from the progress section of a log.
+
+    :param file: the log file
+    :returns: the rows of the progress section without the times
+    """
+    with open(file, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    rows = lines[lines.index("BEGIN_PROGRESS") + 2:
+                 lines.index("END_PROGRESS")]
+    return [f"{r.split(';')[0]};{r.split(';')[2]}" for r in rows]
+
+
+def test_checkpoint_resume() -> None:
+    """Test that a resumed run follows the uninterrupted trajectory."""
+    space = BitStrings(256)
+    with TempDir.create() as td:
+        results = []
+        for crash_at in [None, 300]:
+            log = td.resolve_inside(f"log{crash_at}.txt")
+            ckpt = td.resolve_inside(f"log{crash_at}.checkpoint")
+            ex = Execution().set_solution_space(space)\
+                .set_objective(OneMax(256)).set_rand_seed(1)\
+                .set_max_fes(500).set_log_file(log).set_log_improvements()\
+                .set_checkpoint(ckpt, 1)
+            if crash_at is not None:
+                ex.set_algorithm(_Walker(crash_at))
+                with pytest.raises(ValueError, match="crash"):
+                    with ex.execute():
+                        pass
+                assert exists(ckpt)
+                assert exists(ckpt + ".log")
+            walker = _Walker()
+            with ex.set_algorithm(walker).execute() as process:
+                results.append((process.get_best_f(),
+                                process.get_consumed_fes(),
+                                process.get_last_improvement_fe()))
+            assert not exists(ckpt)
+            assert not exists(ckpt + ".log")
+            assert (walker.steps < 499) == (crash_at is not None)
+            results.append(__progress(log))
+        assert results[0:2] == results[2:4]
+        assert results[0][1] == 500
@@ -1,6 +1,10 @@
 """Test the execution of an experiment on the JSSP."""
 import os.path as pt
 from os import listdir
+from typing import Final
+
+import numpy as np
+import pytest
 
 from moptipy.algorithms.random_sampling import RandomSampling
 from moptipy.algorithms.so.hill_climber import HillClimber
@@ -119,3 +123,182 @@ def test_experiment_jssp() -> None:
                     rp = pt.join(ip, run)
                     assert pt.isfile(rp)
                     assert pt.getsize(rp) > 10
+
+
+def test_experiment_jssp_threads() -> None:
+    """Run the JSSP test experiment with threads sharing the instances."""
+    loaded: list[str] = []
+
+    def __load(name: str) -> Instance:
+        loaded.append(name)
+        return Instance.from_resource(name)
+
+    with TempDir.create() as base_dir:
+        run_experiment(instances=[lambda: __load("dmu01"),
+                                  lambda: __load("demo")],
+                       setups=[algo_1, algo_2],
+                       n_runs=5,
+                       base_dir=base_dir,
+                       n_threads=3,
+                       use_threads=True)
+
+        assert sorted(loaded) == ["demo", "dmu01"]
+        algos = listdir(base_dir)
+        algos.sort()
+        assert algos == ["hc_swap2", "rs"]
+        for a in algos:
+            insts = listdir(pt.join(base_dir, a))
+            insts.sort()
+            assert insts == ["demo", "dmu01"]
+            for i in insts:
+                ip = pt.join(base_dir, a, i)
+                runs = listdir(ip)
+                assert len(runs) == 5
+                for run in runs:
+                    assert run.startswith(a + "_" + i + "_")
+                    assert pt.getsize(pt.join(ip, run)) > 10
+
+
+def test_experiment_jssp_threads_bounded_cache() -> None:
+    """Check that the threads respect the size of their shared cache."""
+    loaded: list[str] = []
+
+    def __load(name: str) -> Instance:
+        loaded.append(name)
+        return Instance.from_resource(name)
+
+    with TempDir.create() as base_dir:
+        run_experiment(instances=[lambda: __load("dmu01"),
+                                  lambda: __load("demo")],
+                       setups=[algo_1, algo_2],
+                       n_runs=2,
+                       base_dir=base_dir,
+                       n_threads=2,
+                       use_threads=True,
+                       instance_cache_bytes=0)
+
+        # with no space in the cache, an instance is created again after
+        # the other one was loaded
+        assert sorted(set(loaded)) == ["demo", "dmu01"]
+        assert len(loaded) > 2
+        for a in ["hc_swap2", "rs"]:
+            for i in ["demo", "dmu01"]:
+                assert len(listdir(pt.join(base_dir, a, i))) == 2
+
+
+def test_experiment_jssp_shared_instances() -> None:
+    """Run the JSSP test experiment with instances in shared memory."""
+    loaded: list[str] = []
+
+    def __load(name: str) -> Instance:
+        loaded.append(name)
+        return Instance.from_resource(name)
+
+    with TempDir.create() as base_dir:
+        run_experiment(instances=[lambda: __load("abz7"),
+                                  lambda: __load("demo"),
+                                  lambda: __load("dmu01")],
+                       setups=[algo_1, algo_2],
+                       n_runs=3,
+                       base_dir=base_dir,
+                       n_threads=2,
+                       share_instances=True)
+
+        # the instances were created once in this process, the workers
+        # would have created their own copies, which we would not see here
+        assert sorted(loaded) == ["abz7", "demo", "dmu01"]
+        for a in ["hc_swap2", "rs"]:
+            for i in ["abz7", "demo", "dmu01"]:
+                ip = pt.join(base_dir, a, i)
+                runs = listdir(ip)
+                assert len(runs) == 3
+                for run in runs:
+                    assert pt.getsize(pt.join(ip, run)) > 10
+
+
+def test_experiment_jssp_shared_instances_released_on_error() -> None:
+    """Check that the shared memory is released if an instance fails."""
+    def __fail() -> Instance:
+        raise ValueError("failed to load")
+
+    shm: Final[str] = "/dev/shm"  # noqa: S108
+    if not pt.isdir(shm):
+        return
+    before: Final[set[str]] = set(listdir(shm))
+    with TempDir.create() as base_dir:
+        with pytest.raises(ValueError, match="failed to load"):
+            run_experiment(instances=[lambda: np.zeros(100_000), __fail],
+                           setups=[algo_1],
+                           n_runs=1,
+                           base_dir=base_dir,
+                           n_threads=2,
+                           share_instances=True)
+    assert set(listdir(shm)) == before
+
+
+def test_experiment_jssp_memoized_instances() -> None:
+    """Run the JSSP test experiment and check that instances are reused."""
+    loaded: list[str] = []
+
+    def __load(name: str) -> Instance:
+        loaded.append(name)
+        return Instance.from_resource(name)
+
+    with TempDir.create() as base_dir:
+        run_experiment(instances=[lambda: __load("dmu01"),
+                                  lambda: __load("demo")],
+                       setups=[algo_1, algo_2],
+                       n_runs=[1, 2],
+                       base_dir=base_dir,
+                       n_threads=1)
+        assert sorted(loaded) == ["demo", "dmu01"]
+        for a in ["hc_swap2", "rs"]:
+            for i in ["demo", "dmu01"]:
+                assert len(listdir(pt.join(base_dir, a, i))) == 2
+
+
+def test_experiment_jssp_schedule_by_cost() -> None:
+    """Run the JSSP test experiment with the cost-aware scheduler."""
+    for n_threads in [1, 2]:
+        with TempDir.create() as base_dir:
+            run_experiment(instances=instances,
+                           setups=[algo_1, algo_2],
+                           n_runs=[2, 3],
+                           base_dir=base_dir,
+                           n_threads=n_threads,
+                           schedule_by_cost=True)
+            run_experiment(instances=instances,
+                           setups=[algo_1, algo_2],
+                           n_runs=4,
+                           base_dir=base_dir,
+                           n_threads=n_threads,
+                           schedule_by_cost=True)
+
+            for a in ["hc_swap2", "rs"]:
+                for i in ["abz7", "demo", "dmu01"]:
+                    ip = pt.join(base_dir, a, i)
+                    runs = listdir(ip)
+                    assert len(runs) == 4
+                    for run in runs:
+                        assert run.startswith(a + "_" + i + "_")
+                        assert pt.getsize(pt.join(ip, run)) > 10
+
+
+def test_experiment_jssp_checkpoints() -> None:
+    """Run the JSSP test experiment with checkpoints."""
+    with TempDir.create() as base_dir:
+        run_experiment(instances=instances,
+                       setups=[algo_1, algo_2],
+                       n_runs=2,
+                       base_dir=base_dir,
+                       n_threads=1,
+                       checkpoint_interval_millis=1)
+
+        for a in ["hc_swap2", "rs"]:
+            for i in ["abz7", "demo", "dmu01"]:
+                ip = pt.join(base_dir, a, i)
+                runs = listdir(ip)
+                assert len(runs) == 2
+                for run in runs:
+                    assert run.endswith(".txt")
+                    assert pt.getsize(pt.join(ip, run)) > 10
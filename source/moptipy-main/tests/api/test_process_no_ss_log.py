@@ -2,7 +2,9 @@
 
 from os.path import exists, isfile
 
+import numpy as np
 from numpy.random import Generator, default_rng
+from pytest import raises
 
 from moptipy.algorithms.so.fea1plus1 import FEA1plus1
 from moptipy.algorithms.so.hill_climber_with_restarts import (
@@ -12,6 +14,11 @@ from moptipy.api.algorithm import Algorithm, Algorithm0
 from moptipy.api.execution import Execution
 from moptipy.api.objective import Objective
 from moptipy.api.process import Process
+from moptipy.api.subprocesses import (
+    for_fes,
+    from_starting_point,
+    without_should_terminate,
+)
 from moptipy.api.space import Space
 from moptipy.examples.bitstrings.leadingones import LeadingOnes
 from moptipy.examples.bitstrings.onemax import OneMax
@@ -305,3 +312,139 @@ def test_process_no_ss_no_log_all_register() -> None:
         j = data.index("END_RESULT_Y")
         assert j > i + 1
         assert data[-1] == "END_RESULT_Y"
+
+
+class _OMABlock(_OMA):
+    """The one-max algorithm registering its FEs in blocks."""
+
+    def solve(self, process: Process) -> None:
+        """Solve."""
+        x = process.create()
+        best_x = process.create()
+        r = process.get_random()
+        left = process.get_max_fes() - process.get_consumed_fes()
+        while left > 0:
+            n = min(left, 7)
+            trace = np.empty((n, 2), int)
+            best_f = -1
+            for i in range(n):
+                self.op0.op0(r, x)
+                f = self.f.evaluate(x)
+                trace[i] = (i + 1, f)
+                if (best_f < 0) or (f < best_f):
+                    best_f = f
+                    best_x[:] = x
+            left = process.register_block(n, best_x, best_f, trace)
+
+
+class _OMABlockWrapped(_OMABlock):
+    """The block one-max algorithm running in a sub-process."""
+
+    def __init__(self, op0: Op0Random, f: OneMax, start: bool):
+        """Initialize."""
+        super().__init__(op0, f)
+        self.start: bool = start
+
+    def solve(self, process: Process) -> None:
+        """Solve."""
+        if not self.start:
+            without_should_terminate(super().solve, process)
+            return
+        x = process.create()
+        self.op0.op0(process.get_random(), x)
+        super().solve(from_starting_point(process, x, process.evaluate(x)))
+
+
+def _progress(algorithm: Algorithm, objective: OneMax, space: Space,
+               goal_f: int, log_all: bool) -> list[str]:
+    """Get the fes and f columns of the progress log of a run."""
+    with TempFile.create() as tf:
+        with Execution()\
+                .set_solution_space(space)\
+                .set_objective(objective)\
+                .set_algorithm(algorithm)\
+                .set_rand_seed(5)\
+                .set_goal_f(goal_f)\
+                .set_max_fes(100)\
+                .set_log_file(tf)\
+                .set_log_improvements(True)\
+                .set_log_all_fes(log_all)\
+                .execute() as process:
+            fes = process.get_consumed_fes()
+            best_f = process.get_best_f()
+        data = tf.read_all_list()
+    progress = data[data.index("BEGIN_PROGRESS") + 2:
+                    data.index("END_PROGRESS")]
+    result = [f"{fes}:{best_f}"]
+    for line in progress:
+        row = line.split(";")
+        result.append(f"{row[0]}:{row[2]}")
+    return result
+
+
+def test_process_no_ss_log_register_block() -> None:
+    """Test that `register_block` creates the same logs as `register`."""
+    dim: int = 12
+    space: Space = BitStrings(dim)
+    objective: OneMax = OneMax(dim)
+    for goal_f in [2, 0]:
+        for log_all in [False, True]:
+            single = _progress(_OMA(Op0Random(), objective), objective,
+                               space, goal_f, log_all)
+            block = _progress(_OMABlock(Op0Random(), objective), objective,
+                              space, goal_f, log_all)
+            assert len(single) > 2
+            assert single == block
+            assert single == _progress(
+                _OMABlockWrapped(Op0Random(), objective, False), objective,
+                space, goal_f, log_all)
+            started = _progress(
+                _OMABlockWrapped(Op0Random(), objective, True), objective,
+                space, goal_f, log_all)
+            assert "inf" not in "".join(started)
+            if log_all:
+                assert len(started) == 1 + int(started[0].split(":")[0])
+
+
+def test_register_block_needs_full_trace_if_all_fes_logged() -> None:
+    """Test that the default `register_block` needs complete traces."""
+    class _P(Process):
+        def logs_all_fes(self) -> bool:
+            return True
+
+    with raises(ValueError):
+        _P().register_block(3, None, 1, np.array([[2, 1]]))
+
+
+def test_for_fes_register_block_beyond_budget() -> None:
+    """Test that `for_fes` cuts off blocks at its budget."""
+    dim: int = 12
+    space: Space = BitStrings(dim)
+    objective: OneMax = OneMax(dim)
+    results: list = []
+
+    class _A(Algorithm):
+        def solve(self, process: Process) -> None:
+            x = space.create()
+            process.evaluate(x)
+            y = space.create()
+            y.fill(True)
+            sub = for_fes(process, 5)
+            results.append(sub.register_block(
+                10, y, 0, np.array([[2, dim], [8, 0]])))
+            results.append(sub.should_terminate())
+            sub.register(y, 0)
+            results.append(sub.register_block(1, y, 0))
+            results.append((process.get_consumed_fes(),
+                            process.get_best_f()))
+            y[0] = False
+            sub = for_fes(process, 5)
+            sub.register_block(10, y, 1, np.array([[3, 1]]))
+            results.append((sub.get_consumed_fes(),
+                            process.get_consumed_fes(),
+                            process.get_best_f()))
+
+    with Execution().set_solution_space(space).set_objective(objective)\
+            .set_algorithm(_A()).set_max_fes(100).execute():
+        pass
+    assert results == [0, True, 0, (6, dim), (5, 11, 1)]
@@ -0,0 +1,56 @@
+"""Test the memory-bounded progress log."""
+import os
+
+from moptipy.api._progress_log import _ProgressLog
+from moptipy.utils.temp import TempFile
+
+
+def test_progress_log_spills_and_streams() -> None:
+    """Test that entries spilled to the file are read back in order."""
+    for is_int in [True, False]:
+        log = _ProgressLog(is_int, 7)
+        rows = [(i, 3 * i, (i * i) if is_int else (i / 4))
+                for i in range(1000)]
+        for row in rows:
+            log.append(*row)
+        assert len(log) == len(rows)
+        assert list(log) == rows
+        log.append(1000, 3000, 5)  # appending after reading is allowed
+        assert len(log) == 1001
+        assert list(log)[-2:] == [rows[-1], (1000, 3000, 5)]
+        log.close()
+
+
+def test_progress_log_save_and_restore() -> None:
+    """Test that checkpoints only copy the newly spilled chunks."""
+    for is_int in [True, False]:
+        log = _ProgressLog(is_int, 7)
+        rows = [(i, 3 * i + 5, (i * i) if is_int else (i / 4))
+                for i in range(1000)]
+        with TempFile.create() as tf:
+            for row in rows[:500]:
+                log.append(*row)
+            state = log.save(tf, 5)
+            assert state[0:2] == (497, 7)
+            assert len(state[2]) == 3
+            assert os.path.getsize(tf) == 497 * 24
+            for row in rows[500:]:
+                log.append(*row)
+            later = log.save(tf, 5)
+            assert later[0] == 994
+            assert os.path.getsize(tf) == 994 * 24
+            log.close()
+
+            restored = _ProgressLog(is_int, 7)  # resume the later state
+            restored.restore(tf, later, 10)
+            assert list(restored) == [(a, b + 5, c) for a, b, c in rows]
+            restored.close()
+
+            restored = _ProgressLog(is_int, 7)  # resume the earlier state
+            restored.restore(tf, state, 5)
+            assert os.path.getsize(tf) == 497 * 24
+            assert list(restored) == rows[:500]
+            restored.append(*rows[500])
+            assert restored.save(tf, 5)[0] == 497
+            assert list(restored) == rows[:501]
+            restored.close()
@@ -0,0 +1,102 @@
+"""Test that binary logs are parsed like the text logs."""
+import os
+import shutil
+
+import numpy as np
+
+from moptipy.algorithms.so.rls import RLS
+from moptipy.api import logging
+from moptipy.api.execution import Execution
+from moptipy.api.experiment import run_experiment
+from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.progress import Progress
+from moptipy.examples.bitstrings.onemax import OneMax
+from moptipy.operators.bitstrings.op0_random import Op0Random
+from moptipy.operators.bitstrings.op1_flip1 import Op1Flip1
+from moptipy.spaces.bitstrings import BitStrings
+from moptipy.utils.binary_logger import read_binary_log
+from moptipy.utils.temp import TempDir
+
+
+def __setup(problem: OneMax) -> Execution:
+    """
+    Create the execution for a OneMax problem.
+
+    :param problem: the problem
+    :returns: the execution
+    """
+    space = BitStrings(problem.n)
+    return Execution().set_solution_space(space).set_objective(problem)\
+        .set_algorithm(RLS(Op0Random(), Op1Flip1())).set_max_fes(300)\
+        .set_log_improvements()
+
+
+def __parse(path: str) -> tuple[list, list]:
+    """
+    Parse the end results and progress from a directory.
+
+    :param path: the directory
+    :returns: the end results and the progress data
+    """
+    ers: list[EndResult] = []
+    EndResult.from_logs(path, ers.append)
+    progress: list[Progress] = []
+    Progress.from_logs(path, progress.append, time_unit="FEs")
+    return (sorted(ers), sorted([
+        (p.algorithm, p.instance, p.rand_seed, p.time.tolist(),
+         p.f.tolist()) for p in progress]))
+
+
+def test_binary_log_matches_text_log() -> None:
+    """Test that binary and text logs give the same evaluation data."""
+    with TempDir.create() as td:
+        run_experiment(base_dir=td,
+                       instances=[lambda: OneMax(32), lambda: OneMax(48)],
+                       setups=[__setup], n_runs=2, n_threads=1,
+                       binary_log=True)
+        texts = []
+        binaries = []
+        for root, _, files in os.walk(td):
+            for f in files:
+                (binaries if f.endswith(logging.BINARY_SUFFIX)
+                 else texts).append(os.path.join(root, f))
+        assert len(texts) == 4
+        assert sorted(binaries) == sorted(
+            t + logging.BINARY_SUFFIX for t in texts)
+        with_binary = __parse(td)
+        assert len(with_binary[0]) == 4
+        assert all(len(p[3]) > 1 for p in with_binary[1])
+
+        # only text logs
+        text_dir = td.resolve_inside("text")
+        shutil.copytree(td, text_dir, ignore=shutil.ignore_patterns(
+            "*" + logging.BINARY_SUFFIX, "text"))
+        assert __parse(text_dir) == with_binary
+
+        # only binary logs
+        for t in texts:
+            os.remove(t)
+        os.rename(text_dir, td + "_text")
+        try:
+            assert __parse(td) == with_binary
+        finally:
+            shutil.rmtree(td + "_text")
+
+
+def test_binary_log_of_execution() -> None:
+    """Test that the binary log stores the progress as typed columns."""
+    with TempDir.create() as td:
+        log = td.resolve_inside("log.txt")
+        ex = __setup(OneMax(16)).set_log_file(log).set_rand_seed(3)\
+            .set_log_all_fes().set_binary_log(True, False)
+        with ex.execute() as process:
+            fes = process.get_consumed_fes()
+        assert not os.path.exists(log)
+        binary = log + logging.BINARY_SUFFIX
+        assert os.path.isfile(binary)
+        sections = dict(read_binary_log(binary))
+        progress = sections[logging.SECTION_PROGRESS]
+        assert progress[logging.PROGRESS_FES].tolist() == list(
+            range(1, fes + 1))
+        assert progress[logging.PROGRESS_CURRENT_F].dtype == np.int64
+        assert "totalFEs: " in sections[logging.SECTION_FINAL_STATE]
@@ -0,0 +1,85 @@
+"""Test the columnar table of end results."""
+from typing import Final
+
+import numpy as np
+
+from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.end_results_frame import EndResults
+from moptipy.evaluation.end_statistics import EndStatistics
+
+
+def __end_results(random: np.random.Generator) -> list[EndResult]:
+    """
+    Create random end results.
+
+    :param random: the random number generator
+    :returns: the end results
+    """
+    result: Final[list[EndResult]] = []
+    for algo in ("rs", "ea_1", "ea", "hc"):
+        for inst, goal in (("i1", 100), ("i2", None), ("i3", 50.5),
+                           ("i4", 0)):
+            for seed in range(int(random.integers(1, 6))):
+                total_fes = int(random.integers(10, 1000))
+                total_ms = int(random.integers(1, 100))
+                result.append(EndResult(
+                    algo, inst, int(random.integers(0, 2 ** 63)),
+                    float(random.random() * 200) if inst == "i3"
+                    else int(random.integers(0, 300)),
+                    int(random.integers(1, total_fes + 1)),
+                    int(random.integers(1, total_ms + 1)),
+                    total_fes, total_ms, goal,
+                    1000 if algo != "hc" else 1000 + seed,
+                    None if algo == "ea" else 100_000))
+    random.shuffle(result)
+    return result
+
+
+def test_end_results_frame() -> None:
+    """Test the conversion and grouping of end results."""
+    results: Final[list[EndResult]] = __end_results(
+        np.random.default_rng(11))
+    frame: Final[EndResults] = EndResults.from_end_results(results)
+    assert len(frame) == len(results)
+    assert list(frame) == results
+    assert EndResults.from_end_results(frame) is frame
+    assert frame.algorithms == ("ea", "ea_1", "hc", "rs")
+
+    for join_algos in (False, True):
+        for join_insts in (False, True):
+            order, starts = frame.groups(join_algos, join_insts)
+            assert sorted(order.tolist()) == list(range(len(results)))
+            groups = [[results[i] for i in order[starts[g]:starts[g + 1]]]
+                      for g in range(len(starts) - 1)]
+            stats: list[EndStatistics] = []
+            EndStatistics.from_end_results(frame, stats.append,
+                                           join_algos, join_insts)
+            assert len(stats) == len(groups)
+            from_list: list[EndStatistics] = []
+            EndStatistics.from_end_results(iter(results), from_list.append,
+                                           join_algos, join_insts)
+            assert from_list == stats
+            for es, group in zip(stats, groups, strict=True):
+                assert es.n == len(group)
+                assert es.best_f.minimum == min(e.best_f for e in group)
+                assert es.total_fes.maximum == max(
+                    e.total_fes for e in group)
+                if es.algorithm is not None:
+                    assert {e.algorithm for e in group} == {es.algorithm}
+                if es.instance is not None:
+                    assert {e.instance for e in group} == {es.instance}
+                if any(e.goal_f is None for e in group):
+                    assert es.goal_f is None
+                    assert es.n_success is None
+                    assert es.ert_fes is None
+                    continue
+                success = [e for e in group if e.success()]
+                assert es.n_success == len(success)
+                if len(success) <= 0:
+                    assert es.success_fes is None
+                    continue
+                assert es.success_fes.minimum == min(
+                    e.last_improvement_fe for e in success)
+                assert es.ert_fes == sum(
+                    e.last_improvement_fe if e.success() else e.total_fes
+                    for e in group) / len(success)
@@ -0,0 +1,113 @@
+"""Test the ERT, ECDF, and ERT-ECDF against a direct computation."""
+from math import inf
+from typing import Final
+
+import numpy as np
+
+from moptipy.evaluation.ecdf import Ecdf
+from moptipy.evaluation.ert import Ert, compute_single_ert
+from moptipy.evaluation.ertecdf import ErtEcdf
+from moptipy.evaluation.progress import Progress
+
+
+def __progress(random: np.random.Generator) -> list[Progress]:
+    """
+    Create random progress data of two algorithms on three instances.
+
+    :param random: the random number generator
+    :returns: the progress data
+    """
+    result: Final[list[Progress]] = []
+    for algo in ("a", "b"):
+        for inst, lb in (("i1", 100), ("i2", 200), ("i3", 150)):
+            for seed in range(5):
+                time = np.unique(random.integers(1, 500, 30))
+                f = np.unique(random.integers(lb, 600, len(time)))[::-1]
+                n = min(len(time), len(f))
+                result.append(Progress(algo, inst, seed, time[:n], "FEs",
+                                       f[:n].copy(), "plainF", lb, True))
+    return result
+
+
+def __hit(p: Progress, goal: int | float) -> int | None:
+    """
+    Get the first time when a run reached a goal.
+
+    :param p: the progress of the run
+    :param goal: the goal
+    :returns: the time, or `None` if the goal was not reached
+    """
+    for t, f in zip(p.time, p.f, strict=True):
+        if f <= goal:
+            return int(t)
+    return None
+
+
+def __ert(runs: list[Progress], goal: int | float) -> float:
+    """
+    Compute an ERT directly.
+
+    :param runs: the runs
+    :param goal: the goal
+    :returns: the ERT
+    """
+    hits = [__hit(p, goal) for p in runs]
+    n_success = sum(h is not None for h in hits)
+    if n_success <= 0:
+        return inf
+    return sum(int(p.time[-1]) if h is None else h
+               for p, h in zip(runs, hits, strict=True)) / n_success
+
+
+def test_ert_ecdf() -> None:
+    """Test the ERT, ECDF, and ERT-ECDF."""
+    progress: Final[list[Progress]] = __progress(np.random.default_rng(5))
+
+    erts: Final[list[Ert]] = []
+    Ert.from_progresses(progress, erts.append)
+    assert len(erts) == 6
+    for ert in erts:
+        runs = [p for p in progress if (p.algorithm == ert.algorithm)
+                and (p.instance == ert.instance)]
+        for goal, value in ert.ert:
+            assert value == __ert(runs, goal)
+            assert compute_single_ert(runs, goal) == value
+
+    goals: Final[list] = [None, 300, 450.5]
+    ecdfs: Final[list[Ecdf]] = []
+    Ecdf.from_progresses(progress, ecdfs.append, goals)
+    ert_ecdfs: Final[list[Ecdf]] = []
+    ErtEcdf.from_progresses(progress, ert_ecdfs.append, goals)
+    assert len(ecdfs) == len(ert_ecdfs) == 6
+    assert all(isinstance(e, ErtEcdf) for e in ert_ecdfs)
+    for i, (ecdf, ert_ecdf) in enumerate(zip(ecdfs, ert_ecdfs, strict=True)):
+        goal = goals[i // 2]
+        algo = ecdf.algorithm
+        assert algo == ert_ecdf.algorithm == "ab"[i % 2]
+        runs = [p for p in progress if p.algorithm == algo]
+        times = sorted(h for h in (__hit(p, p.f_standard if goal is None
+                                          else goal) for p in runs)
+                       if h is not None)
+        for t, v in ecdf.ecdf[:-1]:
+            assert v == sum(h <= t for h in times) / len(runs)
+        insts = sorted({p.instance for p in runs})
+        inst_erts = [__ert(inst_runs, inst_runs[0].f_standard
+                           if goal is None else goal)
+                     for inst_runs in ([p for p in runs if p.instance == i]
+                                       for i in insts)]
+        for t, v in ert_ecdf.ecdf[:-1]:
+            assert v == sum(e <= t for e in inst_erts) / len(insts)
+
+
+def test_ert_below_lower_bound() -> None:
+    """Test the ERT if a run gets below the lower bound in one step."""
+    runs: Final[list[Progress]] = [
+        Progress("a", "i", 1, np.array([1, 2, 4, 8]), "FEs",
+                 np.array([9, 5, 3, 1]), "plainF", None, True),
+        Progress("a", "i", 2, np.array([1, 10]), "FEs",
+                 np.array([9, 7]), "plainF", None, True)]
+    ert: Final[Ert] = Ert.create(runs, f_lower_bound=6)
+    # until the rewrite, the first ERT was 14.0: the cursor of the first
+    # run lagged behind and used the time 4 of f=3 instead of 2 of f=5
+    assert ert.ert.tolist() == [[6.0, 12.0], [7.0, 6.0], [9.0, 1.0]]
+    assert compute_single_ert(runs, 6) == 12.0
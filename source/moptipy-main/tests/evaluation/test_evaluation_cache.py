@@ -0,0 +1,90 @@
+"""Test the incremental cache of parsed log files."""
+import os
+from os.path import join
+
+from moptipy.algorithms.so.rls import RLS
+from moptipy.api.execution import Execution
+from moptipy.api.experiment import run_experiment
+from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.log_parser import ExperimentParser
+from moptipy.evaluation.progress import Progress
+from moptipy.examples.bitstrings.onemax import OneMax
+from moptipy.operators.bitstrings.op0_random import Op0Random
+from moptipy.operators.bitstrings.op1_flip1 import Op1Flip1
+from moptipy.spaces.bitstrings import BitStrings
+from moptipy.utils.temp import TempDir
+
+
+def __setup(problem: OneMax) -> Execution:
+    """
+    Create the execution for a OneMax problem.
+
+    :param problem: the problem
+    :returns: the execution
+    """
+    return Execution().set_solution_space(BitStrings(problem.n))\
+        .set_objective(problem).set_algorithm(RLS(Op0Random(), Op1Flip1()))\
+        .set_max_fes(100).set_log_improvements()
+
+
+def test_evaluation_cache() -> None:
+    """Test that cached results equal freshly parsed ones."""
+    with TempDir.create() as td:
+        logs = join(td, "logs")
+        cache = join(td, "cache.pickle")
+        run_experiment(base_dir=logs,
+                       instances=[lambda: OneMax(16), lambda: OneMax(24)],
+                       setups=[__setup], n_runs=3, n_threads=1)
+        plain: list[EndResult] = []
+        EndResult.from_logs(logs, plain.append)
+        plain.sort()
+
+        first: list[EndResult] = []
+        EndResult.from_logs(logs, first.append, cache_file=cache)
+        assert os.path.isfile(cache)
+        assert sorted(first) == plain
+        second: list[EndResult] = []
+        EndResult.from_logs(logs, second.append, cache_file=cache)
+        assert second == first
+        third: list[EndResult] = []
+        EndResult.from_logs(logs, third.append, n_workers=2,
+                            cache_file=cache)
+        assert third == first
+
+        # a changed log file must be parsed again
+        files = ExperimentParser().files(logs)
+        with open(files[0], encoding="utf-8") as f:
+            text = f.read()
+        with open(files[0], "w", encoding="utf-8") as f:
+            f.write(text.replace(f"totalFEs: {first[0].total_fes}",
+                                 "totalFEs: 99", 1))
+        os.utime(files[0], ns=(0, 0))
+        changed: list[EndResult] = []
+        EndResult.from_logs(logs, changed.append, cache_file=cache)
+        assert changed[0].total_fes == 99
+        assert changed[1:] == first[1:]
+
+        # a deleted log file must vanish from the results
+        os.remove(files[-1])
+        fewer: list[EndResult] = []
+        EndResult.from_logs(logs, fewer.append, cache_file=cache)
+        assert fewer == changed[:-1]
+
+        # progress with different options must not be mixed up
+        ms: list[Progress] = []
+        Progress.from_logs(logs, ms.append, time_unit="ms",
+                           cache_file=cache)
+        fes: list[Progress] = []
+        Progress.from_logs(logs, fes.append, time_unit="FEs",
+                           cache_file=cache)
+        assert [p.time_unit for p in ms] == ["ms"] * len(fewer)
+        assert [p.time_unit for p in fes] == ["FEs"] * len(fewer)
+        again: list[Progress] = []
+        Progress.from_logs(logs, again.append, time_unit="FEs",
+                           cache_file=cache)
+        assert len(again) == len(fes)
+        for a, b in zip(again, fes, strict=True):
+            assert (a.algorithm, a.instance, a.rand_seed) == (
+                b.algorithm, b.instance, b.rand_seed)
+            assert a.time.tolist() == b.time.tolist()
+            assert a.f.tolist() == b.f.tolist()
@@ -1,5 +1,7 @@
 """Test the sections parser."""
 
+from pytest import raises
+
 from moptipy.api import logging
 from moptipy.evaluation.log_parser import LogParser
 from moptipy.utils.logger import FileLogger
@@ -78,3 +80,49 @@ def test_sections_parser() -> None:
                 skip.key_value("x", "y")
         parser = _TestParser(str(tf))
         assert parser.parse_file(str(tf))
+
+
+class _RecordingParser(LogParser):
+    """A parser recording the lines of the sections it does not skip."""
+
+    def __init__(self, skip: str):
+        super().__init__()
+        self.skip = skip
+        self.sections: list[str] = []
+        self.lines_of: dict[str, list[str]] = {}
+
+    def start_section(self, title: str) -> bool:
+        self.sections.append(title)
+        return title != self.skip
+
+    def lines(self, lines: list[str]) -> bool:
+        self.lines_of[self.sections[-1]] = lines
+        return True
+
+
+def test_sections_parser_markers() -> None:
+    """Test that only complete end-marker lines close sections."""
+    text: str = ("# header\r\n\r\nBEGIN_A\r\nx: 1 # END_A\r\n"
+                 "END_AB\r\n  # END_A\r\ny: END_A\r\n  END_A  # end\r\n"
+                 "BEGIN_B\r\n")
+    with TempFile.create(suffix=logging.FILE_SUFFIX) as tf:
+        with open(tf, "wb") as f:
+            f.write(text.encode("utf-8") + b"\xff\xfe junk\nEND_B\n"
+                    b"BEGIN_C\nz\nEND_C")
+        parser = _RecordingParser("B")
+        parser.parse_file(str(tf))
+        assert parser.sections == ["A", "B", "C"]
+        assert parser.lines_of == {"A": ["x: 1", "END_AB", "y: END_A"],
+                                   "C": ["z"]}
+
+        with open(tf, "w", encoding="utf-16") as f:
+            f.write(text + "b\nEND_B")
+        parser = _RecordingParser("A")
+        parser.parse_file(str(tf))
+        assert parser.sections == ["A", "B"]
+        assert parser.lines_of == {"B": ["b"]}
+
+        with open(tf, "w", encoding="utf-8") as f:
+            f.write(text)
+        with raises(ValueError):
+            _RecordingParser("A").parse_file(str(tf))
@@ -0,0 +1,54 @@
+"""Test parsing log directories with several processes."""
+from moptipy.algorithms.so.rls import RLS
+from moptipy.api.execution import Execution
+from moptipy.api.experiment import run_experiment
+from moptipy.evaluation.end_results import EndResult
+from moptipy.evaluation.log_parser import ExperimentParser
+from moptipy.evaluation.progress import Progress
+from moptipy.examples.bitstrings.onemax import OneMax
+from moptipy.operators.bitstrings.op0_random import Op0Random
+from moptipy.operators.bitstrings.op1_flip1 import Op1Flip1
+from moptipy.spaces.bitstrings import BitStrings
+from moptipy.utils.temp import TempDir
+
+
+def __setup(problem: OneMax) -> Execution:
+    """
+    Create the execution for a OneMax problem.
+
+    :param problem: the problem
+    :returns: the execution
+    """
+    return Execution().set_solution_space(BitStrings(problem.n))\
+        .set_objective(problem).set_algorithm(RLS(Op0Random(), Op1Flip1()))\
+        .set_max_fes(200).set_log_improvements()
+
+
+def test_parallel_parsing() -> None:
+    """Test that parallel parsing is deterministic and complete."""
+    with TempDir.create() as td:
+        run_experiment(base_dir=td,
+                       instances=[lambda: OneMax(16), lambda: OneMax(24),
+                                  lambda: OneMax(32)],
+                       setups=[__setup], n_runs=5, n_threads=1)
+        files = ExperimentParser().files(td)
+        assert len(files) == 15
+        assert files == sorted(files)
+
+        serial: list[EndResult] = []
+        EndResult.from_logs(td, serial.append)
+        parallel: list[EndResult] = []
+        EndResult.from_logs(td, parallel.append, n_workers=3)
+        assert sorted(parallel) == sorted(serial)
+        assert [f"{e.algorithm}_{e.instance}_{hex(e.rand_seed)}.txt"
+                for e in parallel] == [f[f.rindex("/") + 1:] for f in files]
+        again: list[EndResult] = []
+        EndResult.from_logs(td, again.append, n_workers=4)
+        assert again == parallel
+
+        progress: list[Progress] = []
+        Progress.from_logs(td, progress.append, n_workers=2)
+        assert [(p.instance, p.rand_seed) for p in progress] == [
+            (e.instance, e.rand_seed) for e in parallel]
+        assert all(p.f[-1] == e.best_f for p, e in zip(
+            progress, parallel, strict=True))
@@ -0,0 +1,85 @@
+"""Test parsing the progress data from text log files."""
+import os
+
+import numpy as np
+
+from moptipy.api import logging
+from moptipy.evaluation.base import TIME_UNIT_FES, TIME_UNIT_MILLIS
+from moptipy.evaluation.progress import Progress
+from moptipy.utils.temp import TempDir
+
+
+def __write_log(base_dir: str, rows: list[str], total_fes: int,
+                total_time: int) -> None:
+    """
+    Write a text log file with the given progress rows.
+
+    :param base_dir: the base directory
+    :param rows: the rows of the progress section
+    :param total_fes: the total number of FEs
+    :param total_time: the total time in milliseconds
+    """
+    path = os.path.join(base_dir, "algo", "inst")
+    os.makedirs(path)
+    with open(os.path.join(path, "algo_inst_0x1.txt"), "w",
+              encoding="utf-8") as log:
+        log.write("\n".join([
+            f"BEGIN_{logging.SECTION_PROGRESS}",
+            f"{logging.PROGRESS_FES};{logging.PROGRESS_TIME_MILLIS};"
+            f"{logging.PROGRESS_CURRENT_F}", *rows,
+            f"END_{logging.SECTION_PROGRESS}",
+            f"BEGIN_{logging.SECTION_FINAL_STATE}",
+            f"{logging.KEY_TOTAL_FES}: {total_fes}",
+            f"{logging.KEY_TOTAL_TIME_MILLIS}: {total_time}",
+            f"END_{logging.SECTION_FINAL_STATE}",
+            f"BEGIN_{logging.SECTION_SETUP}",
+            "p.randSeed: 1",
+            f"END_{logging.SECTION_SETUP}", ""]))
+
+
+def __parse(base_dir: str, time_unit: str) -> Progress:
+    """
+    Parse the single progress record in a directory.
+
+    :param base_dir: the base directory
+    :param time_unit: the time unit
+    :returns: the progress record
+    """
+    progress: list[Progress] = []
+    Progress.from_logs(base_dir, progress.append, time_unit=time_unit)
+    assert len(progress) == 1
+    assert progress[0].algorithm == "algo"
+    assert progress[0].instance == "inst"
+    assert progress[0].rand_seed == 1
+    return progress[0]
+
+
+def test_progress_with_big_integers() -> None:
+    """Test that integers beyond 2**53 are parsed exactly."""
+    big = 2 ** 60
+    with TempDir.create() as td:
+        __write_log(td, [f"1;3;{big + 3}", f"2;4;{big + 1}",
+                         f"{big + 5};8;{big - 1}"], big + 7, 9)
+        p = __parse(td, TIME_UNIT_FES)
+    assert p.time.tolist() == [1, 2, big + 5, big + 7]
+    assert p.f.tolist() == [big + 3, big + 1, big - 1, big - 1]
+    assert np.issubdtype(p.f.dtype, np.integer)
+
+
+def test_progress_with_integers_and_inf() -> None:
+    """Test that integers mixed with `inf` stay integers."""
+    with TempDir.create() as td:
+        __write_log(td, ["1;5;inf", "2;5;7", "3;9;4.0"], 3, 9)
+        p = __parse(td, TIME_UNIT_MILLIS)
+    assert p.time.tolist() == [5, 9]
+    assert p.f.tolist() == [7, 4]
+    assert np.issubdtype(p.f.dtype, np.integer)
+
+
+def test_progress_with_floats() -> None:
+    """Test that floats and integral floats are parsed as numbers."""
+    with TempDir.create() as td:
+        __write_log(td, ["1;2;2.5", "3;4;2.0", "4;4;1.25"], 5, 6)
+        p = __parse(td, TIME_UNIT_FES)
+    assert p.time.tolist() == [1, 3, 4, 5]
+    assert p.f.tolist() == [2.5, 2.0, 1.25, 1.25]
@@ -1,11 +1,25 @@
 """Test the execution of an experiment and parsing the log files the JSSP."""
-from typing import Final
+from typing import Callable, Final
 
 import numpy as np
 
 import moptipy.evaluation.progress as prg
 from moptipy.evaluation.progress import Progress
-from moptipy.evaluation.stat_run import StatRun
+from moptipy.evaluation.stat_run import (
+    STAT_MAXIMUM,
+    STAT_MEAN_ARITH,
+    STAT_MEAN_GEOM,
+    STAT_MEAN_MINUS_STDDEV,
+    STAT_MEAN_PLUS_STDDEV,
+    STAT_MEDIAN,
+    STAT_MINIMUM,
+    STAT_Q10,
+    STAT_Q90,
+    STAT_Q159,
+    STAT_Q841,
+    STAT_STDDEV,
+    StatRun,
+)
 
 
 def test_stat_runs() -> None:
@@ -89,3 +103,62 @@ def test_stat_runs() -> None:
                                 [60.0, 50.0],
                                 [70.0, 41.0],
                                 [90, 40]])).all()
+
+
+def __random_progress(random: np.random.Generator, algorithm: str,
+                      seed: int) -> Progress:
+    """
+    Create a random progress object.
+
+    :param random: the random number generator
+    :param algorithm: the algorithm name
+    :param seed: the random seed of the run
+    :returns: the progress object
+    """
+    time = np.unique(random.integers(1, 1000, 40))
+    f = np.unique(random.integers(1, 10_000, len(time)))[::-1]
+    n = min(len(time), len(f))
+    return Progress(algorithm, "i", seed, time[:n], prg.TIME_UNIT_FES,
+                    f[:n].copy(), prg.F_NAME_RAW, None, True)
+
+
+def test_stat_runs_all_statistics() -> None:
+    """Test all statistics against a direct computation."""
+    random: Final[np.random.Generator] = np.random.default_rng(7)
+    stats: Final[dict[str, Callable]] = {
+        STAT_MINIMUM: np.min,
+        STAT_MEDIAN: np.median,
+        STAT_MEAN_ARITH: np.mean,
+        STAT_MEAN_GEOM: lambda v: np.exp(np.mean(np.log(v))),
+        STAT_MAXIMUM: np.max,
+        STAT_STDDEV: np.std,
+        STAT_MEAN_MINUS_STDDEV: lambda v: np.mean(v) - np.std(v),
+        STAT_MEAN_PLUS_STDDEV: lambda v: np.mean(v) + np.std(v),
+        STAT_Q10: lambda v: np.quantile(v, 0.1),
+        STAT_Q90: lambda v: np.quantile(v, 0.9),
+        STAT_Q159: lambda v: np.quantile(v, 0.15865525393145707),
+        STAT_Q841: lambda v: np.quantile(v, 0.8413447460685429),
+    }
+    progress: Final[list[Progress]] = [
+        __random_progress(random, algo, seed)
+        for algo, n in (("a", 7), ("b", 12), ("c", 1)) for seed in range(n)]
+
+    serial: Final[list[StatRun]] = []
+    StatRun.from_progress(progress, list(stats), serial.append)
+    assert [(s.algorithm, s.stat_name) for s in serial] == [
+        (a, n) for a in "abc" for n in stats]
+    parallel: Final[list[StatRun]] = []
+    StatRun.from_progress(progress, list(stats), parallel.append,
+                          n_threads=3)
+    assert len(parallel) == len(serial)
+    for s, p in zip(serial, parallel, strict=True):
+        assert (s.algorithm, s.stat_name) == (p.algorithm, p.stat_name)
+        assert np.array_equal(s.stat, p.stat)
+
+    for run in serial:
+        runs = [p for p in progress if p.algorithm == run.algorithm]
+        assert run.n == len(runs)
+        for t, v in run.stat:
+            values = np.array([p.f[np.searchsorted(p.time, t, "right") - 1]
+                               for p in runs], float)
+            assert np.isclose(v, stats[run.stat_name](values))
@@ -0,0 +1,47 @@
+"""Test the distance backends of the TSP."""
+import numpy as np
+from numpy.random import Generator, default_rng
+
+from moptipy.examples.tsp.distances import (
+    COORDINATE_KINDS,
+    coordinate_distances,
+    dense_distances,
+    distance,
+    distances_tour_length,
+    farthest_distances,
+    nearest_distances,
+    neighbor_cache,
+)
+
+# noinspection PyProtectedMember
+from moptipy.examples.tsp.instance import _COORD_DISTANCES
+from moptipy.examples.tsp.tour_length import tour_length
+
+
+def test_coordinate_distances() -> None:
+    """Test that the coordinate backends equal the distance matrices."""
+    random: Generator = default_rng()
+    for weight_type in COORDINATE_KINDS:
+        n: int = int(random.integers(2, 60))
+        coords = np.round(random.uniform(-90.0, 90.0, (n, 2)), 2) \
+            if weight_type == "GEO" else random.integers(0, 10_000, (n, 2))
+        matrix = _COORD_DISTANCES[weight_type](
+            np.array(coords, dtype=float)).astype(np.int64)
+        backends = [dense_distances(matrix)] + [
+            coordinate_distances(weight_type, coords, k) for k in (0, 1, 5)]
+        for backend in backends:
+            for i in range(n):
+                for j in range(n):
+                    assert distance(backend, i, j) == matrix[i, j]
+            x = random.permutation(n)
+            assert distances_tour_length(backend, x) == tour_length(matrix, x)
+            assert all(farthest_distances(backend) == matrix.max(axis=1))
+            assert all(nearest_distances(backend) == np.where(
+                matrix > 0, matrix, matrix.max() + 1).min(axis=1))
+        for backend, k in zip(backends, (0, 0, 1, 5)):
+            nn, nn_dist = neighbor_cache(backend)
+            assert nn.shape == nn_dist.shape == (n, min(k, n - 1))
+            for i in range(n):
+                assert i not in nn[i]
+                assert all(nn_dist[i] == matrix[i, nn[i]])
+                assert all(nn_dist[i, :-1] <= nn_dist[i, 1:])
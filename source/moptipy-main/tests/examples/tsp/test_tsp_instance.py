@@ -0,0 +1,89 @@
+"""Test loading TSP instances in the TSPLIB format."""
+import numpy as np
+from numpy.random import Generator, default_rng
+
+from moptipy.examples.tsp.instance import Instance
+
+#: the coordinates of the TSPLIB instance burma14
+_BURMA14 = [
+    "16.47 96.10", "16.47 94.44", "20.09 92.54", "22.39 93.37",
+    "25.23 97.24", "22.00 96.05", "20.47 97.02", "17.20 96.29",
+    "16.30 97.38", "14.05 98.12", "16.53 97.38", "21.52 95.59",
+    "19.41 97.13", "20.09 94.55"]
+
+
+def __tsplib(weight_type: str, section: list[str],
+             extra: list[str] | None = None) -> list[str]:
+    """Create the lines of a TSPLIB file."""
+    n = len(section) if weight_type != "EXPLICIT" else 4
+    return ["NAME : test", "COMMENT : a test instance", "TYPE : TSP",
+            f"DIMENSION : {n}", f"EDGE_WEIGHT_TYPE : {weight_type}",
+            *(extra or []),
+            "NODE_COORD_SECTION" if weight_type != "EXPLICIT"
+            else "EDGE_WEIGHT_SECTION",
+            *(section if weight_type == "EXPLICIT" else [
+                f"{i + 1} {s}" for i, s in enumerate(section)]), "EOF"]
+
+
+def test_load_geo() -> None:
+    """Test loading a `GEO` instance and its optimal tour."""
+    inst = Instance.from_text(__tsplib("GEO", _BURMA14))
+    assert inst.name == "test"
+    assert inst.n_cities == 14
+    assert inst.is_symmetric
+    assert inst.dtype == np.int16
+    tour = np.array([1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]) - 1
+    assert int(inst[tour, np.roll(tour, -1)].sum()) == 3323
+    assert inst.tour_length_lower_bound <= 3323 \
+        <= inst.tour_length_upper_bound
+
+
+def test_load_coordinates() -> None:
+    """Test loading the instances given by coordinates."""
+    coords = ["0 0", "3 4", "6 8", "0 8.5"]
+    euc = Instance.from_text(__tsplib("EUC_2D", coords), "euc")
+    assert euc.name == "euc"
+    assert np.array_equal(euc, [[0, 5, 10, 9], [5, 0, 5, 5],
+                                [10, 5, 0, 6], [9, 5, 6, 0]])
+    ceil = Instance.from_text(__tsplib("CEIL_2D", coords))
+    assert np.array_equal(ceil, [[0, 5, 10, 9], [5, 0, 5, 6],
+                                 [10, 5, 0, 7], [9, 6, 7, 0]])
+    att = Instance.from_text(__tsplib("ATT", coords))
+    assert np.array_equal(att, [[0, 2, 4, 3], [2, 0, 2, 2],
+                                [4, 2, 0, 2], [3, 2, 2, 0]])
+
+
+def test_load_explicit() -> None:
+    """Test loading explicit distance matrices in all formats."""
+    random: Generator = default_rng()
+    full = random.integers(1, 1000, (4, 4))
+    full = full + full.T
+    np.fill_diagonal(full, 0)
+    upper = [" ".join(map(str, full[i, i + 1:])) for i in range(3)]
+    upper_diag = [" ".join(map(str, full[i, i:])) for i in range(4)]
+    lower = [" ".join(map(str, full[i, :i])) for i in range(1, 4)]
+    lower_diag = [" ".join(map(str, full[i, :i + 1])) for i in range(4)]
+    for fmt, section in [
+            ("FULL_MATRIX", [" ".join(map(str, r)) for r in full]),
+            ("UPPER_ROW", upper), ("LOWER_COL", upper),
+            ("UPPER_DIAG_ROW", upper_diag), ("LOWER_DIAG_COL", upper_diag),
+            ("LOWER_ROW", lower), ("UPPER_COL", lower),
+            ("LOWER_DIAG_ROW", lower_diag), ("UPPER_DIAG_COL", lower_diag)]:
+        inst = Instance.from_text(__tsplib(
+            "EXPLICIT", section, [f"EDGE_WEIGHT_FORMAT: {fmt}"]))
+        assert inst.n_cities == 4
+        assert inst.is_symmetric
+        assert np.array_equal(inst, full)
+
+
+def test_lower_bound() -> None:
+    """Test that given lower bounds are used and checked."""
+    lines = __tsplib("GEO", _BURMA14)
+    assert Instance.from_text(
+        lines, tour_length_lower_bound=3323).tour_length_lower_bound == 3323
+    try:
+        Instance.from_text(lines, tour_length_lower_bound=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("lower bound below computed bound accepted")
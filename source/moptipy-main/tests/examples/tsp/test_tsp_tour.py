@@ -0,0 +1,51 @@
+"""Test the tour representations for segment reversals."""
+import numpy as np
+from numpy.random import Generator, default_rng
+
+from moptipy.examples.tsp.tour import ArrayTour, TwoLevelTour, reverse_shorter
+
+
+def _edges(x: np.ndarray) -> set[frozenset[int]]:
+    """Get the undirected edges of a tour."""
+    return {frozenset((int(x[i - 1]), int(x[i]))) for i in range(len(x))}
+
+
+def test_reverse_shorter() -> None:
+    """Test that the shorter reversal yields the same cyclic tour."""
+    random: Generator = default_rng()
+    for n in range(3, 30):
+        x: np.ndarray = random.permutation(n)
+        for _ in range(20):
+            i = int(random.integers(n))
+            j = int(random.integers(i, n))
+            expected = x.copy()
+            expected[i:j + 1] = expected[i:j + 1][::-1]
+            reverse_shorter(x, i, j)
+            assert sorted(x) == list(range(n))
+            assert _edges(x) == _edges(expected)
+
+
+def test_tours() -> None:
+    """Test the array tour and the two-level tour against each other."""
+    random: Generator = default_rng()
+    for n in (1, 2, 3, 5, 10, 37, 200):
+        x: np.ndarray = random.permutation(n)
+        tours = (ArrayTour(x), TwoLevelTour(x))
+        for _ in range(500):
+            a, b = (int(v) for v in random.integers(n, size=2))
+            for tour in tours:
+                tour.reverse(a, b)
+            arrays = [tour.to_array() for tour in tours]
+            assert sorted(arrays[1]) == list(range(n))
+            assert _edges(arrays[0]) == _edges(arrays[1])
+            for tour, arr in zip(tours, arrays):
+                assert len(tour) == n
+                pos = np.empty(n, int)
+                pos[arr] = np.arange(n)
+                a, b, c = (int(v) for v in random.integers(n, size=3))
+                assert tour.next(a) == arr[(pos[a] + 1) % n]
+                assert tour.prev(a) == arr[pos[a] - 1]
+                assert tour.between(a, b, c) == (
+                    ((pos[b] - pos[a]) % n) <= ((pos[c] - pos[a]) % n))
+        dest = np.empty(n, np.int64)
+        assert tours[1].to_array(dest) is dest
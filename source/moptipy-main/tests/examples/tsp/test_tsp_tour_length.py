@@ -0,0 +1,43 @@
+"""Test the tour length objective function of the TSP."""
+import numpy as np
+from numpy.random import Generator, default_rng
+
+from moptipy.examples.tsp.instance import Instance
+from moptipy.examples.tsp.tour_length import TourLength
+from moptipy.spaces.permutations import Permutations
+from moptipy.tests.objective import validate_objective
+
+
+def _tour_length(matrix: np.ndarray, x: np.ndarray) -> int:
+    """The comparison implementation of the tour length."""
+    result: int = 0
+    for i in range(len(x)):
+        result += int(matrix[x[i - 1]][x[i]])
+    return result
+
+
+def test_tour_length() -> None:
+    """Test the tour length objective function."""
+    random: Generator = default_rng()
+    n: int = int(random.integers(3, 40))
+    matrix = random.integers(1, 100_000, (n, n))
+    np.fill_diagonal(matrix, 0)
+    inst: Instance = Instance("rnd", None, matrix)
+    assert not inst.is_symmetric
+    space: Permutations = Permutations.standard(n)
+    f: TourLength = TourLength(inst)
+    assert str(f) == "tourLength"
+    assert f.is_always_integer()
+
+    def __valid(r: Generator, x: np.ndarray) -> np.ndarray:
+        x[:] = r.permutation(n)
+        return x
+
+    validate_objective(
+        objective=f,
+        solution_space=space,
+        make_solution_space_element_valid=__valid,
+        is_deterministic=True,
+        lower_bound_threshold=inst.tour_length_lower_bound,
+        upper_bound_threshold=inst.tour_length_upper_bound,
+        must_be_equal_to=lambda xx: _tour_length(matrix, xx))
@@ -0,0 +1,133 @@
+"""Test the neighbor-list based 2-opt operators."""
+from typing import Final
+
+import numpy as np
+from numpy.random import Generator, default_rng
+
+# noinspection PyProtectedMember
+from moptipy.operators.permutations.op1_2opt_nn import (
+    Op1TwoOptLS,
+    Op1TwoOptNN,
+    _local_search,
+    nearest_neighbors,
+)
+from moptipy.spaces.permutations import Permutations
+from moptipy.tests.on_permutations import validate_op1_on_1_permutations
+
+
+def __distances(random: Generator, n: int) -> np.ndarray:
+    """
+    Create a random symmetric distance matrix.
+
+    :param random: the random number generator
+    :param n: the number of cities
+    :returns: the distance matrix
+    """
+    points: Final[np.ndarray] = random.integers(0, 1000, (n, 2))
+    return np.rint(np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2)
+                           .sum(axis=2))).astype(np.int32)
+
+
+def __tour_length(distances: np.ndarray, x: np.ndarray) -> int:
+    """
+    Compute the length of a tour.
+
+    :param distances: the distance matrix
+    :param x: the tour
+    :returns: the tour length
+    """
+    return int(distances[x, np.roll(x, -1)].sum())
+
+
+def test_nearest_neighbors() -> None:
+    """Test the computation of the neighbor lists."""
+    random: Final[Generator] = default_rng()
+    for n in (2, 3, 10, 50):
+        distances = __distances(random, n)
+        for k in (1, 5, 100):
+            nn = nearest_neighbors(distances, k)
+            assert nn.shape == (n, min(k, n - 1))
+            for i in range(n):
+                assert i not in nn[i]
+                d = distances[i, nn[i]]
+                assert all(d[:-1] <= d[1:])
+                others = np.delete(distances[i], np.append(nn[i], i))
+                if others.size > 0:
+                    assert d[-1] <= others.min()
+
+
+def test_op1_2opt_nn() -> None:
+    """Test the random neighbor-list 2-opt move."""
+    random: Final[Generator] = default_rng()
+    for n in (4, 5, 9, 30):
+        validate_op1_on_1_permutations(
+            Op1TwoOptNN(__distances(random, n), 3), Permutations.standard(n),
+            min_unique_samples=2)
+
+
+def test_op1_2opt_ls() -> None:
+    """Test the neighbor-list 2-opt/Or-opt local search operator."""
+    random: Final[Generator] = default_rng()
+    for n in (4, 5, 9, 30):
+        validate_op1_on_1_permutations(
+            Op1TwoOptLS(__distances(random, n), 5), Permutations.standard(n),
+            min_unique_samples=2)
+
+
+def test_local_search_improves() -> None:
+    """Test that the local search never makes a tour longer."""
+    random: Final[Generator] = default_rng()
+    for n in (5, 8, 13, 100):
+        distances = __distances(random, n)
+        nn = nearest_neighbors(distances, 6)
+        pos = np.empty(n, np.int64)
+        for _ in range(10):
+            x = random.permutation(n)
+            before = __tour_length(distances, x)
+            _local_search(x, pos, distances, nn, np.empty(n, np.int64),
+                          np.empty(n, np.bool_), np.empty(6, np.int64), 0)
+            assert sorted(x) == list(range(n))
+            assert all(pos[x] == np.arange(n))
+            assert __tour_length(distances, x) <= before
+
+
+def test_local_search_from_given_cities() -> None:
+    """Test the local search starting with only some cities."""
+    random: Final[Generator] = default_rng()
+    for n in (8, 13, 100):
+        distances = __distances(random, n)
+        nn = nearest_neighbors(distances, 6)
+        pos = np.empty(n, np.int64)
+        queue = np.empty(n, np.int64)
+        active = np.empty(n, np.bool_)
+        touched = np.empty(6, np.int64)
+        x = random.permutation(n)
+        _local_search(x, pos, distances, nn, queue, active, touched, 0)
+        for _ in range(10):
+            y = x.copy()  # a local optimum stays unchanged
+            queue[0:4] = random.choice(n, 4)
+            _local_search(y, pos, distances, nn, queue, active, touched, 4)
+            assert np.array_equal(x, y)
+
+            y = random.permutation(n)
+            before = __tour_length(distances, y)
+            queue[0:6] = y[0:6]
+            _local_search(y, pos, distances, nn, queue, active, touched, 6)
+            assert sorted(y) == list(range(n))
+            assert all(pos[y] == np.arange(n))
+            assert __tour_length(distances, y) <= before
+
+
+def test_op1_2opt_ls_iterated() -> None:
+    """Test the operator applied to its own results."""
+    random: Final[Generator] = default_rng()
+    n: Final[int] = 60
+    distances: Final[np.ndarray] = __distances(random, n)
+    op: Final[Op1TwoOptLS] = Op1TwoOptLS(distances, 6)
+    x = random.permutation(n)
+    dest = np.empty(n, x.dtype)
+    for _ in range(50):
+        op.op1(random, dest, x)
+        assert sorted(dest) == list(range(n))
+        if __tour_length(distances, dest) <= __tour_length(distances, x):
+            x, dest = dest, x
@@ -1,5 +1,11 @@
 """Test the simple cache."""
-from moptipy.utils.cache import is_new
+from threading import Lock, Thread
+from time import sleep
+from typing import Callable
+
+import numpy as np
+
+from moptipy.utils.cache import is_new, lru_loader
 
 
 def test_is_new() -> None:
@@ -32,3 +38,53 @@ def test_is_new() -> None:
     assert not is_new_3("b")
     assert not is_new_3("c")
     assert not is_new_3("a")
+
+
+def test_lru_loader() -> None:
+    """Test the size-aware LRU memoization of factories."""
+    created: list[int] = []
+
+    def make(i: int) -> Callable[[], np.ndarray]:
+        def __make() -> np.ndarray:
+            created.append(i)
+            return np.zeros(i, np.int8)
+        return __make
+
+    f10, f20, f30 = make(10), make(20), make(30)
+    load = lru_loader(50)
+    a = load(f10)
+    assert load(f10) is a
+    assert load(f20) is load(f20)
+    assert created == [10, 20]
+    assert load(f10) is a  # f10 is now the most recently used one
+    load(f30)  # 60 bytes > 50, so f20 is evicted
+    assert load(f10) is a
+    load(f20)
+    assert created == [10, 20, 30, 20]
+
+    big = lru_loader(5)
+    b = big(f10)  # too large, but the most recently used one is kept
+    assert big(f10) is b
+    assert created == [10, 20, 30, 20, 10]
+
+
+def test_lru_loader_shared_by_threads() -> None:
+    """Test that a locked LRU cache creates each object only once."""
+    created: list[int] = []
+
+    def make() -> np.ndarray:
+        created.append(1)
+        sleep(0.05)  # give the other threads time to ask for the object
+        return np.zeros(10, np.int8)
+
+    load = lru_loader(50, lock=Lock())
+    results: list[np.ndarray] = []
+    threads = [Thread(target=lambda: results.append(load(make)))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert created == [1]
+    assert len(results) == 4
+    assert all(r is results[0] for r in results)
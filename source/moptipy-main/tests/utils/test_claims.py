@@ -0,0 +1,75 @@
+"""Test the crash-safe claims of runs."""
+import os
+import socket
+from time import time
+
+from moptipy.utils.claims import Claim
+from moptipy.utils.temp import TempDir
+
+
+def test_claims() -> None:
+    """Test that live claims block, stale claims are taken over."""
+    with TempDir.create() as td:
+        log = td.resolve_inside("run.txt")
+        claim = Claim.acquire(log)
+        assert claim is not None
+        assert Claim.acquire(log) is None
+        with claim:
+            claim.part_file.write_all("incomplete")
+        assert not os.path.exists(log)
+        assert not os.path.exists(claim.part_file)
+        assert not os.path.exists(claim.claim_file)
+
+        # a claim of a process that no longer exists on this host
+        claim.claim_file.write_all(
+            f"{socket.gethostname()}\n{2 ** 30}\nabc\n{time()}")
+        part = td.resolve_inside("run.txt.abc.part")
+        part.write_all("incomplete")
+        claim = Claim.acquire(log)
+        assert claim is not None
+        assert not os.path.exists(part)
+        with claim:
+            claim.part_file.write_all("complete")
+            claim.commit()
+        assert log.read_all_str().strip() == "complete"
+        assert Claim.acquire(log) is None
+
+        # claims of other hosts are stale only if their heartbeat is old
+        log = td.resolve_inside("run2.txt")
+        claim_file = log + ".claim"
+        with open(claim_file, "w", encoding="utf-8") as f:
+            f.write(f"other-host-{os.getpid()}\n1\nabc\n{time()}")
+        assert Claim.acquire(log) is None
+        with open(claim_file, "w", encoding="utf-8") as f:
+            f.write(f"other-host-{os.getpid()}\n1\nabc\n{time() - 1000}")
+        os.utime(claim_file, (time() - 1000, time() - 1000))
+        claim = Claim.acquire(log, stale_seconds=100)
+        assert claim is not None
+        with claim:
+            assert not claim.lost
+        assert not os.path.exists(claim_file)
+
+
+def test_claim_taken_over_before_commit() -> None:
+    """Test that a claim taken over by another node does not commit."""
+    with TempDir.create() as td:
+        log = td.resolve_inside("run.txt")
+        claim = Claim.acquire(log)
+        assert claim is not None
+        with claim:
+            claim.part_file.write_all("old")
+            # the claim looks stale, e.g., after the node was suspended
+            token = claim.claim_file.read_all_str().split("\n")[2]
+            claim.claim_file.write_all(
+                f"{socket.gethostname()}\n{2 ** 30}\n{token}\n{time()}")
+            other = Claim.acquire(log)
+            assert other is not None
+            assert not os.path.exists(claim.part_file)
+            with other:
+                other.part_file.write_all("new")
+                assert not claim.commit()
+                assert claim.lost
+                assert other.commit()
+            assert log.read_all_str().strip() == "new"
+        assert log.read_all_str().strip() == "new"
+        assert not os.path.exists(claim.claim_file)
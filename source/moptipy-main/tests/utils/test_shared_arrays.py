@@ -0,0 +1,49 @@
+"""Test moving arrays into shared memory."""
+import multiprocessing as mp
+
+import numpy as np
+
+from moptipy.examples.jssp.instance import Instance as JSSPInstance
+from moptipy.examples.tsp.instance import Instance as TSPInstance
+from moptipy.utils.shared_arrays import SharedArrays
+
+
+def __sum_in_child(arr: np.ndarray, result) -> None:
+    """
+    Compute the sum of an array in a child process.
+
+    :param arr: the array
+    :param result: the shared value receiving the sum
+    """
+    result.value = int(arr.sum())
+
+
+def test_share_instances() -> None:
+    """Test that shared instances equal their originals."""
+    with SharedArrays(min_bytes=1) as sa:
+        for inst in (JSSPInstance.from_resource("abz7"),
+                     TSPInstance.from_text([
+                         "NAME: x4", "TYPE: TSP", "DIMENSION: 4",
+                         "EDGE_WEIGHT_TYPE: EXPLICIT",
+                         "EDGE_WEIGHT_FORMAT: UPPER_ROW",
+                         "EDGE_WEIGHT_SECTION", "1 2 3", "4 5", "6", "EOF"])):
+            shared = sa.share(inst)
+            assert shared is not inst
+            assert isinstance(shared, type(inst))
+            assert type(shared.base).__name__ == "mmap"
+            assert np.array_equal(shared, inst)
+            assert shared.name == inst.name
+            assert str(shared) == str(inst)
+            assert sa.share(inst) is shared
+
+
+def test_share_with_child_process() -> None:
+    """Test that a forked child process sees the shared array."""
+    with SharedArrays(min_bytes=1) as sa:
+        arr = sa.array(np.arange(1000, dtype=np.int64))
+        result = mp.get_context("fork").Value("q", 0)
+        proc = mp.get_context("fork").Process(
+            target=__sum_in_child, args=(arr, result))
+        proc.start()
+        proc.join()
+        assert result.value == 499500
@@ -171,11 +171,13 @@ run_experiment(
     instances=problems,  # define the problem instances
     setups=[make_fsa, make_eafea2revn, make_eafearevn, make_fearevn, make_revn, make_safea, make_sarevn, make_safea2],  # setups
     n_runs=1,  # 51 runs to do
-    n_threads=1)  # we use only a single thread here
+    n_threads=1,  # we use only a single thread here
+    checkpoint_interval_millis=None)  # e.g., 600_000 saves each run every 10 minutes, so it can be resumed
 
 
 data = []  # we will load the data into this list
-EndResult.from_logs(td, data.append)  # load all end results
+EndResult.from_logs(td, data.append,  # load all end results
+                    n_workers=os.cpu_count() or 1)  # parse in parallel
 
 file = tabulate_end_results(data, dir_name=td)  # create the table
 print(f"\nnow presenting markdown data from file '{file}'.\n")
@@ -1,30 +1,9 @@
 from moptipy.api.process import Process
 from moptipy.api.algorithm import Algorithm
-from moptipy.examples.tsp.instance import Instance
-import numba  # type: ignore
+from instance import Instance
 import numpy as np
-
-
-@numba.njit(nogil=True)
-def _my_loop_body(i: int,
-                  j: int,
-                  n: int,
-                  matrix: np.ndarray,
-                  x: np.ndarray,
-                  y: int) -> int:
-    """Check a move, apply it if it is better, return new y."""
-    im1 = ((i - 1) + n) % n
-    jp1 = (j + 1) % n
-
-    dy = -matrix[x[im1] - 1][x[i] - 1] - matrix[x[j] - 1][x[jp1] - 1] + \
-        +matrix[x[im1] - 1][x[j] - 1] + matrix[x[i] - 1][x[jp1] - 1]
-    if dy <= 0:
-        if i == 0:
-            x[0:j + 1:1] = x[j::-1]
-        else:
-            x[i:j + 1:1] = x[j:i - 1:-1]  # Reverse the subsequence from i to j in solution x
-        return y + dy
-    return y
+from tspengine import (
+    CHUNK_SIZE, MoveBuffer, budget_of, ea_steps, hand_back)
 
 
 class MyEaAlgorithm(Algorithm):
@@ -33,7 +12,7 @@ class MyEaAlgorithm(Algorithm):
     def __init__(self, ins: Instance) -> None:
         self.name = ins.name
         self.city_number = ins.city_number
-        self.cost_tsp = ins.cost_tsp
+        self.distances = ins.distances
         self.LB = 0
         self.UB = ins.UB
 
@@ -47,26 +26,34 @@ class MyEaAlgorithm(Algorithm):
         """
 
         random = process.get_random()
-        register = process.register
+        register_block = process.register_block
+        log_all = process.logs_all_fes()  # are all FEs logged?
         should_terminate = process.should_terminate
-        ri = random.integers
 
+        resumed = process.get_resumed_state()  # the state of an interrupted run, if any
         x = process.create()
         x[:] = range(self.city_number)
-        random.shuffle(x)  # randomly generate an initial solution
-        y = process.evaluate(x)  # get the tour length of this solution
+        if resumed is None:
+            random.shuffle(x)  # randomly generate an initial solution
+            y = int(process.evaluate(x))  # get the tour length of this solution
+        else:  # the whole state is restored right before the loop
+            y = resumed[1]
         n = self.city_number
-        matrix = self.cost_tsp
+        dist = self.distances
+        fs = np.empty(CHUNK_SIZE, dtype=np.int64)  # the values of one chunk
+        moves = MoveBuffer(random, n)  # the pre-drawn random moves
+
+        if resumed is not None:  # continue exactly where the run was interrupted
+            x, y, buffered = resumed
+            moves.restore(buffered)
 
         while not should_terminate():
-            i = ri(n-1)
-            j = ri(n-1)
-            if i > j:
-                i, j = j, i
-            if (i == j) or (i == 0 and j == n - 2):
-                continue
-            y = _my_loop_body(i, j, n, matrix, x, y)
-            register(x, y)
+            budget = budget_of(process)
+            steps, y = ea_steps(moves.take(budget)[0], dist, n, x, y,
+                                int(process.get_best_f()), fs, budget)
+            moves.advance(steps)
+            hand_back(register_block, fs, steps, x, log_all)
+            process.checkpoint(lambda: (x, y, moves.state()))
 
     def __str__(self):
         """
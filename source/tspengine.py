@@ -0,0 +1,386 @@
+"""
+A fused run-loop engine for the TSP algorithms with reversing operator.
+
+The algorithms in the `tsp*.py` files used to run their main loop in Python:
+each iteration drew two random indices, called a small compiled loop body,
+and registered one FE with the process. This module instead provides compiled
+kernels that perform whole chunks of iterations in one call. They do not
+call the `Generator` of the process per iteration. Instead, a
+:class:`MoveBuffer` draws the moves and uniform random numbers in large
+vectorized blocks, and the kernels read them from its arrays `moves` and `es`.
+
+The SA kernels keep the temperature `t` as state: It is multiplied by `decay`
+after every SA iteration and handed back to the caller, so that the schedule
+continues with the next chunk. Non-worsening moves are always accepted. A
+worsening move by `d > 0` is accepted with probability `exp(-d / t)`, which
+is done via the equivalent test `d < t * e`, where `e = -ln(1 - u)` is a
+pre-drawn exponentially distributed random number computed from a uniform
+`u` in `[0, 1)`. The kernels thus never compute `exp` or a power.
+An accepted move reverses either `x[i:j+1]` or the complementary part of the
+tour, whichever is shorter (see
+:func:`~moptipy.examples.tsp.tour.reverse_shorter`). Both give the same cyclic
+tour, but the arrays and hence the subsequent moves differ from those of the
+original loops.
+
+All distances are read via :func:`~moptipy.examples.tsp.distances.distance`
+from the backend `dist` of the instance, which holds either a dense matrix or
+the node coordinates. Both are stored shifted by one city, since the scripts
+look up city `c` as `c - 1`.
+
+A kernel stops after at most `budget` FEs or directly after the first FE
+that improves upon the best-so-far objective value `best_f` of the process.
+The FFA kernels keep their frequencies in a
+:class:`~moptipy.algorithms.so.ffa_h.FrequencyTable`, which is passed in as
+its arrays `h` and `keys` and its lower bound `lb`.
+
+The objective values of all FEs of the chunk are written into the buffer `fs`.
+The whole chunk is then credited to the process with a single call to
+:meth:`~moptipy.api.process.Process.register_block` via :func:`hand_back`,
+together with the values of all of its FEs if the process logs all FEs.
+"""
+from typing import Callable, Final
+
+import numba  # type: ignore
+import numpy as np
+from moptipy.algorithms.so.ffa_h import FrequencyTable, h_add, h_get
+from moptipy.api.process import Process
+from moptipy.examples.tsp.distances import distance
+from moptipy.examples.tsp.tour import reverse_shorter
+from numpy.random import Generator
+
+#: the maximum number of FEs performed by one kernel invocation
+CHUNK_SIZE: Final[int] = 65_536
+
+
+@numba.njit(nogil=True, inline="always")
+def _delta(dist: tuple, n: int, x: np.ndarray, i: int, j: int) -> int:
+    """Compute the change of the tour length if `x[i:j+1]` is reversed."""
+    im1 = ((i - 1) + n) % n
+    jp1 = (j + 1) % n
+    return (distance(dist, x[im1], x[j]) + distance(dist, x[i], x[jp1])
+            - distance(dist, x[im1], x[i]) - distance(dist, x[j], x[jp1]))
+
+
+class MoveBuffer:
+    """
+    A buffer of pre-drawn random moves for the kernels.
+
+    Each block of `block` raw moves is drawn with a single call to
+    `random.integers` and, if `exponentials`, followed by `block` uniform
+    random numbers `u` drawn with a single call to `random.random`, which are
+    turned into the exponentially distributed numbers `-ln(1 - u)` at once.
+    The index pairs of
+    each move are sorted and invalid moves (`i == j` or the reversal of
+    the whole tour `x[0:n-1]`) are discarded without consuming an FE, exactly
+    like the `continue` statements in the original Python loops. Since the
+    blocks always have the same size, the sequence of moves served only
+    depends on the seed of the process and not on the chunk sizes.
+
+    >>> from numpy.random import default_rng
+    >>> mb = MoveBuffer(default_rng(1), 10, True, 8)
+    >>> moves, es = mb.take(5)
+    >>> bool(np.all(moves[:, 0] < moves[:, 1])), len(moves), len(es)
+    (True, 5, 5)
+    >>> bool(np.all(es >= 0.0))
+    True
+    >>> mb.advance(2)
+    >>> bool(np.all(mb.take(5)[0] == np.concatenate((moves[2:], mb.take(
+    ...     5)[0][3:]))))
+    True
+    >>> mb2 = MoveBuffer(default_rng(2), 10, True, 8)
+    >>> mb2.restore(mb.state())
+    >>> bool(np.all(mb2.take(3)[0] == mb.take(3)[0]))
+    True
+    """
+
+    def __init__(self, random: Generator, n: int, exponentials: bool = False,
+                 block: int = CHUNK_SIZE) -> None:
+        """
+        Create the move buffer.
+
+        :param random: the random number generator of the process
+        :param n: the number of cities
+        :param exponentials: should exponentially distributed random numbers
+            be drawn as well?
+        :param block: the number of raw moves drawn at once
+        """
+        #: the random number generator
+        self.__random: Final[Generator] = random
+        #: the number of cities minus one
+        self.__nm1: Final[int] = n - 1
+        #: should exponentially distributed random numbers be drawn?
+        self.__exponentials: Final[bool] = exponentials
+        #: the block size
+        self.__block: Final[int] = block
+        #: the buffered moves
+        self.__moves: np.ndarray = np.empty((0, 2), np.int64)
+        #: the buffered exponentially distributed random numbers
+        self.__es: np.ndarray = np.empty(0)
+        #: the index of the next move to serve
+        self.__pos: int = 0
+
+    def take(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the next `count` moves and exponential random numbers.
+
+        The moves are not consumed before :meth:`advance` is called.
+
+        :param count: the number of moves needed
+        :returns: the `count*2` array of moves `(i, j)` with `i < j` and the
+            array of `count` exponentially distributed random numbers, which
+            is empty if the buffer draws no such numbers
+        """
+        pos: int = self.__pos
+        if len(self.__moves) - pos < count:
+            moves: list[np.ndarray] = [self.__moves[pos:]]
+            es: list[np.ndarray] = [self.__es[pos:]]
+            have: int = len(moves[0])
+            nm1: Final[int] = self.__nm1
+            while have < count:
+                ij = np.sort(self.__random.integers(
+                    0, nm1, (self.__block, 2)), axis=1)
+                valid = (ij[:, 0] != ij[:, 1]) & (
+                    (ij[:, 0] != 0) | (ij[:, 1] != nm1 - 1))
+                moves.append(ij[valid])
+                if self.__exponentials:
+                    es.append(-np.log1p(
+                        -self.__random.random(self.__block)[valid]))
+                have += len(moves[-1])
+            self.__moves = np.concatenate(moves)
+            self.__es = np.concatenate(es)
+            self.__pos = pos = 0
+        return (self.__moves[pos:pos + count],
+                self.__es[pos:pos + count] if self.__exponentials
+                else self.__es)
+
+    def advance(self, steps: int) -> None:
+        """
+        Consume the moves used by a kernel.
+
+        :param steps: the number of moves to consume
+        """
+        self.__pos += steps
+
+    def state(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the buffered moves that have not been consumed yet.
+
+        Together with the state of the random number generator, they fully
+        determine all future moves, so they belong into a checkpoint.
+
+        :returns: the remaining moves and exponential random numbers
+        """
+        return self.__moves[self.__pos:], self.__es[self.__pos:]
+
+    def restore(self, state: tuple[np.ndarray, np.ndarray]) -> None:
+        """
+        Restore the buffer from a checkpoint.
+
+        :param state: the buffered moves as returned by :meth:`state`
+        """
+        self.__moves, self.__es = state
+        self.__pos = 0
+
+
+@numba.njit(nogil=True)
+def ea_steps(moves: np.ndarray, dist: tuple, n: int, x: np.ndarray,
+             y: int, best_f: int, fs: np.ndarray,
+             budget: int) -> tuple[int, int]:
+    """
+    Perform up to `budget` iterations of the (1+1) EA.
+
+    :returns: the number of FEs performed and the new objective value of `x`
+    """
+    steps = 0
+    while steps < budget:
+        i = moves[steps, 0]
+        j = moves[steps, 1]
+        dy = _delta(dist, n, x, i, j)
+        if dy <= 0:
+            reverse_shorter(x, i, j)
+            y += dy
+        fs[steps] = y
+        steps += 1
+        if y < best_f:
+            break
+    return steps, y
+
+
+@numba.njit(nogil=True)
+def fea_steps(moves: np.ndarray, dist: tuple, n: int, x: np.ndarray,
+              y: int, h: np.ndarray, keys: np.ndarray, lb: int, best_f: int,
+              fs: np.ndarray, budget: int) -> tuple[int, int]:
+    """
+    Perform up to `budget` iterations of the (1+1) FEA.
+
+    :returns: the number of FEs performed and the new objective value of `x`
+    """
+    steps = 0
+    while steps < budget:
+        i = moves[steps, 0]
+        j = moves[steps, 1]
+        y2 = y + _delta(dist, n, x, i, j)
+        h_add(h, keys, lb, y)
+        h_add(h, keys, lb, y2)
+        if h_get(h, keys, lb, y2) <= h_get(h, keys, lb, y):
+            reverse_shorter(x, i, j)
+            y = y2
+        fs[steps] = y
+        steps += 1
+        if y < best_f:
+            break
+    return steps, y
+
+
+@numba.njit(nogil=True)
+def sa_steps(moves: np.ndarray, es: np.ndarray, dist: tuple, n: int,
+             x: np.ndarray, y: int, t: float, decay: float, best_f: int,
+             fs: np.ndarray, budget: int) -> tuple[int, int, float]:
+    """
+    Perform up to `budget` iterations of simulated annealing.
+
+    :returns: the number of FEs performed, the new objective value of `x`,
+        and the temperature for the next iteration
+    """
+    steps = 0
+    while steps < budget:
+        i = moves[steps, 0]
+        j = moves[steps, 1]
+        dy = _delta(dist, n, x, i, j)
+        if (dy <= 0) or (dy < t * es[steps]):
+            reverse_shorter(x, i, j)
+            y += dy
+        t *= decay
+        fs[steps] = y
+        steps += 1
+        if y < best_f:
+            break
+    return steps, y, t
+
+
+@numba.njit(nogil=True)
+def fsa_steps(moves: np.ndarray, es: np.ndarray, dist: tuple, n: int,
+              x: np.ndarray, y: int, h: np.ndarray, keys: np.ndarray,
+              lb: int, t: float, decay: float, best_f: int,
+              fs: np.ndarray, budget: int) -> tuple[int, int, float]:
+    """
+    Perform up to `budget` iterations of SA with FFA.
+
+    :returns: the number of FEs performed, the new objective value of `x`,
+        and the temperature for the next iteration
+    """
+    steps = 0
+    while steps < budget:
+        i = moves[steps, 0]
+        j = moves[steps, 1]
+        y2 = y + _delta(dist, n, x, i, j)
+        h_add(h, keys, lb, y)
+        h_add(h, keys, lb, y2)
+        dh = h_get(h, keys, lb, y2) - h_get(h, keys, lb, y)
+        if (dh <= 0) or (dh < t * es[steps]):
+            reverse_shorter(x, i, j)
+            y = y2
+        t *= decay
+        fs[steps] = y
+        steps += 1
+        if y < best_f:
+            break
+    return steps, y, t
+
+
+@numba.njit(nogil=True)
+def hybrid_steps(moves: np.ndarray, es: np.ndarray, dist: tuple, n: int,
+                 xc: np.ndarray, yc: int, xd: np.ndarray, yd: int,
+                 h: np.ndarray, keys: np.ndarray, lb: int,
+                 use_ffa: bool, copy_new: bool,
+                 use_sa: bool, t: float, decay: float,
+                 best_f: int, fs: np.ndarray,
+                 budget: int) -> tuple[int, int, int, bool, float]:
+    """
+    Perform up to `budget` iterations of an EAFEA or SAFEA hybrid.
+
+    The hybrid alternates between the FEA working on `xd` and the EA (or SA,
+    if `use_sa`) working on `xc`. The FEA solution is copied over to `xc` if
+    its objective value is entirely new (if `copy_new`, the "A" variants) or
+    if it is not worse than `yc` (the "B" variants).
+
+    :returns: the number of FEs performed, the new `yc`, the new `yd`, the
+        new `use_ffa` flag, which also tells whether the solution registered
+        last was `xd`, and the temperature for the next SA iteration
+    """
+    steps = 0
+    while steps < budget:
+        i = moves[steps, 0]
+        j = moves[steps, 1]
+        use_ffa = not use_ffa
+        if use_ffa:
+            y2 = yd + _delta(dist, n, xd, i, j)
+            h_add(h, keys, lb, yd)
+            h_add(h, keys, lb, y2)
+            if h_get(h, keys, lb, y2) <= h_get(h, keys, lb, yd):
+                reverse_shorter(xd, i, j)
+                yd = y2
+            if (h_get(h, keys, lb, yd) <= 1) if copy_new else (yd <= yc):
+                yc = yd
+                xc[:] = xd
+            fs[steps] = yd
+        else:
+            if use_sa:
+                dy = _delta(dist, n, xc, i, j)
+                if (dy <= 0) or (dy < t * es[steps]):
+                    reverse_shorter(xc, i, j)
+                    yc += dy
+                t *= decay
+            else:
+                dy = _delta(dist, n, xc, i, j)
+                if dy <= 0:
+                    reverse_shorter(xc, i, j)
+                    yc += dy
+            fs[steps] = yc
+        steps += 1
+        if fs[steps - 1] < best_f:
+            break
+    return steps, yc, yd, use_ffa, t
+
+
+def budget_of(process: Process, table: FrequencyTable | None = None) -> int:
+    """
+    Get the number of FEs the next kernel invocation may perform.
+
+    If a frequency table is given, it is made ready to take one new
+    objective value per FE of the chunk. This may replace its arrays, so they
+    must be read only after calling this function.
+
+    :param process: the process
+    :param table: the frequency table of the kernel, if any
+    :returns: the FE budget of the next chunk
+    """
+    max_fes: Final[int | None] = process.get_max_fes()
+    budget: Final[int] = CHUNK_SIZE if max_fes is None else max(
+        1, min(CHUNK_SIZE, max_fes - process.get_consumed_fes()))
+    if table is not None:
+        table.reserve(budget + 1)
+    return budget
+
+
+def hand_back(register_block: Callable, fs: np.ndarray, steps: int,
+              x: np.ndarray, log_all: bool = False) -> int:
+    """
+    Hand the FEs of one chunk back to the process.
+
+    Only the last FE of a chunk can improve upon the best-so-far solution of
+    the process, so `x` is the solution registered last. If only the
+    improvements are logged, the chunk can therefore be credited as one block
+    without a trace. If all FEs are logged, the objective values of all FEs
+    of the chunk are handed in as trace, so that each of them appears in the
+    log.
+
+    :param register_block: the `register_block` method of the process
+    :param fs: the objective values of the FEs of the chunk
+    :param steps: the number of FEs in the chunk
+    :param x: the solution registered with the last FE
+    :param log_all: does the process log all FEs?
+    :returns: the number of FEs that may still be consumed
+    """
+    return register_block(steps, x, int(fs[steps - 1]), np.column_stack((
+        np.arange(1, steps + 1), fs[:steps])) if log_all else None)
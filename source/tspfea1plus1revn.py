@@ -1,39 +1,10 @@
 import numpy as np
-import numba
 from moptipy.api.process import Process
 from moptipy.api.algorithm import Algorithm
-from moptipy.examples.tsp.instance import Instance
-
-# np.set_printoptions(threshold=np.inf)
-
-
-@numba.njit(nogil=True)
-def _my_loop_body(i: int,
-                  j: int,
-                  n: int,
-                  matrix: np.ndarray,
-                  x: np.ndarray,
-                  y: int,
-                  y2: int,
-                  H: np.ndarray) -> int:
-    """Check a move, apply it if it has better H, return new y."""
-    im1 = ((i - 1) + n) % n
-    jp1 = (j + 1) % n
-    """dy is the change of the objective value."""
-    dy = -matrix[x[im1]-1][x[i]-1]-matrix[x[j]-1][x[jp1]-1] + \
-        +matrix[x[im1]-1][x[j]-1]+matrix[x[i]-1][x[jp1]-1]
-    H[y] += 1  # The frequency of objective value of the current solution increases
-    y2 = int(y + dy)
-    H[y2] += 1  # The frequency of objective value of the new solution increases
-
-    if (H[y2] <= H[y]):
-        if (i == 0):
-            x[0:j+1:1] = x[j::-1]
-        else:
-            x[i:j+1:1] = x[j:i-1:-1]  # Reverse the subsequence from i to j in solution x
-        return y2
-    return y
-
+from instance import Instance
+from moptipy.algorithms.so.ffa_h import FrequencyTable
+from tspengine import (
+    CHUNK_SIZE, MoveBuffer, budget_of, fea_steps, hand_back)
 
 class MyFeaAlgorithm(Algorithm):
     """An example for a simple FEA algorithm with reversing operator."""
@@ -41,8 +12,8 @@ class MyFeaAlgorithm(Algorithm):
     def __init__(self, ins: Instance) -> None:
         self.name = ins.name
         self.city_number = ins.city_number
-        self.cost_tsp = ins.cost_tsp
-        self.LB = 0
+        self.distances = ins.distances
+        self.LB = ins.LB or 0  # no tour is shorter than the optimum
         self.UB = ins.UB
 
     def solve(self, process: Process) -> None:
@@ -55,29 +26,37 @@ class MyFeaAlgorithm(Algorithm):
         """
 
         random = process.get_random()
-        register = process.register
+        register_block = process.register_block
+        log_all = process.logs_all_fes()  # are all FEs logged?
         should_terminate = process.should_terminate
-        ri = random.integers
 
-        H = np.zeros(self.UB, dtype=int)  # H is used to store the access frequency of the objective value
+        H = FrequencyTable(self.LB, self.UB)  # H is used to store the access frequency of the objective value
 
+        resumed = process.get_resumed_state()  # the state of an interrupted run, if any
         x = process.create()
         x[:] = range(self.city_number)
-        random.shuffle(x)  # randomly generate an initial solution
-        y = int(process.evaluate(x))  # get the tour length of this solution
-        matrix = self.cost_tsp
+        if resumed is None:
+            random.shuffle(x)  # randomly generate an initial solution
+            y = int(process.evaluate(x))  # get the tour length of this solution
+        else:  # the whole state is restored right before the loop
+            y = resumed[1]
+        dist = self.distances
         n = self.city_number
-        y2 = 0
+        fs = np.empty(CHUNK_SIZE, dtype=np.int64)  # the values of one chunk
+        moves = MoveBuffer(random, n)  # the pre-drawn random moves
+
+        if resumed is not None:  # continue exactly where the run was interrupted
+            x, y, H, buffered = resumed
+            moves.restore(buffered)
 
         while not should_terminate():
-            i = ri(n-1)
-            j = ri(n-1)
-            if i > j:
-                i, j = j, i
-            if (i == j) or (i == 0 and j == n - 2):
-                continue
-            y = _my_loop_body(i, j, n, matrix, x, y, y2, H)
-            register(x, y)
+            budget = budget_of(process, H)  # may grow H, so call it first
+            steps, y = fea_steps(moves.take(budget)[0], dist, n, x, y, H.h,
+                                 H.keys, H.lb, int(process.get_best_f()), fs,
+                                 budget)
+            moves.advance(steps)
+            hand_back(register_block, fs, steps, x, log_all)
+            process.checkpoint(lambda: (x, y, H, moves.state()))
 
     def __str__(self):
         """
@@ -1,40 +1,9 @@
 from moptipy.api.process import Process
 from moptipy.api.algorithm import Algorithm
-from moptipy.examples.tsp.instance import Instance
-import numba  # type: ignore
+from instance import Instance
 import numpy as np
-
-
-@numba.njit(nogil=True)
-def _my_loop_body(i: int,
-                  j: int,
-                  u: np.float64,
-                  n: int,
-                  Ts: int,
-                  a: np.float64,
-                  tau: int,
-                  matrix: np.ndarray,
-                  x: np.ndarray,
-                  y: int) -> int:
-    """Check a move, apply it if it is acceptable, return new y."""
-    im1 = ((i - 1) + n) % n
-    jp1 = (j + 1) % n
-
-    tau += 1  # current iteration number
-    t = Ts * (1 - a) ** (tau - 1)  # current temperature
-
-    dy = -matrix[x[im1] - 1][x[i] - 1] - matrix[x[j] - 1][x[jp1] - 1] + \
-        +matrix[x[im1] - 1][x[j] - 1] + matrix[x[i] - 1][x[jp1] - 1]
-
-    p = np.exp(- dy / t)  # Calculate the current acceptance probability
-
-    if (u < p):
-        if i == 0:
-            x[0:j + 1:1] = x[j::-1]
-        else:
-            x[i:j + 1:1] = x[j:i - 1:-1]  # Reverse the subsequence from i to j in solution x
-        return y + dy
-    return y
+from tspengine import (
+    CHUNK_SIZE, MoveBuffer, budget_of, hand_back, sa_steps)
 
 
 class MySaAlgorithm(Algorithm):
@@ -43,9 +12,10 @@ class MySaAlgorithm(Algorithm):
     def __init__(self, ins: Instance) -> None:
         self.name = ins.name
         self.city_number = ins.city_number
-        self.cost_tsp = ins.cost_tsp
+        self.distances = ins.distances
         self.LB = 0
         self.UB = ins.UB
+        self.M = ins.mean_nearest_distance  # the average distance between the nearest neighbors of each city, computed once per instance
 
     def solve(self, process: Process) -> None:
         """
@@ -56,37 +26,43 @@ class MySaAlgorithm(Algorithm):
         """
 
         random = process.get_random()
-        register = process.register
+        register_block = process.register_block
+        log_all = process.logs_all_fes()  # are all FEs logged?
         should_terminate = process.should_terminate
-        ri = random.integers
-        rj = random.random
+        resumed = process.get_resumed_state()  # the state of an interrupted run, if any
         x = process.create()
         x[:] = range(self.city_number)
-        random.shuffle(x)  # randomly generate an initial solution
-        y = process.evaluate(x)  # get the tour length of this solution
+        if resumed is None:
+            random.shuffle(x)  # randomly generate an initial solution
+            y = int(process.evaluate(x))  # get the tour length of this solution
+        else:  # the whole state is restored right before the loop
+            y = resumed[1]
         n = self.city_number
-        matrix = self.cost_tsp
+        dist = self.distances
+        fs = np.empty(CHUNK_SIZE, dtype=np.int64)  # the values of one chunk
+        moves = MoveBuffer(random, n, True)  # the pre-drawn random moves
 
-        mx = np.ma.masked_array(matrix, mask=matrix == 0)
-        M = np.mean(mx.min(1))  # Calculate the average distance between the nearest neighbors for each city
+        M = self.M
         # print(M)
 
         Ts = 0.2 * M  # Set the starting temperature
         a = 1 - (1 / Ts)**(1 / 10000000000)  # The cooling rate is according to the number of iterations, 10B here
         # a = 1 - (1 / Ts)**(1 / 100000000) # 100M
         # a = 0.000008
-        tau = 0
+        t = float(Ts)  # the current temperature, cooled in every SA step
+
+        if resumed is not None:  # continue exactly where the run was interrupted
+            x, y, t, buffered = resumed
+            moves.restore(buffered)
 
         while not should_terminate():
-            i = ri(n-1)
-            j = ri(n-1)
-            if i > j:
-                i, j = j, i
-            if (i == j) or (i == 0 and j == n - 2):
-                continue
-            u = rj()
-            y = _my_loop_body(i, j, u, n, Ts, a, tau, matrix, x, y)
-            register(x, y)
+            budget = budget_of(process)
+            steps, y, t = sa_steps(*moves.take(budget), dist, n, x, y, t,
+                                   1.0 - a, int(process.get_best_f()), fs,
+                                   budget)
+            moves.advance(steps)
+            hand_back(register_block, fs, steps, x, log_all)
+            process.checkpoint(lambda: (x, y, t, moves.state()))
 
     def __str__(self):
         """